@@ -0,0 +1,197 @@
+# benchmarks/check_backends.py
+# Conferência entre os backends de leitura (core.reader_backends): para cada
+# aba, o cabeçalho detectado (linha dos nomes, linha agrupadora das linhas
+# 13-14 e nomes combinados) e as abas lidas devem ser idênticos em todos os
+# backends disponíveis. Cada aba também é exportada em CSV e conferida pelo
+# backend de CSV (sem mesclagens: o cabeçalho em dois níveis é reconhecido só
+# pelos valores); nos dados do CSV as diferenças só são informadas, já que
+# colunas só com números chegam como texto. Sai com código 1 se algo divergir.
+#
+# Exemplo:
+#   python benchmarks/check_backends.py --rows 20000
+#   python benchmarks/check_backends.py --workbook clientes/evidencias.xlsx
+
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "src"))
+
+from config.settings import DATE_COLUMN
+from core.excel_reader import Excel_Reader
+from core.header_detection import Schema_Cache
+from core.reader_backends import CALAMINE, CSV, OPENPYXL, calamine_available, open_workbook
+
+from generate_workbook import generate_workbook
+
+
+def _variants() -> list:
+    # (rótulo, backend, streaming): o openpyxl lê as mesclagens de formas
+    # diferentes no modo completo e no somente leitura
+    variants = [("openpyxl", OPENPYXL, True), ("openpyxl completo", OPENPYXL, False)]
+    if calamine_available():
+        variants.append(("calamine", CALAMINE, True))
+    else:
+        print("python-calamine não instalado: só o openpyxl e o CSV são conferidos.")
+    return variants
+
+
+def _layouts(path: str, backend: str, streaming: bool) -> dict:
+    # Cache de layouts novo: cada backend passa pela detecção completa
+    reader = Excel_Reader(path, streaming=streaming, schema_cache=Schema_Cache(), backend=backend)
+    reader._load_workbook()
+    layouts = {}
+    try:
+        for sheet_name in reader.workbook.sheetnames:
+            reader.sheet = reader.workbook[sheet_name]
+            layout = reader._get_header_layout(reader._read_top_rows())
+            # Sem os nomes vazios do fim, que dependem da largura declarada
+            headers = list(layout.headers)
+            while headers and headers[-1] in (None, ""):
+                headers.pop()
+            layouts[sheet_name] = (layout.header_row, layout.group_row, tuple(headers))
+    finally:
+        reader._close_workbook()
+    return layouts
+
+
+def _load(path: str, backend: str, streaming: bool):
+    start = time.perf_counter()
+    reader = Excel_Reader(path, streaming=streaming, schema_cache=Schema_Cache(), backend=backend)
+    data = reader.get_data_as_dataframe(DATE_COLUMN)
+    return data, time.perf_counter() - start
+
+
+def _export_csv(path: str, output_dir: str) -> dict:
+    # Uma planilha CSV por aba, com os valores como o Excel os exporta
+    # (datas em dd/mm/aaaa)
+    workbook = open_workbook(path, OPENPYXL)
+    paths = {}
+    try:
+        for index, sheet_name in enumerate(workbook.sheetnames):
+            csv_path = os.path.join(output_dir, f"aba_{index}.csv")
+            with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, delimiter=";")
+                for row in workbook[sheet_name].iter_rows():
+                    writer.writerow(
+                        [
+                            value.strftime("%d/%m/%Y") if isinstance(value, datetime) else value
+                            for value in row
+                        ]
+                    )
+            paths[sheet_name] = csv_path
+    finally:
+        workbook.close()
+    return paths
+
+
+def _same_frame(expected, actual) -> bool:
+    return (
+        list(expected.columns) == list(actual.columns)
+        and list(expected.dtypes) == list(actual.dtypes)
+        and expected.equals(actual)
+    )
+
+
+def check(path: str) -> list:
+    # Lista das divergências encontradas
+    problems = []
+    print(f"\n{path}")
+    variants = _variants()
+    reference_label = variants[0][0]
+    reference_layouts = None
+    reference_data = None
+    for label, backend, streaming in variants:
+        layouts = _layouts(path, backend, streaming)
+        data, seconds = _load(path, backend, streaming)
+        rows = sum(len(df) for df in data.values())
+        print(f"  {label:<20} {seconds:8.2f} s  {len(data)} abas, {rows} linhas")
+        if reference_layouts is None:
+            reference_layouts, reference_data = layouts, data
+            continue
+        for sheet_name, layout in reference_layouts.items():
+            if layouts.get(sheet_name) != layout:
+                problems.append(
+                    f"{label}: cabeçalho de '{sheet_name}' {layouts.get(sheet_name)} != {layout} ({reference_label})"
+                )
+        if list(data) != list(reference_data):
+            problems.append(f"{label}: abas {list(data)} != {list(reference_data)} ({reference_label})")
+        for sheet_name, df in reference_data.items():
+            if sheet_name in data and not _same_frame(df, data[sheet_name]):
+                problems.append(f"{label}: dados de '{sheet_name}' diferentes de {reference_label}")
+
+    same_data = 0
+    with tempfile.TemporaryDirectory() as csv_dir:
+        for sheet_name, csv_path in _export_csv(path, csv_dir).items():
+            csv_layout = next(iter(_layouts(csv_path, CSV, True).values()), None)
+            if csv_layout != reference_layouts[sheet_name]:
+                problems.append(
+                    f"csv: cabeçalho de '{sheet_name}' {csv_layout} != {reference_layouts[sheet_name]} ({reference_label})"
+                )
+            csv_data, _ = _load(csv_path, CSV, True)
+            if sheet_name in reference_data and any(
+                _same_frame(reference_data[sheet_name], df) for df in csv_data.values()
+            ):
+                same_data += 1
+    print(f"  {'csv':<20} cabeçalhos de {len(reference_layouts)} abas, dados iguais em {same_data}")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Confere a leitura entre os backends.")
+    parser.add_argument("--workbook", action="append", default=[], help="Workbook existente (pode repetir)")
+    parser.add_argument("--sheets", type=int, default=4, help="Abas dos workbooks sintéticos")
+    parser.add_argument("--rows", type=int, default=5000, help="Linhas por aba dos workbooks sintéticos")
+    args = parser.parse_args(argv)
+
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = list(args.workbook)
+        if not paths:
+            # Os modelos de cabeçalho, um com bloco de identificação no topo e
+            # um com muita formatação vazia
+            for header_type in ("single", "multilevel", "vertical", "mixed"):
+                paths.append(
+                    generate_workbook(
+                        os.path.join(tmp_dir, f"{header_type}.xlsx"), args.sheets, args.rows, header_type
+                    )
+                )
+            paths.append(
+                generate_workbook(
+                    os.path.join(tmp_dir, "identificacao.xlsx"),
+                    args.sheets,
+                    args.rows,
+                    "mixed",
+                    title_block=True,
+                )
+            )
+            paths.append(
+                generate_workbook(
+                    os.path.join(tmp_dir, "formatado.xlsx"),
+                    args.sheets,
+                    args.rows,
+                    "mixed",
+                    seed=1,
+                    trailing_rows=5000,
+                    trailing_columns=50,
+                )
+            )
+        for path in paths:
+            problems.extend(check(path))
+
+    if problems:
+        print("\nDivergências:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\nTodos os backends conferem.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
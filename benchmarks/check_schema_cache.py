@@ -0,0 +1,118 @@
+# benchmarks/check_schema_cache.py
+# Conferência do cache de layouts de cabeçalho (core.header_detection): pares
+# de workbooks com abas de mesmo nome e a mesma linha de nomes, mas com ou sem
+# agrupadora (mesclada ou não, com colunas mescladas na vertical) na linha de
+# cima ou um bloco de identificação no topo, lidos em sequência com um
+# Schema_Cache compartilhado. As colunas de cada aba devem ser as esperadas
+# pelo modelo, com o cache vazio ou não. Workbooks do mesmo modelo devem
+# aproveitar o cache. Sai com código 1 se algo divergir.
+#
+# Exemplo:
+#   python benchmarks/check_schema_cache.py
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "src"))
+
+from openpyxl import Workbook
+
+from config.settings import DATE_COLUMN
+from core.excel_reader import Excel_Reader
+from core.header_detection import Schema_Cache
+
+SHEET_NAME = "Evidências"
+HEADER = ("CÓDIGO", "TÍTULO", "Número", "Data", "STATUS")
+
+VERTICAL_HEADER = ("CÓDIGO", "TÍTULO", "Número", "Data", None, None)
+# Linha 3 com rótulos e valores, acima do cabeçalho padrão
+TITLE_BLOCK = ("Cliente:", "ARTESP", "Contrato:", "CT-123", "Lote:", "05")
+
+# (linhas de cima {número: valores}, linha de nomes na 14, intervalos
+# mesclados, colunas esperadas)
+MODELS = {
+    "simples": ({}, HEADER, [], list(HEADER)),
+    "agrupadora": (
+        {13: [None, None, "VERSÃO ATUAL", None, "SITUAÇÃO"]},
+        HEADER,
+        ["C13:D13"],
+        ["CÓDIGO", "TÍTULO", "VERSÃO ATUAL - Número", "Data", "SITUAÇÃO - STATUS"],
+    ),
+    "título": ({13: ["Lista de documentos"]}, HEADER, [], list(HEADER)),
+    "título mesclado": (
+        {13: ["Lista de documentos"]},
+        HEADER,
+        ["A13:B13"],
+        ["Lista de documentos - CÓDIGO", "TÍTULO", "Número", "Data", "STATUS"],
+    ),
+    # Linhas 13 e 14 com o mesmo número de células: STATUS e OBS só na 13
+    "mesclagem vertical": (
+        {13: ["DOCUMENTO", None, "VERSÃO ATUAL", None, "STATUS", "OBS"]},
+        VERTICAL_HEADER,
+        ["A13:B13", "C13:D13", "E13:E14", "F13:F14"],
+        ["DOCUMENTO - CÓDIGO", "TÍTULO", "VERSÃO ATUAL - Número", "Data", "STATUS", "OBS"],
+    ),
+    "identificação": ({3: list(TITLE_BLOCK)}, HEADER, [], list(HEADER)),
+}
+
+
+def _write_model(path: str, model: str) -> str:
+    rows_above, header, merges, _ = MODELS[model]
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = SHEET_NAME
+    worksheet.append(["RELATÓRIO DE EVIDÊNCIAS"])
+    for row_number in range(2, 14):
+        worksheet.append(rows_above.get(row_number, []))
+    worksheet.append(list(header))
+    for cell_range in merges:
+        worksheet.merge_cells(cell_range)
+    for i in range(20):
+        row = [f"PRJ-{i:03d}", f"Documento {i}", i, datetime(2024, 1, i + 1), "Aprovado", "Reemitido"]
+        worksheet.append(row[: len(header)])
+    workbook.save(path)
+    return path
+
+
+def _columns(path: str, schema_cache: Schema_Cache) -> list:
+    reader = Excel_Reader(path, streaming=True, schema_cache=schema_cache)
+    data = reader.get_data_as_dataframe(DATE_COLUMN)
+    return list(data[SHEET_NAME].columns)
+
+
+def main(argv=None) -> int:
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {model: _write_model(os.path.join(tmp_dir, f"{i}.xlsx"), model) for i, model in enumerate(MODELS)}
+        expected = {model: MODELS[model][3] for model in MODELS}
+        for model, path in paths.items():
+            columns = _columns(path, Schema_Cache())
+            print(f"  {model:<18} {columns}")
+            if columns != expected[model]:
+                problems.append(f"'{model}' com o cache vazio: {columns} != {expected[model]}")
+
+        # Cada modelo lido depois de cada um dos outros, com o cache já preenchido
+        for first in MODELS:
+            for second in MODELS:
+                schema_cache = Schema_Cache()
+                _columns(paths[first], schema_cache)
+                columns = _columns(paths[second], schema_cache)
+                if columns != expected[second]:
+                    problems.append(f"'{second}' depois de '{first}': {columns} != {expected[second]}")
+                if first == second and schema_cache.hits == 0:
+                    problems.append(f"'{second}' lido duas vezes sem aproveitar o cache")
+
+    if problems:
+        print("\nDivergências:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\nCache de layouts confere.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# benchmarks/check_settings.py
+# Conferência das tabelas de disciplinas de config/settings.py: disciplinas
+# repetidas num mesmo dict literal (o Python guarda só a última definição, sem
+# aviso, então só dá para encontrá-las lendo o código-fonte) e os conflitos
+# entre códigos já informados na inicialização da aplicação
+# (core.discipline_classifier.find_table_conflicts). Sai com código 1 se
+# encontrar algum problema.
+#
+# Exemplo:
+#   python benchmarks/check_settings.py
+
+import os
+import ast
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "src"))
+
+from config import settings
+from core.discipline_classifier import find_table_conflicts
+
+
+def find_duplicated_keys(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    duplicates = []
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Dict):
+            continue
+        table_name = node.targets[0].id if isinstance(node.targets[0], ast.Name) else "?"
+        seen = set()
+        for key in node.value.keys:
+            if isinstance(key, ast.Constant):
+                if key.value in seen:
+                    duplicates.append(
+                        f"{table_name}: disciplina '{key.value}' definida mais de uma vez "
+                        f"(linha {key.lineno}); só a última definição é usada"
+                    )
+                seen.add(key.value)
+    return duplicates
+
+
+def main(argv=None) -> int:
+    problems = find_duplicated_keys(settings.__file__) + find_table_conflicts()
+    if problems:
+        print("Problemas nas tabelas de disciplinas:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("Tabelas de disciplinas conferem.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+# benchmarks/generate_workbook.py
+# Gera workbooks sintéticos no formato que o Excel_Reader espera: título nas
+# primeiras linhas (e, opcionalmente, um bloco "Cliente:" | "ARTESP" | ...),
+# cabeçalho simples (linha 14) ou em dois níveis com células mescladas (linhas
+# 13 e 14, com ou sem colunas mescladas na vertical), dados a partir da linha
+# 15, colunas de data, cabeçalhos repetidos e linhas/colunas vazias (mas
+# formatadas) no fim.
+#
+# Exemplo:
+#   python benchmarks/generate_workbook.py /tmp/evidencias.xlsx --sheets 4 --rows 50000
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
+
+HEADER_TYPES = ("single", "multilevel", "vertical", "mixed")
+# Tipos de cabeçalho que o 'mixed' alterna, aba a aba
+_MIXED_HEADER_TYPES = ("multilevel", "single", "vertical")
+
+# (grupo da linha 13, subtítulos da linha 14). No cabeçalho em dois níveis o
+# grupo fica mesclado sobre as suas colunas, e o leitor só o combina com a
+# primeira delas: "VERSÃO ATUAL - Data", "Revisão", "Status"...
+_MULTILEVEL_GROUPS = (
+    ("DOCUMENTO", ("Código", "Título")),
+    ("VERSÃO ATUAL", ("Data", "Revisão", "Status")),
+    ("VERSÃO ANTERIOR", ("Data", "Revisão")),
+    (None, ("Observações",)),
+)
+# Dois níveis com colunas sem subtítulo: o nome fica na linha 13, mesclado na
+# vertical sobre a 14 (sem grupo, "()"). As linhas 13 e 14 têm o mesmo número
+# de células preenchidas: "DOCUMENTO - Código", "Título", ..., "Status".
+_VERTICAL_GROUPS = (
+    ("DOCUMENTO", ("Código", "Título")),
+    ("VERSÃO ATUAL", ("Data", "Revisão")),
+    ("Status", ()),
+    ("Observações", ()),
+)
+# Colunas de _data_row usadas nas abas com _VERTICAL_GROUPS
+_VERTICAL_DATA_COLUMNS = (0, 1, 2, 3, 4, 7)
+# "Status" repetido de propósito: o leitor mantém só a primeira ocorrência
+_SINGLE_HEADERS = (
+    "Código",
+    "Título",
+    "VERSÃO ATUAL - Data",
+    "Revisão",
+    "Status",
+    "Data",
+    "Status",
+    "Observações",
+)
+
+_DISCIPLINE_CODES = ("C1", "H1", "G1", "E1", "J01", "K01", "L01", "P01", "S09", "T01")
+_TITLE_WORDS = (
+    "Pavimentação",
+    "Drenagem",
+    "Terraplenagem",
+    "Sinalização",
+    "Projeto",
+    "Memorial",
+    "Desenho",
+    "Dispositivo",
+    "Contenção",
+    "Iluminação",
+)
+_STATUSES = ("Aprovado", "Em análise", "Reprovado", "Aprovado com comentários")
+_REVISIONS = ("0", "A", "B", "C", 1, 2, 3)
+
+TITLE_ROWS = 12
+# Bloco de identificação (rótulo: valor) nas linhas 4 e 5, com 'title_block'
+_TITLE_BLOCK = (
+    ("Cliente:", "ARTESP", "Contrato:", "CT-123", "Lote:", "05"),
+    ("Emissão:", None, "Responsável:", "Engenharia"),
+)
+TRAILING_EMPTY_ROWS = 20
+TRAILING_EMPTY_COLUMNS = 3
+
+
+def _header_rows(header_type: str):
+    # (linha 13, linha 14, mesclagens como (min_col, min_row, max_col, max_row))
+    if header_type == "single":
+        return [None] * len(_SINGLE_HEADERS), list(_SINGLE_HEADERS), []
+    groups = _VERTICAL_GROUPS if header_type == "vertical" else _MULTILEVEL_GROUPS
+    row_13, row_14, merges = [], [], []
+    for group, titles in groups:
+        first_column = len(row_14) + 1
+        if not titles:
+            row_13.append(group)
+            row_14.append(None)
+            merges.append((first_column, 13, first_column, 14))
+            continue
+        row_13.extend([group] + [None] * (len(titles) - 1))
+        row_14.extend(titles)
+        if group is not None and len(titles) > 1:
+            merges.append((first_column, 13, first_column + len(titles) - 1, 13))
+    return row_13, row_14, merges
+
+
+def _data_row(rng: random.Random, row_number: int, base_date: datetime, days: int) -> list:
+    code = f"PRJ-{rng.choice(_DISCIPLINE_CODES)}-{row_number:06d}"
+    title = " ".join(rng.sample(_TITLE_WORDS, rng.randint(2, 5))) + f" {row_number}"
+    current_date = base_date + timedelta(days=rng.randrange(days)) if rng.random() > 0.05 else None
+    previous_date = (
+        current_date - timedelta(days=rng.randint(1, 60))
+        if current_date is not None and rng.random() > 0.3
+        else None
+    )
+    observation = rng.choice(("", "", "", "Reemitido", "Aguardando retorno do cliente"))
+    return [
+        code,
+        title,
+        current_date,
+        rng.choice(_REVISIONS),
+        rng.choice(_STATUSES),
+        previous_date,
+        rng.choice(_STATUSES),
+        observation or None,
+    ]
+
+
+def _styled_empty_cells(worksheet, count: int) -> list:
+    # Células sem valor mas com formatação: aumentam a dimensão da planilha
+    # como acontece nas planilhas reais
+    cells = []
+    for _ in range(count):
+        cell = WriteOnlyCell(worksheet, value=None)
+        cell.number_format = "0.00"
+        cells.append(cell)
+    return cells
+
+
+def generate_workbook(
+    output_path: str,
+    sheets: int = 3,
+    rows: int = 10000,
+    header_type: str = "mixed",
+    seed: int = 0,
+    empty_row_every: int = 50,
+    start_date: datetime = datetime(2023, 1, 1),
+    days: int = 730,
+    trailing_rows: int = TRAILING_EMPTY_ROWS,
+    trailing_columns: int = TRAILING_EMPTY_COLUMNS,
+    title_block: bool = False,
+) -> str:
+    # 'mixed' alterna abas com cabeçalho em dois níveis, simples e em dois
+    # níveis com colunas mescladas na vertical.
+    # 'trailing_rows' e 'trailing_columns' simulam a formatação que estende a
+    # dimensão da planilha muito além dos dados.
+    if header_type not in HEADER_TYPES:
+        raise ValueError(f"Tipo de cabeçalho desconhecido: '{header_type}'")
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    for sheet_number in range(sheets):
+        worksheet = workbook.create_sheet(title=f"Evidências {sheet_number + 1}")
+        sheet_header_type = header_type
+        if header_type == "mixed":
+            sheet_header_type = _MIXED_HEADER_TYPES[sheet_number % len(_MIXED_HEADER_TYPES)]
+
+        worksheet.append(["RELATÓRIO DE EVIDÊNCIAS"])
+        worksheet.append([f"Gerado em {start_date:%d/%m/%Y}"])
+        title_rows = 2
+        if title_block:
+            worksheet.append([])
+            worksheet.append(list(_TITLE_BLOCK[0]))
+            emission = list(_TITLE_BLOCK[1])
+            emission[1] = start_date
+            worksheet.append(emission)
+            title_rows += 3
+        for _ in range(TITLE_ROWS - title_rows):
+            worksheet.append([])
+
+        row_13, row_14, merges = _header_rows(sheet_header_type)
+        for min_col, min_row, max_col, max_row in merges:
+            worksheet.merged_cells.add(
+                CellRange(min_col=min_col, min_row=min_row, max_col=max_col, max_row=max_row)
+            )
+        worksheet.append(row_13)
+        worksheet.append(row_14)
+
+        for row_number in range(rows):
+            if empty_row_every and row_number % empty_row_every == empty_row_every - 1:
+                worksheet.append([])
+                continue
+            row = _data_row(rng, row_number, start_date, days)
+            if sheet_header_type == "vertical":
+                row = [row[i] for i in _VERTICAL_DATA_COLUMNS]
+            if row_number % 10 == 0:
+                row.extend(_styled_empty_cells(worksheet, trailing_columns))
+            worksheet.append(row)
+
+        for _ in range(trailing_rows):
+            worksheet.append(_styled_empty_cells(worksheet, 1))
+
+    workbook.save(output_path)
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um workbook sintético de evidências.")
+    parser.add_argument("output", help="Arquivo .xlsx de saída")
+    parser.add_argument("--sheets", type=int, default=3, help="Número de abas")
+    parser.add_argument("--rows", type=int, default=10000, help="Linhas de dados por aba")
+    parser.add_argument("--header", choices=HEADER_TYPES, default="mixed", help="Tipo de cabeçalho")
+    parser.add_argument("--seed", type=int, default=0, help="Semente dos valores aleatórios")
+    parser.add_argument(
+        "--title-block", action="store_true", help="Bloco de identificação (Cliente:, Contrato:...) no topo"
+    )
+    parser.add_argument(
+        "--trailing-rows", type=int, default=TRAILING_EMPTY_ROWS, help="Linhas vazias formatadas no fim de cada aba"
+    )
+    parser.add_argument(
+        "--trailing-columns", type=int, default=TRAILING_EMPTY_COLUMNS, help="Colunas vazias formatadas à direita"
+    )
+    args = parser.parse_args(argv)
+    generate_workbook(
+        args.output,
+        args.sheets,
+        args.rows,
+        args.header,
+        args.seed,
+        trailing_rows=args.trailing_rows,
+        trailing_columns=args.trailing_columns,
+        title_block=args.title_block,
+    )
+    print(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+# benchmarks/run_benchmarks.py
+# Mede tempo e pico de memória (tracemalloc) das etapas principais: carga do
+# workbook (openpyxl e, se instalado, calamine), detecção do cabeçalho, limpeza, gravação e mapeamento das abas em
+# Arrow (Sheet_Store), filtro por data, paginação e ajuste da largura das
+# colunas. O resultado vai para um JSON, que pode ser
+# comparado com o de uma execução anterior (--compare).
+#
+# Exemplos:
+#   python benchmarks/run_benchmarks.py --sheets 4 --rows 50000
+#   python benchmarks/run_benchmarks.py --workbook cliente.xlsx --compare benchmarks/results/antes.json
+
+import os
+import sys
+import gc
+import json
+import time
+import platform
+import argparse
+import importlib.util
+import statistics
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "src"))
+
+import openpyxl
+import pandas as pd
+
+from config.settings import DATE_COLUMN, READER_WORKERS
+from core.date_index import Date_Index
+from core.excel_reader import Excel_Reader, _normalize_cell_value
+from core.header_detection import Schema_Cache
+from core.reader_backends import CALAMINE, OPENPYXL, calamine_available
+from core.sheet_store import open_sheet, write_sheet
+from ui import column_widths
+from ui.formatting import format_dataframe
+
+from generate_workbook import HEADER_TYPES, generate_workbook
+
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+ROWS_PER_PAGE = 50
+PAGES = 20
+
+
+class _Fixed_Width_Font:
+    # Usada quando não há display para criar uma fonte do Tk: mantém o custo
+    # do motor de larguras (seleção dos candidatos, caches), sem o do Tcl
+    def actual(self):
+        return {"family": "fixed-width"}
+
+    def measure(self, text: str) -> int:
+        return 7 * len(text)
+
+
+def _measurement_font():
+    try:
+        import tkinter as tk
+        from tkinter import font as tkfont
+
+        root = tk.Tk()
+        root.withdraw()
+        return tkfont.Font(root=root, font="TkDefaultFont"), "TkDefaultFont"
+    except Exception:
+        return _Fixed_Width_Font(), "fixed-width"
+
+
+def _run_stage(func, repeat: int) -> dict:
+    # Tempo medido sem o tracemalloc (que deixa tudo mais lento); o pico de
+    # memória vem de uma execução a mais, separada
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        started_at = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - started_at)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds_min": min(seconds),
+        "seconds_median": statistics.median(seconds),
+        "seconds": seconds,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _read_raw_sheets(workbook_path: str) -> dict:
+    # DataFrames ainda sem limpeza (como o modo completo os monta), para medir
+    # a limpeza separadamente da leitura
+    reader = Excel_Reader(workbook_path, streaming=True)
+    reader._load_workbook()
+    raw_sheets = {}
+    try:
+        for sheet_name in reader.workbook.sheetnames:
+            reader.sheet = reader.workbook[sheet_name]
+            layout = reader._get_header_layout(reader._read_top_rows())
+            headers = reader._get_clean_headers(layout)
+            rows = reader.sheet.iter_rows(min_row=layout.data_start_row)
+            data = [[_normalize_cell_value(value) for value in row] for row in rows]
+            width = max([len(headers)] + [len(row) for row in data])
+            headers = headers + [None] * (width - len(headers))
+            data = [row + [None] * (width - len(row)) for row in data]
+            raw_sheets[sheet_name] = pd.DataFrame(data, columns=headers, dtype=object)
+    finally:
+        reader._close_workbook()
+    return raw_sheets
+
+
+def _detect_headers(reader: Excel_Reader, schema_cache: Schema_Cache = None):
+    # Workbook já aberto (a abertura é medida na carga). Sem 'schema_cache',
+    # cada execução detecta os cabeçalhos do zero.
+    reader.schema_cache = schema_cache or Schema_Cache()
+    for sheet_name in reader.workbook.sheetnames:
+        reader.sheet = reader.workbook[sheet_name]
+        reader._get_clean_headers(reader._get_header_layout(reader._read_top_rows()))
+
+
+def _filter_range(date_index: Date_Index):
+    # Intervalo central com metade do período dos dados
+    firsts = [dates[0] for dates in date_index.sorted_dates.values() if len(dates)]
+    lasts = [dates[-1] for dates in date_index.sorted_dates.values() if len(dates)]
+    first, last = pd.Timestamp(min(firsts)), pd.Timestamp(max(lasts))
+    quarter = (last - first) / 4
+    return (first + quarter).normalize(), (last - quarter).normalize()
+
+
+def run(workbook_path: str, repeat: int, workers: int) -> dict:
+    def load(**kwargs):
+        return Excel_Reader(workbook_path, **kwargs).get_data_as_dataframe(DATE_COLUMN)
+
+    stages = {}
+    # O backend é fixado: o automático mudaria com o tamanho do workbook
+    stages["load_full"] = _run_stage(lambda: load(streaming=False, backend=OPENPYXL), repeat)
+    stages["load_streaming"] = _run_stage(lambda: load(streaming=True, backend=OPENPYXL), repeat)
+    if calamine_available():
+        stages["load_calamine"] = _run_stage(lambda: load(streaming=True, backend=CALAMINE), repeat)
+    if workers > 1:
+        # O tracemalloc só enxerga este processo: o pico não inclui os processos de leitura
+        stages["load_parallel"] = _run_stage(
+            lambda: load(streaming=True, workers=workers, backend=OPENPYXL), repeat
+        )
+    header_reader = Excel_Reader(workbook_path, streaming=True)
+    header_reader._load_workbook()
+    try:
+        stages["header_detection"] = _run_stage(lambda: _detect_headers(header_reader), repeat)
+        # Mesmo modelo já visto: só a conferência da assinatura no cache
+        warm_schema_cache = Schema_Cache()
+        _detect_headers(header_reader, warm_schema_cache)
+        stages["header_detection_cached"] = _run_stage(
+            lambda: _detect_headers(header_reader, warm_schema_cache), repeat
+        )
+    finally:
+        header_reader._close_workbook()
+
+    raw_sheets = _read_raw_sheets(workbook_path)
+    cleaner = Excel_Reader(workbook_path)
+    stages["cleanup"] = _run_stage(
+        lambda: {name: cleaner._clean_dataframe(df) for name, df in raw_sheets.items()}, repeat
+    )
+
+    data_by_sheet = load(streaming=True)
+    if importlib.util.find_spec("pyarrow") is not None:
+        with tempfile.TemporaryDirectory() as store_dir:
+            paths = [os.path.join(store_dir, f"sheet_{i}.arrow") for i in range(len(data_by_sheet))]
+
+            def write_store():
+                for path, df_sheet in zip(paths, data_by_sheet.values()):
+                    write_sheet(df_sheet, path)
+
+            stages["sheet_store_write"] = _run_stage(write_store, repeat)
+            # Handles novos a cada execução: mede o mapeamento e a conversão
+            # para DataFrame, não o reaproveitamento do último lido
+            stages["sheet_store_map"] = _run_stage(
+                lambda: [open_sheet(path).read() for path in paths], repeat
+            )
+    stages["date_index_build"] = _run_stage(lambda: Date_Index(data_by_sheet, DATE_COLUMN), repeat)
+    date_index = Date_Index(data_by_sheet, DATE_COLUMN)
+    start, end = _filter_range(date_index)
+    stages["date_filter"] = _run_stage(lambda: date_index.filter(start, end), repeat)
+
+    filtered_df = date_index.filter(start, end)
+
+    def paginate():
+        for page in range(PAGES):
+            format_dataframe(filtered_df.iloc[page * ROWS_PER_PAGE : (page + 1) * ROWS_PER_PAGE])
+
+    stages["paging"] = _run_stage(paginate, repeat)
+
+    font, font_name = _measurement_font()
+
+    def autosize():
+        # Sem os caches de medição, como na primeira exibição
+        column_widths._FONT_MEASUREMENTS.clear()
+        column_widths.Column_Width_Engine(font).widths_for(filtered_df)
+
+    stages["autosize"] = _run_stage(autosize, repeat)
+
+    return {
+        "stages": stages,
+        "details": {
+            "rows_loaded": int(sum(len(df) for df in data_by_sheet.values())),
+            "rows_filtered": int(len(filtered_df)),
+            "filter_range": [start.strftime("%d/%m/%Y"), end.strftime("%d/%m/%Y")],
+            "pages": PAGES,
+            "rows_per_page": ROWS_PER_PAGE,
+            "autosize_font": font_name,
+        },
+    }
+
+
+def compare(results: dict, previous_path: str):
+    with open(previous_path, encoding="utf-8") as f:
+        previous = json.load(f)
+    print(f"\nComparação com {previous_path} (mediana, tempo atual / anterior):")
+    for stage, current in results["stages"].items():
+        before = previous.get("stages", {}).get(stage)
+        if before is None:
+            print(f"  {stage:<24} (sem medição anterior)")
+            continue
+        ratio = current["seconds_median"] / before["seconds_median"] if before["seconds_median"] else float("inf")
+        print(
+            f"  {stage:<24} {before['seconds_median'] * 1000:9.1f} ms -> "
+            f"{current['seconds_median'] * 1000:9.1f} ms  ({ratio:.2f}x)"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks da leitura e exibição dos workbooks.")
+    parser.add_argument("--workbook", help="Workbook existente (padrão: gera um sintético)")
+    parser.add_argument("--sheets", type=int, default=3, help="Abas do workbook sintético")
+    parser.add_argument("--rows", type=int, default=20000, help="Linhas por aba do workbook sintético")
+    parser.add_argument("--header", choices=HEADER_TYPES, default="mixed", help="Cabeçalho do workbook sintético")
+    parser.add_argument("--seed", type=int, default=0, help="Semente do workbook sintético")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções cronometradas por etapa")
+    parser.add_argument("--workers", type=int, default=READER_WORKERS, help="Processos da carga paralela")
+    parser.add_argument("-o", "--output", help="Arquivo JSON de resultados (padrão: benchmarks/results/<data>.json)")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = args.workbook
+        workbook_info = {"path": workbook_path}
+        if workbook_path is None:
+            workbook_path = os.path.join(tmp_dir, "evidencias.xlsx")
+            generate_workbook(workbook_path, args.sheets, args.rows, args.header, args.seed)
+            workbook_info = {
+                "synthetic": True,
+                "sheets": args.sheets,
+                "rows_per_sheet": args.rows,
+                "header": args.header,
+                "seed": args.seed,
+            }
+        workbook_info["size_bytes"] = os.path.getsize(workbook_path)
+        measured = run(workbook_path, args.repeat, args.workers)
+
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "openpyxl": openpyxl.__version__,
+            "cpu_count": os.cpu_count(),
+        },
+        "workbook": workbook_info,
+        "repeat": args.repeat,
+        "workers": args.workers,
+        **measured,
+    }
+
+    output_path = args.output
+    if output_path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output_path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    for stage, result in results["stages"].items():
+        print(
+            f"{stage:<24} {result['seconds_median'] * 1000:9.1f} ms (mediana)  "
+            f"pico {result['peak_memory_bytes'] / 1024 / 1024:8.1f} MiB"
+        )
+    print(f"Resultados gravados em {output_path}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# src/cli.py
+# Modo em lote, sem interface gráfica: filtra um ou vários workbooks por
+# intervalo de datas e grava o resultado combinado em CSV, Parquet ou XLSX.
+# Não importa Tk, PIL nem customtkinter.
+#
+# Exemplo:
+#   python src/cli.py clientes/*.xlsx --start 01/01/2025 --end 31/03/2025 -o saida.csv
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# O openpyxl importa o PIL (suporte a imagens) quando ele está instalado. Para
+# ler valores não precisamos dele; bloqueá-lo mantém a inicialização enxuta.
+sys.modules.setdefault("PIL", None)
+
+import pandas as pd
+
+from config.settings import DATE_COLUMN, READER_WORKERS
+from core.date_index import Date_Index
+from core.discipline_classifier import get_default_classifier, report_table_conflicts
+from core.excel_reader import Excel_Reader
+from core.exporter import EXPORT_FORMATS, export_dataframe
+from core.profiling import profiler
+from core.workbook_cache import Workbook_Cache
+
+SOURCE_COLUMN = "Arquivo"
+OUTPUT_FORMATS = EXPORT_FORMATS
+
+
+def _parse_date(text: str) -> pd.Timestamp:
+    try:
+        return pd.Timestamp(datetime.strptime(text, "%d/%m/%Y"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"data inválida '{text}' (use dd/mm/aaaa)")
+
+
+def filter_workbook(
+    file_path: str, start: pd.Timestamp, end: pd.Timestamp, use_cache: bool = True
+) -> pd.DataFrame:
+    # Mesma lógica do filtro da interface: índice de datas por aba
+    reader = Excel_Reader(
+        file_path,
+        streaming=True,
+        cache=Workbook_Cache() if use_cache else None,
+    )
+    data_by_sheet = reader.get_data_as_dataframe(date_column_name=DATE_COLUMN)
+    get_default_classifier().classify_sheets(data_by_sheet)
+    filtered_df = Date_Index(data_by_sheet, DATE_COLUMN).filter(start, end)
+    if not filtered_df.empty:
+        filtered_df.insert(0, SOURCE_COLUMN, os.path.basename(file_path))
+    return filtered_df
+
+
+def write_output(df: pd.DataFrame, output_path: str, output_format: str, sep: str):
+    # Gravação em blocos, a mesma da exportação da interface
+    export_dataframe(df, output_path, output_format, sep=sep)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Filtra workbooks de evidências por data, sem interface gráfica."
+    )
+    parser.add_argument("paths", nargs="+", help="Planilhas (.xlsx, .xls, .xlsb, .csv) a processar")
+    parser.add_argument("--start", required=True, type=_parse_date, help="Data inicial (dd/mm/aaaa)")
+    parser.add_argument("--end", required=True, type=_parse_date, help="Data final (dd/mm/aaaa)")
+    parser.add_argument("-o", "--output", required=True, help="Arquivo de saída")
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        help="Formato de saída (padrão: extensão do arquivo de saída)",
+    )
+    parser.add_argument("--sep", default=";", help="Separador do CSV (padrão: ';')")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=READER_WORKERS,
+        help="Processos usados para ler vários workbooks ao mesmo tempo",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Não usa o cache em disco")
+    parser.add_argument(
+        "--profile",
+        metavar="ARQUIVO_JSON",
+        help="Mede o tempo de cada etapa e grava o resultado neste arquivo",
+    )
+    args = parser.parse_args(argv)
+    if args.profile:
+        profiler.enable()
+
+    output_format = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if output_format not in OUTPUT_FORMATS:
+        parser.error(f"formato de saída desconhecido: '{output_format}'")
+
+    report_table_conflicts()
+    use_cache = not args.no_cache
+    workers = max(1, min(args.workers, len(args.paths)))
+    # Muitos workbooks: cada processo lê um arquivo inteiro e devolve só as
+    # linhas filtradas, que são pequenas
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    filter_workbook,
+                    args.paths,
+                    [args.start] * len(args.paths),
+                    [args.end] * len(args.paths),
+                    [use_cache] * len(args.paths),
+                )
+            )
+    else:
+        results = [
+            filter_workbook(path, args.start, args.end, use_cache) for path in args.paths
+        ]
+
+    # Mantém a ordem dos arquivos passados na linha de comando
+    filtered = [df for df in results if not df.empty]
+    combined = pd.concat(filtered, ignore_index=True) if filtered else pd.DataFrame()
+    write_output(combined, args.output, output_format, args.sep)
+    print(
+        f"{len(combined)} registros de {len(filtered)}/{len(args.paths)} arquivos gravados em {args.output}",
+        file=sys.stderr,
+    )
+    if args.profile:
+        # Com vários processos, só as etapas feitas neste processo são medidas
+        profiler.dump_json(args.profile)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
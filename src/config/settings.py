@@ -1,3 +1,50 @@
+import os
+
+# Coluna usada nos filtros por intervalo de datas
+DATE_COLUMN = "VERSÃO ATUAL - Data"
+
+# Coluna com a disciplina deduzida do código do documento, e os trechos de nome
+# usados para achar a coluna do código (o primeiro que aparecer vence)
+DISCIPLINE_COLUMN = "Disciplina"
+DOCUMENT_CODE_COLUMN_KEYWORDS = ("CÓDIGO", "CODIGO", "Nº DOCUMENTO", "DOCUMENTO")
+
+# Dimensões e períodos disponíveis no relatório de contagem de documentos
+REPORT_DIMENSIONS = ("Disciplina", "Aba")
+REPORT_PERIODS = ("Semana", "Mês")
+
+# Número de processos usados para ler as abas do workbook em paralelo.
+# Com 1, a leitura acontece no processo da interface, aba por aba.
+READER_WORKERS = os.cpu_count() or 1
+
+# Carga sob demanda: ao abrir um arquivo (fora do cache) só os nomes e os
+# cabeçalhos das abas são lidos; cada aba é lida quando é exibida ou quando um
+# filtro sobre todas as abas precisa dela
+LAZY_SHEET_LOADING = True
+
+APP_CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "Evidencias",
+)
+
+# Cache em disco das abas já processadas (arquivos Arrow IPC), com limite de tamanho
+CACHE_DIR = os.path.join(APP_CACHE_DIR, "workbooks")
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Abas mapeadas do cache (Arrow) mantidas na memória ao mesmo tempo; as menos
+# usadas recentemente são descartadas e lidas de novo do disco quando pedidas
+RESIDENT_SHEETS_MAX_BYTES = 512 * 1024 * 1024
+
+# Imagens já decodificadas e redimensionadas (ex.: logo do rodapé)
+ASSETS_CACHE_DIR = os.path.join(APP_CACHE_DIR, "assets")
+
+# Medição do tempo de cada etapa da leitura e da exibição (ver core.profiling).
+# Também pode ser ligada pelo painel de diagnóstico da interface.
+PROFILING_ENABLED = os.environ.get("EVIDENCIAS_PROFILING") == "1"
+# Medições guardadas; as mais antigas são descartadas (o profiler fica ligado
+# a sessão inteira)
+PROFILING_MAX_RECORDS = 20000
+
+
 ANTT_DISCIPLINES_TYPES = {
     "Topografia": ["C1", "C2"],
     "Geometria": ["A2", "F1"],
@@ -37,6 +84,16 @@ ARTESP_FILE_GROUPED_TYPES = {
         "J13",
         "J14",
         "J15",
+        "Q01",
+        "Q02",
+        "Q03",
+        "Q04",
+        "Q05",
+        "Q06",
+        "Q07",
+        "Q09",
+        "Q10",
+        "Q11",
     ],
     "Topografia": [
         "T01",
@@ -53,18 +110,6 @@ ARTESP_FILE_GROUPED_TYPES = {
     ],
     "Drenagem": ["H1", "H03", "H04", "H06", "H07", "H08", "H09", "H10", "H11"],
     "Geometria": ["F01", "F02", "F03", "F04", "F05", "F07", "F09", "F10", "F11"],
-    "Terraplanagem": [
-        "Q01",
-        "Q02",
-        "Q03",
-        "Q04",
-        "Q05",
-        "Q06",
-        "Q07",
-        "Q09",
-        "Q10",
-        "Q11",
-    ],
     "Pavimentação": [
         "P02",
         "P03",
@@ -84,7 +129,7 @@ ARTESP_FILE_GROUPED_TYPES = {
     "Sinalização": ["l01", "L02", "L03", "L04", "L05", "L06", "L09", "L11", "L12"],
     "Desvio de Tráfego": ["L07"],
     "Obras Complementares": ["L09"],
-    "Cadasrto de Interferências": ["I01", "I10", "I11"],
+    "Cadastro de Interferências": ["I01", "I10", "I11"],
     "Desapropriação": ["D01", "D02", "D03", "D04", "D06", "D09", "D10", "D11", "D12"],
     "Elétrica": [
         "E01",
@@ -0,0 +1,152 @@
+# src/core/aggregation.py
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+from config.settings import DISCIPLINE_COLUMN, REPORT_DIMENSIONS, REPORT_PERIODS
+
+# Frequências do pandas para cada período do relatório (semanas de segunda a domingo)
+PERIOD_FREQUENCIES = dict(zip(REPORT_PERIODS, ("W-SUN", "M")))
+PERIOD_LABEL_FORMATS = dict(zip(REPORT_PERIODS, ("%d/%m/%Y", "%m/%Y")))
+PERIOD_COLUMN = "Período"
+TOTAL_COLUMN = "Total"
+NO_DISCIPLINE_LABEL = "Sem disciplina"
+
+
+class Aggregation_Engine:
+    # Contagem de documentos por período (semana/mês) e por aba ou disciplina,
+    # feita sobre o Date_Index (datas já ordenadas). A contagem de cada período
+    # fica guardada: mudar o intervalo só conta os períodos ainda não vistos.
+    # Um Date_Index novo (dados recarregados) exige um motor novo.
+    def __init__(self, date_index, max_cached_results: int = 32):
+        self.date_index = date_index
+        self.max_cached_results = max_cached_results
+        # dimensão -> (rótulos, {aba: código do rótulo de cada linha, na ordem do índice})
+        self._dimensions = {}
+        # (dimensão, início, fim) -> contagens por rótulo
+        self._period_counts = {}
+        # (dimensão, período, início, fim) -> tabela pronta
+        self._results = OrderedDict()
+
+    def is_current(self, date_index) -> bool:
+        return date_index is self.date_index
+
+    def _dimension(self, dimension: str):
+        if dimension in self._dimensions:
+            return self._dimensions[dimension]
+        if dimension not in REPORT_DIMENSIONS:
+            raise ValueError(f"Dimensão desconhecida: {dimension}")
+
+        labels = []
+        codes_by_sheet = {}
+        if dimension == "Aba":
+            for code, sheet_name in enumerate(self.date_index.sorted_dates):
+                labels.append(sheet_name)
+                codes_by_sheet[sheet_name] = np.full(
+                    len(self.date_index.positions[sheet_name]), code, dtype=np.intp
+                )
+        else:
+            labels.append(NO_DISCIPLINE_LABEL)
+            code_by_label = {NO_DISCIPLINE_LABEL: 0}
+            for sheet_name, positions in self.date_index.positions.items():
+                df_sheet = self.date_index.data_by_sheet[sheet_name]
+                if DISCIPLINE_COLUMN not in df_sheet.columns:
+                    codes_by_sheet[sheet_name] = np.zeros(len(positions), dtype=np.intp)
+                    continue
+                categorical = df_sheet[DISCIPLINE_COLUMN].astype("category").cat
+                category_codes = []
+                for category in categorical.categories:
+                    label = str(category)
+                    if label not in code_by_label:
+                        code_by_label[label] = len(labels)
+                        labels.append(label)
+                    category_codes.append(code_by_label[label])
+                # Posição extra no fim para as linhas sem disciplina (cat.codes == -1)
+                code_by_category = np.array(category_codes + [0], dtype=np.intp)
+                codes_by_sheet[sheet_name] = code_by_category[
+                    categorical.codes.to_numpy()[positions]
+                ]
+
+        self._dimensions[dimension] = (labels, codes_by_sheet)
+        return self._dimensions[dimension]
+
+    def date_range(self):
+        # Primeira e última data presentes nos dados (None se não houver datas)
+        firsts = [dates[0] for dates in self.date_index.sorted_dates.values() if len(dates)]
+        lasts = [dates[-1] for dates in self.date_index.sorted_dates.values() if len(dates)]
+        if not firsts:
+            return None, None
+        return pd.Timestamp(min(firsts)).normalize(), pd.Timestamp(max(lasts)).normalize()
+
+    def _period_bounds(self, period: str, start: pd.Timestamp, end: pd.Timestamp):
+        # Os períodos das pontas são recortados pelo intervalo pedido
+        bounds = []
+        for p in pd.period_range(start, end, freq=PERIOD_FREQUENCIES[period]):
+            lo = max(p.start_time.normalize(), start)
+            hi = min(p.end_time.normalize(), end)
+            bounds.append((p, lo, hi))
+        return bounds
+
+    def _count(self, dimension: str, bounds: list) -> np.ndarray:
+        # Conta todos os períodos pedidos de uma vez: cada linha recebe o
+        # número do seu período (busca binária nos inícios) e um único bincount
+        # por aba soma as combinações período x rótulo
+        labels, codes_by_sheet = self._dimension(dimension)
+        starts = np.array([np.datetime64(lo, "ns") for lo, _ in bounds])
+        ends = np.array([np.datetime64(hi + pd.Timedelta(days=1), "ns") for _, hi in bounds])
+        counts = np.zeros(len(bounds) * len(labels), dtype=np.int64)
+        for sheet_name, dates in self.date_index.sorted_dates.items():
+            first = np.searchsorted(dates, starts[0], side="left")
+            last = np.searchsorted(dates, ends[-1], side="left")
+            if last <= first:
+                continue
+            sheet_dates = dates[first:last]
+            period_ids = np.searchsorted(starts, sheet_dates, side="right") - 1
+            # Entre dois períodos pedidos pode haver outros já contados
+            inside = sheet_dates < ends[period_ids]
+            flat = period_ids[inside] * len(labels) + codes_by_sheet[sheet_name][first:last][inside]
+            counts += np.bincount(flat, minlength=len(counts))
+        return counts.reshape(len(bounds), len(labels))
+
+    def counts(self, dimension: str, period: str, start=None, end=None) -> pd.DataFrame:
+        # Tabela com uma linha por período e uma coluna por aba/disciplina
+        # presente no intervalo, mais o total. Sem datas, usa todo o período dos dados.
+        if period not in PERIOD_FREQUENCIES:
+            raise ValueError(f"Período desconhecido: {period}")
+        data_start, data_end = self.date_range()
+        start = data_start if start is None else pd.Timestamp(start).normalize()
+        end = data_end if end is None else pd.Timestamp(end).normalize()
+        if start is None or end is None or start > end:
+            return pd.DataFrame()
+
+        key = (dimension, period, start, end)
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        labels, _ = self._dimension(dimension)
+        bounds = self._period_bounds(period, start, end)
+        missing = [
+            (lo, hi) for _, lo, hi in bounds if (dimension, lo, hi) not in self._period_counts
+        ]
+        if missing:
+            for (lo, hi), row in zip(missing, self._count(dimension, missing)):
+                self._period_counts[(dimension, lo, hi)] = row
+
+        table = np.vstack([self._period_counts[(dimension, lo, hi)] for _, lo, hi in bounds])
+        present = table.sum(axis=0) > 0
+        result = pd.DataFrame(
+            table[:, present], columns=[label for label, keep in zip(labels, present) if keep]
+        )
+        result[TOTAL_COLUMN] = table.sum(axis=1)
+        result.insert(
+            0,
+            PERIOD_COLUMN,
+            [p.start_time.strftime(PERIOD_LABEL_FORMATS[period]) for p, _, _ in bounds],
+        )
+
+        self._results[key] = result
+        while len(self._results) > self.max_cached_results:
+            self._results.popitem(last=False)
+        return result
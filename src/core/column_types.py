@@ -0,0 +1,84 @@
+# src/core/column_types.py
+
+from datetime import date, datetime
+import numbers
+import pandas as pd
+
+# Colunas de texto com poucos valores distintos (status, disciplina, revisão...)
+# viram 'category': cada valor é guardado uma vez e as linhas guardam só códigos.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+CATEGORY_MAX_UNIQUE = 1000
+
+DATE_FORMAT = "%d/%m/%Y"
+# Uma coluna com ao menos esta fração de datas (objetos de data ou texto
+# dd/mm/aaaa) continua sendo de datas mesmo com marcadores em texto ("-",
+# "N/A", "Sem data"), que viram datas ausentes. Textos com dígitos não são
+# tratados como marcadores: podem ser datas digitadas errado.
+DATE_COLUMN_MIN_RATIO = 0.5
+
+
+def _is_date(value) -> bool:
+    return isinstance(value, (datetime, date))
+
+
+def _as_text(value) -> str:
+    if _is_date(value):
+        return value.strftime(DATE_FORMAT)
+    return str(value)
+
+
+def _as_date_column(column: pd.Series, values: pd.Series, kinds: set):
+    # A coluna como datas, ou None se ela não for uma coluna de datas
+    if not all(issubclass(kind, (datetime, date, str)) for kind in kinds):
+        return None
+    is_text = values.map(type) == str
+    texts = values[is_text]
+    parsed = pd.to_datetime(texts, format=DATE_FORMAT, errors="coerce")
+    placeholders = texts[parsed.isna()]
+    date_count = len(values) - len(placeholders)
+    if date_count == 0 or date_count < len(values) * DATE_COLUMN_MIN_RATIO:
+        return None
+    if placeholders.str.contains(r"\d").any():
+        return None
+    converted = column.astype(object)
+    converted[texts.index] = parsed.astype(object)
+    return pd.to_datetime(converted)
+
+
+def convert_column(column: pd.Series) -> pd.Series:
+    values = column.dropna()
+    if values.empty:
+        return column.astype("string")
+
+    kinds = set(map(type, values))
+    if all(issubclass(kind, (datetime, date)) for kind in kinds):
+        return pd.to_datetime(column)
+    # Datas, também digitadas como texto no padrão dd/mm/aaaa, com ou sem
+    # marcadores no lugar das que faltam
+    if str in kinds:
+        dates = _as_date_column(column, values, kinds)
+        if dates is not None:
+            return dates
+
+    if all(issubclass(kind, numbers.Real) and kind is not bool for kind in kinds):
+        if all(issubclass(kind, numbers.Integral) for kind in kinds):
+            return column.astype("Int64")
+        return column.astype("float64")
+
+    # Texto (ou mistura de tipos): mesma representação usada na planilha
+    text = column.map(_as_text, na_action="ignore")
+    unique_count = text.nunique()
+    if (
+        unique_count <= CATEGORY_MAX_UNIQUE
+        and unique_count <= max(1, len(text) * CATEGORY_MAX_UNIQUE_RATIO)
+    ):
+        return text.astype("category")
+    return text.astype("string")
+
+
+def convert_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    # Converte coluna a coluna por posição (os nomes podem se repetir)
+    converted = {i: convert_column(df.iloc[:, i]) for i in range(df.shape[1])}
+    result = pd.DataFrame(converted, index=df.index)
+    result.columns = df.columns
+    return result
@@ -0,0 +1,89 @@
+# src/core/date_index.py
+
+import numpy as np
+import pandas as pd
+
+from core.profiling import profiler
+
+
+class Date_Index:
+    # Índice por aba da coluna de data: valores ordenados (datetime64) e as
+    # posições das linhas correspondentes. Montado uma vez, na carga dos dados.
+    # 'read_sheet(aba)' lê cada aba (ex.: com cancelamento, pelo Filter_Engine).
+    def __init__(self, data_by_sheet: dict[str, pd.DataFrame], date_column: str, read_sheet=None):
+        self.data_by_sheet = data_by_sheet
+        self.date_column = date_column
+        self.sorted_dates = {}
+        self.positions = {}
+        read_sheet = read_sheet or data_by_sheet.__getitem__
+        for sheet_name in data_by_sheet:
+            self._index_sheet(sheet_name, read_sheet(sheet_name))
+
+    def _index_sheet(self, sheet_name: str, df_sheet: pd.DataFrame):
+        if self.date_column not in df_sheet.columns:
+            return
+        date_col = df_sheet[self.date_column]
+        if not pd.api.types.is_datetime64_any_dtype(date_col):
+            date_col = pd.to_datetime(date_col, format="%d/%m/%Y", errors="coerce")
+        dates = date_col.to_numpy(dtype="datetime64[ns]")
+
+        # Linhas sem data ficam fora do índice (como no filtro original)
+        valid_rows = np.flatnonzero(~np.isnat(dates))
+        order = np.argsort(dates[valid_rows], kind="stable")
+        self.positions[sheet_name] = valid_rows[order]
+        self.sorted_dates[sheet_name] = dates[valid_rows][order]
+
+    def is_current(self, data_by_sheet: dict[str, pd.DataFrame]) -> bool:
+        return data_by_sheet is self.data_by_sheet
+
+    def sheet_range(self, sheet_name: str, start: pd.Timestamp, end: pd.Timestamp):
+        # Busca binária: as linhas do intervalo formam uma fatia contínua.
+        # 'end' é inclusivo para o dia inteiro.
+        dates = self.sorted_dates.get(sheet_name)
+        if dates is None:
+            return None, None
+        lo = np.searchsorted(dates, np.datetime64(start, "ns"), side="left")
+        hi = np.searchsorted(
+            dates, np.datetime64(end + pd.Timedelta(days=1), "ns"), side="left"
+        )
+        return dates[lo:hi], self.positions[sheet_name][lo:hi]
+
+    def filter(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        with profiler.stage("filtro por data") as stage:
+            filtered_df = self._filter(start, end)
+            stage.rows = len(filtered_df)
+        return filtered_df
+
+    def _filter(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        dates_per_sheet = []
+        rows_per_sheet = []
+        for sheet_name, df_sheet in self.data_by_sheet.items():
+            dates, positions = self.sheet_range(sheet_name, start, end)
+            if dates is None or len(dates) == 0:
+                continue
+            dates_per_sheet.append(dates)
+            rows_per_sheet.append(df_sheet.iloc[positions])
+        return merge_by_date(dates_per_sheet, rows_per_sheet)
+
+    def sorted_rows(self, sheet_name: str, mask: np.ndarray):
+        # Datas e posições, em ordem de data, das linhas marcadas em 'mask'
+        dates = self.sorted_dates.get(sheet_name)
+        if dates is None:
+            return None, None
+        positions = self.positions[sheet_name]
+        selected = mask[positions]
+        return dates[selected], positions[selected]
+
+
+def merge_by_date(dates_per_sheet: list, rows_per_sheet: list) -> pd.DataFrame:
+    # Junta as fatias das abas (cada uma já ordenada por data) num único
+    # DataFrame em ordem de data
+    if not rows_per_sheet:
+        return pd.DataFrame()
+
+    # Intercalação k-way das fatias: o sort estável (timsort) detecta as k
+    # sequências ordenadas e apenas as intercala, mantendo a ordem das abas em
+    # caso de empate.
+    merge_order = np.argsort(np.concatenate(dates_per_sheet), kind="stable")
+    combined = pd.concat(rows_per_sheet, ignore_index=True)
+    return combined.take(merge_order).reset_index(drop=True)
@@ -0,0 +1,143 @@
+# src/core/discipline_classifier.py
+
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
+
+from config.settings import (
+    ANTT_DISCIPLINES_TYPES,
+    ARTESP_FILE_GROUPED_TYPES,
+    DISCIPLINE_COLUMN,
+    DOCUMENT_CODE_COLUMN_KEYWORDS,
+)
+from core.sheet_store import insert_column
+
+DISCIPLINE_TABLES = {
+    "ANTT_DISCIPLINES_TYPES": ANTT_DISCIPLINES_TYPES,
+    "ARTESP_FILE_GROUPED_TYPES": ARTESP_FILE_GROUPED_TYPES,
+}
+
+# Separador usado quando um código pertence a mais de uma disciplina
+MULTIPLE_DISCIPLINES_SEPARATOR = " / "
+
+
+def find_table_conflicts(tables: dict = None) -> list[str]:
+    # Disciplinas repetidas no próprio settings.py são conferidas por
+    # benchmarks/check_settings.py, que lê o código-fonte
+    tables = DISCIPLINE_TABLES if tables is None else tables
+    conflicts = []
+
+    for table_name, table in tables.items():
+        disciplines_by_code = {}
+        for discipline, codes in table.items():
+            for code in codes:
+                if code != code.upper():
+                    conflicts.append(
+                        f"{table_name}: código '{code}' ({discipline}) fora do padrão "
+                        f"maiúsculo; tratado como '{code.upper()}'"
+                    )
+                disciplines_by_code.setdefault(code.upper(), []).append(discipline)
+        for code, disciplines in disciplines_by_code.items():
+            if len(disciplines) > 1:
+                conflicts.append(
+                    f"{table_name}: código '{code}' aparece em várias disciplinas: "
+                    + ", ".join(disciplines)
+                )
+    return conflicts
+
+
+def report_table_conflicts(tables: dict = None) -> list[str]:
+    # Avisos das tabelas de disciplinas. Chamado uma vez, por quem inicia a
+    # aplicação ou o modo em lote, e não a cada classificador criado: os
+    # processos de leitura também criam o seu
+    conflicts = find_table_conflicts(tables)
+    for conflict in conflicts:
+        print(f"Aviso (tabela de disciplinas): {conflict}")
+    return conflicts
+
+
+def find_document_code_column(df: pd.DataFrame):
+    def fold(text) -> str:
+        text = unicodedata.normalize("NFKD", str(text).upper())
+        return "".join(c for c in text if not unicodedata.combining(c))
+
+    folded_columns = [(col, fold(col)) for col in df.columns]
+    for keyword in DOCUMENT_CODE_COLUMN_KEYWORDS:
+        folded_keyword = fold(keyword)
+        for col, folded in folded_columns:
+            if folded_keyword in folded:
+                return col
+    return None
+
+
+class Discipline_Classifier:
+    # Compila as tabelas de códigos uma única vez num índice reverso
+    # código -> disciplina(s) e numa única expressão regular com todos os códigos.
+    def __init__(self, tables: dict = None):
+        tables = DISCIPLINE_TABLES if tables is None else tables
+
+        disciplines_by_code = {}
+        for table in tables.values():
+            for discipline, codes in table.items():
+                for code in codes:
+                    found = disciplines_by_code.setdefault(code.upper(), [])
+                    if discipline not in found:
+                        found.append(discipline)
+        self.disciplines_by_code = {
+            code: tuple(disciplines) for code, disciplines in disciplines_by_code.items()
+        }
+        self.label_by_code = {
+            code: MULTIPLE_DISCIPLINES_SEPARATOR.join(disciplines)
+            for code, disciplines in self.disciplines_by_code.items()
+        }
+
+        # Uma única expressão com os códigos agrupados pela primeira letra (o
+        # motor de regex decide o ramo por ela) e delimitados por caracteres que
+        # não sejam letras/dígitos: 'H1' não casa dentro de 'H10' nem de 'PH1'
+        suffixes_by_prefix = {}
+        for code in self.label_by_code:
+            suffixes_by_prefix.setdefault(code[0], []).append(code[1:])
+        alternatives = "|".join(
+            re.escape(prefix)
+            + "(?:"
+            + "|".join(re.escape(s) for s in sorted(suffixes, key=len, reverse=True))
+            + ")"
+            for prefix, suffixes in sorted(suffixes_by_prefix.items())
+        )
+        self.pattern = re.compile(f"(?<![A-Z0-9])({alternatives})(?![A-Z0-9])")
+
+    def classify(self, document_codes: pd.Series) -> pd.Series:
+        # Trabalha sobre os valores distintos (categorias) e depois espalha o
+        # resultado pelas linhas usando os códigos inteiros da categoria
+        categorical = document_codes.astype("category").cat
+        categories = pd.Series(categorical.categories.astype(str), dtype="string")
+        found = categories.str.upper().str.extract(self.pattern, expand=False)
+        # Posição extra no fim para as linhas sem código (cat.codes == -1)
+        label_by_category = np.append(
+            found.map(self.label_by_code).to_numpy(dtype=object), None
+        )
+        labels = label_by_category[categorical.codes.to_numpy()]
+        return pd.Series(labels, index=document_codes.index, dtype="category")
+
+    def classify_sheets(self, data_by_sheet: dict[str, pd.DataFrame], code_column=None):
+        for sheet_name, df_sheet in data_by_sheet.items():
+            column = code_column if code_column is not None else find_document_code_column(df_sheet)
+            if column is None or column not in df_sheet.columns:
+                continue
+            if DISCIPLINE_COLUMN in df_sheet.columns:
+                print(f"Página '{sheet_name}' já tem a coluna '{DISCIPLINE_COLUMN}'.")
+                continue
+            insert_column(data_by_sheet, sheet_name, DISCIPLINE_COLUMN, self.classify(df_sheet[column]))
+        return data_by_sheet
+
+
+_default_classifier = None
+
+
+def get_default_classifier() -> Discipline_Classifier:
+    # As tabelas são compiladas uma única vez por processo
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = Discipline_Classifier()
+    return _default_classifier
@@ -1,38 +1,209 @@
 # src/core/excel_reader.py
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import pandas as pd
-import openpyxl
-from datetime import datetime
+
+from core.column_types import convert_column_types
+from core.header_detection import (
+    DEFAULT_GROUP_ROW,
+    DEFAULT_HEADER_ROW,
+    HEADER_SEARCH_ROWS,
+    Header_Layout,
+    detect_header_layout,
+    get_default_schema_cache,
+)
+from core.profiling import profiler
+from core.reader_backends import open_workbook
+
+# Versão do formato das abas produzidas pelo leitor. Deve ser incrementada
+# sempre que a saída mudar, para invalidar as entradas do cache em disco.
+PARSER_VERSION = 7
+
+# Quantidade de linhas convertidas por bloco no modo streaming. Mantém o uso de
+# memória intermediário limitado, independente do tamanho da planilha.
+STREAM_CHUNK_SIZE = 5000
+
+# Linhas vazias seguidas que encerram a leitura de uma aba. A formatação das
+# planilhas dos clientes costuma estender a dimensão declarada a milhares de
+# linhas sem dados depois da última linha real. Com 0, lê até o fim.
+MAX_EMPTY_ROW_RUN = 1000
+
+
+class Load_Cancelled(Exception):
+    # Levantada quando 'should_cancel' pede a interrupção da leitura
+    pass
+
+
+def _normalize_cell_value(value):
+    # Os valores mantêm o tipo nativo; células vazias (None ou "") viram None.
+    # A formatação para exibição fica a cargo da interface.
+    return None if value == "" else value
+
+
+def _read_sheet_in_worker(
+    file_path: str,
+    sheet_name: str,
+    chunk_size: int,
+    max_empty_rows: int = MAX_EMPTY_ROW_RUN,
+    backend: str = None,
+    profile: bool = False,
+):
+    # Executado em outro processo: cada worker abre o arquivo por conta própria
+    # (somente leitura, que carrega apenas a aba pedida) e devolve a aba já
+    # limpa. O DataFrame é serializado pelo pickle em blocos colunares. As
+    # medições do profiler voltam junto, para o processo principal.
+    if profile:
+        profiler.enable()
+    profiler.reset()
+    reader = Excel_Reader(
+        file_path,
+        streaming=True,
+        chunk_size=chunk_size,
+        max_empty_rows=max_empty_rows,
+        backend=backend,
+    )
+    reader._load_workbook()
+    if not reader.workbook:
+        return None, list(profiler.records)
+    try:
+        return reader._read_sheet_by_name(sheet_name), list(profiler.records)
+    finally:
+        reader._close_workbook()
+
+
+class Sheet_Metadata:
+    # O que se sabe de uma aba sem ler os dados: a dimensão declarada no
+    # arquivo (pode faltar ou incluir linhas só formatadas) e o cabeçalho
+    __slots__ = ("name", "max_row", "max_column", "layout")
+
+    def __init__(self, name: str, max_row, max_column, layout: Header_Layout):
+        self.name = name
+        self.max_row = max_row
+        self.max_column = max_column
+        self.layout = layout
+
+    @property
+    def header_type(self) -> str:
+        return self.layout.header_type
+
+    @property
+    def estimated_rows(self):
+        # Limite superior (linhas vazias do fim ainda contam), ou None
+        if self.max_row is None:
+            return None
+        return max(0, self.max_row - self.layout.header_row)
 
 
 class Excel_Reader:
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        streaming: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        max_empty_rows: int = MAX_EMPTY_ROW_RUN,
+        workers: int = 1,
+        cache=None,
+        schema_cache=None,
+        backend: str = None,
+    ):
         self.file_path = file_path
         self.workbook = None
         self.sheet = None
+        # Modo streaming: workbook somente leitura, leitura apenas de valores
+        # e construção do DataFrame em blocos de 'chunk_size' linhas.
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        # Fim da área usada: a leitura para depois de tantas linhas vazias seguidas
+        self.max_empty_rows = max_empty_rows
+        # Com mais de um worker, as abas são distribuídas entre processos
+        self.workers = max(1, workers or 1)
+        # Cache opcional (Workbook_Cache) das abas já processadas
+        self.cache = cache
+        # Layouts de cabeçalho já detectados (Schema_Cache); por padrão, o do processo
+        self.schema_cache = schema_cache if schema_cache is not None else get_default_schema_cache()
+        # Backend de leitura ("openpyxl", "calamine", "csv"); None escolhe pelo
+        # tipo e pelo tamanho do arquivo (ver core.reader_backends)
+        self.backend = backend
+        # Callbacks de progresso e de cancelamento (ver get_data_as_dataframe)
+        self._progress_callback = None
+        self._should_cancel = None
+        self._sheet_index = 0
+        self._sheet_count = 0
+        self._rows_read = 0
 
     def _load_workbook(self):
         try:
-            self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
+            with profiler.stage("abertura do workbook"):
+                self.workbook = open_workbook(self.file_path, self.backend, read_only=self.streaming)
         except Exception as e:
-            print(f"Erro fatal ao carregar o workbook com openpyxl: {e}")
+            print(f"Erro fatal ao carregar o workbook: {e}")
             self.workbook = None
 
+    def _close_workbook(self):
+        if self.workbook is not None:
+            self.workbook.close()
+
+    def _report_progress(self, sheet_name: str, rows_read: int):
+        if self._progress_callback is not None:
+            self._progress_callback(
+                sheet_name, self._sheet_index, self._sheet_count, rows_read
+            )
+
+    def _sheet_title(self):
+        return self.sheet.title if self.sheet is not None else None
+
+    def _check_cancelled(self):
+        if self._should_cancel is not None and self._should_cancel():
+            raise Load_Cancelled()
+
+    def _merged_ranges(self) -> list:
+        with profiler.stage("varredura de mesclagens", sheet=self.sheet.title):
+            return list(self.sheet.merged_ranges())
+
     def _get_header_type(self) -> str:
+        # Modelo padrão: dois níveis quando há células mescladas na linha 13
         if not self.sheet:
             return None
         has_merged_cells_on_row_13 = any(
-            cell_range.min_row == 13 or cell_range.max_row == 13
-            for cell_range in self.sheet.merged_cells.ranges
+            min_row == DEFAULT_GROUP_ROW or max_row == DEFAULT_GROUP_ROW
+            for _, min_row, _, max_row in self._merged_ranges()
         )
         return "multilevel" if has_merged_cells_on_row_13 else "single"
 
-    def _get_clean_headers(self, header_type: str) -> list:
-        if not self.sheet:
-            return None
+    def _read_top_rows(self) -> list:
+        return list(self.sheet.iter_rows(min_row=1, max_row=HEADER_SEARCH_ROWS))
+
+    def _get_header_layout(self, top_rows: list) -> Header_Layout:
+        # Abas do mesmo modelo (mesmo nome e mesmo cabeçalho) já vistas não
+        # passam pela detecção nem, a não ser que o layout dependa delas, pela
+        # varredura das mesclagens
+        layout = self.schema_cache.get(self.sheet.title, top_rows, merged_ranges=self._merged_ranges)
+        if layout is not None:
+            return layout
+
+        with profiler.stage("detecção do cabeçalho", sheet=self.sheet.title):
+            layout = detect_header_layout(top_rows, merged_ranges=self._merged_ranges)
+            if layout is None:
+                # Nada parecido com um cabeçalho no topo: linhas 13 e 14, como
+                # no modelo padrão
+                group_row = DEFAULT_GROUP_ROW if self._get_header_type() == "multilevel" else None
+                layout = Header_Layout(DEFAULT_HEADER_ROW, group_row=group_row, merge_dependent=True)
+            row_count = len(top_rows)
+            group_values = (
+                list(top_rows[layout.group_row - 1])
+                if layout.group_row is not None and layout.group_row <= row_count
+                else []
+            )
+            header_values = (
+                list(top_rows[layout.header_row - 1]) if layout.header_row <= row_count else []
+            )
+            layout.headers = self._combine_headers(layout.header_type, group_values, header_values)
+        return self.schema_cache.put(self.sheet.title, top_rows, layout)
+
+    def _combine_headers(self, header_type: str, row_13: list, row_14: list) -> list:
         if header_type == "multilevel":
-            headers_l1_raw = [cell.value for cell in self.sheet[13]]
-            headers_l2 = [cell.value for cell in self.sheet[14]]
+            headers_l1_raw = row_13
+            headers_l2 = row_14
             combined_headers = []
             num_columns = max(len(headers_l1_raw), len(headers_l2))
             for i in range(num_columns):
@@ -46,69 +217,298 @@ class Excel_Reader:
                     combined_headers.append(final_h2)
             return combined_headers
         else:  # 'single'
-            return [cell.value for cell in self.sheet[14]]
+            return list(row_14)
 
-    def get_data_as_dataframe(self, date_column_name: str) -> dict[str, pd.DataFrame]:
-        self._load_workbook()
-        if not self.workbook:
-            return {}
+    def _get_clean_headers(self, layout: Header_Layout) -> list:
+        if not self.sheet or layout.headers is None:
+            return None
+        return list(layout.headers)
 
-        all_sheets_data = {}
+    def _clean_dataframe(self, df_sheet: pd.DataFrame) -> pd.DataFrame:
+        # --- A LÓGICA DE LIMPEZA CONTINUA A MESMA ---
+        with profiler.stage("limpeza", sheet=self._sheet_title(), rows=len(df_sheet)):
+            df_sheet = df_sheet[df_sheet.notna().any(axis=1)]
+            if df_sheet.empty:
+                return None
 
-        for sheet_name in self.workbook.sheetnames:
-            print(f"--- Processando a página: {sheet_name} ---")
-            self.sheet = self.workbook[sheet_name]
+            is_empty_col = df_sheet.isna().all()
+            if is_empty_col.any():
+                cols_to_drop = is_empty_col[is_empty_col].index
+                df_sheet = df_sheet.drop(columns=cols_to_drop)
 
-            if self.sheet.max_row < 15:
-                print(f"Página '{sheet_name}' ignorada por ter poucas linhas.")
-                continue
+        return self._finalize_dataframe(df_sheet)
 
-            header_type = self._get_header_type()
-            if not header_type:
-                continue
+    def _finalize_dataframe(self, df_sheet: pd.DataFrame) -> pd.DataFrame:
+        is_duplicated = df_sheet.columns.duplicated(keep="first")
+        if is_duplicated.any():
+            df_sheet = df_sheet.loc[:, ~is_duplicated]
+        # Datas, números e categorias com tipos nativos do pandas
+        with profiler.stage("tipos das colunas", sheet=self._sheet_title(), rows=len(df_sheet)):
+            return convert_column_types(df_sheet.reset_index(drop=True))
 
-            clean_headers = self._get_clean_headers(header_type)
-            if not clean_headers:
-                continue
+    def _read_sheet(self) -> pd.DataFrame:
+        with profiler.stage("cabeçalho", sheet=self.sheet.title):
+            layout = self._get_header_layout(self._read_top_rows())
+            clean_headers = self._get_clean_headers(layout)
 
-            # --- NOVA E DEFINITIVA LÓGICA DE LEITURA DE DADOS ---
-            all_rows_data = []
-            # Itera sobre as linhas da planilha, começando da linha 15
-            for row in self.sheet.iter_rows(min_row=15):
-                processed_row = []
-                for cell in row:
-                    # Verifica se o valor da célula é um objeto de data do Python
-                    if isinstance(cell.value, datetime):
-                        # Se for, formata para o nosso padrão de string
-                        processed_row.append(cell.value.strftime("%d/%m/%Y"))
-                    else:
-                        # Se não, apenas converte para string, tratando células vazias (None)
-                        processed_row.append(
-                            str(cell.value) if cell.value is not None else ""
-                        )
+        if self.sheet.max_row is not None and self.sheet.max_row < layout.data_start_row:
+            print(f"Página '{self.sheet.title}' ignorada por ter poucas linhas.")
+            return None
+        if not clean_headers:
+            return None
+
+        # --- NOVA E DEFINITIVA LÓGICA DE LEITURA DE DADOS ---
+        all_rows_data = []
+        width = 0
+        # Itera sobre as linhas da planilha, começando logo abaixo do cabeçalho
+        with profiler.stage("conversão de linhas", sheet=self.sheet.title) as stage:
+            rows = self.sheet.iter_rows(min_row=layout.data_start_row)
+            for processed_row in self._used_rows(rows):
+                width = max(width, len(processed_row))
                 all_rows_data.append(processed_row)
+            stage.rows = self._rows_read
 
-            if not all_rows_data:
-                continue
+        if not all_rows_data:
+            return None
 
-            # Cria o DataFrame a partir dos dados já processados e formatados
-            df_sheet = pd.DataFrame(all_rows_data, columns=clean_headers)
+        # Cria o DataFrame a partir dos dados já processados e formatados, só
+        # com as colunas até a última preenchida
+        width = max(width, len(clean_headers))
+        for processed_row in all_rows_data:
+            processed_row.extend([None] * (width - len(processed_row)))
+        clean_headers = clean_headers + [None] * (width - len(clean_headers))
+        with profiler.stage("montagem do DataFrame", sheet=self.sheet.title, rows=len(all_rows_data)):
+            df_sheet = pd.DataFrame(all_rows_data, columns=clean_headers, dtype=object)
+        return self._clean_dataframe(df_sheet)
 
-            # --- A LÓGICA DE LIMPEZA CONTINUA A MESMA ---
-            df_sheet = df_sheet[~(df_sheet == "").all(axis=1)]
-            if df_sheet.empty:
+    def _used_rows(self, rows):
+        # Linhas da área usada, já normalizadas e sem as células vazias do fim
+        # (colunas só formatadas). Linhas vazias são puladas, e uma sequência
+        # de 'max_empty_rows' delas encerra a aba. '_rows_read' conta as
+        # linhas percorridas, vazias inclusive.
+        self._rows_read = 0
+        empty_run = 0
+        for row in rows:
+            self._rows_read += 1
+            if self._rows_read % self.chunk_size == 0:
+                self._check_cancelled()
+                self._report_progress(self.sheet.title, self._rows_read)
+            end = len(row)
+            while end and row[end - 1] is None:
+                end -= 1
+            processed_row = [_normalize_cell_value(value) for value in row[:end]]
+            while processed_row and processed_row[-1] is None:
+                processed_row.pop()
+            if processed_row:
+                empty_run = 0
+                yield processed_row
                 continue
+            empty_run += 1
+            if self.max_empty_rows and empty_run >= self.max_empty_rows:
+                return
 
-            is_empty_col = (df_sheet == "").all()
-            if is_empty_col.any():
-                cols_to_drop = is_empty_col[is_empty_col].index
-                df_sheet.drop(columns=cols_to_drop, inplace=True)
+    def _read_sheet_streaming(self) -> pd.DataFrame:
+        # A largura vem das próprias linhas (até a última célula preenchida):
+        # a dimensão declarada não é usada, nem calculada quando falta
+        with profiler.stage("cabeçalho", sheet=self.sheet.title):
+            layout = self._get_header_layout(self._read_top_rows())
+            clean_headers = self._get_clean_headers(layout) or []
+        if not clean_headers:
+            return None
+        rows = self.sheet.iter_rows(min_row=layout.data_start_row)
+
+        chunks = []
+        buffer = []
+        width = 0
+        non_empty_columns = []
+        # A montagem dos blocos é medida à parte, dentro desta etapa
+        with profiler.stage("conversão de linhas", sheet=self.sheet.title) as stage:
+            for processed_row in self._used_rows(rows):
+                width = max(width, len(processed_row))
+                buffer.append(processed_row)
+                if len(buffer) >= self.chunk_size:
+                    chunks.append(self._build_chunk(buffer, width, non_empty_columns))
+                    buffer = []
+            if buffer:
+                chunks.append(self._build_chunk(buffer, width, non_empty_columns))
+            stage.rows = self._rows_read
+
+        if not self._rows_read:
+            print(f"Página '{self.sheet.title}' ignorada por ter poucas linhas.")
+            return None
+        if not chunks:
+            return None
+
+        with profiler.stage("montagem do DataFrame", sheet=self.sheet.title):
+            # Blocos lidos antes da linha mais larga ganham as colunas que faltam
+            for chunk in chunks:
+                for column in range(chunk.shape[1], width):
+                    chunk[column] = None
+            df_sheet = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+            df_sheet.columns = (clean_headers + [None] * width)[:width]
+
+        # Mesma regra do modo completo: remove (por nome) as colunas vazias
+        with profiler.stage("limpeza", sheet=self.sheet.title, rows=len(df_sheet)):
+            if not all(non_empty_columns):
+                cols_to_drop = df_sheet.columns[[not flag for flag in non_empty_columns]]
+                df_sheet = df_sheet.drop(columns=cols_to_drop)
+
+        return self._finalize_dataframe(df_sheet)
+
+    def _build_chunk(self, buffer: list, width: int, non_empty_columns: list) -> pd.DataFrame:
+        with profiler.stage("montagem do DataFrame", sheet=self.sheet.title, rows=len(buffer)):
+            for processed_row in buffer:
+                processed_row.extend([None] * (width - len(processed_row)))
+            chunk = pd.DataFrame(buffer, columns=range(width), dtype=object)
+            non_empty_columns.extend([False] * (width - len(non_empty_columns)))
+            for i, has_value in enumerate(chunk.notna().any().tolist()):
+                if has_value:
+                    non_empty_columns[i] = True
+        return chunk
+
+    def _read_sheet_by_name(self, sheet_name: str) -> pd.DataFrame:
+        print(f"--- Processando a página: {sheet_name} ---")
+        self._check_cancelled()
+        self._report_progress(sheet_name, 0)
+        self.sheet = self.workbook[sheet_name]
+        with profiler.stage("leitura da aba (total)", sheet=sheet_name):
+            if self.streaming:
+                return self._read_sheet_streaming()
+            return self._read_sheet()
+
+    def _get_data_in_parallel(self) -> dict[str, pd.DataFrame]:
+        # Só precisamos dos nomes das abas aqui; o parse fica com os workers
+        sheet_names = list(self.workbook.sheetnames)
+        self._close_workbook()
+
+        max_workers = min(self.workers, len(sheet_names))
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        finished = False
+        try:
+            futures = {
+                executor.submit(
+                    _read_sheet_in_worker,
+                    self.file_path,
+                    sheet_name,
+                    self.chunk_size,
+                    self.max_empty_rows,
+                    self.backend,
+                    profiler.enabled,
+                ): sheet_name
+                for sheet_name in sheet_names
+            }
+            pending = set(futures)
+            results = {}
+            while pending:
+                # Espera em intervalos curtos para poder atender ao cancelamento
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                self._check_cancelled()
+                for future in done:
+                    df_sheet, records = future.result()
+                    results[futures[future]] = df_sheet
+                    profiler.extend(records)
+                    self._sheet_index = len(results)
+                    self._report_progress(futures[future], 0)
+            finished = True
+        finally:
+            if finished:
+                executor.shutdown()
+            else:
+                # Cancelamento ou erro num worker: abas já em andamento
+                # terminam no worker; as demais nem começam
+                executor.shutdown(wait=False, cancel_futures=True)
 
-            is_duplicated = df_sheet.columns.duplicated(keep="first")
-            if is_duplicated.any():
-                cols_to_drop = df_sheet.columns[is_duplicated]
-                df_sheet = df_sheet.loc[:, ~is_duplicated]
+        # Junta os resultados na ordem original das abas
+        all_sheets_data = {}
+        for sheet_name in sheet_names:
+            if results.get(sheet_name) is not None:
+                all_sheets_data[sheet_name] = results[sheet_name]
+        return all_sheets_data
+
+    def get_sheet_metadata(self, progress_callback=None, should_cancel=None) -> dict[str, Sheet_Metadata]:
+        # Leitura rápida para a carga sob demanda: nomes das abas, dimensão e
+        # cabeçalho (só as primeiras linhas). Abas sem linhas de dados ficam de
+        # fora, como na leitura completa. O workbook (somente leitura) continua
+        # aberto para a leitura das abas; quem chama fecha com _close_workbook.
+        self._progress_callback = progress_callback
+        self._should_cancel = should_cancel
+        self.streaming = True
+        self._load_workbook()
+        if not self.workbook:
+            return {}
+        try:
+            sheet_names = list(self.workbook.sheetnames)
+            self._sheet_count = len(sheet_names)
+            metadata = {}
+            # Da última aba para a primeira: no calamine, que só guarda a
+            # última aba carregada, sobra a primeira, exibida logo depois
+            for index, sheet_name in enumerate(reversed(sheet_names)):
+                self._sheet_index = index
+                self._check_cancelled()
+                self._report_progress(sheet_name, 0)
+                self.sheet = self.workbook[sheet_name]
+                with profiler.stage("cabeçalho", sheet=sheet_name):
+                    layout = self._get_header_layout(self._read_top_rows())
+                max_row = self.sheet.max_row
+                if max_row is not None and max_row < layout.data_start_row:
+                    print(f"Página '{sheet_name}' ignorada por ter poucas linhas.")
+                    continue
+                metadata[sheet_name] = Sheet_Metadata(sheet_name, max_row, self.sheet.max_column, layout)
+            return {sheet_name: metadata[sheet_name] for sheet_name in sheet_names if sheet_name in metadata}
+        except BaseException:
+            self._close_workbook()
+            raise
+
+    def get_data_as_dataframe(
+        self,
+        date_column_name: str,
+        progress_callback=None,
+        should_cancel=None,
+    ) -> dict[str, pd.DataFrame]:
+        # progress_callback(nome_da_aba, índice_da_aba, total_de_abas, linhas_lidas)
+        # é chamado no início de cada aba e a cada bloco de linhas.
+        # should_cancel() é consultado nos mesmos pontos; se devolver True, a
+        # leitura é interrompida com Load_Cancelled.
+        self._progress_callback = progress_callback
+        self._should_cancel = should_cancel
 
-            all_sheets_data[sheet_name] = df_sheet.reset_index(drop=True)
+        if self.cache is not None:
+            cached_data = self.cache.get(self.file_path)
+            if cached_data is not None:
+                print(f"--- Abas carregadas do cache: {self.file_path} ---")
+                return cached_data
+
+        all_sheets_data = self._parse_workbook()
+        if self.cache is not None and all_sheets_data:
+            # As abas gravadas no cache voltam mapeadas do disco: os DataFrames
+            # recém-lidos são liberados e só as abas usadas ocupam memória
+            stored_data = self.cache.put(self.file_path, all_sheets_data)
+            if stored_data is not None:
+                return stored_data
+        return all_sheets_data
+
+    def _parse_workbook(self) -> dict[str, pd.DataFrame]:
+        # No modo paralelo basta abrir em somente leitura para listar as abas
+        parallel = self.workers > 1
+        if parallel:
+            self.streaming = True
+        self._load_workbook()
+        if not self.workbook:
+            return {}
+
+        self._sheet_count = len(self.workbook.sheetnames)
+        if parallel and self._sheet_count > 1:
+            return self._get_data_in_parallel()
+
+        all_sheets_data = {}
+
+        try:
+            for index, sheet_name in enumerate(self.workbook.sheetnames):
+                self._sheet_index = index
+                df_sheet = self._read_sheet_by_name(sheet_name)
+                if df_sheet is not None:
+                    all_sheets_data[sheet_name] = df_sheet
+        finally:
+            self._close_workbook()
 
         return all_sheets_data
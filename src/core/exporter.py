@@ -0,0 +1,233 @@
+# src/core/exporter.py
+
+import os
+import re
+from datetime import datetime
+import pandas as pd
+
+from core.column_types import DATE_FORMAT
+from core.sheet_store import Sheet_Store
+
+EXPORT_FORMATS = ("xlsx", "csv", "parquet")
+EXPORT_CHUNK_SIZE = 5000
+# Formato de data das células no XLSX (equivale a dd/mm/aaaa)
+XLSX_DATE_FORMAT = "DD/MM/YYYY"
+
+# Caracteres que o Excel não aceita em nomes de planilha
+_INVALID_SHEET_TITLE_CHARS = re.compile(r"[\\/*?:\[\]]")
+_MAX_SHEET_TITLE_LENGTH = 31
+
+
+class Export_Cancelled(Exception):
+    pass
+
+
+def format_from_path(output_path: str) -> str:
+    return os.path.splitext(output_path)[1].lstrip(".").lower()
+
+
+def _header_label(label) -> str:
+    # Nomes de coluna como aparecem na tabela (datas em dd/mm/aaaa)
+    if label is None:
+        return ""
+    if isinstance(label, datetime):
+        return label.strftime(DATE_FORMAT)
+    return str(label)
+
+
+def _sheet_title(sheet_name, used_titles: set) -> str:
+    title = _INVALID_SHEET_TITLE_CHARS.sub("_", str(sheet_name))[:_MAX_SHEET_TITLE_LENGTH] or "Planilha"
+    base, suffix = title, 2
+    while title.lower() in used_titles:
+        tail = f" ({suffix})"
+        title = base[: _MAX_SHEET_TITLE_LENGTH - len(tail)] + tail
+        suffix += 1
+    used_titles.add(title.lower())
+    return title
+
+
+class _Progress:
+    # Repassa o total de linhas gravadas e verifica o cancelamento entre blocos
+    def __init__(self, total_rows: int, progress_callback=None, should_cancel=None):
+        self.total_rows = total_rows
+        self.rows_written = 0
+        self.progress_callback = progress_callback
+        self.should_cancel = should_cancel
+
+    def advance(self, rows: int):
+        if self.should_cancel is not None and self.should_cancel():
+            raise Export_Cancelled()
+        self.rows_written += rows
+        # O total das abas ainda não lidas é estimado e pode ficar abaixo do real
+        self.total_rows = max(self.total_rows, self.rows_written)
+        if self.progress_callback is not None:
+            self.progress_callback(self.rows_written, self.total_rows)
+
+
+def _iter_chunks(df: pd.DataFrame, chunk_size: int):
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def _write_xlsx_sheet(workbook, title: str, df: pd.DataFrame, chunk_size: int, progress):
+    from openpyxl.cell import WriteOnlyCell
+
+    worksheet = workbook.create_sheet(title=title)
+    worksheet.append([_header_label(label) for label in df.columns])
+    date_columns = [pd.api.types.is_datetime64_any_dtype(df.iloc[:, i]) for i in range(df.shape[1])]
+
+    def date_cell(value):
+        if value is None:
+            return None
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.number_format = XLSX_DATE_FORMAT
+        return cell
+
+    for chunk in _iter_chunks(df, chunk_size):
+        columns = []
+        for i, is_date in enumerate(date_columns):
+            values = chunk.iloc[:, i].astype(object).where(chunk.iloc[:, i].notna(), None)
+            if is_date:
+                columns.append([date_cell(None if v is None else v.to_pydatetime()) for v in values])
+            else:
+                columns.append(values.tolist())
+        for row in zip(*columns):
+            worksheet.append(row)
+        progress.advance(len(chunk))
+
+
+def _write_xlsx(output_path: str, frames: dict, chunk_size: int, progress):
+    from openpyxl import Workbook
+
+    # Modo write-only: as linhas vão direto para o arquivo, sem manter as
+    # células em memória
+    workbook = Workbook(write_only=True)
+    used_titles = set()
+    for sheet_name, df in frames.items():
+        _write_xlsx_sheet(workbook, _sheet_title(sheet_name, used_titles), df, chunk_size, progress)
+    workbook.save(output_path)
+
+
+def _write_csv(output_path: str, df: pd.DataFrame, chunk_size: int, progress, sep: str):
+    header = [_header_label(label) for label in df.columns]
+    # Com BOM: o Excel abre o CSV em UTF-8 (acentos) em vez da página de código local
+    with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
+        pd.DataFrame(columns=header).to_csv(f, index=False, sep=sep)
+        for chunk in _iter_chunks(df, chunk_size):
+            chunk.to_csv(f, index=False, header=False, sep=sep, date_format=DATE_FORMAT)
+            progress.advance(len(chunk))
+
+
+def _is_object_column(column: pd.Series) -> bool:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return pd.api.types.is_object_dtype(column.cat.categories.dtype)
+    return pd.api.types.is_object_dtype(column.dtype)
+
+
+def _as_text(column: pd.Series) -> pd.Series:
+    # Valores como aparecem na tabela (datas em dd/mm/aaaa); ausentes seguem ausentes
+    values = column.astype(object)
+    return values.map(_header_label, na_action="ignore").where(values.notna(), None)
+
+
+def _write_parquet(output_path: str, df: pd.DataFrame, chunk_size: int, progress):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # O Parquet só aceita nomes de coluna em texto; as datas seguem tipadas
+    renamed = df.set_axis([_header_label(label) for label in df.columns], axis=1)
+    # Colunas 'object' podem misturar tipos (ex.: datas e textos) ou só ter
+    # ausentes no primeiro bloco: vão como texto, com o tipo fixado no esquema
+    # para todos os blocos
+    text_columns = [i for i in range(renamed.shape[1]) if _is_object_column(renamed.iloc[:, i])]
+
+    def prepared(chunk: pd.DataFrame) -> pd.DataFrame:
+        if text_columns:
+            chunk = chunk.copy(deep=False)
+            for i in text_columns:
+                chunk.isetitem(i, _as_text(chunk.iloc[:, i]))
+        return chunk
+
+    schema = pa.Schema.from_pandas(prepared(renamed.iloc[:chunk_size]), preserve_index=False)
+    for i in text_columns:
+        schema = schema.set(i, pa.field(schema.field(i).name, pa.string()))
+    with pq.ParquetWriter(output_path, schema) as writer:
+        if renamed.empty:
+            writer.write_table(schema.empty_table())
+        for chunk in _iter_chunks(renamed, chunk_size):
+            table = pa.Table.from_pandas(prepared(chunk), schema=schema, preserve_index=False)
+            writer.write_table(table)
+            progress.advance(len(chunk))
+
+
+def _split_path(output_path: str, sheet_name) -> str:
+    root, extension = os.path.splitext(output_path)
+    safe_name = _INVALID_SHEET_TITLE_CHARS.sub("_", str(sheet_name))
+    return f"{root}_{safe_name}{extension}"
+
+
+def _row_count(frames, sheet_name) -> int:
+    # Num Sheet_Store, sem ler a aba: as linhas gravadas em Arrow ou, nas abas
+    # ainda não lidas (carga sob demanda), a estimativa da dimensão declarada,
+    # que pode faltar
+    if isinstance(frames, Sheet_Store):
+        return frames.row_count(sheet_name) or 0
+    return len(frames[sheet_name])
+
+
+def export_sheets(
+    frames: dict[str, pd.DataFrame],
+    output_path: str,
+    output_format: str = None,
+    sep: str = ";",
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    progress_callback=None,
+    should_cancel=None,
+) -> list[str]:
+    # Grava em blocos de 'chunk_size' linhas. No XLSX cada DataFrame vira uma
+    # planilha do mesmo arquivo; em CSV/Parquet, com mais de um DataFrame, cada
+    # um vai para '<saida>_<aba>.<ext>'. Os arquivos são gravados com nome
+    # temporário e só aparecem completos; em caso de cancelamento
+    # (Export_Cancelled) ou erro nada fica pela metade. Cada aba é lida só
+    # quando chega a sua vez de ser gravada.
+    # progress_callback(linhas_gravadas, total_de_linhas)
+    output_format = output_format or format_from_path(output_path)
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação desconhecido: '{output_format}'")
+    progress = _Progress(
+        sum(_row_count(frames, name) for name in frames), progress_callback, should_cancel
+    )
+
+    # (arquivo, aba); no XLSX, None: todas as abas no mesmo arquivo
+    if output_format == "xlsx":
+        targets = [(output_path, None)]
+    elif len(frames) == 1:
+        targets = [(output_path, next(iter(frames)))]
+    else:
+        targets = [(_split_path(output_path, name), name) for name in frames]
+
+    written = []
+    try:
+        for path, sheet_name in targets:
+            tmp_path = f"{path}.tmp-{os.getpid()}"
+            written.append(tmp_path)
+            if output_format == "xlsx":
+                _write_xlsx(tmp_path, frames, chunk_size, progress)
+            elif output_format == "csv":
+                _write_csv(tmp_path, frames[sheet_name], chunk_size, progress, sep)
+            else:
+                _write_parquet(tmp_path, frames[sheet_name], chunk_size, progress)
+    except BaseException:
+        for tmp_path in written:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+
+    for (path, _), tmp_path in zip(targets, written):
+        os.replace(tmp_path, path)
+    return [path for path, _ in targets]
+
+
+def export_dataframe(df: pd.DataFrame, output_path: str, output_format: str = None, **kwargs) -> str:
+    # Resultado filtrado (um único DataFrame) num único arquivo
+    return export_sheets({"Resultado": df}, output_path, output_format, **kwargs)[0]
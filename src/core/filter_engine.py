@@ -0,0 +1,344 @@
+# src/core/filter_engine.py
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+from core.date_index import Date_Index, merge_by_date
+from core.profiling import profiler
+from core.sheet_store import Sheet_Store
+
+# Nome usado na interface para filtrar pela aba carregada (chave de data_by_sheet)
+SHEET_FILTER_LABEL = "Página"
+# Colunas com mais valores distintos que isso não aparecem na lista de filtros
+MAX_FILTER_VALUES = 200
+
+
+class Filter_Cancelled(Exception):
+    # Levantada quando 'should_cancel' pede a interrupção de uma consulta
+    pass
+
+
+class Criterion:
+    # Um critério do filtro. 'key' identifica a máscara no cache do motor:
+    # o mesmo critério numa mesma aba é calculado uma única vez.
+    __slots__ = ("kind", "column", "values", "key")
+
+    def __init__(self, kind: str, column=None, values: tuple = ()):
+        self.kind = kind
+        self.column = column
+        self.values = tuple(values)
+        self.key = (kind, column, self.values)
+
+    @classmethod
+    def equals(cls, column, *values):
+        # Coluna igual a qualquer um dos valores
+        return cls("values", column, values)
+
+    @classmethod
+    def sheets(cls, *sheet_names):
+        return cls("sheets", None, sheet_names)
+
+    @classmethod
+    def date_range(cls, start: pd.Timestamp, end: pd.Timestamp):
+        # Sobre a coluna do índice de datas; 'end' inclui o dia inteiro
+        return cls("date_range", None, (pd.Timestamp(start), pd.Timestamp(end)))
+
+    @classmethod
+    def text(cls, query: str):
+        # Busca textual (ver Search_Index)
+        return cls("text", None, (query,))
+
+    def describe(self) -> str:
+        if self.kind == "values":
+            return f"{self.column} = " + " ou ".join(str(value) for value in self.values)
+        if self.kind == "sheets":
+            return f"{SHEET_FILTER_LABEL} = " + " ou ".join(self.values)
+        if self.kind == "date_range":
+            start, end = self.values
+            return f"{start:%d/%m/%Y} a {end:%d/%m/%Y}"
+        return f'"{self.values[0]}"'
+
+    def __repr__(self):
+        return f"Criterion({self.describe()})"
+
+
+class Query:
+    # Combinação de critérios (ou de outras Query) com E ("and") ou OU ("or")
+    __slots__ = ("mode", "children")
+
+    def __init__(self, mode: str = "and", children: list = ()):
+        if mode not in ("and", "or"):
+            raise ValueError(f"Modo de combinação desconhecido: {mode}")
+        self.mode = mode
+        self.children = list(children)
+
+    def key(self) -> tuple:
+        # Identifica a consulta pelo conteúdo (ex.: para não repetir a mesma)
+        return (
+            self.mode,
+            tuple(child.key() if isinstance(child, Query) else child.key for child in self.children),
+        )
+
+    def criteria(self):
+        for child in self.children:
+            if isinstance(child, Query):
+                yield from child.criteria()
+            else:
+                yield child
+
+
+class Filter_Engine:
+    # Cada critério vira uma máscara booleana por aba, calculada uma vez e
+    # guardada por (aba, critério). Consultas combinam as máscaras guardadas;
+    # ao refinar um filtro só o critério novo é calculado.
+    def __init__(
+        self,
+        data_by_sheet: dict[str, pd.DataFrame],
+        date_column: str,
+        date_index: Date_Index = None,
+        search_index=None,
+        max_cached_masks: int = 512,
+        previous_search_index=None,
+    ):
+        self.data_by_sheet = data_by_sheet
+        self.date_column = date_column
+        self.date_index = date_index
+        self.search_index = search_index
+        # Índice de uma carga anterior: sem 'search_index', o motor o atualiza
+        # (ver Search_Index) em vez de indexar todas as abas de novo
+        self.previous_search_index = previous_search_index
+        self.max_cached_masks = max_cached_masks
+        # (aba, chave do critério) -> (máscara, quantidade de linhas marcadas)
+        self._masks = OrderedDict()
+
+    def is_current(self, data_by_sheet: dict[str, pd.DataFrame]) -> bool:
+        return data_by_sheet is self.data_by_sheet
+
+    # --- Valores para montar os filtros na interface ---
+
+    def _loaded_frames(self):
+        # Num Sheet_Store, só as abas já lidas: montar os menus não força a
+        # leitura das demais
+        if isinstance(self.data_by_sheet, Sheet_Store):
+            return self.data_by_sheet.loaded_frames()
+        return self.data_by_sheet.values()
+
+    def filterable_columns(self) -> list:
+        # Colunas com poucos valores distintos (categorias), na ordem em que aparecem
+        columns = [SHEET_FILTER_LABEL]
+        for df_sheet in self._loaded_frames():
+            for i in range(df_sheet.shape[1]):
+                column = df_sheet.iloc[:, i]
+                label = df_sheet.columns[i]
+                if (
+                    isinstance(column.dtype, pd.CategoricalDtype)
+                    and len(column.cat.categories) <= MAX_FILTER_VALUES
+                    and label not in columns
+                ):
+                    columns.append(label)
+        return columns
+
+    def column_values(self, column) -> list:
+        if column == SHEET_FILTER_LABEL:
+            return list(self.data_by_sheet)
+        values = []
+        seen = set()
+        for df_sheet in self._loaded_frames():
+            if column not in df_sheet.columns:
+                continue
+            series = df_sheet[column]
+            distinct = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) else series.dropna().unique()
+            for value in distinct:
+                if value not in seen:
+                    seen.add(value)
+                    values.append(value)
+        return sorted(values, key=lambda value: str(value).casefold())[:MAX_FILTER_VALUES]
+
+    # --- Leitura das abas e índices ---
+
+    def _read_sheet(self, sheet_name: str, should_cancel=None) -> pd.DataFrame:
+        # Na carga sob demanda, ler uma aba ainda não lida é ler o Excel: a
+        # leitura também para com should_cancel (como Filter_Cancelled)
+        if should_cancel is not None and should_cancel():
+            raise Filter_Cancelled()
+        if not isinstance(self.data_by_sheet, Sheet_Store):
+            return self.data_by_sheet[sheet_name]
+        from core.excel_reader import Load_Cancelled
+
+        try:
+            return self.data_by_sheet.load(sheet_name, should_cancel=should_cancel)
+        except Load_Cancelled:
+            raise Filter_Cancelled() from None
+
+    def get_date_index(self, should_cancel=None) -> Date_Index:
+        # Montado no primeiro uso; cancelado, fica para a próxima consulta
+        if self.date_index is None:
+            self.date_index = Date_Index(
+                self.data_by_sheet,
+                self.date_column,
+                read_sheet=lambda sheet_name: self._read_sheet(sheet_name, should_cancel),
+            )
+        return self.date_index
+
+    def get_search_index(self, should_cancel=None):
+        if self.search_index is None:
+            from core.search_index import Search_Index
+
+            previous = self.previous_search_index or Search_Index()
+            self.search_index = previous.updated(
+                self.data_by_sheet,
+                read_sheet=lambda sheet_name: self._read_sheet(sheet_name, should_cancel),
+            )
+        return self.search_index
+
+    # --- Máscaras ---
+
+    def _compute_mask(self, sheet_name: str, criterion: Criterion, should_cancel=None) -> np.ndarray:
+        df_sheet = self._read_sheet(sheet_name, should_cancel)
+        row_count = len(df_sheet)
+        if criterion.kind == "sheets":
+            return np.full(row_count, sheet_name in criterion.values)
+
+        if criterion.kind == "values":
+            if criterion.column not in df_sheet.columns:
+                return np.zeros(row_count, dtype=bool)
+            column = df_sheet[criterion.column]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Compara os códigos inteiros da categoria, sem tocar nos textos
+                wanted = [column.cat.categories.get_loc(v) for v in criterion.values if v in column.cat.categories]
+                return np.isin(column.cat.codes.to_numpy(), wanted)
+            return column.isin(criterion.values).to_numpy(dtype=bool, na_value=False)
+
+        mask = np.zeros(row_count, dtype=bool)
+        if criterion.kind == "date_range":
+            start, end = criterion.values
+            _, positions = self.get_date_index(should_cancel).sheet_range(sheet_name, start, end)
+            if positions is not None:
+                mask[positions] = True
+            return mask
+
+        if criterion.kind == "text":
+            # A busca devolve todas as abas de uma vez: guarda as demais também
+            hits = self.get_search_index(should_cancel).search(criterion.values[0])
+            for other_sheet in self.data_by_sheet:
+                if other_sheet == sheet_name:
+                    continue
+                other_mask = np.zeros(len(self._read_sheet(other_sheet, should_cancel)), dtype=bool)
+                if other_sheet in hits:
+                    other_mask[hits[other_sheet]] = True
+                self._store(other_sheet, criterion, other_mask)
+            if sheet_name in hits:
+                mask[hits[sheet_name]] = True
+            return mask
+
+        raise ValueError(f"Critério desconhecido: {criterion.kind}")
+
+    def _store(self, sheet_name: str, criterion: Criterion, mask: np.ndarray):
+        self._masks[(sheet_name, criterion.key)] = (mask, int(np.count_nonzero(mask)))
+        while len(self._masks) > self.max_cached_masks:
+            self._masks.popitem(last=False)
+
+    def mask(self, sheet_name: str, criterion: Criterion, should_cancel=None):
+        # (máscara, linhas marcadas), do cache quando possível
+        cache_key = (sheet_name, criterion.key)
+        entry = self._masks.get(cache_key)
+        if entry is None:
+            with profiler.stage("máscara do filtro", sheet=sheet_name):
+                self._store(sheet_name, criterion, self._compute_mask(sheet_name, criterion, should_cancel))
+            entry = self._masks[cache_key]
+        else:
+            self._masks.move_to_end(cache_key)
+        return entry
+
+    def _known_count(self, sheet_name: str, node):
+        # Seletividade já conhecida (linhas marcadas) ou None
+        if isinstance(node, Criterion):
+            entry = self._masks.get((sheet_name, node.key))
+            return None if entry is None else entry[1]
+        return None
+
+    def _evaluate_sheet(self, sheet_name: str, node, should_cancel=None):
+        if isinstance(node, Criterion):
+            return self.mask(sheet_name, node, should_cancel)
+
+        row_count = len(self._read_sheet(sheet_name, should_cancel))
+        if not node.children:
+            return np.ones(row_count, dtype=bool), row_count
+
+        # E: começa pelos critérios mais seletivos (menos linhas) e para assim
+        # que nada sobra. OU: começa pelos menos seletivos e para quando tudo
+        # já foi marcado. Critérios ainda não calculados ficam por último.
+        is_and = node.mode == "and"
+
+        def order(child):
+            count = self._known_count(sheet_name, child)
+            if count is None:
+                return (1, 0)
+            return (0, count if is_and else -count)
+
+        result = None
+        for child in sorted(node.children, key=order):
+            mask, count = self._evaluate_sheet(sheet_name, child, should_cancel)
+            if result is None:
+                result = mask.copy()
+            elif is_and:
+                result &= mask
+            else:
+                result |= mask
+            remaining = int(np.count_nonzero(result))
+            if (is_and and remaining == 0) or (not is_and and remaining == row_count):
+                break
+        return result, remaining
+
+    def evaluate(self, query, should_cancel=None) -> dict[str, np.ndarray]:
+        # Máscara final por aba. should_cancel() é consultado antes de cada
+        # aba, na montagem dos índices e nas leituras da carga sob demanda; se
+        # devolver True, a consulta para com Filter_Cancelled.
+        if isinstance(query, Criterion):
+            query = Query("and", [query])
+        masks = {}
+        for sheet_name in self.data_by_sheet:
+            if should_cancel is not None and should_cancel():
+                raise Filter_Cancelled()
+            masks[sheet_name] = self._evaluate_sheet(sheet_name, query, should_cancel)[0]
+        return masks
+
+    def filter(self, query, should_cancel=None) -> pd.DataFrame:
+        # Linhas de todas as abas que atendem à consulta. Com um critério de
+        # data que restringe a consulta inteira (filho do E de cima), o
+        # resultado vem em ordem de data (como o filtro por data), e só há
+        # linhas com data; nos demais casos (ex.: data OU status), na ordem
+        # das abas e das linhas, com ou sem data.
+        if isinstance(query, Criterion):
+            query = Query("and", [query])
+        with profiler.stage("filtro combinado") as stage:
+            masks = self.evaluate(query, should_cancel)
+            if should_cancel is not None and should_cancel():
+                raise Filter_Cancelled()
+            by_date = query.mode == "and" and any(
+                isinstance(child, Criterion) and child.kind == "date_range" for child in query.children
+            )
+            if by_date:
+                dates_per_sheet = []
+                rows_per_sheet = []
+                for sheet_name, mask in masks.items():
+                    # Abas sem nenhuma linha podem ter parado antes do
+                    # critério de data (e o índice, nem ter sido montado)
+                    if not mask.any():
+                        continue
+                    dates, positions = self.date_index.sorted_rows(sheet_name, mask)
+                    if dates is None or len(dates) == 0:
+                        continue
+                    dates_per_sheet.append(dates)
+                    rows_per_sheet.append(self.data_by_sheet[sheet_name].iloc[positions])
+                result = merge_by_date(dates_per_sheet, rows_per_sheet)
+            else:
+                frames = [
+                    self.data_by_sheet[sheet_name].iloc[np.flatnonzero(mask)]
+                    for sheet_name, mask in masks.items()
+                    if mask.any()
+                ]
+                result = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            stage.rows = len(result)
+        return result
@@ -0,0 +1,63 @@
+# src/core/filter_worker.py
+
+import queue
+import threading
+
+from core.filter_engine import Filter_Cancelled
+
+
+class Filter_Worker:
+    # Executa as consultas do Filter_Engine (e outras tarefas sobre os mesmos
+    # índices, como o relatório) numa thread fora da interface. Só a tarefa
+    # mais recente interessa: uma nova cancela a que está em andamento (entre
+    # uma aba e outra) e toma o lugar da que ainda esperava. As tarefas rodam
+    # uma de cada vez, então as máscaras e os índices em cache nunca são
+    # disputados. Os resultados vão para 'results' como
+    # (geração, "done", resultado) ou (geração, "error", mensagem).
+    def __init__(self):
+        self.results = queue.Queue()
+        self._condition = threading.Condition()
+        self._pending = None
+        # Cada consulta enviada (ou cancelamento) ganha uma nova geração;
+        # resultados de gerações anteriores estão obsoletos
+        self.generation = 0
+        self._thread = None
+
+    def submit(self, engine, query) -> int:
+        return self.submit_task(lambda should_cancel: engine.filter(query, should_cancel=should_cancel))
+
+    def submit_task(self, task) -> int:
+        # task(should_cancel) devolve o resultado ou levanta Filter_Cancelled
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, task)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="filtros", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return self.generation
+
+    def cancel(self):
+        # Descarta a consulta em espera e interrompe a que está rodando
+        with self._condition:
+            self.generation += 1
+            self._pending = None
+
+    def is_latest(self, generation: int) -> bool:
+        return generation == self.generation
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                generation, task = self._pending
+                self._pending = None
+            try:
+                result = task(lambda: not self.is_latest(generation))
+            except Filter_Cancelled:
+                continue
+            except Exception as e:
+                self.results.put((generation, "error", str(e)))
+                continue
+            self.results.put((generation, "done", result))
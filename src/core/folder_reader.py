@@ -0,0 +1,143 @@
+# src/core/folder_reader.py
+
+import os
+import hashlib
+import pandas as pd
+
+from config.settings import DATE_COLUMN
+from core.excel_reader import Excel_Reader
+from core.reader_backends import CSV_EXTENSIONS, supported_extensions
+from core.sheet_store import Sheet_Store, insert_column
+
+SOURCE_FILE_COLUMN = "Arquivo"
+SOURCE_SHEET_COLUMN = "Aba"
+# Separa o nome do arquivo do nome da aba nas chaves de data_by_sheet
+SHEET_KEY_SEPARATOR = " › "
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _content_hash(file_path: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Folder_Reader:
+    # Lê todos os workbooks de uma pasta num único conjunto de abas, marcadas
+    # com o arquivo e a aba de origem. Em novas varreduras só os arquivos cujo
+    # tamanho, data de modificação e conteúdo mudaram são lidos de novo.
+    def __init__(self, folder_path: str, workers: int = 1, cache=None, on_parsed=None):
+        self.folder_path = folder_path
+        self.workers = workers
+        self.cache = cache
+        # Chamado com o dict de abas de cada arquivo lido de fato (ex.: para
+        # classificar as disciplinas apenas uma vez por arquivo)
+        self.on_parsed = on_parsed
+        # caminho -> {"size", "mtime_ns", "hash", "data"}
+        self._files = {}
+        self.parsed_files = []
+        self.reused_files = []
+
+    def list_workbooks(self) -> list[str]:
+        # Só os formatos que os backends instalados leem. CSVs ficam de fora: a
+        # pasta costuma guardar também as exportações do próprio programa.
+        extensions = tuple(ext for ext in supported_extensions() if ext not in CSV_EXTENSIONS)
+        paths = []
+        for name in sorted(os.listdir(self.folder_path), key=str.lower):
+            # "~$arquivo.xlsx" são arquivos de trava do Excel
+            if name.startswith("~$") or not name.lower().endswith(extensions):
+                continue
+            path = os.path.join(self.folder_path, name)
+            if os.path.isfile(path):
+                paths.append(path)
+        return paths
+
+    def _is_unchanged(self, path: str, stat, entry: dict) -> bool:
+        if entry is None:
+            return False
+        if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        # Tamanho igual mas data diferente (arquivo copiado/salvo sem mudanças):
+        # confirma pelo conteúdo antes de ler de novo
+        if entry["size"] == stat.st_size and entry["hash"] == _content_hash(path):
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return True
+        return False
+
+    def _read_workbook(self, path: str, progress_callback, should_cancel) -> dict:
+        reader = Excel_Reader(path, streaming=True, workers=self.workers, cache=self.cache)
+        data = reader.get_data_as_dataframe(
+            date_column_name=DATE_COLUMN,
+            progress_callback=progress_callback,
+            should_cancel=should_cancel,
+        )
+        if self.on_parsed is not None:
+            self.on_parsed(data)
+
+        file_name = os.path.basename(path)
+        for sheet_name in data:
+            row_count = data.row_count(sheet_name) if isinstance(data, Sheet_Store) else len(data[sheet_name])
+            insert_column(data, sheet_name, SOURCE_SHEET_COLUMN, pd.Categorical([sheet_name] * row_count), position=0)
+            insert_column(data, sheet_name, SOURCE_FILE_COLUMN, pd.Categorical([file_name] * row_count), position=0)
+        return data
+
+    def scan(self, progress_callback=None, should_cancel=None) -> dict[str, pd.DataFrame]:
+        # progress_callback(nome_do_arquivo, índice, total, linhas_lidas) e
+        # should_cancel() seguem o mesmo contrato de Excel_Reader
+        paths = self.list_workbooks()
+        files = {}
+        self.parsed_files = []
+        self.reused_files = []
+        for index, path in enumerate(paths):
+            file_name = os.path.basename(path)
+            if progress_callback is not None:
+                progress_callback(file_name, index, len(paths), 0)
+            stat = os.stat(path)
+            entry = self._files.get(path)
+            if self._is_unchanged(path, stat, entry):
+                files[path] = entry
+                self.reused_files.append(path)
+                continue
+
+            def on_sheet_progress(sheet_name, sheet_index, sheet_count, rows_read):
+                if progress_callback is not None:
+                    label = f"{file_name}{SHEET_KEY_SEPARATOR}{sheet_name}"
+                    progress_callback(label, index, len(paths), rows_read)
+
+            files[path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": _content_hash(path),
+                "data": self._read_workbook(path, on_sheet_progress, should_cancel),
+            }
+            self.parsed_files.append(path)
+
+        # Arquivos removidos da pasta simplesmente deixam de existir aqui
+        self._files = files
+        return self.data_by_sheet()
+
+    def data_by_sheet(self) -> dict[str, pd.DataFrame]:
+        # Com todos os arquivos no cache em disco, o resultado também é um
+        # Sheet_Store: as abas só são lidas quando usadas
+        if self._files and all(isinstance(entry["data"], Sheet_Store) for entry in self._files.values()):
+            handles = {}
+            for path, entry in self._files.items():
+                file_name = os.path.basename(path)
+                for sheet_name in entry["data"]:
+                    key = f"{file_name}{SHEET_KEY_SEPARATOR}{sheet_name}"
+                    handles[key] = entry["data"].handle(sheet_name)
+            return Sheet_Store(handles)
+
+        all_sheets_data = {}
+        for path, entry in self._files.items():
+            file_name = os.path.basename(path)
+            for sheet_name, df_sheet in entry["data"].items():
+                all_sheets_data[f"{file_name}{SHEET_KEY_SEPARATOR}{sheet_name}"] = df_sheet
+        return all_sheets_data
+
+    def combined(self) -> pd.DataFrame:
+        frames = list(self.data_by_sheet().values())
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
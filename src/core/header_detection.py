@@ -0,0 +1,243 @@
+# src/core/header_detection.py
+
+from collections import OrderedDict
+
+# Quantas linhas do topo da planilha são examinadas em busca do cabeçalho
+HEADER_SEARCH_ROWS = 30
+# Posição do cabeçalho no modelo padrão (linha 13 agrupadora, 14 com os nomes)
+DEFAULT_GROUP_ROW = 13
+DEFAULT_HEADER_ROW = 14
+# Linhas logo abaixo do cabeçalho que precisam parecer dados
+DATA_CHECK_ROWS = 2
+
+
+class Header_Layout:
+    # Onde está o cabeçalho de uma aba. As linhas são numeradas como no Excel
+    # (a partir de 1); 'group_row' é a linha agrupadora dos cabeçalhos em dois
+    # níveis, ou None. Os dados começam logo abaixo de 'header_row'.
+    # 'headers' guarda os nomes já combinados, reaproveitados nas abas do
+    # mesmo modelo. 'merge_dependent': a linha acima do cabeçalho só foi
+    # reconhecida (ou descartada) como agrupadora pelas mesclagens.
+    __slots__ = ("header_row", "group_row", "signature", "headers", "merge_dependent")
+
+    def __init__(self, header_row: int, group_row=None, signature: tuple = None, merge_dependent: bool = False):
+        self.header_row = header_row
+        self.group_row = group_row
+        self.signature = signature
+        self.headers = None
+        self.merge_dependent = merge_dependent
+
+    @property
+    def header_type(self) -> str:
+        return "multilevel" if self.group_row is not None else "single"
+
+    @property
+    def data_start_row(self) -> int:
+        return self.header_row + 1
+
+    def __repr__(self):
+        return f"Header_Layout(header_row={self.header_row}, group_row={self.group_row})"
+
+
+def _filled_columns(row) -> list[int]:
+    return [i for i, value in enumerate(row) if value is not None and value != ""]
+
+
+def _row(top_rows: list, row_number: int) -> tuple:
+    index = row_number - 1
+    return tuple(top_rows[index]) if 0 <= index < len(top_rows) else ()
+
+
+def header_signature(top_rows: list, header_row: int, group_row=None) -> tuple:
+    # Valores das linhas do cabeçalho, como texto: identifica o modelo da aba
+    # (sem as células vazias do fim, que variam com a largura da planilha).
+    # No cabeçalho simples entra também a linha de cima: a mesma linha de
+    # nomes pode vir com ou sem agrupadora em cima, conforme o workbook.
+    rows = [header_row - 1 if group_row is None else group_row, header_row]
+    signature = []
+    for row_number in rows:
+        values = ["" if value is None else str(value) for value in _row(top_rows, row_number)]
+        while values and not values[-1]:
+            values.pop()
+        signature.append(tuple(values))
+    return tuple(signature)
+
+
+def _is_label_row(row) -> bool:
+    # Bloco de identificação do modelo ("Cliente:" | "ARTESP" | "Contrato:" |
+    # "CT-123"...): metade ou mais dos textos são rótulos com dois-pontos
+    texts = [value.strip() for value in row if isinstance(value, str) and value.strip()]
+    return bool(texts) and sum(1 for text in texts if text.endswith(":")) * 2 >= len(texts)
+
+
+def _looks_like_header(row, widest: int) -> bool:
+    # Ao menos dois nomes, a maioria em texto, cobrindo mais da metade da
+    # largura da planilha (linhas de título têm uma ou duas células)
+    filled = _filled_columns(row)
+    if len(filled) < 2 or len(filled) * 2 <= widest or _is_label_row(row):
+        return False
+    text_cells = sum(1 for i in filled if isinstance(row[i], str))
+    return text_cells * 2 >= len(filled)
+
+
+def _is_group_row(row, header_columns: set) -> bool:
+    # Linha agrupadora: só texto, não mais células que o cabeçalho, sobre
+    # parte das colunas com nome na linha de baixo. Células fora dessas
+    # colunas são as mescladas na vertical (ex.: "Status" em E13:E14), cujo
+    # nome só aparece na linha de cima.
+    filled = set(_filled_columns(row))
+    return (
+        bool(filled & header_columns)
+        and len(filled) <= len(header_columns)
+        and bool(header_columns - filled)
+        and all(isinstance(row[i], str) for i in filled)
+        and not _is_label_row(row)
+    )
+
+
+def _followed_by_data(top_rows: list, header_row: int, columns: set) -> bool:
+    # As linhas logo abaixo do cabeçalho são dados: preenchidas em alguma das
+    # colunas com nome e sem rótulos. Linhas além do topo lido (planilha
+    # curta) não contam.
+    last_row = min(header_row + DATA_CHECK_ROWS, len(top_rows))
+    for row_number in range(header_row + 1, last_row + 1):
+        row = _row(top_rows, row_number)
+        if not set(_filled_columns(row)) & columns or _is_label_row(row):
+            return False
+    return True
+
+
+def _merged_on_row(merged_ranges, row_number: int) -> bool:
+    return any(min_row <= row_number <= max_row for _, min_row, _, max_row in merged_ranges())
+
+
+def _group_row_above(top_rows: list, header_row: int, header_columns: set, merged_ranges):
+    # (linha agrupadora ou None, decidida pelas mesclagens). Várias células de
+    # texto sobre parte das colunas bastam; uma única (título ou grupo) e os
+    # demais casos em texto ficam com as mesclagens da linha.
+    if header_row <= 1:
+        return None, False
+    row = _row(top_rows, header_row - 1)
+    filled = _filled_columns(row)
+    if not filled or not all(isinstance(row[i], str) for i in filled) or _is_label_row(row):
+        return None, False
+    if len(filled) > 1 and _is_group_row(row, header_columns):
+        return header_row - 1, False
+    if merged_ranges is None:
+        return None, False
+    return (header_row - 1 if _merged_on_row(merged_ranges, header_row - 1) else None), True
+
+
+def _default_layout(top_rows: list, widest: int, merged_ranges):
+    # Modelo padrão: nomes na linha 14, com ou sem agrupadora na 13. Uma
+    # linha 13 com cara de cabeçalho que não agrupa a 14 é um cabeçalho
+    # simples, e a 14 já são dados: a busca segue pelas demais linhas.
+    header_row = _row(top_rows, DEFAULT_HEADER_ROW)
+    if not _looks_like_header(header_row, widest):
+        return None
+    header_columns = set(_filled_columns(header_row))
+    # Com as colunas mescladas na vertical, que só têm nome na linha 13
+    columns = header_columns | set(_filled_columns(_row(top_rows, DEFAULT_GROUP_ROW)))
+    if not _followed_by_data(top_rows, DEFAULT_HEADER_ROW, columns):
+        return None
+    group_row, merge_dependent = _group_row_above(top_rows, DEFAULT_HEADER_ROW, header_columns, merged_ranges)
+    if group_row is None and _looks_like_header(_row(top_rows, DEFAULT_GROUP_ROW), widest):
+        return None
+    return Header_Layout(DEFAULT_HEADER_ROW, group_row=group_row, merge_dependent=merge_dependent)
+
+
+def detect_header_layout(top_rows: list, merged_ranges=None):
+    # Procura o cabeçalho nas primeiras linhas ('top_rows', valores da linha 1
+    # em diante): primeiro nas linhas 13 e 14 do modelo padrão, depois de cima
+    # para baixo, na primeira linha com cara de cabeçalho seguida de dados.
+    # 'merged_ranges()' devolve os intervalos mesclados (min_col, min_row,
+    # max_col, max_row) e só é chamado quando a linha acima dos nomes, em
+    # texto, tanto pode ser título quanto agrupadora.
+    # Devolve None quando nenhuma linha parece um cabeçalho.
+    widest = max((len(_filled_columns(row)) for row in top_rows), default=0)
+    layout = _default_layout(top_rows, widest, merged_ranges)
+    if layout is not None:
+        return layout
+
+    for index, row in enumerate(top_rows):
+        if not _looks_like_header(row, widest):
+            continue
+        header_row = index + 1
+        header_columns = set(_filled_columns(row))
+
+        # A linha achada pode ser a agrupadora de um cabeçalho em dois níveis
+        next_row = _row(top_rows, header_row + 1)
+        next_columns = set(_filled_columns(next_row))
+        if (
+            _looks_like_header(next_row, widest)
+            and _is_group_row(row, next_columns)
+            and _followed_by_data(top_rows, header_row + 1, header_columns | next_columns)
+        ):
+            return Header_Layout(header_row + 1, group_row=header_row)
+
+        if not _followed_by_data(top_rows, header_row, header_columns):
+            continue
+        group_row, merge_dependent = _group_row_above(top_rows, header_row, header_columns, merged_ranges)
+        return Header_Layout(header_row, group_row=group_row, merge_dependent=merge_dependent)
+    return None
+
+
+class Schema_Cache:
+    # Layouts já detectados, por nome de aba e assinatura do cabeçalho. Abas de
+    # workbooks feitos a partir do mesmo modelo só conferem a assinatura (e,
+    # nos layouts decididos pelas mesclagens, se elas continuam as mesmas).
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        # nome da aba -> layouts conhecidos (mais recente por último)
+        self._layouts_by_sheet = {}
+        self._count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sheet_name: str, top_rows: list, merged_ranges=None):
+        # 'merged_ranges()' como em detect_header_layout; sem ele, layouts
+        # decididos pelas mesclagens não são reaproveitados
+        layouts = self._layouts_by_sheet.get(sheet_name)
+        if layouts:
+            for signature, layout in reversed(layouts.items()):
+                if header_signature(top_rows, layout.header_row, layout.group_row) != signature:
+                    continue
+                if layout.merge_dependent and (
+                    merged_ranges is None
+                    or _merged_on_row(merged_ranges, layout.header_row - 1) != (layout.group_row is not None)
+                ):
+                    continue
+                layouts.move_to_end(signature)
+                self.hits += 1
+                return layout
+        self.misses += 1
+        return None
+
+    def put(self, sheet_name: str, top_rows: list, layout: Header_Layout) -> Header_Layout:
+        layout.signature = header_signature(top_rows, layout.header_row, layout.group_row)
+        layouts = self._layouts_by_sheet.setdefault(sheet_name, OrderedDict())
+        if layout.signature not in layouts:
+            self._count += 1
+        layouts[layout.signature] = layout
+        layouts.move_to_end(layout.signature)
+        while self._count > self.max_entries:
+            # Descarta o layout mais antigo da aba com mais layouts guardados
+            largest = max(self._layouts_by_sheet.values(), key=len)
+            largest.popitem(last=False)
+            self._count -= 1
+        return layout
+
+    def clear(self):
+        self._layouts_by_sheet = {}
+        self._count = 0
+
+
+_default_schema_cache = None
+
+
+def get_default_schema_cache() -> Schema_Cache:
+    # Compartilhado por todos os leitores do processo
+    global _default_schema_cache
+    if _default_schema_cache is None:
+        _default_schema_cache = Schema_Cache()
+    return _default_schema_cache
@@ -0,0 +1,137 @@
+# src/core/lazy_workbook.py
+
+import os
+import tempfile
+import threading
+import importlib.util
+import pandas as pd
+
+from core.excel_reader import Excel_Reader, Sheet_Metadata
+from core.profiling import profiler
+from core.sheet_store import Sheet_Store, Sheet_Handle, write_sheet
+
+
+class _Lazy_Workbook:
+    # Workbook aberto (somente leitura) compartilhado pelas abas ainda não
+    # lidas; fecha quando a última aba é lida. As abas lidas são gravadas em
+    # Arrow numa pasta temporária da sessão, de onde voltam mapeadas depois de
+    # descartadas da memória, sem ler o Excel de novo. Lidas todas, os
+    # arquivos vão para o cache de workbooks (se houver).
+    def __init__(self, file_path: str, reader: Excel_Reader = None, cache=None):
+        self.file_path = file_path
+        self.cache = cache
+        self.handles = []
+        # O leitor que levantou os metadados, com o workbook ainda aberto
+        self.reader = reader
+        self.lock = threading.Lock()
+        self.spill_dir = None
+        if importlib.util.find_spec("pyarrow") is not None:
+            self.spill_dir = tempfile.TemporaryDirectory(prefix="evidencias-", ignore_cleanup_errors=True)
+
+    def read_sheet(self, sheet_name: str, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        # Progresso e cancelamento (Load_Cancelled) só desta leitura
+        with self.lock:
+            if self.reader is None:
+                self.reader = Excel_Reader(self.file_path, streaming=True)
+                self.reader._load_workbook()
+            if not self.reader.workbook:
+                return None
+            self.reader._progress_callback = progress_callback
+            self.reader._should_cancel = should_cancel
+            self.reader._sheet_index, self.reader._sheet_count = 0, 1
+            try:
+                return self.reader._read_sheet_by_name(sheet_name)
+            finally:
+                self.reader._progress_callback = self.reader._should_cancel = None
+                if all(handle.is_parsed or handle.metadata.name == sheet_name for handle in self.handles):
+                    self.reader._close_workbook()
+                    self.reader = None
+
+    def spill_path(self, sheet_index: int):
+        if self.spill_dir is None:
+            return None
+        return os.path.join(self.spill_dir.name, f"sheet_{sheet_index}.arrow")
+
+    def sheet_parsed(self):
+        # Mesmo conteúdo que a leitura completa gravaria no cache (abas sem
+        # dados ficam de fora)
+        if self.cache is None or not all(handle.path is not None for handle in self.handles):
+            return
+        cache, self.cache = self.cache, None
+        cache.put_sheet_files(
+            self.file_path,
+            {handle.metadata.name: handle.path for handle in self.handles if handle.num_rows},
+        )
+
+
+class Lazy_Sheet_Handle(Sheet_Handle):
+    # Aba ainda não lida: 'path' fica vazio até a primeira leitura, quando a
+    # aba é lida do Excel e gravada em Arrow como saiu do leitor. 'on_parsed'
+    # (ex.: classificação das disciplinas) roda a cada leitura, sobre o
+    # DataFrame já carregado. Até a primeira leitura, 'num_rows' é a
+    # estimativa da dimensão declarada e 'nbytes' é zero.
+    __slots__ = ("workbook", "metadata", "sheet_index", "on_parsed")
+
+    def __init__(self, workbook: _Lazy_Workbook, metadata: Sheet_Metadata, sheet_index: int, on_parsed=None):
+        super().__init__(None, metadata.estimated_rows, 0, None)
+        self.workbook = workbook
+        self.metadata = metadata
+        self.sheet_index = sheet_index
+        self.on_parsed = on_parsed
+
+    @property
+    def is_parsed(self) -> bool:
+        return self.columns is not None
+
+    def _materialize(self, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        name = self.metadata.name
+        if self.path is not None:
+            df_sheet = super()._materialize()
+        else:
+            first_read = not self.is_parsed
+            with profiler.stage("carga sob demanda", sheet=name):
+                df_sheet = self.workbook.read_sheet(name, progress_callback, should_cancel)
+            if df_sheet is None:
+                df_sheet = pd.DataFrame()
+            self.columns = list(df_sheet.columns)
+            self.num_rows = len(df_sheet)
+            spill_path = self.workbook.spill_path(self.sheet_index)
+            if spill_path is not None:
+                try:
+                    stored = write_sheet(df_sheet, spill_path)
+                    self.path = spill_path
+                    self.nbytes = self.nbytes or stored.nbytes
+                except Exception as e:
+                    print(f"Erro ao gravar a aba '{name}' em disco: {e}")
+            if first_read:
+                self.nbytes = self.nbytes or int(df_sheet.memory_usage(index=False, deep=True).sum())
+                self.workbook.sheet_parsed()
+        if self.on_parsed is not None:
+            self.on_parsed({name: df_sheet})
+        return df_sheet
+
+
+def open_workbook_lazily(
+    file_path: str,
+    on_parsed=None,
+    cache=None,
+    progress_callback=None,
+    should_cancel=None,
+) -> Sheet_Store:
+    # Abas do workbook com leitura sob demanda: só os nomes, a dimensão e o
+    # cabeçalho são lidos agora; cada aba é lida na primeira vez que é pedida
+    reader = Excel_Reader(file_path, streaming=True)
+    metadata = reader.get_sheet_metadata(progress_callback, should_cancel)
+    if metadata:
+        # Progresso e cancelamento valem só para esta carga, não para as
+        # leituras das abas feitas depois pela interface
+        reader._progress_callback = reader._should_cancel = None
+    else:
+        reader._close_workbook()
+        reader = None
+    workbook = _Lazy_Workbook(file_path, reader, cache)
+    workbook.handles = [
+        Lazy_Sheet_Handle(workbook, sheet_metadata, index, on_parsed)
+        for index, sheet_metadata in enumerate(metadata.values())
+    ]
+    return Sheet_Store({handle.metadata.name: handle for handle in workbook.handles})
@@ -0,0 +1,164 @@
+# src/core/profiling.py
+
+import os
+import json
+import time
+import threading
+import tracemalloc
+from collections import deque
+from datetime import datetime
+
+from config.settings import PROFILING_ENABLED, PROFILING_MAX_RECORDS
+
+
+class _Null_Stage:
+    # Devolvida quando o profiler está desligado: nada é medido nem guardado
+    __slots__ = ("rows",)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_STAGE = _Null_Stage()
+
+
+class _Stage:
+    __slots__ = (
+        "profiler",
+        "name",
+        "sheet",
+        "rows",
+        "started_at",
+        "child_seconds",
+        "memory_before",
+    )
+
+    def __init__(self, profiler, name: str, sheet, rows):
+        self.profiler = profiler
+        self.name = name
+        self.sheet = sheet
+        self.rows = rows
+        self.child_seconds = 0.0
+
+    def __enter__(self):
+        self.profiler._stack().append(self)
+        self.memory_before = (
+            tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        )
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - self.started_at
+        memory_delta = None
+        if self.memory_before is not None and tracemalloc.is_tracing():
+            memory_delta = tracemalloc.get_traced_memory()[0] - self.memory_before
+        stack = self.profiler._stack()
+        stack.pop()
+        # Tempo próprio: descontado o das etapas internas (ex.: montagem dos
+        # blocos dentro da conversão de linhas)
+        if stack:
+            stack[-1].child_seconds += seconds
+        self.profiler.records.append(
+            {
+                "stage": self.name,
+                "sheet": self.sheet,
+                "seconds": seconds,
+                "self_seconds": seconds - self.child_seconds,
+                "rows": self.rows,
+                "memory_delta_bytes": memory_delta,
+            }
+        )
+        return False
+
+
+class Profiler:
+    # Medição por etapa (tempo, linhas e variação de memória), por aba. Fica
+    # desligado por padrão; desligado, 'stage' devolve sempre o mesmo objeto
+    # vazio e o custo é o de uma chamada de função.
+    #
+    #     with profiler.stage("conversão de linhas", sheet=nome) as stage:
+    #         ...
+    #         stage.rows = linhas_lidas
+    #
+    # Só as últimas 'max_records' medições são guardadas, e o resumo é sobre elas.
+    def __init__(self, max_records: int = PROFILING_MAX_RECORDS):
+        self.enabled = False
+        self.records = deque(maxlen=max_records)
+        self._local = threading.local()
+        self._started_tracemalloc = False
+
+    def enable(self, track_memory: bool = False):
+        # A memória é medida com o tracemalloc, que deixa tudo bem mais lento
+        self.enabled = True
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self):
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        self.records.clear()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def stage(self, name: str, sheet=None, rows=None):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, sheet, rows)
+
+    def extend(self, records: list):
+        # Medições feitas em outro processo (leitura paralela das abas)
+        self.records.extend(records)
+
+    def summary(self) -> list[dict]:
+        # Totais por (etapa, aba), na ordem em que apareceram
+        totals = {}
+        for record in list(self.records):
+            key = (record["stage"], record["sheet"])
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = {
+                    "stage": record["stage"],
+                    "sheet": record["sheet"],
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "self_seconds": 0.0,
+                    "rows": None,
+                    "memory_delta_bytes": None,
+                }
+            total["calls"] += 1
+            total["seconds"] += record["seconds"]
+            total["self_seconds"] += record["self_seconds"]
+            for field in ("rows", "memory_delta_bytes"):
+                if record[field] is not None:
+                    total[field] = (total[field] or 0) + record[field]
+        return list(totals.values())
+
+    def dump_json(self, output_path: str):
+        report = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "memory_tracked": tracemalloc.is_tracing(),
+            "summary": self.summary(),
+            "records": list(self.records),
+        }
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+
+
+# Instância única do processo, usada pelo leitor e pela interface
+profiler = Profiler()
+if PROFILING_ENABLED:
+    profiler.enable()
@@ -0,0 +1,325 @@
+# src/core/reader_backends.py
+
+import os
+import re
+import csv
+import importlib.util
+from datetime import date, datetime
+import openpyxl
+from openpyxl.utils.cell import range_boundaries
+
+# Backends de leitura por trás do Excel_Reader. Todos expõem o mesmo formato:
+# o workbook tem 'sheetnames', '[nome]' e 'close()'; a aba tem 'title',
+# 'max_row'/'max_column' (ou None), 'iter_rows(min_row, max_row)' com os
+# valores de cada linha (None nas células vazias, linhas e colunas numeradas
+# a partir da célula A1) e 'merged_ranges()' com os intervalos mesclados
+# (min_col, min_row, max_col, max_row). Assim a detecção do cabeçalho e a
+# montagem dos DataFrames são as mesmas em qualquer backend.
+
+OPENPYXL = "openpyxl"
+CALAMINE = "calamine"
+CSV = "csv"
+
+# Arquivos .xlsx a partir deste tamanho vão para o calamine (leitura nativa,
+# em Rust), quando instalado; abaixo disso, a abertura do openpyxl é rápida
+# e o ganho não compensa
+FAST_BACKEND_MIN_BYTES = 1024 * 1024
+
+OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm")
+# Formatos que só o calamine lê (binários antigos e o .xlsb)
+CALAMINE_ONLY_EXTENSIONS = (".xls", ".xlsb")
+CSV_EXTENSIONS = (".csv",)
+# Tudo o que o leitor conhece, instalado ou não o calamine
+READABLE_EXTENSIONS = OPENPYXL_EXTENSIONS + CALAMINE_ONLY_EXTENSIONS + CSV_EXTENSIONS
+
+# Os intervalos mesclados ficam no final do XML da planilha, depois dos dados.
+_MERGE_CELL_PATTERN = re.compile(rb'<(?:\w+:)?mergeCell\s+ref="([A-Z]+\d+(?::[A-Z]+\d+)?)"')
+_MERGE_SCAN_BLOCK_SIZE = 1024 * 1024
+
+# O calamine devolve todo número como float; até este valor, floats inteiros
+# voltam a ser int, como o openpyxl lê os números gravados sem casas decimais
+_MAX_EXACT_INTEGER = 2**53
+
+# O separador é o mais frequente entre os candidatos no início do arquivo
+# (o csv.Sniffer desiste de linhas com larguras diferentes, como as de título)
+_CSV_SAMPLE_SIZE = 64 * 1024
+_CSV_DELIMITERS = ";,\t|"
+# Exportações do Excel em português costumam vir em cp1252; latin-1 aceita
+# qualquer sequência de bytes
+_CSV_ENCODINGS = ("utf-8-sig", "cp1252", "latin-1")
+
+
+class Backend_Unavailable(Exception):
+    # O formato pede um backend cujo pacote não está instalado
+    pass
+
+
+def calamine_available() -> bool:
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def supported_extensions() -> tuple:
+    # Extensões que podem ser lidas com os pacotes instalados
+    extensions = OPENPYXL_EXTENSIONS
+    if calamine_available():
+        extensions += CALAMINE_ONLY_EXTENSIONS
+    return extensions + CSV_EXTENSIONS
+
+
+def choose_backend(file_path: str) -> str:
+    # Pelo tipo do arquivo e, nos .xlsx, pelo tamanho
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in CSV_EXTENSIONS:
+        return CSV
+    if extension in CALAMINE_ONLY_EXTENSIONS:
+        if not calamine_available():
+            raise Backend_Unavailable(
+                f"Arquivos '{extension}' precisam do pacote python-calamine (pip install python-calamine)."
+            )
+        return CALAMINE
+    if calamine_available() and os.path.getsize(file_path) >= FAST_BACKEND_MIN_BYTES:
+        return CALAMINE
+    return OPENPYXL
+
+
+def open_workbook(file_path: str, backend: str = None, read_only: bool = True):
+    # 'backend' None: escolhido por choose_backend. 'read_only' só muda o
+    # openpyxl (o modo completo carrega a planilha inteira na memória).
+    backend = backend or choose_backend(file_path)
+    if backend == OPENPYXL:
+        return Openpyxl_Workbook(file_path, read_only)
+    if backend == CALAMINE:
+        return Calamine_Workbook(file_path)
+    if backend == CSV:
+        return Csv_Workbook(file_path)
+    raise ValueError(f"Backend de leitura desconhecido: '{backend}'")
+
+
+# --- openpyxl ---
+
+
+class Openpyxl_Workbook:
+    name = OPENPYXL
+
+    def __init__(self, file_path: str, read_only: bool = True):
+        self.read_only = read_only
+        self.workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=read_only)
+
+    @property
+    def sheetnames(self) -> list:
+        return self.workbook.sheetnames
+
+    def __getitem__(self, sheet_name: str):
+        return Openpyxl_Sheet(self.workbook[sheet_name], self.read_only)
+
+    def close(self):
+        # Workbooks somente leitura mantêm o arquivo aberto até serem fechados
+        if self.read_only:
+            self.workbook.close()
+
+
+class Openpyxl_Sheet:
+    def __init__(self, worksheet, read_only: bool):
+        self.worksheet = worksheet
+        self.read_only = read_only
+
+    @property
+    def title(self) -> str:
+        return self.worksheet.title
+
+    @property
+    def max_row(self):
+        return self.worksheet.max_row
+
+    @property
+    def max_column(self):
+        return self.worksheet.max_column
+
+    def iter_rows(self, min_row: int = 1, max_row: int = None):
+        return self.worksheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+
+    def merged_ranges(self):
+        if not self.read_only:
+            for cell_range in self.worksheet.merged_cells.ranges:
+                yield cell_range.bounds
+            return
+        # Planilhas somente leitura não expõem 'merged_cells'; lemos as tags
+        # <mergeCell> direto do XML, em blocos, sem montar a planilha inteira.
+        tail = b""
+        with self.worksheet._get_source() as source:
+            while True:
+                block = source.read(_MERGE_SCAN_BLOCK_SIZE)
+                if not block:
+                    break
+                data = tail + block
+                last_end = 0
+                for match in _MERGE_CELL_PATTERN.finditer(data):
+                    last_end = match.end()
+                    yield range_boundaries(match.group(1).decode("ascii"))
+                # Preserva o final do bloco caso uma tag tenha sido cortada
+                tail = data[max(last_end, len(data) - 256) :]
+
+
+# --- calamine ---
+
+
+def _calamine_value(value):
+    # Mesmos tipos que o openpyxl devolve: None nas células vazias, int nos
+    # números inteiros e datetime nas datas sem hora
+    kind = type(value)
+    if kind is str:
+        return value or None
+    if kind is float:
+        if value.is_integer() and -_MAX_EXACT_INTEGER <= value <= _MAX_EXACT_INTEGER:
+            return int(value)
+        return value
+    if kind is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+class Calamine_Workbook:
+    name = CALAMINE
+
+    def __init__(self, file_path: str):
+        from python_calamine import CalamineWorkbook
+
+        self.workbook = CalamineWorkbook.from_path(file_path)
+        # O calamine só lê abas inteiras. A última carregada (ex.: para o
+        # cabeçalho e a dimensão, nos metadados da carga sob demanda) fica
+        # aqui até a leitura dos dados, que usa a mesma carga em vez de ler a
+        # aba de novo; carregar outra a descarta. (nome, aba) ou None.
+        self._loaded_sheet = None
+
+    @property
+    def sheetnames(self) -> list:
+        return list(self.workbook.sheet_names)
+
+    def __getitem__(self, sheet_name: str):
+        if sheet_name not in self.workbook.sheet_names:
+            raise KeyError(sheet_name)
+        return Calamine_Sheet(self, sheet_name)
+
+    def load_sheet(self, sheet_name: str):
+        if self._loaded_sheet is not None and self._loaded_sheet[0] == sheet_name:
+            return self._loaded_sheet[1]
+        # Solta a anterior antes de carregar: nunca duas abas inteiras guardadas
+        self._loaded_sheet = None
+        sheet = self.workbook.get_sheet_by_name(sheet_name)
+        self._loaded_sheet = (sheet_name, sheet)
+        return sheet
+
+    def release_sheet(self, sheet_name: str):
+        if self._loaded_sheet is not None and self._loaded_sheet[0] == sheet_name:
+            self._loaded_sheet = None
+
+    def close(self):
+        self._loaded_sheet = None
+        self.workbook.close()
+
+
+class Calamine_Sheet:
+    # A aba é lida (inteira, pelo calamine) no primeiro acesso aos dados, ou
+    # vem da carga já feita pelo workbook; os valores só viram objetos Python
+    # linha a linha, em iter_rows
+    def __init__(self, workbook: Calamine_Workbook, sheet_name: str):
+        self.workbook = workbook
+        self.title = sheet_name
+        self._sheet = None
+
+    @property
+    def sheet(self):
+        if self._sheet is None:
+            self._sheet = self.workbook.load_sheet(self.title)
+        return self._sheet
+
+    @property
+    def max_row(self):
+        end = self.sheet.end
+        return end[0] + 1 if end is not None else 0
+
+    @property
+    def max_column(self):
+        end = self.sheet.end
+        return end[1] + 1 if end is not None else 0
+
+    def iter_rows(self, min_row: int = 1, max_row: int = None):
+        # O iter_rows do calamine começa na linha 1, mas na primeira coluna
+        # usada: as colunas vazias à esquerda são repostas
+        start = self.sheet.start
+        padding = (None,) * (start[1] if start is not None else 0)
+        if max_row is None:
+            # Leitura dos dados: o workbook não precisa mais guardar a aba
+            self.workbook.release_sheet(self.title)
+        for row_number, row in enumerate(self.sheet.iter_rows(), start=1):
+            if max_row is not None and row_number > max_row:
+                break
+            if row_number >= min_row:
+                yield padding + tuple(map(_calamine_value, row))
+
+    def merged_ranges(self):
+        # (linha, coluna) a partir de 0 no calamine; None nos formatos sem mesclagem
+        for (first_row, first_column), (last_row, last_column) in self.sheet.merged_cell_ranges or ():
+            yield first_column + 1, first_row + 1, last_column + 1, last_row + 1
+
+
+# --- CSV ---
+
+
+class Csv_Workbook:
+    # Uma única aba, com o nome do arquivo. O CSV não tem tipos: os valores
+    # chegam como texto (datas dd/mm/aaaa viram datas na conversão de tipos)
+    name = CSV
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.encoding, self.delimiter = self._sniff()
+        self.sheet_name = os.path.splitext(os.path.basename(file_path))[0]
+
+    def _sniff(self):
+        with open(self.file_path, "rb") as f:
+            sample = f.read(_CSV_SAMPLE_SIZE)
+        if len(sample) == _CSV_SAMPLE_SIZE:
+            # Só linhas inteiras (e nenhum caractere cortado ao meio)
+            sample = sample[: sample.rfind(b"\n") + 1] or sample
+        for encoding in _CSV_ENCODINGS:
+            try:
+                text = sample.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        delimiter = max(_CSV_DELIMITERS, key=text.count)
+        return encoding, delimiter
+
+    @property
+    def sheetnames(self) -> list:
+        return [self.sheet_name]
+
+    def __getitem__(self, sheet_name: str):
+        if sheet_name != self.sheet_name:
+            raise KeyError(sheet_name)
+        return Csv_Sheet(self, sheet_name)
+
+    def close(self):
+        pass
+
+
+class Csv_Sheet:
+    max_row = None
+    max_column = None
+
+    def __init__(self, workbook: Csv_Workbook, sheet_name: str):
+        self.workbook = workbook
+        self.title = sheet_name
+
+    def iter_rows(self, min_row: int = 1, max_row: int = None):
+        # O arquivo é percorrido de novo a cada chamada, sem guardar as linhas
+        with open(self.workbook.file_path, encoding=self.workbook.encoding, newline="") as f:
+            for row_number, row in enumerate(csv.reader(f, delimiter=self.workbook.delimiter), start=1):
+                if max_row is not None and row_number > max_row:
+                    break
+                if row_number >= min_row:
+                    yield tuple(value or None for value in row)
+
+    def merged_ranges(self):
+        return iter(())
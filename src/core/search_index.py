@@ -0,0 +1,167 @@
+# src/core/search_index.py
+
+import re
+import bisect
+import weakref
+import unicodedata
+import numpy as np
+import pandas as pd
+
+from core.sheet_store import Sheet_Store
+
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+
+def normalize_text(text) -> str:
+    # "Pavimentação" -> "pavimentacao": sem acentos e sem diferença de caixa
+    # (os acentos viram caracteres combinantes no NFKD e são descartados junto
+    # com o restante fora do ASCII, que os tokens não usam)
+    text = unicodedata.normalize("NFKD", str(text).casefold())
+    return text.encode("ascii", "ignore").decode("ascii")
+
+
+def tokenize(text) -> list[str]:
+    return _TOKEN_PATTERN.findall(normalize_text(text))
+
+
+def _is_text_column(column: pd.Series) -> bool:
+    return (
+        isinstance(column.dtype, pd.CategoricalDtype)
+        or pd.api.types.is_string_dtype(column.dtype)
+        or pd.api.types.is_object_dtype(column.dtype)
+    )
+
+
+def _index_sheet(df_sheet: pd.DataFrame) -> dict[str, np.ndarray]:
+    # token -> posições (ordenadas, sem repetição) das linhas que o contêm
+    token_parts, row_parts = [], []
+    for i in range(df_sheet.shape[1]):
+        column = df_sheet.iloc[:, i]
+        if not _is_text_column(column):
+            continue
+        # Tokeniza cada valor distinto uma única vez
+        codes, uniques = pd.factorize(column)
+        if len(uniques) == 0:
+            continue
+        tokens = pd.Series(np.asarray(uniques, dtype=object)).map(tokenize).explode().dropna()
+        if tokens.empty:
+            continue
+        unique_ids = tokens.index.to_numpy()
+
+        # Linhas agrupadas por valor distinto; cada par (token, valor) vira o
+        # bloco de linhas daquele valor
+        row_order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[row_order], np.arange(len(uniques) + 1))
+        lengths = bounds[unique_ids + 1] - bounds[unique_ids]
+        block_starts = np.cumsum(lengths) - lengths
+        offsets = np.arange(lengths.sum()) - np.repeat(block_starts, lengths)
+        row_parts.append(row_order[np.repeat(bounds[unique_ids], lengths) + offsets])
+        token_parts.append(np.repeat(tokens.to_numpy(dtype=object), lengths))
+
+    if not token_parts:
+        return {}
+    token_codes, vocabulary = pd.factorize(np.concatenate(token_parts))
+    rows = np.concatenate(row_parts)
+    order = np.lexsort((rows, token_codes))
+    token_codes, rows = token_codes[order], rows[order]
+    # Remove a mesma linha repetida para um token (ex.: em duas colunas)
+    keep = np.ones(len(rows), dtype=bool)
+    keep[1:] = (token_codes[1:] != token_codes[:-1]) | (rows[1:] != rows[:-1])
+    token_codes, rows = token_codes[keep], rows[keep]
+    splits = np.searchsorted(token_codes, np.arange(1, len(vocabulary)))
+    return dict(zip(vocabulary, np.split(rows, splits)))
+
+
+def _file_source(data_by_sheet, sheet_name: str):
+    # Num Sheet_Store, o arquivo Arrow de onde a aba é lida (com as colunas
+    # derivadas acrescentadas depois); None para DataFrames na memória e abas
+    # da carga sob demanda ainda não lidas
+    if not isinstance(data_by_sheet, Sheet_Store):
+        return None
+    handle = data_by_sheet.handle(sheet_name)
+    if handle.path is None:
+        return None
+    extra_labels = tuple(label for _, label, _ in handle.extra_columns)
+    return (handle.path, handle.num_rows, handle.nbytes, extra_labels)
+
+
+class Search_Index:
+    # Índice invertido token -> linhas, por aba, sobre todas as colunas de
+    # texto. Cada atualização gera um novo índice que reaproveita as abas que
+    # não mudaram, sem alterar o índice antigo (que pode estar em uso).
+    # 'read_sheet(aba)' lê as abas a indexar (ex.: com cancelamento, pelo
+    # Filter_Engine).
+    def __init__(self, data_by_sheet: dict[str, pd.DataFrame] = None, previous=None, read_sheet=None):
+        self.data_by_sheet = data_by_sheet or {}
+        read_sheet = read_sheet or self.data_by_sheet.__getitem__
+        # aba -> (origem, {token: posições}). A origem é o arquivo da aba num
+        # Sheet_Store, que identifica a aba mesmo reaberta do cache ou
+        # descartada da memória (reaproveitada, ela nem é lida), ou uma
+        # referência fraca ao DataFrame indexado: o índice não segura as abas
+        # na memória, e uma aba descartada e lida de novo é indexada outra vez.
+        self.sheets = {}
+        for sheet_name in self.data_by_sheet:
+            old_entry = previous.sheets.get(sheet_name) if previous is not None else None
+            source = _file_source(self.data_by_sheet, sheet_name)
+            if old_entry is not None and source is not None and old_entry[0] == source:
+                self.sheets[sheet_name] = old_entry
+                continue
+            df_sheet = read_sheet(sheet_name)
+            if (
+                old_entry is not None
+                and isinstance(old_entry[0], weakref.ref)
+                and old_entry[0]() is df_sheet
+            ):
+                self.sheets[sheet_name] = old_entry
+                continue
+            # Uma aba da carga sob demanda só tem arquivo depois de lida
+            source = _file_source(self.data_by_sheet, sheet_name)
+            if source is None:
+                source = weakref.ref(df_sheet)
+            self.sheets[sheet_name] = (source, _index_sheet(df_sheet))
+
+        # Vocabulário ordenado para a busca por prefixo
+        sheets_by_token = {}
+        for sheet_name, (_, postings) in self.sheets.items():
+            for token in postings:
+                sheets_by_token.setdefault(token, []).append(sheet_name)
+        self.sheets_by_token = sheets_by_token
+        self.vocabulary = sorted(sheets_by_token)
+
+    def updated(self, data_by_sheet: dict[str, pd.DataFrame], read_sheet=None) -> "Search_Index":
+        return Search_Index(data_by_sheet, previous=self, read_sheet=read_sheet)
+
+    def _tokens_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        return self.vocabulary[start:end]
+
+    def search(self, query: str) -> dict[str, np.ndarray]:
+        # Todos os termos precisam aparecer na linha (E); cada termo vale como
+        # prefixo, para a busca acompanhar a digitação
+        terms = tokenize(query)
+        if not terms:
+            return {}
+
+        hits = None
+        for term in terms:
+            term_hits = {}
+            for token in self._tokens_with_prefix(term):
+                for sheet_name in self.sheets_by_token[token]:
+                    term_hits.setdefault(sheet_name, []).append(self.sheets[sheet_name][1][token])
+            term_hits = {
+                sheet_name: np.unique(np.concatenate(rows_list))
+                for sheet_name, rows_list in term_hits.items()
+            }
+            if hits is None:
+                hits = term_hits
+            else:
+                hits = {
+                    sheet_name: np.intersect1d(rows, term_hits[sheet_name], assume_unique=True)
+                    for sheet_name, rows in hits.items()
+                    if sheet_name in term_hits
+                }
+            if not hits:
+                return {}
+        return {sheet_name: rows for sheet_name, rows in hits.items() if len(rows)}
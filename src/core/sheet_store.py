@@ -0,0 +1,211 @@
+# src/core/sheet_store.py
+
+import os
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime
+import pandas as pd
+
+from config.settings import RESIDENT_SHEETS_MAX_BYTES
+from core.profiling import profiler
+
+# Nomes originais das colunas, guardados nos metadados do arquivo Arrow
+_LABELS_METADATA_KEY = b"evidencias.column_labels"
+
+
+def encode_label(label):
+    # O Arrow só aceita nomes de coluna em texto; os nomes originais (que podem
+    # ser None, números ou datas) são guardados à parte, com o tipo junto.
+    if isinstance(label, datetime):
+        return {"type": "datetime", "value": label.isoformat()}
+    return {"type": "raw", "value": label}
+
+
+def decode_label(encoded):
+    if encoded["type"] == "datetime":
+        return datetime.fromisoformat(encoded["value"])
+    return encoded["value"]
+
+
+class Sheet_Handle:
+    # Uma aba gravada em disco no formato Arrow IPC (Feather v2, sem
+    # compressão), que pode ser mapeado em memória sem cópia. 'extra_columns'
+    # são colunas derivadas (disciplina, arquivo de origem...) acrescentadas
+    # depois da gravação e reaplicadas a cada leitura.
+    __slots__ = ("path", "num_rows", "nbytes", "columns", "extra_columns", "_frame_ref", "_read_lock")
+
+    def __init__(self, path: str, num_rows: int, nbytes: int, columns: list):
+        self.path = path
+        self.num_rows = num_rows
+        self.nbytes = nbytes
+        self.columns = columns
+        self.extra_columns = []
+        self._frame_ref = None
+        # Duas threads pedindo a mesma aba: a segunda espera a leitura da
+        # primeira e recebe o mesmo DataFrame
+        self._read_lock = threading.Lock()
+
+    def read(self, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        # Enquanto o último DataFrame lido estiver em uso, ele é devolvido de
+        # novo: a mesma aba não existe duas vezes na memória. Progresso e
+        # cancelamento (como no Excel_Reader) só valem para as abas ainda não
+        # lidas da carga sob demanda.
+        with self._read_lock:
+            df = self._frame_ref() if self._frame_ref is not None else None
+            if df is not None:
+                return df
+            df = self._materialize(progress_callback, should_cancel)
+            for position, label, values in self.extra_columns:
+                df.insert(len(df.columns) if position is None else position, label, values)
+            self._frame_ref = weakref.ref(df)
+            return df
+
+    def _materialize(self, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        import pyarrow as pa
+
+        with profiler.stage("mapeamento da aba", rows=self.num_rows):
+            table = pa.ipc.open_file(pa.memory_map(self.path)).read_all()
+            # split_blocks: colunas numéricas e de data sem valores ausentes
+            # viram arrays que apontam direto para o arquivo mapeado
+            df = table.to_pandas(split_blocks=True)
+            df.columns = list(self.columns)
+        return df
+
+    def loaded_frame(self):
+        # DataFrame já lido e ainda vivo, ou None
+        return self._frame_ref() if self._frame_ref is not None else None
+
+
+def write_sheet(df: pd.DataFrame, path: str) -> Sheet_Handle:
+    import pyarrow as pa
+
+    df_to_write = df.copy(deep=False)
+    df_to_write.columns = [f"c{j}" for j in range(df.shape[1])]
+    table = pa.Table.from_pandas(df_to_write, preserve_index=False)
+    labels = json.dumps([encode_label(c) for c in df.columns], ensure_ascii=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_LABELS_METADATA_KEY] = labels.encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return Sheet_Handle(path, table.num_rows, table.nbytes, list(df.columns))
+
+
+def open_sheet(path: str) -> Sheet_Handle:
+    # Lê só o esquema e o tamanho dos blocos; os dados ficam no disco
+    import pyarrow as pa
+
+    reader = pa.ipc.open_file(pa.memory_map(path))
+    labels = json.loads(reader.schema.metadata[_LABELS_METADATA_KEY].decode("utf-8"))
+    num_rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    return Sheet_Handle(path, num_rows, os.path.getsize(path), [decode_label(c) for c in labels])
+
+
+class Resident_Frames:
+    # Abas lidas dos arquivos mapeados que ficam na memória, das mais usadas
+    # recentemente, até 'max_bytes' (estimado pelo tamanho dos dados no Arrow).
+    # A aba mais recente nunca é descartada, mesmo se passar do limite.
+    def __init__(self, max_bytes: int = RESIDENT_SHEETS_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.resident_bytes = 0
+        # Sheet_Handle -> DataFrame
+        self._frames = OrderedDict()
+        # A carga em segundo plano, os filtros e a interface leem as mesmas
+        # abas. O lock protege só o dicionário: a leitura (mapeamento ou carga
+        # sob demanda) fica fora dele, para uma aba demorada não travar o
+        # acesso às que já estão na memória
+        self._lock = threading.Lock()
+
+    def get(self, handle: Sheet_Handle, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        with self._lock:
+            df = self._frames.get(handle)
+            if df is not None:
+                self._frames.move_to_end(handle)
+                return df
+        df = handle.read(progress_callback, should_cancel)
+        with self._lock:
+            if handle in self._frames:
+                # Lida ao mesmo tempo por outra thread (o mesmo DataFrame)
+                self._frames.move_to_end(handle)
+                return df
+            self._frames[handle] = df
+            self.resident_bytes += handle.nbytes
+            while self.resident_bytes > self.max_bytes and len(self._frames) > 1:
+                evicted, _ = self._frames.popitem(last=False)
+                self.resident_bytes -= evicted.nbytes
+            return df
+
+    def clear(self):
+        with self._lock:
+            self._frames = OrderedDict()
+            self.resident_bytes = 0
+
+
+_default_resident_frames = None
+
+
+def get_default_resident_frames() -> Resident_Frames:
+    # Um único limite de memória para todas as abas abertas no processo
+    global _default_resident_frames
+    if _default_resident_frames is None:
+        _default_resident_frames = Resident_Frames()
+    return _default_resident_frames
+
+
+class Sheet_Store(Mapping):
+    # Abas por nome, como o dict de DataFrames devolvido pelo leitor, mas
+    # guardando só referências aos arquivos: cada aba é mapeada quando pedida e
+    # fica na memória enquanto couber em Resident_Frames.
+    def __init__(self, handles: dict[str, Sheet_Handle], resident: Resident_Frames = None):
+        self.handles = dict(handles)
+        self.resident = resident if resident is not None else get_default_resident_frames()
+
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        return self.resident.get(self.handles[sheet_name])
+
+    def __iter__(self):
+        return iter(self.handles)
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __contains__(self, sheet_name) -> bool:
+        # Sem ler a aba (o padrão do Mapping chamaria __getitem__)
+        return sheet_name in self.handles
+
+    def load(self, sheet_name: str, progress_callback=None, should_cancel=None) -> pd.DataFrame:
+        # Como store[aba], acompanhando a leitura de uma aba ainda não lida
+        # (ver Sheet_Handle.read)
+        return self.resident.get(self.handles[sheet_name], progress_callback, should_cancel)
+
+    def handle(self, sheet_name: str) -> Sheet_Handle:
+        return self.handles[sheet_name]
+
+    def row_count(self, sheet_name: str) -> int:
+        return self.handles[sheet_name].num_rows
+
+    def loaded_frames(self) -> list[pd.DataFrame]:
+        # Só as abas já lidas e ainda na memória, sem ler as demais
+        frames = (handle.loaded_frame() for handle in self.handles.values())
+        return [df for df in frames if df is not None]
+
+    def insert_column(self, sheet_name: str, label, values, position: int = None):
+        handle = self.handles[sheet_name]
+        handle.extra_columns.append((position, label, values))
+        df = handle.loaded_frame()
+        if df is not None:
+            df.insert(len(df.columns) if position is None else position, label, values)
+
+
+def insert_column(data_by_sheet, sheet_name: str, label, values, position: int = None):
+    # Acrescenta uma coluna derivada a uma aba, num dict de DataFrames ou num
+    # Sheet_Store (onde a coluna sobrevive ao descarte da aba da memória)
+    if isinstance(data_by_sheet, Sheet_Store):
+        data_by_sheet.insert_column(sheet_name, label, values, position)
+        return
+    df_sheet = data_by_sheet[sheet_name]
+    df_sheet.insert(len(df_sheet.columns) if position is None else position, label, values)
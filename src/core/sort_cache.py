@@ -0,0 +1,94 @@
+# src/core/sort_cache.py
+
+import numbers
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def _text_ranks(values: np.ndarray) -> np.ndarray:
+    # Ordem dos valores distintos sem diferenciar maiúsculas; números antes de textos
+    return np.array(
+        sorted(
+            range(len(values)),
+            key=lambda i: (
+                (0, values[i], "")
+                if isinstance(values[i], numbers.Real) and not isinstance(values[i], bool)
+                else (1, 0, str(values[i]).casefold())
+            ),
+        ),
+        dtype=np.intp,
+    ).argsort(kind="stable")
+
+
+def sort_keys(column: pd.Series):
+    # Chave numérica de cada linha segundo o tipo da coluna (datas em ordem
+    # cronológica, números pelo valor, textos e categorias em ordem
+    # alfabética) e a máscara dos valores ausentes
+    missing = column.isna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column.to_numpy(dtype="datetime64[ns]").view(np.int64), missing
+    if pd.api.types.is_bool_dtype(column):
+        return column.fillna(False).to_numpy(dtype=np.int64), missing
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64, na_value=np.nan), missing
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        categories = np.asarray(column.cat.categories, dtype=object)
+    else:
+        codes, categories = pd.factorize(column)
+        categories = np.asarray(categories, dtype=object)
+    # Ordena só os valores distintos; as linhas herdam a posição do seu valor
+    ranks = np.append(_text_ranks(categories), -1) if len(categories) else np.array([-1])
+    return ranks[codes], missing
+
+
+def sort_permutation(column: pd.Series, ascending: bool = True) -> np.ndarray:
+    # Posições das linhas em ordem; ordenação estável (empates mantêm a ordem
+    # original) e valores ausentes sempre no fim
+    keys, missing = sort_keys(column)
+    valid_rows = np.flatnonzero(~missing)
+    valid_keys = keys[valid_rows]
+    order = np.argsort(valid_keys if ascending else -valid_keys, kind="stable")
+    return np.concatenate([valid_rows[order], np.flatnonzero(missing)])
+
+
+class Sort_Cache:
+    # Permutações de ordenação por DataFrame e por (coluna, sentido),
+    # calculadas uma única vez. O DataFrame ordenado mais recente também fica
+    # guardado, para a paginação não refazer o 'take'. Tudo é descartado
+    # quando o DataFrame deixa de existir ou sai do cache.
+    def __init__(self, max_cached_frames: int = 8):
+        self.max_cached_frames = max_cached_frames
+        # id -> (referência fraca, {(posição, crescente): permutação}, [chave, DataFrame ordenado])
+        self._entries = OrderedDict()
+
+    def _entry(self, df: pd.DataFrame):
+        entry = self._entries.get(id(df))
+        if entry is not None and entry[0]() is df:
+            self._entries.move_to_end(id(df))
+            return entry
+        entry = (weakref.ref(df), {}, [None, None])
+        self._entries[id(df)] = entry
+        while len(self._entries) > self.max_cached_frames:
+            self._entries.popitem(last=False)
+        return entry
+
+    def permutation(self, df: pd.DataFrame, column_position: int, ascending: bool = True) -> np.ndarray:
+        _, permutations, _ = self._entry(df)
+        key = (column_position, ascending)
+        if key not in permutations:
+            permutations[key] = sort_permutation(df.iloc[:, column_position], ascending)
+        return permutations[key]
+
+    def sorted_frame(self, df: pd.DataFrame, column_position: int, ascending: bool = True) -> pd.DataFrame:
+        _, _, last_sorted = self._entry(df)
+        key = (column_position, ascending)
+        if last_sorted[0] != key:
+            permutation = self.permutation(df, column_position, ascending)
+            last_sorted[:] = [key, df.take(permutation).reset_index(drop=True)]
+        return last_sorted[1]
+
+    def clear(self):
+        self._entries = OrderedDict()
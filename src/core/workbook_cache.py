@@ -0,0 +1,205 @@
+# src/core/workbook_cache.py
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import importlib.util
+import pandas as pd
+
+from config.settings import CACHE_DIR, CACHE_MAX_BYTES
+from core.excel_reader import PARSER_VERSION
+from core.sheet_store import Sheet_Store, open_sheet, write_sheet
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+_MANIFEST_NAME = "manifest.json"
+# Formato dos arquivos das abas; entradas gravadas em outro formato (ex.: as
+# antigas em Parquet) são tratadas como ausentes
+_STORAGE_FORMAT = "arrow-ipc"
+# Pastas temporárias de gravação ('<chave>.tmp-<pid>') mais antigas que isto
+# sobraram de um processo interrompido e são removidas em _evict
+_STALE_TMP_SECONDS = 60 * 60
+
+
+class Workbook_Cache:
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # O formato colunar (Arrow) depende do pyarrow; sem ele o cache fica inativo
+        self.enabled = importlib.util.find_spec("pyarrow") is not None
+        if not self.enabled:
+            print("Cache de workbooks desativado: pyarrow não está instalado.")
+
+    def _file_key(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        digest.update(f"|{stat.st_size}|{stat.st_mtime_ns}|{PARSER_VERSION}".encode())
+        return digest.hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def _read_manifest(self, entry_dir: str) -> dict:
+        try:
+            with open(os.path.join(entry_dir, _MANIFEST_NAME), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, entry_dir: str, manifest: dict):
+        with open(os.path.join(entry_dir, _MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    def get(self, file_path: str) -> Sheet_Store:
+        # As abas voltam mapeadas do disco (Sheet_Store): só são lidas quando
+        # usadas, e duas sessões com o mesmo arquivo compartilham as páginas
+        if not self.enabled:
+            return None
+        try:
+            entry_dir = self._entry_dir(self._file_key(file_path))
+            manifest = self._read_manifest(entry_dir)
+            if (
+                not manifest
+                or manifest.get("parser_version") != PARSER_VERSION
+                or manifest.get("format") != _STORAGE_FORMAT
+            ):
+                return None
+
+            handles = {
+                sheet["name"]: open_sheet(os.path.join(entry_dir, sheet["file"]))
+                for sheet in manifest["sheets"]
+            }
+
+            # Marca o acesso para a política LRU
+            manifest["last_access"] = time.time()
+            self._write_manifest(entry_dir, manifest)
+            return Sheet_Store(handles)
+        except Exception as e:
+            print(f"Erro ao ler o cache do workbook: {e}")
+            return None
+
+    def put(self, file_path: str, data_by_sheet: dict[str, pd.DataFrame]) -> Sheet_Store:
+        # Devolve as abas gravadas já mapeadas do disco (ou None se não gravou),
+        # para o chamador poder soltar os DataFrames lidos
+        return self._store(file_path, data_by_sheet, write_sheet)
+
+    def put_sheet_files(self, file_path: str, sheet_files: dict[str, str]) -> Sheet_Store:
+        # Abas já gravadas em Arrow por write_sheet (ex.: pela carga sob
+        # demanda): os arquivos só são copiados para a entrada do cache
+        return self._store(file_path, sheet_files, shutil.copyfile)
+
+    def _store(self, file_path: str, sheets_by_name: dict, write) -> Sheet_Store:
+        if not self.enabled or not sheets_by_name:
+            return None
+        tmp_dir = None
+        try:
+            key = self._file_key(file_path)
+            entry_dir = self._entry_dir(key)
+            tmp_dir = f"{entry_dir}.tmp-{os.getpid()}"
+            os.makedirs(tmp_dir, exist_ok=True)
+
+            sheets = []
+            for i, (sheet_name, sheet) in enumerate(sheets_by_name.items()):
+                file_name = f"sheet_{i}.arrow"
+                write(sheet, os.path.join(tmp_dir, file_name))
+                sheets.append({"name": sheet_name, "file": file_name})
+
+            now = time.time()
+            self._write_manifest(
+                tmp_dir,
+                {
+                    "source": os.path.abspath(file_path),
+                    "parser_version": PARSER_VERSION,
+                    "format": _STORAGE_FORMAT,
+                    "created": now,
+                    "last_access": now,
+                    "sheets": sheets,
+                },
+            )
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            try:
+                os.replace(tmp_dir, entry_dir)
+            except OSError:
+                # Outro processo gravou a mesma entrada (mesma chave, mesmo
+                # conteúdo) entre a remoção e a troca: vale a dele
+                manifest = self._read_manifest(entry_dir)
+                if not manifest or manifest.get("format") != _STORAGE_FORMAT:
+                    raise
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                sheets = manifest["sheets"]
+            tmp_dir = None
+
+            self._invalidate_stale(os.path.abspath(file_path), keep=key)
+            self._evict()
+            return Sheet_Store(
+                {
+                    sheet["name"]: open_sheet(os.path.join(entry_dir, sheet["file"]))
+                    for sheet in sheets
+                }
+            )
+        except Exception as e:
+            print(f"Erro ao gravar o cache do workbook: {e}")
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+    def _iter_entries(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, name)
+            if os.path.isdir(entry_dir) and ".tmp-" not in name:
+                yield name, entry_dir, self._read_manifest(entry_dir)
+
+    def _invalidate_stale(self, source: str, keep: str):
+        # Uma nova versão do mesmo arquivo torna as entradas anteriores obsoletas
+        for name, entry_dir, manifest in list(self._iter_entries()):
+            if name == keep:
+                continue
+            if (
+                not manifest
+                or manifest.get("source") == source
+                or manifest.get("parser_version") != PARSER_VERSION
+                or manifest.get("format") != _STORAGE_FORMAT
+            ):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _entry_size(self, entry_dir: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(entry_dir, name)) for name in os.listdir(entry_dir)
+        )
+
+    def _remove_stale_tmp_dirs(self):
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            tmp_dir = os.path.join(self.cache_dir, name)
+            if ".tmp-" not in name or not os.path.isdir(tmp_dir):
+                continue
+            try:
+                if now - os.path.getmtime(tmp_dir) > _STALE_TMP_SECONDS:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+            except OSError:
+                continue
+
+    def _evict(self):
+        # Remove as entradas menos usadas recentemente até caber no limite
+        # (e as gravações interrompidas, que não são entradas)
+        self._remove_stale_tmp_dirs()
+        entries = [
+            (manifest.get("last_access", 0), entry_dir, self._entry_size(entry_dir))
+            for _, entry_dir, manifest in self._iter_entries()
+            if manifest
+        ]
+        total = sum(size for _, _, size in entries)
+        for _, entry_dir, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -1,7 +1,13 @@
 # src/main.py
 
+import time
+
+# Marca o início o mais cedo possível, para medir o tempo de inicialização
+STARTUP_STARTED_AT = time.perf_counter()
+
 import sys
 import os
+import multiprocessing
 from ui.app import App
 
 # Adiciona o diretório 'src' ao path para permitir importações relativas
@@ -10,5 +16,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 
 if __name__ == "__main__":
-    app = App()
+    # Necessário para os processos de leitura paralela no executável do Windows
+    multiprocessing.freeze_support()
+    app = App(startup_started_at=STARTUP_STARTED_AT)
     app.mainloop()
@@ -0,0 +1,91 @@
+# src/ui/column_widths.py
+
+import weakref
+from collections import OrderedDict
+import pandas as pd
+
+from ui.formatting import format_column
+
+# Larguras de glifos e de textos já medidos, por fonte. Cada medição é uma ida
+# e volta ao Tcl, então nenhuma é feita duas vezes.
+_FONT_MEASUREMENTS = {}
+
+
+class Column_Width_Engine:
+    def __init__(
+        self,
+        font,
+        padding: int = 20,
+        max_width: int = 500,
+        top_k: int = 5,
+        max_cached_frames: int = 32,
+    ):
+        self.font = font
+        self.padding = padding
+        self.max_width = max_width
+        # Quantos textos mais longos de cada coluna são candidatos à medição
+        self.top_k = top_k
+        self.max_cached_frames = max_cached_frames
+        font_key = str(sorted(font.actual().items()))
+        self._glyph_widths, self._text_widths = _FONT_MEASUREMENTS.setdefault(
+            font_key, ({}, {})
+        )
+        # Larguras já calculadas por DataFrame (id -> (referência fraca, larguras))
+        self._widths_by_frame = OrderedDict()
+
+    def measure(self, text: str) -> int:
+        width = self._text_widths.get(text)
+        if width is None:
+            width = self.font.measure(text)
+            self._text_widths[text] = width
+        return width
+
+    def estimate(self, text: str) -> int:
+        # Soma das larguras dos glifos: mede cada caractere uma única vez
+        total = 0
+        for char in text:
+            width = self._glyph_widths.get(char)
+            if width is None:
+                width = self.font.measure(char)
+                self._glyph_widths[char] = width
+            total += width
+        return total
+
+    def _longest_values(self, column: pd.Series) -> list[str]:
+        if column.empty:
+            return []
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # Todas as datas têm o mesmo formato (dd/mm/aaaa)
+            return format_column(column.dropna().head(1))
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Poucos valores distintos: basta olhar as categorias
+            categories = pd.Series(column.cat.categories.astype(str))
+            return categories[categories.str.len().nlargest(self.top_k).index].tolist()
+        lengths = column.astype("string").str.len().fillna(0)
+        top_positions = lengths.reset_index(drop=True).nlargest(self.top_k).index
+        return format_column(column.iloc[top_positions])
+
+    def _compute_widths(self, df: pd.DataFrame) -> dict:
+        widths = {}
+        for i, col in enumerate(df.columns):
+            max_width = self.measure(str(col))
+            candidates = self._longest_values(df.iloc[:, i])
+            if candidates:
+                # Estimativa por glifos para escolher; medição exata só do maior
+                widest = max(candidates, key=self.estimate)
+                max_width = max(max_width, self.measure(widest))
+            widths[col] = min(max_width + self.padding, self.max_width)
+        return widths
+
+    def widths_for(self, df: pd.DataFrame) -> dict:
+        # Mesmo DataFrame (ex.: páginas do mesmo resultado) reaproveita o cálculo
+        entry = self._widths_by_frame.get(id(df))
+        if entry is not None and entry[0]() is df:
+            self._widths_by_frame.move_to_end(id(df))
+            return entry[1]
+
+        widths = self._compute_widths(df)
+        self._widths_by_frame[id(df)] = (weakref.ref(df), widths)
+        while len(self._widths_by_frame) > self.max_cached_frames:
+            self._widths_by_frame.popitem(last=False)
+        return widths
@@ -0,0 +1,107 @@
+# src/ui/diagnostics_window.py
+
+import customtkinter as ctk
+from tkinter import filedialog, messagebox, ttk
+
+from core.profiling import profiler
+
+_COLUMNS = (
+    ("stage", "Etapa", 200),
+    ("sheet", "Aba", 160),
+    ("calls", "Chamadas", 80),
+    ("seconds", "Tempo (ms)", 100),
+    ("self_seconds", "Tempo próprio (ms)", 130),
+    ("rows", "Linhas", 90),
+    ("memory_delta_bytes", "Memória (KiB)", 110),
+)
+
+
+class DiagnosticsWindow(ctk.CTkToplevel):
+    # Painel com os totais do profiler por etapa e por aba
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Diagnóstico")
+        self.geometry("900x420")
+
+        controls_frame = ctk.CTkFrame(self)
+        controls_frame.pack(fill="x", padx=10, pady=(10, 5))
+        self.enabled_switch = ctk.CTkSwitch(
+            controls_frame, text="Medir etapas", command=self._toggle_profiling
+        )
+        self.enabled_switch.pack(side="left", padx=10, pady=10)
+        self.memory_switch = ctk.CTkSwitch(
+            controls_frame, text="Medir memória (mais lento)", command=self._toggle_profiling
+        )
+        self.memory_switch.pack(side="left", padx=10, pady=10)
+        if profiler.enabled:
+            self.enabled_switch.select()
+        ctk.CTkButton(controls_frame, text="Atualizar", width=90, command=self.refresh).pack(
+            side="left", padx=(10, 5), pady=10
+        )
+        ctk.CTkButton(controls_frame, text="Limpar", width=90, command=self._clear).pack(
+            side="left", padx=5, pady=10
+        )
+        ctk.CTkButton(controls_frame, text="Salvar JSON", width=110, command=self._save_json).pack(
+            side="left", padx=5, pady=10
+        )
+
+        table_frame = ctk.CTkFrame(self)
+        table_frame.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        scrollbar_y = ctk.CTkScrollbar(table_frame, orientation="vertical")
+        scrollbar_y.pack(side="right", fill="y")
+        self.tree = ttk.Treeview(
+            table_frame,
+            columns=[key for key, _, _ in _COLUMNS],
+            show="headings",
+            yscrollcommand=scrollbar_y.set,
+        )
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar_y.configure(command=self.tree.yview)
+        for key, title, width in _COLUMNS:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=width, anchor="w" if key in ("stage", "sheet") else "e")
+
+        self.refresh()
+
+    def _toggle_profiling(self):
+        if self.enabled_switch.get():
+            profiler.disable()
+            profiler.enable(track_memory=bool(self.memory_switch.get()))
+        else:
+            profiler.disable()
+
+    def _clear(self):
+        profiler.reset()
+        self.refresh()
+
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        for total in profiler.summary():
+            memory = total["memory_delta_bytes"]
+            self.tree.insert(
+                "",
+                "end",
+                values=(
+                    total["stage"],
+                    total["sheet"] or "",
+                    total["calls"],
+                    f"{total['seconds'] * 1000:.1f}",
+                    f"{total['self_seconds'] * 1000:.1f}",
+                    "" if total["rows"] is None else total["rows"],
+                    "" if memory is None else f"{memory / 1024:.0f}",
+                ),
+            )
+
+    def _save_json(self):
+        output_path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Salvar diagnóstico",
+            defaultextension=".json",
+            filetypes=(("JSON", "*.json"),),
+        )
+        if not output_path:
+            return
+        try:
+            profiler.dump_json(output_path)
+        except OSError as e:
+            messagebox.showerror("Erro", f"Falha ao salvar o diagnóstico: {e}", parent=self)
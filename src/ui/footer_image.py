@@ -0,0 +1,37 @@
+# src/ui/footer_image.py
+
+import os
+import hashlib
+
+from config.settings import ASSETS_CACHE_DIR
+
+FOOTER_SIZE = (1280, 100)
+
+
+def get_footer_image_path() -> str:
+    # Decodifica e redimensiona o logo uma única vez e guarda o PNG pronto em
+    # disco. Nas próximas execuções o Tk abre o PNG direto, sem PIL.
+    from ui.footer_logo import FOOTER_LOGO_BASE64
+
+    width, height = FOOTER_SIZE
+    logo_hash = hashlib.blake2b(FOOTER_LOGO_BASE64.encode("ascii"), digest_size=8)
+    image_path = os.path.join(
+        ASSETS_CACHE_DIR, f"footer_{width}x{height}_{logo_hash.hexdigest()}.png"
+    )
+    if os.path.exists(image_path):
+        return image_path
+
+    import base64
+    import io
+    from PIL import Image
+
+    image_data = base64.b64decode(FOOTER_LOGO_BASE64)
+    img_pil = Image.open(io.BytesIO(image_data))
+    # Redimensiona a imagem usando um filtro de alta qualidade (LANCZOS)
+    resized_img = img_pil.resize(FOOTER_SIZE, Image.Resampling.LANCZOS)
+
+    os.makedirs(ASSETS_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{image_path}.tmp-{os.getpid()}"
+    resized_img.save(tmp_path, format="PNG")
+    os.replace(tmp_path, image_path)
+    return image_path
@@ -0,0 +1,8 @@
+# src/ui/footer_logo.py
+# Logo do rodapé em base64. Substitua o conteúdo desta string pelo seu próprio
+# código base64; a versão redimensionada em cache é refeita automaticamente.
+
+FOOTER_LOGO_BASE64 = """
+               iVBORw0KGgoAAAANSUhEUgAABh8AAAC0CAYAAACEwD1XAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAP+lSURBVHhe7P1XkBxnmqYLvh4eWmekVkBCK5IASYAACWoWq4qsZlX3zHTXzJnq7mob2+qRp3ovjtmu7bnoY7Z356b6snvN9uxc9PSM2XSP6CpqAhTQklCJRGqdkRlah8t/L8I/p6cjRUQgM5EA/8fMLSNd/K7dI973/75POHv2LAOHw+FwOBwOh8PhcJ443hTeso/icDgcDofD4XC2BQ77CA6Hw+FwOBwOh8PhcDgcDofD4XA4nEeBmw8cDofD4XA4HA6Hw+FwOBwOh8PhcDYUbj5wOBwOh8PhcDgcDofD4XA4HA6Hw9lQuPnA4XA4HA6Hw+FwOBwOh8PhcDgcDmdD4eYDh8PhcDgcDofD4XA4HA6Hw+FwOJwNhZsPHA6Hw+FwOBwOh8PhcDgcDofD4XA2FG4+cDgcDofD4XA4HA6Hw+FwOBwOh8PZULj5wOFwOBwOh8PhcDgcDofD4XA4HA5nQ+HmA4fD4XA4HA6Hw+FwOBwOh8PhcDicDYWbDxwOh8PhcDgcDofD4XA4HA6Hw+FwNhRuPjxGdF2HqqpQFAWSJKFcLqNUKqFYLCKfzyOfz6NQKKBYLKJSqUCSJCiKAlVVwRizN8fhcDgcDofD4XA4HA6Hw+FwOBzOtkA4e/YsV7E3EU3TTJNB13VommYaCKqqQtM0cxx9pnkZYxBFEQ6HA06nE263G06n86GBpouiCEEQIIoiRFG0bwqHw+FwOBwOh8N5ynhTeMs+isPhcDgcDofD2RZw82EDsUYj6LoOWZbN6IV8Po9qtQpZllEul1GtVqHrurkcY8w0J3RdN6eRqUAGg8PhWGYuCIIAAAiFQohEIvD7/YhEIgiFQnC73eb20HwcDofD4XA4HA7n6YGbDxwOh8PhcDic7Qo3HzYIWZaRy+WWDaVSCZVKxYxmkGUZkiRBkiSoqopqtQqHwwGXywWXy2WaCjQIggBBEOBwOOBwOJZFUKiqaral6zrC4TBaW1sRDAbh9/vh9Xrh8XgQCAQQiUQQi8Xg8/nsm83hcDgcDofD4XCeYLj5wOFwOBwOh8PZrnDzoUk0TUMqlUI2m0WlUkE6nUa5XIYkSahWq2atBkmSlhkMZCIoigJd11GpVKDruplSieZzu93LUig5HLXyHLIsQ5ZlaJq2zMhwuVwIhULw+/1wu93QdR2CIMDn8yEcDiMSicDj8cDr9aKlpQWtra1wOp323eJwOBwOh8PhcDhPENx84HA4HA6Hw+FsV7j50ACMMRQKBRQKBSQSCczPzyOTyUCWZZRKJZTLZQiCAJfLBUEQzELSuq7D5XLB6/XC5/PB5XJB0zQ4HA5UKhXTgBAEwazjIIqiaUJYUy+RcUE1I8iMAAC32w2XywWPx2PWkLCOJ5Ojs7MT/f39ZjSE3++37SmHw+FwOBwOh8N5EuDmA4fD4XA4HA5nu8LNh3VgjEHTNMiyjGw2i9HRUUxMTCAej6NcLsPhcCAQCCAQCCCXy0GSJHi9XoRCIbhcLjDGUK1WUa1WAcAU+91ut5lOSZZlFAqFZbUeyHywF5oWRRGMMSiKAkVRzFROtIzT6YTX64XD4TDnU1UVgiBAVVUoigK3241QKIRYLIbu7m709/cjEAiYpgmHw+FwOBwOh8N5MuDmA4fD4XA4HA5nu8LNh3VIJpMYHx/H8PAw5ubmoCgKAoEAGGMolUqQJAkulwstLS0IBAKQJAmlUgmMMQQCAQSDQYiiCFVVUalUIMsyBEEwDQsS/DVNQ7VaNQ0FxphZ84GMCrfbbRoRACBJkmk+6LpuzkMmhdWokGUZTqcTsixDVVVzXlEU4Xa70dHRgT179qCrq8ssZs3hcDgcDofD4XC2N9x84HA4HA6Hw+FsV7j5YENVVWQyGUxNTWFmZgZLS0uoVCqAEQVRLpdNoV/TNDOlktPpRDAYhNfrhSAIpilAdRY8Hg8YY2aqJFqOikM7nU5ommZGWVBRaYqEAGAaBlQXwpraSVEUM+WTy6gtQUWrqT4EbTelZKJ5yOjw+XwIBoPo6OjArl27EAgEzFoTHA6Hw+FwOBwOZ/vBzQcOh8PhcDgcznaFmw+GqSDLMlKpFObn5zE3N4elpSVks1kUi0UAgN/vRyAQAABUq1VIkgTGmCngAzDNhFAoBFEUUS6XoSiKmQrJ4/GYdRuoUDSlVfJ4PPB4PGaUhKZpZl0HTdPM9E8Oh2NZYWqHwwFVVSFJEjRNM6dRjQh7miYyI3Rdh6ZpEATBTP1EtSMCgQB6enrQ3t6Orq4uBAIBHg3B4XA4HA6Hw+FsQ7j5wOFwOBwOh8PZrnyvzQeKRMjn81haWsLY2BhGRkaQSqXg9/sRiUTgcDggSRKq1SoEQUA0GoUoiigWi5AkyRTvqVg0pVSKRCJwuVymAUFRCRTlAACyLENRFDDG4Ha7zSgI2jaqAUEREKqqmuPJhKCUTBRRQeOt5oNg1HEgAwIAdF2HLMvQNA1ut3vZODJXWlpasHfvXvT29iIUCsHj8ZhtcTgcDofD4XA4nMcPNx84HA6Hw+FwONuV7635oGkaisUilpaWMD4+jqGhIWSzWbPGgtPphMPhMNMm6bpuplzy+Xxm8WYY6ZBoINHf4/GYaZhI1JdlGaIomm06nU6zHgNFLVgjIEjot0Y+UNQCY7XTxhgzC0yTSUEmCLVB7QhGOigyNch80XXdjGygtE9kVDidTrS3t2PHjh3o6uqCz+fjURAcDofD4XA4HM42gZsPHA6Hw+FwOJztyvfOfGCMIZfLIR6PY2pqCtPT08jn8yiVSmbKIhLjqZaDy+UyUyYpimJGGahG4Wan02lGM5Dw73A4zEgHEuxpOcYYXC4XfD4fHEZNBTIWyDSwFpe2mgXWiAgyJCiqQjBSKtH6KSLDGq0gGHUirPUkVFU1p9H/ZD4oigKHw2HWgujo6EB7ezs8Ho/ZJofD4XA4HA6Hw3k8cPOBw+FwOBwOh7Nd+d6YD4wxFItFxONxzM7OYmFhAclkErlczoxYoEgB+/9Oo2aD1+s1IwOq1eqyGgwUDUAmALVjredARoKiKGaEgsvlgtvtNo0DMhbI/HC73eZ2WKMd7CYEGQ00j9V4IFPBuhxFU8BifDCj8LRuSfVUrVbNdE4ejwfhcBhdXV1oa2sz01JxOBwOh8PhcDicxwM3HzgcDofD4XA425XvhfkgyzKSySSmp6dN46FYLJrmAUU4wOj9bzUTKILAGv1ANRFgmA0k9AOAKIpm9INgpHCivz6fD263G7qRhkk3aje4jOLRolEcmkwFap+2z2oikElAnzVNM9dP7dL8VmgZGmC0R4aIdRptp2oUvqbaFYFAAO3t7ejs7EQsFjNrRnA4HA6Hw+FwOJythZsPHA6Hw+FwOJztylNvPkiShNnZWdy+fRvT09NmL39N0yAa9ReoFgOlOSLx3ev1mp9puiiKSCQS0DQNPp8PPp/PNAY0o27DSmmYyIDwer1myiJrhAGZFlYTggwFisSg4tJW04AMBl3Xl5kTVvOB9sHhcJhtWiMmyOywpmKi9dN4TdPMdE2UiikUCqG3txcDAwOmWcPhcDgcDofD4XC2Dm4+cDgcDofD4XC2K0+1+VAqlXD79m3cunULmUzGFNq9Xi/cbrcptlPxZ1VVwRgzCz6TKeDxeCAYtRIYY4jH45AkCeFwGJFIxCz4bI+eEIxaDNZxZHBQRINV5IdhVlDkBUU3wDADaBqZCiulPBIsqZdgzGP93xrdQG1Te2Qw6EZaJuv8ZEJIkmQaEKqqwuv1or+/H/v27eMGBIfD4XA4HA6Hs8Vw84HD4XA4HA6Hs115as2HmZkZ3Lp1CxMTEygUCoAhrns8HtMAcLvdcLlcKBaLcBsFnmk+qrdA0QWU+qhcLmN0dNSMfIhEIgiHw8vaJVNAMIpHW6MfaLp1G0RRNKMxmBFlIYqiGfEAwwSAJQqC2iPjgNZHBguZEBQBQYaDdSCDgfaR1qNpmmnEWM0Kzah3oSiKaVTIsgy3242dO3eiv7+fF6LmcDgcDofD4XC2EG4+cDgcDofD4XC2K0+d+VAulzE9PY1vv/0WMzMzKJfLZqQBifVkJJD5QII7jSfR3mokOIzaDMViEUNDQ6aR4PV60dLSgkAggGAwaEZNkJhP63MYtSOs2yCKIrxer7ltuqXWAxkJZELQONq2lcZR2zSe/lLbMIwG2CIayFygNskIoYgMWpaiHyjqQdM0SJIEWZbh8XgwMDCAjo4OeL1ecDgcDofD4XA4nM2Hmw8cDofD4XA4nO3KU2M+aJqGfD6P0dFRXLp0CfF4HMFgEC6XC5IkweVyIRgMolKpmFENJKp3dHRAkiQoigKXUVgaRqFqn89nGhSyLKNcLmNkZMQ0JhxG7YNgMIiWlhZzfopoIFGfDAgyA8hYIGPEWs+BBsKebommWU0OWIwGu/FAkQ26UYjaaijAEu0Aw2Sh6TSOPpNRoaqqGQFB00qlEjweD/r7+9He3m6mquJwOBwOh8PhcDibBzcfOBwOh8PhcDjblafCfFAUBTMzM/j2228xODgIVVURDochSRIAwO/3w+FwQFVV+P1+U9ynyAdZltHS0mJ+VhQFgUAAoihCkiS4jULRiqJgbGwMCwsL8Hg8pqHg8/kgGgWhOzs7EQqFzKgIq+Eg2NIwOSzRFfSZIh3sRgMta20PhjFhNRJgqQVhF//tbdJnZqRUspoVZEDYjQf6n1IwaUaKJlVVUSqV4Ha70dHRge7ubp6CicPhcDgcDofD2WS4+cDhcDgcDofD2a488eZDoVDA8PAwBgcHsbCwYPbWFwTB7H3PGDOjCzRNMyMJKCLA5/NBMNIokQGgGWmYqOaCw+FAtVrF6OgokskkPB6PmWKJ6jeIoohIJIJQKIRAIIBAIPCQoWA3HGgQjToPNJARYDcQaF6HESVB20eGAhkPtG/0F5ZICJpuncc6jsZrRg0Ka/olGhhjUBRlWQqmarUKWZbhdDoRi8XQ0dEBn89nbDmHw+FwOBwOh8PZaLj5wOFwOBwOh8PZrjzR5kM2m8Xg4CDu37+PRCIBAPB4PKYBYTcfyHAQRdGsswAAXq8XzEiP5Ha74fF4oBspiqxif6FQwK1bt6AoyjLTwel0miK71+uF3++H3+9HOBxGMBhcZmpYjQj7Z/rfblYQZB7QNNp+URTN6Ae7WQHDVCCzgpYjk8HOSqaENQKCzAj6a68BUa1WIUkSHA4HWltbzXoYHA6Hw+FwOBwOZ+Ph5gOHw+FwOBwOZ7vynbL9BMEYQzabxf3793Hz5k3MzMxA13UzvZLL5TLTJgmCYNZfoM8UeUD1HZglBROJ9F6v16zDQEaDIAgol8vmZ1jEfmqfIgKq1SpKpRJUVQUsBatpPaKl3gMZI9a/NNjno3FWY4TMBaspYR3IwKBtJVPBPh/Na29fNMwar9drRnx4PB54vV74fD5z8Hq9CAaDCAaDEAQBmUwG6XQapVJpRaODw+FwOBwOh8PhcDgcDofD4XA4TydPpPmQy+Vw9+5dXLp0CclkEk6jhgKl/KF0SB6PxzQK6H8YdRLIWIARIUEiPxkTqqrC4XCYtR10o+C0ruum0SAYqZqsxgYMI0IUxYcMCDIJSMinZa0GBK3fKvzTYB1PRgNWiXbYCKhdWi+t22WYNlbzIRAIwO/3m5+p7kU6ncb8/DxKpZK9eQ6Hw+FwOBwOh8PhcDgcDofD4TylPHHmQyKRwNWrV3H58mVIkmSK9STcU0ogq0hOBoLdYKB5rMK+tS3rPIwxFItFM90QLQNDpCezwirYM8ZMA6JUKpmpnMgMoWgBMh5offYoBKvJwFZJl7QVWLfLun10jK0mRDAYNNNOpdNpTExMIJvN2pvkcDgcDofD4XA4HA6Hw+FwOBzOU8gTZT4sLCzg2rVrGBwcRLVaNU0AEu8pQkDXdVOoJ3Hc6/XCYUQdkHFAEQeCIDzUhstIwSQY0Q2qqqJYLMLhcJjRD2QwOC21JGgcANO0UFUV1WoV5XIZsiyb66Nt1DTNLN5M5gkZDrAViraO32pWMj0ES70KMnv8fj8CgQCCwSBCoRCi0Sjy+TympqaQz+ftTXA4nCahYvCcpwtmnFsOh8PhcDgcDofD4XA4nCeZJ6LgtKZpWFpawo0bN/DgwQMUi0V4jKLQFKVAxgFs9RWs00i4px771igEijxwGJEP1t79Xq8X8XgcN2/eRKVSgcPhQCAQMOcPBALQdd0cJwiCWXha0zT4/X6IRt2IcDiMUCgEj8cDh8Nhmg1OI3UUGSK0DfWi6zokSYKmaaYgSUWirZ+t+03HgfafjpPT6bQ3XzdkUNB6FUWBLMuYmZlBJpNBLBbDnj174Pf77YtyOJwVkGXZuI+kmkkpK5CkKsrlChhj6OvvR0tLi30xzjanZjjLUGQFsqJAVRRIsoRyqQxd1xFtaUFfX599MQ6Hw+FwHoIXnOZwOBwOh8PhbFe2vfmgaRqSySQuX76Mu3fvQtM0eL1eaJpmCvQk7DuMqASv12tGLJDY7na74fP5oGmaKb7TQLUgSIgn0Z+EeLfbjYmJCVy5cgV+vx+yLCMYDJrr9/l8gFE7wuv1mssGAgHTfCBxn+okkKlBUQ5UA8Lj8SwzQlaCUi+RwC/LMrLZLLLZLGRZRrVaNYte0/+yLEOSJNOUIZPDXq+BohbIMKHtaDbigsyVXC6HqakpJJNJ9PX1Yc+ePeZx/77DGDN7r9O5tUeZWK/Xlf63Qu1pmmbeByvNx3n8WM83mYS6rgOMQdU0FItFpFMpZDIZZLNZ5PM55HM5ZLMZFItFRFti+L3f+wAHDx2yN815jNjPq/X8qqqKYqGAbC6LfC5fO5+5HPK52jM8k8kgFArhpZOn8PY779ib5nA4HA7nIbj5wOFwOBwOh8PZrmxr84ExhsXFRVy6dAmDg4MQLSmVAoEAZFmGw4g8ILHW7XaDMWaO0zQNbrfbFPoDgYDZNkVD6LoOn88HURTBjKLQbrcbuq6bRaSHhoZw48YNtLa2olQqmfUayJwgkT4SiZhthsNhCEYhajIUSPDXNM00MGggU8AanbCSaCxJEhKJBGZnZzE3N4dkMolqtQqfz4dIJAJJkpYJ0KqqQpZlqKoKVVVNE4T2kQwPwUgD5XQ6zQiNvr4+dHd3N20UMMNc0XXdrP2wsLCAgwcPYseOHaZZ832FMSCXyyKTSaNULKFcKddSiqnfpVwRBAEejxtud62uht/vh9fvR8AwjJy2SJVCoYDJiQlMT00hHIngmWef5T3jtyGMMVTKZWQyGaQzaWQzGaRTaWQyGWQyaeTzBSiqCkWqQtU0yLICVVWgqSpUI1Vbd08P/pd/+QscO3bM3jznMcEYg6IoyGYzSKXSyGTSyKTTSGcyNRMpk4Eky1BlGZqZck+FpipQjGd1e0cH3n7nHXzwwU/tzXM4HA6H8xDcfOBwOBwOh8PhbFe2rfnAGMPCwgJu3ryJBw8ewOFwoFqtwu12QxRFs1c3pTyyCvaU0oeMB4/HA8YYPB4PBCO1ERkGNI9uFIOm8dRjXBRFFItF3Lt3D/fv30dbWxtUVYXL5YLX6zWjJSjFUigUgtPphK7r8Pv9pplA2y2KohmZQcWmKc0SmRSipeaEpmmoVquYmZnB9PQ0kskkSqWSaSZIkoRKpQJFUeB0Ok1Dg8wYOpbMqD2hqqppsJDpQIYDmQ+MMXP/gsGgGQ0RjUbR1dWFWCy2alTGagiCAEVRkEwmMTIygkqlgt27d6Ovr+97ZUDkcznMzs5iemYaS/FF5PI5VCtVVKUqVEWBqqrQdB26poHOoCAIEI0IH6fTCafohNPlgugU4XK64HK74DGur3K1inKphHw+j0Iuj0NHDuP3Pvgpent7bVvCedxUqxVcuXIFly9dQi6bhaKqkGQZsiRBkWXIsgydMUDXAePetCIA6Ojuxh//8Z9w82EbIcsyRkeG8flnnyGVTkOSpFrkmXFuZVkGM6IgyFy2nltBEBBtacEP3n0XP/vZ71ta5jSCruvI5XKYnZlGJpMGUKulsdUIAByiCKfohMNR+64QDAYRiUYRiUQafpdyOBzOSnDzgcPhcDgcDoezXdm25kMymcTNmzdx8+ZNSJKEYDAIGEWcScimSAHBqNtAf71erynskLhPwj9jzDQkqMe4aNSKIMPBaj643W4sLCzg9u3bmJqaQiQSMdMsUduCICASiUCWZfj9frjdbnN5isCwRjWQyUDtkzFhnUdVVeRyOSwsLCAej6NUKmF+fh6pVAqVSmXZvgpGZIFu1MBwG9EaZCSQqaAb6T8oXROtk1JROYxi2TSfaESaAIDTiIZoa2tDa2srurq60N3djXA4bJyx+lAUBXNzcxgaGoLP58OOHTvQ3d391BoQTNeRy+cQjy9iYX4e83NziMfjiMcXkEqloCjKd/OuUNB7JQQAsEXECAAEw6yi8y0IAvbv348/+vk/x/4DB0yhk7M9KJVK+Pzzz/HpJx8jl83WRlJaLcbqEkq7errxi19w82E7UalUcPfOHfyXv/s7xOML392rglDXeRUEAS2xGH7w7rv46U9/Zp/MqRNN0zA5OYFzX3+D4ZEHAKsd28eBKIpwiCIcDhFerwd+vx+hUBgtsRg6OtrR3d2Djo6Op/Y9yOFwNh9uPnA4HA6Hw+Fwtivb0nwoFAq4desWrl+/jng8jlAoBABmSiMS8x1GjQcS+wHA5/OZIjz15ieRXlVVU+inKAeXywXdqBNBYj31MBeMKIrh4WF8++23yGazcDqdiMVi0DQNLpfLTEcUCoXM6IlAIGCK+rTtLiPagkwQj8dj/iWzgEwQSZKQTCYxMTGBkZERJBIJtLe3QzQiPmSjV7RmFJCm/bGKzoIgQDOKTxPWz7qRkol6XdJyVjSjXgOJ4rR/jDHs3r0bzz77LHbv3o1wOGxGldRDuVzG8PAw5ubmEAqFMDAwgK6uLtPIeRrQVBXlchmL8TjGJ8Zx9+5dDA0NoVwqmftYr9nQLIIgoL+/Hx/89Kc48dJJ02zjbA9kWcbg4CCuXL6M4QdDD5lR9cDNh+2HqqqYnZ3FhXPnMHjvHuKLcVSrVftsq8LNh41B0zSMjY3hi88+w7VrVyFJ0rZ6vzChlnavu6sLzz37HI4eO4Zdu3cjFAptq+3kcDhPBtx84HA4HA6Hw+FsV8Rf/vKXf2kf+ThRFAWDg4O4evUqFhcXEQgE4HQ6zToJZAh4jaLTwWDQHE8mBP0VjGLSHo8HiqIsS7vktKQm8vv9cDgcpmEhGlEUFKEwNTWFhYUFuN1uqKq6rHA1mSAURQCj7oTH4zFNEDIzyCSglEe0TkEQzEiHubk5fPvtt7h+/TrGx8ehaRpaW1shyzKcRq0Gr9drLk/rdjqdZiQGRU94jALYZHo4LamdaD4aR0YMjaPPZI7QPtH0UqmERCKBQqFgzk/bs55wQvtcKBRQKBTMKJZAIGCaIU8yiixjaWkJd+7cwScff4zzF85jZnq6YWH5Ualdwx50dHZi565d5nHnbA9EUURXVxcGdu2Cx+PG/MICKpVKQ6ZUMBTCc88dRVdXl30S5zHhcDgQjUax/8ABeDwepJJJ5HK5us+rIAjw+XzYvWcPDhw4aJ/MqROHIMDldMLr80FwOFCpVFCVJDOa77HDahFrxWIRk5OTWIjPoyXaglgsBpfxXYLD4XDqZUD4j/ZRHA6Hw+FwOBzOtmBbmQ+apmF0dBQXLlxAIpEwhXMSpAUjlREJqIFAwBxHEQBkPJDA7zR6e9N4Es8FIyLC5XIBhiBObdB4p9MJTdMwNTWFRCIBt9u9LN0TLeM0ajxQiiXrdtA6reujcaIoolqtIpVKYWpqCoODg3jw4AFSqRQAmGaJqqrw+/0QLaYIRVeQ2G/dZjIDyFiw/m+dj6bZDQzrfLSd9nZFIyVTtVpFqVRCpVIxIyPIiFgN2v9cLodsNotqtWruF5kqTypStYrhkRF88/XXOPfN15ifn4PUQK/njYTug1gshoMHDzYUncLZOjweNwSHA/NG8fhGxFFuPmxf6Nkaj8eRSCTqNh8Fbj5sDMY7pbW1FTsHdkJWVGTSaZRLJfucTSEIy4dHgTGGXC4HWZLR0dGB9vZ2+ywcDoezJtx84HA4HA6Hw+FsV7aNyqvrOubm5nDlyhUkEglTwIfRkxRGT2HRkmJIVVUIhvlA0QAk+JAATsI6zUfjrSI8TSexlkR3l8uFSqWCcrkMVVUBwxCgegmCkebIujyJ8hT1QL1dSfQlIV+WZczPz+P+/fu4efMmbt++jdnZWRQKBVSrVTOlksdI60Qpk5hROFrXdXg8tdzRVLia9ov2jUwSr9drFo32+Xzm/z6fD4FAwBx8Pt+ycdS23+83B5/PZ36mY5HNZjE3N4eJiQlMTk5ifn4epXUEHo/Hg5aWFni9XlQqFSSTSSwuLiKXy5nH+kmjWq3izp07+OrsWVy5egVLS4uQZdk+W90IxnWz2rAejDGUy2WkUsm6hU/O1iOKTkQiUYTD4SfaeOM8TCQSQTgchsvtqtVq4WwpgsMBr8+H7u4eHDx4AO0dHRAfJf2cIMDn9SIaiSIWa0Vrazta2zvQ0tKKUDhkvq+FJs420xnu3buLiYnxR3pvcDgcDofD4XA4HA6Hs53YNkrX0tISbt++jYmJCTgcDrOQMg32XvgOo7iubhSWpl7z1EOf5hEsRaTJaLCaGDSe5rVOdzqdtVQNhhlAEQiUcslqKND2WLfNaYgctB6HUaOiVCphZmYGQ0NDuH//PsbHx7G0tIRqtWoaCLIso1qtmrUYqtUqqtWqOb5YLKJarZr7r+s6VFWFoijmX1mWoSgKFEUxjxWhG0WlrbUe6H+7YcIYM0VRwTBo6BgJRvHvfD6P+fl5jI+PY2RkBBMTE0gkEmsaCa2trYhEIoBR5yORSCCVSqFYLK653HZElmUMPRjC+fPncPPmDRTyedSZZWVFHKIIr8+HSDSK1tZWdHR2orOrC+0dHWhpaUEwGITLiNpZC03TkM1kUS6V6k77wtl6yAitx1TiPDm43W643G6IDtGoFM95XHR2dqKlpcV8LzeKKIro6OjAwUOH8MILL+Clk6fw0qlTOHXqZRw/cQLPP/8CDh0+jL6+Pri9NROiERhjUIxOCdmcUYCew+FwOBwOh8PhcDicJ5xtkXYpnU6bBabJICChlIwEj1GgmQQ6ZhSdJmOCBHFKJUTzkTFgNy5oHP0vGtECVmFdFEXMzc1hfn4e5XIZABAOh6EoyrKoCVqOMQav12tuPxWxpukATOPhwYMHWFxcRLlcNg0SxhgURYFgGC6qqkKWZTDGoOu6aSxomgZJklCtViFJkmkuKIoCSZJM00GW5WXzVSoVcx67mVEul5fNX61WzXmpTVVVzc9kxtBA08vlMjKZDJLJJIrFIgKBgHlM7Hg8HlSrVWQyGVQqFdPMsJ+b7Y6maZiYmMDnn3+GO3fuQJKkpoV+QRDg9fnQ3t6Offv24cgzz+LwocM4dPgwDhw4gN2796C3tw8tsRgEhwNVqbqmUSMYxtyhQ0fQ2tq64nngPH5URcHQ0BBmZqbXPJ92eNql7c/IyAgmJydQrdSXfk3gaZc2BU1TMToygtmZmYbuMRjnJBqL4cSJl3Dq5Zfx3NGj2Lt3L/bt24c9e/ZgYOdODAwMYMeOnWiJxaCoCrKZrBmxWC+CICASiWDHjp1oa2uzT+ZwOJxV4WmXOBwOh8PhcDjblcduPpRKJQwODuLWrVuQJAkOhwOqqpppg0RRNKMgSNQXRRE+nw8A4PV67U3C7XabgjcJ+w6jODS1QwMZCGRY0DI0fWRkBKlUyhQRwuEwVFU1TQea3+VygTEGn89nRjhQ2iOnURMikUhgdHQUM4b4QftJ88DoAQ0jWsIqvpMoLxhRDoJhwNAgrBC9QEYFGRP0mcwJMg3IOFCNiAkyNMiMoOgJGkfzWZejtsicKJfLSKfTyGazCIfDCIVCKxoJDocD1WoV6XTa3A8yh+gY075tRxhjWFxcxJkvvsCd27dRLBbsszRET08vjr/0Ek6/chrHjj2Pw0eOYM/evaaw1d/fj/4dO9Df34+dO3ags6sLkiQjl8sBeLhWgCAIcLndteX6+83rjLO9UBUFDx48wNTUZEPCKDcftjeCIGBkZBiTExOoVCr2ySvCzYfNQdM0DA8/wMz0DJQG09CJTic6Ozvx7rvvYt/+/WhpaYHfSFXo9/sRCAYRjkTQ3taG9vZ2+Hx+pFONFRoHmQ/RKHbv2o3u7m77ZA6Hw1kVbj5wOBwOh8PhcLYrD6vBW4iqqhgbG8PIyAgkSUIwGISqqsuiFzwej2k4MMbgNAolw2I8kDhNgjWNc7lc8Hg8psBP08lcILOBxpPoTfMqimLWLnC5XKZw7/V6TSNANGo8kEiuG0WXKZLB4XAgnU5jeHgYw8PDZnolRVHg8/nMffX5fAgGg+Y+03iXUbOB9sPj8cDn85n7ROMdhrlCNR1chnmz0uDxeMx10F8aqE23YfzQMaLBesys0+h4kClCkRoLCwu4efMmJicnVxR8IpEIYrEYnE6nGZ2Rz+eRy+WWpZbarpRKJdy9exeD9+6hkM83lesbhmF25Jln8O4Pf4g333wTzx09ioFduxCLxRAIBMxz4vP5EI1G0dPTgwMHD+LUqZfx/vvv4+TJl+D3Bx82aoxUHouLiw2J2pythZ49nKeL2rvluxR9nMdH7TuFC/VbAd8hAPB5PWhtazM7Q9A9S59FUYTodKIlFsO+ffuwc2CXWQOiEZiugzW1lRwOh8PhcDgcDofD4Ww/HqvatbS0hKGhISwsLABGL3IqfOx2u00xjv5ST3irUUACP40XDZNCN4o+i0bRZhLzSTQn4RyGKEHt0TSHw4FKpYJKpQJZls11SJIEt2F+UE99GhxGrQfBSHWjKApSqRSmp6cxOzuLTCYDVVVNU4GMBjILyIAgA8Hr9ZpFoOl/Mg6o+DPN4/V6TXHaWhialqeC036/H8FgEMFg0CwsHQwGzSLSNA/9pcG6bvu22M0NMj5cLhd0o5B4LaXMDGRbIU1BEBCLxdDR0WFGT1QqFRQKBeTzeRQKBchG6qnthq7rmJ+bw51bt5BMJpveRo/Xiz179+LNN9/EiRMnsGPHDtOIWk20FI3on46ODhx7/hhef/NNPP/886YhRzAAiqIgvrAAdQXzh8PhbAXNPRs4G4fL5YTYpMknCAKc4ncdH9aDTHXR6OzQCPR+5XA4HA6Hw+FwOBwO52mg8V/hGwBjDNVqFaOjo5idnUW5XIamaahWq4hGo8t67eu6DqeRKsZrRBwwo96DaqQ/spsLZCqQGEymAkULWA0G6s1P81iNjXK5bNY/AGBGZlD71COfDA+n07ksx3MmkzHTLFWrVXM5h1FQW1VVCJaUTYKRboOEe3sEgsdSUNttKbDtNtJM0TGwmhBWA8Ln85nmgdVsIAOCjB8ayJSwGhkrmQ9WU4L+0vZ5jfRX8/PzGBwcxOzs7EN5sKPRKAYGBiCKopn2qVwuo1gsIp/Po1QqQVGUpsX9zSKTyWBkeBhTk5PQtOaiCkSnE339/Th9+lW8+OJxRFtaGhar3G4PDh06jHd+8AM888yzDwlkiqJgMR7nkQ8cDmddtttzdqNwOESIDhGOBp+vRO17Qf3LNvocJ6KxGGKxmH30pvK0nnMOh8PhcDgcDofD4Tx+Hov5oGkaJicnce/ePUiSZPbyi0ajSKVSEEXR7HnvNVIcBIPBZVEOmqaZvb8dltQHMMwAXdfhMYpUk8gvCIIp6JPZ4DHSIlgjKsiEyOVyZn0DXdfhNQpIa5pmGhlkYKhG/QYyINLpNO7fv4/5+XmzxgKlW6pUKshkMpBlGYVCAZlMBtVqFcViEblcziwETVEXVARaNgo9a0axZxIMrCYLCR4k/pOJQ5/pL0VakJFgNSKs461mhM/nMwtI200IqxlB66Fj5DPSRKVSKdy9exfj4+PLDAhRFNHa2opQKGTum2oUryYTolKpPGRaPG6SiQRGRkeQSqeaE28EAe3t7Thx/AReOX0a7iZSdBCiKGLnwAB+/P772H/w4DIDgjGGdCaNYrHY3HauAjNqi1CUkarWaotQPZBioYBKuQxZkqAa41Xj+qVlnyRom5cNug48Ifti3W46Z9ZxWw0dv9q1Y9SRMY3HEsrlsvnsVI36NbTNnOah81171tbuWdUwfYvFIgqFAqRqFYp57J/ce3ZFmJFHaRMpl8vI5fJQVQ1o8Jj19fahs3Pja7jQfW897/R9pFAoolQqffecVule4/cbh8PhcLYLrwD+egf7shwOh8PhcB4nwtmzZ7f0l6VuFF7++uuvMTIysky0J1MhEAiYPf99RmFpEstES82GQCAAxhhcRr0FMibIZKBxFC1gHagdwShILdrqGmiahvPnz2NwcBCpVAo+nw8tLS3I5XJmaiQyHnw+H3RdRyQSgSzLSCaTWFxcRD6fh9MoNs0sKZoI2j6HJX0UTScjRTdqSJDwY+9NaR2nWwpRw2jf+pmmU9u0PutA89J0wjqN2qXlaRtpunU5mkc0oj4AIBQKYf/+/di3b595fhVFwdjYGK5cuQKXy2WaIMFgEJFIBJFIBNFo1Dzuj5tSqYQL58/ji88/w+zcbFNZVdxuF15/4028+8Mfobe31z65KSqVCq5fv45PPv4I01NTpmHjdDrxr//tv8WxYw+nZloJXdMgWK5HGNcaCcCqpiGfyyEejyOVSiGVTCKbzZjRQlK1Ck3XIUCAQ3TA7XLB7/MjFA4jEo2io6Md3T09aG1tQzAQhMtdK7TeDFZxTNN141zoYOw7oRWMQQeJ3bUaMmRsroVm1HnJ5bJILCWQy+VqRphxzXu9HkTCEXR2diESjdTV5kpUymX8wz/8A748e6buwsQA0NXTjV/84k9w7Ngx+yQTTdOgKgqSyRRSqSTy+XxtH1QVDocDHp8X0WgLOjo60BKNwu3xNtTDuxEYY1BVFaViEfHFRSwsLCCxtIRUKoV8Pg9ZqkI1hG6HIEB0OuFxuxGORNHa2oquri709vais7MLXl8tqmorYYxB13RouiHG6zogCNBUDapWM6mXI+Czzz7FuW++QSadXnatroYgCGiJxfCDd9/FT3/6M/vkptCN2i+FQgFLi4uYn5+vFUTO52vXQ7kCVVPN7RcdIhwOAT6fH8FQEJFoBK2t7ejq6kJPTw9CoRBcTiccW3z8HwXGGP7b3/89Pv/sM+SL+Yae2S6XC0eOHMH/7c//HJFI1D55GYqiYGR4GP/zv/93PBh+AKXudHcMx55/Eb/3wQc4eHDjCo0rqgq5KmFhYR7zC/NYWkognU4hn8uhXK5A1zTorPbdwOV0wu3xIBAIoLW1DZ2dnejp6UFnVxeCgQCcrsae04wxoxOFBF1naOLRWBcOwQGnywVRdAD4rgaHQxQf2WdijEGx1P9q6MJpAEH4rt4YfY+i/WjmnbIete+OxntdZxBYrdIIvTPNZxW9OxkgVyX4A/6HoitXgjFWM/nM9gGAQWe1d7M5D2NgYND12vPUIYpmxC+nMd4U3rKP4nCeLg4zoN0+chXKfwVc/Qv7WA6Hw+FwOI+JLTcfisUi7t27h6+//tpMZ0S95XVdN8Vop9Np9qx3u93mDyFmiN6UYsj6A40MDIdhQlA7ohHRQIaEy1IfAoawYP5YNcyKcrmMzz//HNPT06aJEA6Hzf0IBAKmqB4MBqEbkRbJZBLz8/MoFovmD6jaj7zlxgPtj12sp3lofruhQG1Zfxxa/640wJIiaqV10PqtP3jt8622LK2DPq+0jHV+6kHb2tqK559/Hnv27DGPaz6fx9///d9DEASEw2H4jHRPwWAQ4XAY0WgU4XAYbrf7ofa3mrm5OXz+2Wc49803qFTK9snrwgDsGhjABz/9GU6eOmWf/Ehks1l8+sknuHTxApaWlgAjMuJnf/AH+MEP3l12Ha+ELMuYGB8Dg4BIJAKvzwtJkpDNZJHJZJDNpJHJZpHL5pDP5ZDL51DI582e6nQdfHeKBDC9JjDU0n0FEImEEY22oK29Db09vdixcyd6+/rM+38tdF1HpVJBNpuBLNd6bSuKAkVVoMgyZEWBIhvjFAWKItd6cWsaFFmGrjMMDAzg5MmT8K6wPsYYKuUylpaWMDc/j/n5eaRSSeQyWZQrZciSDJ3VzAeXYapEoxF0dfdg/4H92LFjJ4LBoL3ZNdlo84ExhnK5jEQigbnZWSwsLGBpadE4TzUxUNN0iGJNtKudkwh6uruxZ98+7N69G4FAYFmbj4Kmacjnc1hcXMTszCwWFuaRWEognU7XarsUC5AlGQ7Hd9cNmUcCAJfbjVAojGg0glhrG3p6erBjRz/6+negtbW1LkOtGZghPFYrFeTzeaQyaRSNVHB0HGVZgaaq0DQVus0gZjrD9PQ05hfmUa3zvAobaD7Isox8Loe5+TnMTM9gcTGOdCqFTCaDQqGAcrkMSZLM57OpChofmZHi0B/wIxQKIxKJoq01hq6ubvT29aG7pwctLS3b4pm8Howx/MN//a/44vPPN9V8WFhYwPlz53D2iy+QL+TNd/BaCIIDXZ0d+L2f/gwvvPgiQqGQfZaG0BlDsVBAMpHAzOwMZmdmavdbJo1sNotisfjdea+dbsDyPhdFEaFQCNFoC2KtMdP027V7Dzo6Ouq+32RZxt07dzA0NIR8PgtRrNUx2qhrhTEGMEBwCHA6XXC7XfB6vQgEg7Xtj7Qg2hJFKBQyo0AbRdU0zM7M4MuzZ6EotZpVG70PtbZq3yc9RhpNv9+PYDiMSDiMllgLQqEwvEZ9sEbXXXsfVFAs5FGpVqHrWu0dqdaiymqfVaiyDEWrRaGpxntUVVWomgpFUSHLEt5994fYOTBgX4UZvVupVGrvW6NtVVVr72m19pxUFAWyopr/U3SbrChwOZ3YvXs3Dhw8hJaWFvsqOOvAzQfOUw83HzgcDofDeWLZUvNB13VMTU3hm2++wdjYmBnx4DFqFzCj4DRFQ9CPLL/fb85L0Q8ulwuqqsJtSaFEpoLTqBFhjWig5QXDMHBaIiDsJoau60in0/jkk0+QTCYhSRIYqwmnkUgE5XIZgUDANCsCgYCZHmlubg65XK4mSvr95r5Q+4LFSLDicDjMfYPx45ZEANjMA5qf2rG2ZzUraBnrZ2s7JDTYzQ/639qudbvphy8tb52XxtH/1u2xDqIooq+vD8eOHcPu3bsRDoehKAr+y3/5L6hWq2ZRbPoRHgqFDDEkikAgYJ7Lx8XgvXv46MMPcfPmDfukuhAEAe/+8Ef40Y9/tCkpNh4MDeHTTz7BrW9voipJEEURL518CX/083+B9va1v7kXCgX8t//29ygVy4jFYggEA6hWq0gsLWFxKYFUYgmZbAaC4PhOrLRdL2thPW+MMXR3deHAoUN49tnnsHffPkQjEYjGPbwSkiRhenoaN65dRalchiLX0jxJigxFqkJWVEjVKiRZgSxVocgSJEmGoqoQHALAgEOHDuNP/+zP0NPTs2x7qtVqrUj81BTGRkcxPDyM6ZmZWk2PNfZPEACfz49nn3sWJ146icOHDyMUWtvksbJR5gNjDLIsIZlMYmpqGqMjIxgdGcHk5CQYs/fKX45gFD9/7uhRvHTyJA4dOryuUbUeuq6jWCwiHo9jcmIc42NjGB0ZRXwxbjnutV6161GbvbaM0+nEnj27sf/AQRw8eAj9O3YgHA6bz8tHhTEGWZKQyWawuLiI+EIcqUQC8cQScpk08vkCiqVS7VyR2Ybv9GzrZ2qvXoQNMB9UVUUmk8HC/DwmJycwMjKC0dFRFAuFZfPVu10ChO9SFTGGUCiMXXt2Y8+evRgYGEBfXx+ihgmxXWGbbD5omoZ0KoVbt27hyy/PYnJiwj7LijidTrR1dOLkiRN4/c030dnZaZ+lbsiYXVpawvR07Rk2OjqC6anph56762G93xwOB3r7+3DwwEEcPnwEu3bvRjQaXfd+q1ar+PLsWXz55VnMTE/XvgMZ09bfgvoRjBtOZwxejwehcBjRlhhaW1vR0dGOjvYOtLa3o729HdFo1PzeWA+yLGNwcBD/8f/3fyGdSkHXNMB2vz8q1mPCDMMvFAwhEouhtaUFHZ0daGtvR3t7B9rb29ESjcLr9dYdeaRpGianJvHg/hCWlhZrpoAh+MuSZPyVIcsyZEWGLEtQZWO6rNTMduN6+Hf/4T/g5MmHO0zMz8/jwdAQZmZmvjP9KQ2jJBltK7X3saxCNdZTrUq1KElBgOgQ8Pobb+DH7/1kw6JBv09w84Hz1MPNBw6Hw+FwnljEX/7yl39pH7lZpNNp3LlzB3fv3oXH44HDiEYgId3v96NcLtd+VBlCPUU9CIZp4DUKGFOkgWBEMpDAT8YDmQ1kStB4MgzIcLCaD7QOTdOQSCSM3np5c3lN0xAKhSBJktmLTjQiGwqFAmZmZlCpVOA2airQj0jRCCOn8dQe/aVtsP+lz9QG/W81Wez7Sf9b1+UyCnjTeOu2WNdlXedKn9dan3U91vZX+kznvFKpoFgswuVymcJhMllLC6Prutm2aEmJRefO3YB4sNEoioKRkREM3ruHbDZrn7wugiDA6/Phhz/6Ifbu3bcp++H3+2uGQSJhbqNDdOD5F15cV1AuFov43e9+h7u3b2N4+EGt5+rgIGZmZpBOpcyIpboU4zooFouYmprC3Ows3G43oi0t8Pv9q5pLkiRh5MED/Pa3v8PQ0H1MT09hbm4W8YUFJBIJpFMp5HI5lIrFWq0Uo2YLUFN3BEGA2+NGX1/fMvOhXCphenoaV69exdmzZ3H71rdIp1PQ9fXztjNWuy7m5maRy2YRjkTQ3d1d97lVFQX379/H5OQE1AYKgwdDITz33FF0dXWBMYZSqYSpiQlcunwZX335pbEP9aX7YYZovRiPI5lMoLWtDS0tMbgaTLVCMMaQSqVw7+5dnP/mG1w4fx7Dw8Molor2WRtG13UkkzWTKJVOweFwIBQKwet99LRsmqYhl8thYmIc3964gXPnzuH8uXMYGhrCwvw8MplaejHVlk5nmdlg+dwogiDA5/Nh9549OHCgsfQ7jDFIUhWzs3P49ttv8fXXX+Pi+XOYm5uDLEn22ZtGkiUsxuMYHx/D4kIciqqaaRKbvV62gvuDg5gYH4ckN3YsRFFER0cHXjx+/KFe/8yIzllcXMSNGzdw6cIFjI+PLZtnNdxuN7q6uvHSyZN49bXX0N7e3vT1q2kastksHgwN4eKFCzj3zTe4d/cOcrmcfdaGYYwhl81hdHQU6WQKABAMBhEIBld9ThOi04lQMAR/wI9KtYpqtQq9judRI7BaAARgRCqUy2WkUynMzs5geHgYY6MjWEwsoVgoQNNUuJy1ziHrbTuM+1EURTMKUzbqcdk7hDwKzPbM0DQNlUoFmXQa8/NzGH7wACPDI4jH4ygUCrVOLe5aalKxDgNCVVU8GBrCuXPf4NrVq5icnMT09DTm5uYQj8dr7810GrlczoxekGQZ6rLaYrW2Xn75FfSsYAxMTU7i/LlvcOli7fqfnp62RN3VUutls1kj4qpk1ECrtU9nIRDwY9eu3di9Z3dD5j2nxoDwH+2jOJyni/a/BOoNylUuA/Mf28dyOBwOh8N5TGyZ+aCqKu7fv4/r16+jXC7DbUnTQAI3AHi93mXitnWaw4gOcDqdZtojpyVqwTq4LGYELU/zWtuleazL1kTEOYyNjaFUKpnbpGka/H4/mNFzn0SWTCaDpaUllMtlsw3aL+r577CYG7QvDov5IRp5fWkc/XUZ0R/WY0J/6fNKgr9d7HcZNTTchglB062Foa3TrMeGto+2ibaZ5rPOY902+7ZYp5F5QEWlHQ4HgsEgHA4HlpaWIEmSOa913XQcXZbcyFtNqVTC0OAgRkaGLXmg60cQBPT29eGNN97ctNQCLpcLTpcTxUIBC/PztZQKioyXTp5Ea2urffZllMslfP7ppyiXLemkVjjOgrVWiDGY4+wz10G5XMbS0iK8Xi/a2tpWTcFE6xNFEU6XE7IkQWpAWKX7LNbaioMHD8LhcKBQKODunTv4+quvcf36NaTTabNeRiMIACrVKlRdR39fP4J1iHN4RPPh6NFj6OrqQiGfx+07d/DV2bO4fes2UslkUwKZruu1c8+A7q4uRJu4RjVNw9TUFM598w2++upLjI6O1BXRseyaqgNVVZFKpbC0uARFUdHW2gq/8W5oBlmWMTc3i2tXruCrr7/G7du3sRiPN5C3/9ERHsF8KJdLGBwcxDdff42rV69gbnYWSp3XUzP3bi2dVh7z83PIZDNwOkWEQ2F46kzLs9VshvlQLpcxPDyMC+fP48rlS5idm133vmOMIRAIYt++/Xjl9GmcOH4c7e3tcK4R8bUWNdNwEZcvX8I3577Bg6Eh5HLZdU2wRu83QRCQy+WxuLSISqWCSCSCUDhsfuexIwgCIuEwevv60NnVBV3XkFhKQG7w+D8qsiwjk05jZnoaM7OzKBSLcDprqaXWO+Z0P/b19aK/rx9MZ8jlaqmrtgpBEIxopjRmZ2cwOTmFYqEAh+CA3++Hx+OxL7Iiblfte5iiKChXyg3d6zC249Spl1c0HxgYnKITHo8Xuq6jYIuyqge3240dO3Zi925uPjTDlpkP/lcAV/8mDzPA1r12OU8K3HzYWrbkXn/EQZmxbzVnu9LI9cTPK4fzVLJlaZcWFhbw9ddfm1EPJEQ7LGYAjFoKmqaZorpgCM30VxRFU0QXLMWiScwnwdwq6lvFa7tYbhW1Yfy4KpfLuH79Oq5du4ZcLmfWGZAkySw2zYx0RdS7vFqtQjUKuAoWEwGGcGHdDvqxT+ukv/beyXZhwLoMjVtpvpXGUds0jqJJrNPsn+3/W9ukgfbHOq+1fXvb1nl0XYeiKNA0DW1tbdi1axei0SiuXLmCTCaDSCQCv99vFp/2+XwIBAJmSqbHlX4pmUjg4w8/xMWLF5HLN96rVBRFnH71NfzTf/bP1jUCHgVZlnH9+jV89OGHGB8bAxjDf/j1r/HSyVNrHrN4PI7/1//z/7GioF9bTIA/EEBLS4vR2/y7PNSKoqBcLpuGHFtHhLMjCAKeefZZ/PBHP8Kxo8cgrCBqMcZQrVaRzWYxMzONy5cu4e7dOygV6zOCBAAenw8vHj+OX/3qz1EqlXDj5g1cuXwZYyMjTRlKVgTDXHr/J7+HV155ZV1xC4+Qdqm7twd/+qd/hn179+LChfO4dPESJicnHnkfAKCvrx+/98EHOHHiRENisizLGB0dxeXLl3D3zh0sxuP2WR5CEASEQ2FEW6Jwuz1QVQX5fAHpTLqua0gQBPT29OLESy/hrXfeQSwWs8+yLpVKBePj47h+/Rru37uH+OIiFFluKL3KivcVqwlz9SI0mXYpn8/j1q1vcfXKFYyNjtbd450xIBgMIBqNwuV2QVFUFAp55LK5lfdnFYLBIHbv3oMTJ07g2AsvbJqx2izsEdMuHT5yBH/+r/+NGTlWyOexsLCAyYkJDN67h4nJCWQyGTBLQV07giCAAejr68OBAwdx5MgR7Nm7F7FYrKFjbUVVVUxNTeHy5Uu4c+sW4nWaZX6/Hy0tMfj9PjAw5HM5pFJp6Jq29qExDKrOzk48//wLeO2NN9DX27tuCiBZlvHgwRD+53/77xgdG61rG+0wBohOEczYRvt3j/UQBAGCw4HW1lbs3rULLxw/jkOHDjf0vBi8dw9nvvgcN2/eXPEduSbGdjpEJ3SmG5F4NKnefQAYBLS0tGDXwACeO3oUzzzzLLq6u+2zmjDGIEkSisUi5mZncfPbm7h65SryuWzd64Vx/H79F/93HD9xwj4JsiyjXCohlU5j5MEDfPjh74z7of72g8EATr/6Gt75wQ/Q0/OwwcFZm61Ju/Qr4I2/to/cXMqjQGkEKP93YOlvgMbLrHGeFnjapa3D/xvgxK/tY7cfU6eByQv2sZztRqPX06AAJOwjORzOk86WRD7ouo7bt29jZGQEmqYhGAyCGeK91QRw2YpEWwV7q1HhMNI0WU0Jq+GwkrlA/6/Uk54G+iFbKpUwNjaGZDIJVVXN5VwuF3RdRzAYhKZpKJVKKBQKKBQKEI30SFZzwS7A67oOXdehadpDf1VVhaZpyz6rRrE+RanltLcOktHbW5ZlVI1UBtVq1RxvnS5Jkpl7l9qkdmncStvBGDO30b691u2jzzQfjdN1HcyoN0F/6TMdG6JcLkNRFLjdbiQSCUhGnYLVBjp/9HkryeVyuH37NmZmZqBq9fUqtuJwOHD69KvYvWcP3JuYI52OT6GQx8L8PHRdx+EjR9Dd3W3eayuRSafx6aef2EcDhjnY09OLAwcO4Mgzz+DIM8/g8OHD2Lf/APbs2Ytdu3ejp7cX0WhNeMznctAaiCAQBAGyoqClpQU9Pb0P9TKmeVwuF0KhENra2lCuVLC0uIh8tj6xFQA0XUcgEMDRY8dw585tnD93Dg+GhlBtVExag2AwhP3799d1jpuNfIhEoxgY2IlUKoWzZ7/AyPBw44LYKmi6jvb2dvT09tZdfFqWZYyPj+HC+fO4fuMGUsmkfZaHEEURvX19ePbZozhy5Aj27d+Pvv5+RKJRQABKxeK615AgCMjn88jna2Zxe0dHXcedqFarGBsbw+VLl3Dj+nXE43HodZgeVlwuFwLBIMLhMEKhEMLhsBmhp+kamF6fCCc0EflQLBZxf3AQ576p9Xqvt1e2y+VCd08vDh06hCNHjmDvvn3o6e1DSzQKQRBMU70ear3LMyiVivB4vejo6FjzOfM4eJTIh/a2Njz73FFoqoqZmRkMDQ3h5o0buH37NkZHR1AsFtcUWkVRREtLC/bs3YsXjx/Hiy++iH379iEcDjdtPDDGMD01hUsXL+LKlSuIG8/5tXA6nejo6MChQ4fw7HPP4cDBgxgYGECLYYAUisW6znm5XEahkIfH40FbWzt866Qxou9I4+NjiMdrdQfqxWWkp9q9ezc6u7rQ3taOcDgMn88P0SGa3z/qgTGGSqmEZDKJYrEI0SkiGAzV/YxziCKSiQRmZ2caetY6nU50dnVhYOcAunt70dbegWg0Cr/fD6cRjVDvPgCAZNQnKhQKgADzeKz0fUgwOur4/X60trbC4XBgdnYWuVy2oXUKa0Q+iKIIr8+HWCyGcDiM2blZpJLJdZ/dVnjkw6OxNZEPLwIDH9hHbi6uGBDYB0Q/AHr/Ehj4BRDYA5Q+5tER3zd45MPW4fox0PtwfZ9tR+7/C2R5L/ltT6PXU+L/4EYzh/MUsiXmQzwex6VLl5BMJhGL1XKI0w8k0VJg2ev1QlVV+Hw+OI20P25LvQPBSLVCAj+JS1azwmpC0PwUJUGpf6zCNc1D6Eax6ZGREWSzWQhGD32Xy2Xm+w0EagV4s9nvQu9FUTTzXdM20t+V1kn7YDUrHIapQv/TD3lhhYLNZABYTQAyFKyfrYNs5PCV5e8KAZIxYTc3yLSwmx3VahWVSsUcyuUySqUSSqWSmULJOtA8tJy1Tdoeq3GhKAqq1appXliPofW42s8zHautIJPJ4Ntvv8XsbHNfdkRRxLvv/hDdPT3Lrr3NwOOuRRmlMym0trZiz7596OzsXFWYZYxhYWEeX3/11bLxgiAgEongueeO4vSrr+KFF1/EwUOHMDCwC13d3Whra0NbWxs6OjrQ3d2N7u5utMZiWJifQ7FYgF6n8AoATGeIRKPo6elByzo9Up1OJ6qVKhbm57FQRw97QjDMz+7ubnz2+WcYHRmBZumJuxHXVCQcxt59exEMhtZtq1nzIRyJgOk6hh8M4d7du9AsQtKj7oOuqYi1xNDb11dXhA4DMGEYD1evXkW+jp73jDH09ffjnR/8AC+//DL2HTiAHTt2oL+/Hz29vYhEwkinUijWYUDAKJaez+fR19eHtvb2uvZf0zRMTkzgvLHdhVzuu+7IdSAa+eB3DuzEocOHcPjwERw4eAD7Dx7Cnj17oKgKctkclDp7egsNmg+qqmJ0ZARnz5zBvXt36xZERVFEX18/Xn/9dZw6dQqHDh3Czp0D6Ovvx84dA4i2tKBaqSKXy9V9Teqs9v7MZrLo6upCLBbb9GdcIzRrPjgcDoRDIbR3dGBoaAhXrlzGjes3MDIyjGQyuey+WxmGaDSKY8eex5tvvYXnnju6rglcD0uLizhv1CTJZDL2yQ8hOhzo6enByVOn8OprrxnP8AH09vWjr68PsZYYCsVirbDyOvvEjAi0QrGAlpYYYq2tq75XCIfDgaEHQ5ibnX2oZspaxGIxvPba63jnBz/A/v37ceDQIRw8dBA7duxAOBSCrusolUrrbrMVVdOQTKdRzBfg83nR0hJb0ey2wxjD/PwcJicmlqcmXANBEBAMBvHq62/gtddewzPPPIODBw5g//79GNg1gJaWGDS9VuS+3ucEjGdXJptFNpuFw+FAR3s7vF7vms89+t40NTWJhfn5up6rhLCG+WDF7fEgm8lgcmqq7ucRuPnwyDy15sNDxIDAqZoR0XESyP4tNyG+L3DzYetoVCx+XHDz4cmg0euJmw8czlPJlpgPly5dwvDwMDQjnZKiKGa6FlCPKeMz1VQQjJ5ajDE4jbQl1lRLlA+exllFfsp/S0YALeOw1Vmg/60/1FRVxdLSEoaHh1EoFJZFV/h8PlSrVQiCgEKhYP7YpagIZkRj+Hw+s6iya4W6CDRYjRW3ETVBBgm1aU1R5bbUdqDUUx6Px/zsthW0pn0VbREe1DvTOs4+0DGxCphkfNg/0/+6JXpCNaIf7GaI3RShaWRGeL1eMMYgyzJgiMt0/uj40XG1HkvHCr39NotUMolvb9bXq3slRFHEj997/5FSbdRLrVdnEP07duLIM89gx44d8PsDqx4vRVEwMzONS5cumeMEQUBPTw9ef+MNvPbGG9i7bx9isVaz+Lsdh8MBn8+HaEsLVFXD9PR0QwKErmuIRqLo27EDXV1d9skPUSgWMT09jfjCQkNCiqIoiMfnMT01vUzwcTqdCEci8HrckBUVuqUgZr04HA6EQmHs3r0H0Wh0xeNkpVnzgZ5XS4uLkI19oOdVKByCx+OBIivL7tX6YQiHwzWDqY7zEF9YwMXz53H92lXk6ohCEQQBfX19ePutt3Hq1MumeEnPw2AwiFgsBocoIr4wX3dv/mw2C4fTgY6ODkQiEfvkZTDGsLS4iDNnvsC1a1dRbCBPuYBaMd09+/bhxz9+D6dffQ3PPPMsdu/Zg507B9Df34++vn4kE0nMz82hSoXa10Fo0HyYmZnBuW++wbVrV+sWLh2O2vF54803ceKlk+jq6oLX54PL7YbX60UwGERHRwd8Ph8KhTxSiUTd1xBjDMViEalkCocOH667R/lW0Kz5wIy0NdNTk7h//z5mpmeQy2XrvlddLje6u3uMSLEjiBqRJY8CYwwff/wxzn3zNTLZ9Y0HQRDQ2t6Oky+/jDfffAtdXV1mRw+nUUcrEo0iFAxhZmoapXUiOWCpDyM4HGhta0OsJbbquwXG/IN372F6ehqKWt+1CgAtsRheeuklPPPMM4hGo4jFYmhra0NXZyd27NyJ/p074ff5MT093dA7gOk6crkcqpUqAoEAOru61n9WqypmpqYwPjaOUrm+9HaCIMDv9+PUyy/j2eeeQ1tbG1paWgzDvhO9fX3Yu2cPPF4v0pk0KnWaGjCug3KphFwmg3Akgra2tnVrQGiahvGxcczOztT9zEAD5gMzCpTfH7xXt0EDbj48Mt8f88GCa1/NhBAWgOx1+1TO0wY3H7aORsXixwU3H54MGr2euPnA4TyVrP4rcQNgjCGZTGJ8fBwwfljIsgyn02mKyz6fzzQedKM4MzPMB4dFPHdZCkiLlkLOsAnkDkNcp2WsgrW1TVrGLgCoqopSqYRisQhFUcwf5oTb7TbSe+ShKIop1sMilDPDMAmFQggGg/D7/WbNAuvgNoQea0Fol8sFr9cLr9drmhh+v9+sfUCffUb9A/s0qoVgrYtA83u93lUNCxL8PB6PuU302bo91M5qg3X/vEYtABIUrefCfk4EQUCxWEQ6nTaPYblcNiMgrKYFmRoUwaEZKaK2Cp3VIjQa6R1N0DXnXad34kbi9/sxMDCAgYEBRCKRNcUVVVVRKCwXefv6+nH61VfxyulX0dfXB7/fb95DqyEYYsuxY8cQDAbtk9dE1/ValEydYq3L6ayZfWvs10ooioLp6Znas4jVBK7Tr57GH//pn+JP/uRP8cs/+1f4oz/6Ofbt3bfmvq5EbR/KdffYb5ZqtYp8LlcTeIRaJMTrr7+Bf/mLP8af/Omf4Zd/9q/w83/+zzEwsHPN874yAirlSl31IyrlMgbv3sXg4CBSqXRd96Pb48HBw4fx3LFjZtFa6zNZEASEQiG88MKL6O/fAY/HW1P810HXddy9cxfDD4bXFYcVRcH5c+dw+/ZtFPJ5++TVEQR4fX4cf/E4fvKT38Px48exa9cudHTUUqmEQrU0LsFgEF6fB4Kjjg1vAk3TcPfuHdy4fs18p66LIMDr9+PgocM4+vzzZnSC9Z3ocDjgDwRw4OBBHD16FG0dHfZW1kQ20m9dvnSxseO6TWGMoVgqYWZ2FslkEtVqBbqRQrAeNF3HUmIJFy+cx9/93X/Cb//xHzE+Ngb9EZ4NV65cwa1b3yKdTtsnrYjL5cKBAwfw3HNH0dbWZn5fsd5zwWAQu3bvxnPHjtZduF2WZdwfHMTo8Ajym3Sua0bf8hpaTqcTPr8frW1t2L9/P15/4w386MfvwWd0TKkXVVUxNjaGmzeuY3pqss5zuv5xsSNYOlEIRsSt0+hI09rail27d+Ptt9/G66+/gda2trqOPaGqKuKLi7h48SImJyfXNRQcDge8Xi/EOuoRNUswGIIobl77HM4ydv41cOI39rEcDofD4XA4nG3CppoPqqpiaGgIS0tLgPGjUdM0iGItR6+qqqbR4Ha7EQ6HzUgCp9Fzn0wHEs7oh7Ku66YpQD9GSUCxGhP0A0+01HsgcWWlH3dkPlCEA61b0zRUKhU4HI5aTzlDGKU2aF4YQgWMdZPIT9tA20NiP4n/9JkMB6sBYDUBSNi3Gw8kdJHhEQgEzNzj1un02WpI2M0IqwlB61tpPbQuGuz/r2SA2Ndp3Xen02lGlND1UanURB5N00yzQTEiJihaQmkwV/KjoqpqHWk2VoYZ0TGuR0y30QgkdIgWw2c1FFlGoVATkAQAHR0dePH4cZw8dQqdnZ3mPVcPgiCgp7cXvjpSWVgRBAGKWjvH9SA6nfC43XA2KK4zxsx1dHZ14pVXTuOHP/oxXn31VRw/8RKOnziBN996CydeeqmJ4rkMklRFuVSCrjcvMK4Hswig7W3teP31N/DOD36A06++ihMnTuD48RN47fU38M47P4Df77cvvi6SUVNmLTFL0zTMzs7i1q1vMTc3Z5+8IoIgoLe3VjukfQ1hWxAEtLa2Yv/+A2hpaYFQjy4IIJlM4u6dO5gwjO+VoPfTjRvXkTDeUfUgAPB4PDh85DBef+MNPPvss4i2tJjvqrXur41mbHQMd2/frru4NNHR0YmDhw6hs6PTfG+tRDQaxb59+7F3z16410mpY6dSqeDqlSuYnJq0T3oiYUa6w4YqVRvomoZ8LoeRkRFcunABZ898gY8++hBnznyBqcmJNe8vO4wxpNNpXLp4AXOzs3Vfb6FQCAcOHMDAwIB90jIikQgOHDqEtra2OoV4IJfN4v7QIKampzblXcywPNLSiiAI8Hg86OuvpRB77uhR+Hy+uo8LAFSrFYyOjuL2rZoJudq6HpXVDCvBMCbaOzrw8isv4+TJk/B6GntvyrKM0dER3Lt3D4nE2lUa6Zi5DCNkoxEEAV6fF45NMl05nBXx/5obEBwOh8PhcDjblNVVhw0gl8thaGjI7J1OhoGu63A4HNCNHP/MiBTwer21Hpd+f60nsxHpAIvpQOYBCfgk5pPwQ8vQDyrrvFYDYDXBRZIkFAoF0wTRNM1sy1rrgEwTgkQnwWJs0LK0Luq9T6K5bCkGTdNIVKcaC/TZKrzTfHRM7dtgNWNI6F7JyLCOIyOAjhOZAlZzgEwJqyFhH+zmhtUksQ5kQljNllAoBEVRkM1moSgKBEEw60TolpoQdCzomGmWAtmbDWMMuqaDPYLA4nR+V/NkuyEritl71eV249Dhw3jx+HF0dq6fdmclBEGAx+0BGjg3dO/Uaz44BAGiU4SjSRHF7/fjhReP46233saePXvh8XwnmgSDQTz33HM4cODgsvt9PXSdQVFUSLLUUL2LZgmHwnjmmWfxo/few+49e0zxTTAKkb72+htob19d5F8ZBl3/zvRbjXK5jAcPhjA+Pg5Zluq+D3fs2IG+3j6IddwLBw4dQscaJoUdxhjGxkZx986dVa+jQqGAr7/6EvPz8w2dWwZg544dOHHiJRx+5pmGRfmN5Pq1q5iYmLCPXhUBQMDvR19vL3bv3g2xDsOuvaMD+/fvRzQaaeg4AcDk1BTu37+PdKq+3vlPEvRu9/l86GhvR2dnJwLB4LrHSNM0LC0t4eKFC/iHv/97fPTRhxi6P1gTvet4r8iyjDt3bmNkeBiyLNd1vwmCgFgsht7e3nWvV6fTia7OLnT39MDrq08AFwCMj41j6P79ho2wjUIQBHR1d+PNN9/Ejh07G/aI0qk07ty+jZmZmVWfGVtBV1c3Tr38Mg4cbOydAwBSpYJ7d+9icmJizVSHggCIoqOuZ28zCIIAt5GylMPZUvy/Bg7/yj6Ww+FwOBwOh/OY2ZxfHgBKpRJGR0eRSCRqPVYNUTwUCkHTNFPYhqUHci6XQyQSWRbtQMYEANOccDqd8Pv9UFUVLuMHDjMKyJIZQZ8dRhomEntrglxt/pUolUrIGz3fRFGEJEkQjWLSkiQhHo/DYdRmIGGfTA2C1gGjp5vVWKlUKshms8hkMkilUkgmk1hcXMT8/DwWFhYwPT2Nubk5TE9PY3p6GjMzM5icnMTU1BQmJycxPT2N2dlZzMzMYGZmBgsLC5ibm8Pi4iISiQSSyWSt4Gc2i1wuh3w+b6aRIiGfBHsyUByWWhhk7sDS05OMDlrGPsBSP0I0allYzQ0yGch0sJoP1sHv98PpdEIz0irReatWq5CkmqhJ18pKpg1ty2rndiN5tB/VrKnes1uBqqooFosQBAEdnV144cXj2LFjh322hqB0GY2gq1rdBUnpXDST2kYURfT29+PEyZfQ1b2ywRJtacGOnTvto9dF03Uolutys2AAdgzsxMuvnEZLNGqfDABwiCJ2DuyE3++vP2EIE6AzHZqmriqKkpB6724tt3e9u8p0HdFoFMFwyD5pRXp6ehCLtdZ91wgAioUCJicnzbR/VjQjWuP6tWvms6ZeQuEQ9h84gL1798HVQCTQRsIYQyqZxNjYKEqlUv3bLwjw+X3o7OpAW1ubfeqKBINB7BjYiZaWxotHa6qKB/fvY+opiX6A8bxxulwIBALo6GjHgYMH8bM/+AP84c9/juPHjyMUDK57ndL5yufzuHjhIv7ub/8WV65cRqqOQs+FQgGXL19uKJe+6HCgq7sbfv/6ybIZYwgE/Ojo7EQoFKrrXccAlIpFTE5MYGF+vv7rcRPYt/8ADhw8iFCdzxZCZzoW4gsYGxtt6NhuBl2dXXj55ZfhazCFFAMwOTGOiYnxdVNgCVv0XYnD2XLa/xoYeMU+lsPhcDgcDofzGNk08yGbzWJ0dNTsuU+98lVVXSb+k1BPAwnLoigiEAjA5/OZIj8zDAGnET1hNSmsA4zee7ROMiHo/9XQNA3FYhHZbK2QJJkegpHKqSauMTNFEG2Xdd30v8NSn0I0zItYLIauri50dnYiHA6bUQH2NEXWCAIS6z1GWiTRMAeYUeCZIiEkSTKjMkqlkmk40F+qU5HNZk3TI5FIYHFxEQsLC+YwPz+Pubk5zM/Pm4aI/fPc3BwWFhYQj8exuLiIpaUlpFIppNNppNNp83MulzO3oVwuo1wum0aCLMumyWA1QzxGoUQyFUgYlCQJ1WoVupFSSzfqQNB81vRLa53jR6UmPDkhPEKPQU3TwLagN3wzKIqCQqEAp9OFZ595Bjv6+xsWHHVdR7VaRaFQQD6Xg1xvLnoLGtOhrpKiYiMRRREvvvAiutaI7PD5fOsWLl4JXdNqUTKbvA8+nw87BwZw4OAB+yQTQRDQEovB5XbXur3WAQMDMyKOVkszJklVLC0tYnp6qqHz7PZ44PP54VwnJ7iu66hUq1BUteGeurKiYGFhHmMjI9BsufXT6TSuXb3aVA/nrq5u7N69B23t9Yn3mwFjDIP3B5HJZhu6vhhjCAVDiMVqxb3rweFwIBZrRUdHh/lOrBdBELC0tISFhXloTRzr7YIgCHA5nYi1RLFz5068+MKL+PF77+N/+cUf4xd//Cd46eRJPP/8C/jRj3+Md3/0I3R3dtX9HtI0DXPz8/jtb3+Lc+e+wdLion0WE1mWMTc3i8TSUkPXrkMUEQoG4fasfc4ZY5CqVciyApfohOho7Nm/MD+PB0NDkBp4Fmw0Ho8Hu/fsRm9fX93nAMa+V6tVDA3dRzabXdcE2kzcHg+6enowMDDQ8PsXYJibncX83FxDzwYOZ1Mo/xXwlbD6cPV0bRj8cyDx0cYVGN35v9vHcDicTeWjh+/vrRgmL9g3hMPhcDjblPqVnAaoVCpmb3yn0wlJkuDxeOB0OqGqKtxuN3RDWHRaih56vV4zvYdu5PknQZ8EfxL2YSnwTMaCdaA2yZygz2v9GKVe34VCAczode9yuaAadSBkWV6Wmki01G+g7aT/rQNts9uoa9HW1obOzk5EIhHTYKDBWleB6iXY6ynYUxuRMWFdFx0jSldEnxv9MUrz0/kgw8CeFoqMDzIZ6LPVDLEaIYVCwYzMyOVy5iBJ0rJIC1mWoaqqaTaQyWA3X2iZRvevGRxCYyKoHVVVoT5CodHNRFVVSLKMaEsLDh85gsgqPemtaFrt/kgmk5iZmcb9+4O4fv0avv76S/z2t7/F0tLSuj2BV2IrzqXP58PBQwcRCq3eS9ZpFAVtlFrP0s0VsARBQEdHJ3buXF+k8vv9DdfFAATo+ur51kvFEmamp1GuNKYYOF0uiM7vzGJC0zSUSiWk02nMzc7g/v1BXLl0CV989ikmp6agr7IdVujZDwCVcgWpVApF45lOJJaWcO/u3VX3azVcbje6u3uaEuI3El3XMTo8gmJxeXH49RBFEcFgCOFw2D5pTbxeLzq7uuBtsH4LAJTLFSwuLiGZTNonPTEIDgdi7e148+238dOf/T5+/P77eOX0aTzzzLPo6uqCz1frINDfvwMvnTyF06++iu7unoeu79XQNA2JRALnz53D5cuXV83ZXy6XMDkx8dD1XA+1jhHLr1ldr9WyymYymDeMg2vXruHcN99g6MEDFIvFddcjCLV7jjGGfKGAhYUFVI3UlI8DQRDQ3d2Nrq6uht87mqZhenoa2UymIXNnoxFFEdFoFLuNWitrfW99GAHxeBzz8/PQtMe3DxxOXZQv1IbE3wCD7wNXBeCr08DUR/Y5G+Q9Hv3A4XA424XyXzxsHK01rPw1mMPhPOE0r6CuQTqdxuzsLIrFopkWSbSk9HGuEJUA48exbikkbe3Jbo0kIENhNcOB2rfPt94POEVRTMGcRANRFM1e3NZtswr89m2xmg72bXa5XAgGg2htbUVbWxui0ahpJFB6Iop2sBoRVhNipcFqSNjTGdFANRus6wkEAsuKR4dCNWFqpeLRK6VLskZkWI8zCQ9kItgHMhLITCAzg843bNEPZC6oRrSDaqSzsZoimqUGxnrn+lFwGsXCmxFXBEM4pCia7Ybb7UJ3dzcOHT6EHQM7V+0dLcsyisUiEktLGB0Zwa2bN3Hxwnl8eeYMznz+Ob48ewZfnj2Ls2fPIJ3envneRaeIWGsr2ts71r1eXC6XkdSifpglLdlm0tvTg97eHvvoh/B6vHDUKYYSOu3DCvvBGEOhWMTM9EwTkTw6dF2DJFUhyzJyuRzi8ThGR0Zw+/YtXL50sXb9nDmDr86exReff46pdcwHAYDb7YbP50M0GkV3Tw/6d+5AOBJZJiRWKxXMz8+vKvCuhiAICPj96OzqQqhB8X6jqVQqmJ9fgFSt2ietiSiK8Af8CNSRfseKKIro6OiEr8FCvgCgqgrSqVTDx3s74TBqJpx6+TReOnkS+/btQ0dHx0PPR0EQ0NPTg5OnTuH5F15ALBar/3gxhng8jksXL+LWt9+uGD1QKpUwOzuLarXa8LNFM+43TdOQz+extLSEsbEx3L1zG5cvX8ZXX36JM198gbNnz+Lrr77C8PADFEslezMmgiAY91sAkUgEXd3d2NHfj0g0Yr6HHxfhcARtbe3w+/32SWvCGEMhX0BiaQnVBu+tjcbv96Ovr6/h7xqMMSSTScQX45Clh68hDmf7cwGYfP/RTYj2P7KP4XA4HA6Hw+E8JjbcfFBVFUtLtV6OgiBAlmX4fD6z173b7YamaWaUAAwhXxRFczwZFTSdfnjRfKJRVwAW4d9qZNgHYr0fcLIso1wuQ1VV+Hw+UzykWglOpxPMiIigdZLQbh1ICKf/YemNKxgpg5xOJyKRCGKxGFpaWkzTgAwCt1FTwloQ2l5DwZq2yWpCkHGwUoQEtU3t2A0PMj3IcLC3ZR1ofqshQZ/t66F1+Hw+08iwmidW44MELjITyKSgCAiKgrAaEFaTwnrcNwPR6YTP7zcNqkZghvmQecw9K1cjEoni1MlTeOONNxAJL081xIx6G9lMBuPj47h27SrOnPkCn33yKT75+GN89OHv8Omnn+LKlSu4P3gfC/MLqGxTkwUAXE4XduzYAZdr/R7soihuSeHoZmjvaK+rGLPL5YJDqP+RT5LpaudP13VUymUsJRINi42KoiKbzWFmegb37tzB5UsXceaLz/HpJ5/g048/xocf/g6ffvIpLl+6hOGRYaRSKSiyvKxeBT3znU4nfF4v2trbMTAwgOeOHsXpV1/Fu+++i7ff+QGOPf88AsGguVwqncbM7Myq+7UWwUAAHe2Ni5obia7ryOVyKJVL0BqMoHKIovmsbgSn04nW1la4PZ76xXQDTVORz+eQy2btk54YBEGAx+lEMLC+aSMIAjq7unDq5Zexb+8+BOpYhmCMYWZ6ChcvXMDwgwcPXaOlUgmZTNqMEK0XXdeRzxcwNzuHwXt3cfnyJZw9cwaff/opPvnkY3z08Yf4+OOPcPHiBTwYuo9EYqlmbFnWL1AkqREJ1traip27duHZZ5/Fyy+fxttvv4Mfv/8+Tr38MnwNXl8bjcvpRCQcXrUGzlrouo75hYXHXvfB5XIhGo029azRdR3pZAqlNcwjDmf7Y5gQV//KPqE+/D8BGr99OBwOh8PhcDibQP1KVJ3k83nE43EUi0WEQiE4nU54PB5TjKdeXFbTwGnUT9B1HV6v1xRURKPgNIkdtByZEm63e1kbNI3+d1oiIOoRTCgdEP3IVhQF1WrVFInJOIBNkGOMQZZllEqlWp57o7ZCJpNBMpnE0tKSWVuB6iVQYelEIoFcLodyuWymJSoUCstqJVQqlYfEdVqvVYBzuVzLTAmKYAiHwwiHw4hEIua4gJHuicwBMjtcRoorj8ezzJCwRkBYDQmrcUH/W80HapPOB50nqylhbZ+MDTKjaJBlGdVqrZc0XR/W6cxi+jQqyDWKy+WC3+eH2yiY3iiMMaRTqYYFpK0gGAziwMGD2Lt37zJzRdM0LMYXce3qVXz66Sf48He/w0e/+xBnvvgc129cx9TUJAqFWooOu2C2HaH7prOzC4568pobqUW2GwxAKByGz7f+L2xBEOot91A3UrWKbDrV8DlXFBX3Bwfx2aef4Le/+y0++ugjnD1zBjduXMf4+DiymSw0/eE0anQOnE4XOjo7cODgAbzyymn86L338ZPf+wA/+b0P8N77P8GP33sfb7zxJo4dO4be3l54LKJ5LptFfCG+ahHt1RAEAR6vF+FI+KEe71uJpmnIpFNNmZcCANEhQmwwZZTD4UAwFGoq3ZwgOGrvt/ITLoQKAlid0U+iKKKnpwfHXngePT29yzpBrIsgYHZ2BhcvnEM2k1n2vi+Vyqg00SOfMYbR0RGc+eIL/OP/+J/45KMP8cUXn+Pq1asYGR5BOpmCZvluQQiCYFwzDrREW7Bnz16cOvUy3v3hj2r3209+gvfefx8/eu/HePOtt3D8+AkMDAzA20SEzEYiGjXDQmuk01uLxNISqpWKffSWIhj1K8LRqPmdt14EQUC5UkYylbJP4nCePMp/0aQBsRfo4KmXOBwOh8PhcLYDDfwiro9sNot0Oo1SqQRmFBCm3u4ulwuappkGhDUygcRAGEIH/XC1RhjA+BFNg1V4t84nGtER9mXXgjFmmga6rsPhcEA3Cufqum625zLSSAmWehIUoUBmCaURqlarZg0EqnWQy+WQyWSQTqeRSCSQTCaRTCaRyWRQKBRM48FqYuRyOWSz2WXL03iaRvUTyPTI5XJIp9PmvNb5qfg0DYVCYZnRQZEe1WoV1WoVilEQGtbej8ZxJ6PCalJEIhFEo9FlRod1sBoUNFiNiEAgYP7Ytp53inCgKAhYalpoRpQEDXR9bAYuI3WWx+v7rnt4IwgC4gsL2zIlgmAaeTUTjzGGubk5nPvmG3zycU2wunjxIu4PDmJhYQGlUrlmilnqbdD9IQC13tKPUahdC1EU0dbWVqcw2MyJ3nyYrjfVM3Yj0HUdsqKg3ER+d8YY5ufmMDQ0hInxcSQTCdPoJYPXvI4EAT6vD93d3TjyzDN47fXX8f777+PHP34P7777I7z1ztt47bXXceKll3Do8GHs2LkT0WgUHq/XNDutz4JCoYB0Mlm3kGzF4/EgEAguM+a2Gk3TUCgUocqSfdK61N6PDjgcjV3PDofDfIc381yVZRlStdrUsk8qHo8HBw8ewq7duxEIfBd5Uw/lchljY+O4d++e+e5VFAXVSgWq0ri5rus6kokkRkaGMTY2hsX4IspGHSvdeHbTvQYAbpcLXV1dOHDwIE69cho/fu99vPeTn+DdH/4Q77zzDl5/vXa/HT58GDsHBtDW1ga/329ErtbeHY8Th8NhdIxo7tmYyWYgSY3fXxuKIMDlciEQ8DdsPsBIL5fNZOyjOZwnk/JfAFOj9rHr43/GPobD4XA4HA6H8xioR3WrG0VRkEqlkM/nTRGeoh5IWKae8CQwkajPLCmZ3EYNgZpQUvtr/QyLKUFGg9VwsJoO9f4I1nV9WeQDLUe96ldaBwnwZD4EjHRFPp/vIZPCvi0kppPYZhduad2qUfeAev5TIWcyCyhawl7UmYwMMiysRoPV1KDpVmOC5rG2YR3sURnWQtPWgbaXTAwaaF+q1apZ64EiO+h40zGzwoy0P2SMKEZNEIp2sJoPNP9m4PV6EY5E4PN5UZPYG4PpOqZnZlCVGu/BupVkMhncvnULX3/1Fc6eOYMrly9jeHjYEIrL0PXlIhidL7/fjx07duD4iRN47Y3X0dLSsmnn4lFwiGKtN/djFJIfFZ/XB6/n8aQ40XUdapPROwKw7D4mGKtZAn5/AB0dndi9Zw+OPf88Xjl9Gm+88Sbeevtt/OAHP8Rbb7+NkydP4Zlnn8WePXvR2dWJSCRSe8esI9SVy2WUm+jVLAgCRKcTXq/HPmlrMVIB0rOyEb57WjX+3PJ6vXC7Gi1+W0PTNEhSLX3e94lYayt2GeJ8I+eKMYZMOoN79+4in88DxjGsmQWNR7wwIzpTkiTIigxYvh8xAB4jbdmu3buNtGWv4fU33sBbb7+Dd37wA7z1zjt4+ZVXcOz557F37150dXcbKYECcDUZAbiZOEQRTrcbbre7iSsdKBaKK9bc2GpcLhc8DRecriFJEkqlohEfx+E8BUz+n/Yx6xM4bB/D4XA4HA6Hw3kMbKj5UC6XEY/HUSqVIBgpijRNQ7lchqZpZg93Eu0dliLSohFBAMNYsJoL9L/TSKnkMCIQaF4aZzUH6Id1vT/aNKMIY6VSgdPpXCZmW9sWVkjpJBo1KPx+v1nHIRKJmIaLNTUR9ey3pjEKBoMPpUgKGnUR/EYtCI/HA5clfZHdBIEhBtpZa/9p/0j4J3GCREGrsUCGBkVaUIRFOp1GOp1+KL1UPB7H4uIiEokEFhcXsbS0hKWlJSQSCaRSKaTT6YfaooiNYrEIRVFWNW1qQlZtG601Hqzmw0rHYqPwer2IxWJN9zhnjGF2bhaFQk1U2m7ouo5kMomrV6/gw9/9Dl+ePYvR0RHkCnkzNcdKOprL5UJnVzeef/4FvPfee/hnf/hHeP/9n6C1tXXN6/BxIUCA16jt8qTi9XqbSoWzIRj33KPAjB7XbrcbgUAAsVgMe/bswfPPP4+33noLP/3p7+MP/+jn+Onv/z7eeucdPP/8C9izdw/aOzoMA9AHRwP7rxvRbGoTAi4EAaJTrC9N1yaiGyZsM1etzhg0rbnnoyiKcLpcDR1vEwHQmAatiVRRTzrdvT3o7umG6GzsupFkCTMzM1hcWIBuRD/oTG8qYodgjJk96v1+P6LRKHYODODo0aN47bXX8cEHP8XP//m/wO//k3+Ct95+B8ePH8eBAwfQ1dVl1h9otGj948D8nuZyNuyzMcZqz4gmjdWNQhAEOEQRLrF2zzX6DtU0DVWpCsYaW47D2b78DZCwj+NwOBwOh8PhPAk0oSKsTqFQwOLiInK5nCluVKtVOBwOs0c+M6IIKLWOVdyXZdmMimBG73eCzAyCppN4ZR1nHepFVVUUCgUoigK322322Lf+4LMaDg7DDLGbEA4j3L+lpQWxWKyWnsdS/8DtdsNpSVdkNSjIiAiFQohEImhpaUEkElk2nkwJawojiiahFEZWk8M60Dh7oWd7SiRKIUX7I1oiPNxGb0JaJxkhVlOEjonVACJDgIwDxainYTU7qtWqGVVh7Q1NkEgsGGYT9QSlHsC6pRB1M+JavYiiiGhLFMFQqCnhmjGGUqGAhfn5x5/aYQWymQz+4b/+V/z2H/8RQ0P3UaZc7WvsqtfjwfMvvICf//zn+MOf/xzHXzqJ7p6ebdszFjUtGS7D0HxScbldj00MFBwOCA08Y+0IANweD3p6e3Hy5Cn803/2h/h3//7f49/8m3+Lf/4v/gXeeudtPPvcs+jr6zPNvkdN4aWqKhRVwYru2TqIogiPq/GCy5sBvSMbhRkGBInZjSAIAkRX7dneKIwBus4eSTh/Umlv70BHZydcrsauXV3TUCwUMTs3h2pVMt/HaKBovB2X242uzi68ePw4PvjZz/Crf/1v8G//3b/Dv/zFL/DDH/0IR48dM+83+u6yHa73ZqDvMA27DwAUVYHexP210TiMaKtmzoGm65BlZe0X9yaibeJ3MM73mHKDqZf8++1jOBwOh8PhcDiPgeZ/xdqQZRmJRALlchmCIJjCuiAIZuFpEo2pV7u1Nz/13vd6vRCMnnluI9ychG+HEfHgcrkgGpESgi06goZGf6yl02mUy2VTPLf2qoelx/1qKX5ovVYjIBwOo62tDa2trQiHw2YUAwn8NFiFfBL3fUbhaHuEBBkTZBzY/wYCAXi9XrOINJkctF6aRu1bzQhr1IU9AsO6zbS9tJ8UmUHmBpkftCy1TdtnjeYgI4OuARrofNuPsx0yG2iwnptmxLl6iUSi6OzohL/JnNKqquLB0AMsLS3ZJz1WJiYm8Hf/6T/h+vXryKTT66Z2EQQBrW1t+MkHH+CnP/sZnjt6FLFYDF6v1xQpdaO37XZDEIQn3nxwOJ2PZAA8CnT8Vrs310IQgN179uCP/vCP8K//9b/B7/+Tf4KTp05h95696OzqQrSlBYFAEG63e5mRuWFsYFNbjWAIko5mjgdj0HWtaWHQ6XLVTCf7hHUQIEB0PP6okcdBOBxGS0us4SLfjDEUCgXMGCn6XC4X3E4Xmj2C4UgYv/8Hf4B//7/+r/gn//Sf4bXXXseBAwfQ3d2DWKwVwWDtfhMtqS6fZL773rD6+2s1Gi1Gv1nUIpXWfgevBmMMTG98uY2AMQbZSIvJ4WwopRH7mCcX/yurD08j9n18mvd1Nez7/n09Dt8bVjjPW3mu7ev1vwI0J1t8P3no2D3Bx/ChfXiC98XOQ/tkGb6P2I/BNjvPG6JaMSOf8Pz8PKrV6rKIABhiCc1H4r2iKFBV1RTsSdiG0WNNMIrdWs0E+2AdbzUcmvnhnEwmUSwWAVsPe2tblJ6oaqQkoiLS2WwWyWTSTDE0Pz+Pubk5M/1QIpFAJpMxaybYaytQ/QRrDYWqURtBURQwS3Ftq5lAx4wEfUrvRCYDTafPVlOCDAiKvLBGRpCZYTUk7JEStD5q074Omm43I8jYoHZoIEPCuo2iUcCbjAT6ax1gMSBIbLAaEJtFJBJBZ1cXWmItDQtxMK6x0ZERzM3O2idtOqVSEYlEAtlMZtkxmpmexjdff40bN26gXK4VjF+PtrY2vPra63j1tdewc+cAvIZ5aEVV1aaO0VZAz6gnFUH47vm61TgcDjjdtfQtjW+DAKfThY7OTgzs2oWOjg6Ew2HTUN4sHA4HnKKzqVQkTNehat8Z0o8Tj8fTVGFfXdchyzLkJopVA4BI73L7hHWoHffa++v7iM/ng7uJCDBFkZHNZiFJEgRBgN/vh7OJdgBAdIhob2vHzp070d3djUgkYpp7TxuMMWiqBlXVGr9YjZoRjd5bGw1951GoE0yDz51a1ERzkR+PCmMMiiw1uskczlPKK0D7b4DDHwInRoA3WG04cX71wZxnpLZc+5MmorwCDPymvv217uvAb7aVSNI838dz/qRhF+fWGuzLroL/V8Y5N87lGyuc52XneiPPs3HNrXu90baNAId/s4Hrr4OHjusaw1bTTuduveNnPYbW+/VXj2e7V+Jp2pdlPCXPVfu1vtawLg3c9yd+Y1/4sbAhvzoZYyiXy6b5QD3WVVWFKIqQpFrKABhCpNPpNAVjq7Du8Xig6/oyAcpuRNB4+sFs7aVH62jmRyNFbehGDQRq02qkULsk4FC6oFKphHw+j0wms6z2wfz8PObn57GwsIBkMolMJmPWN8jlckin0+Y4a9HnXC5n1lOwF4suFovmULYUnibTolKpLCvkao8KsH6mwS7mU/SH0+k0DQyribGS6WCNSKEIDlrOHn1BRgSZGTRY//f7/XA6ncu2zWo+kLlgHWj7rfNuFoFAAF3dXWhrb2tG24AgCEgkEpicmEAqlbJP3jR0TcPkxASuXrmM+/fvo2IU3i0Vi7hx/TquXrkMSZbqOnY+nxcHDh7EG2+8ifb2Dvtkk+1sPnAeDY/Hi2hLi330ujDGkEgmsbi4CHmTUo9RWjZJkkyTjZ5Notj4q4+e+/ZC61uNKIoI+P1wNLEPmq7XzO0mCm4DqNVsqOPZYIUBEJ0i3N4nN4XPo+IUxaZqszDGIBnpCQEgEAzAa0SUNoosyYjHFzbtfUP3G6VCfJwwXYei1Lalsau19m72er1wPqZ0dlY0VYWsyNBZ4wnLRKcIj8cNQWh0yY2hXCo99mclh4PysH3M1tH+G0PYOQ8c/jXQ/h7g32ufa238e2vLHTZElBMj20M8WQ3rPu/8dWP7699bW+aEIYwO/Mo+x/bn+3jOn1QO28W5NYYja4l2rwADHxrn6q+Nc26fZxX8dJ4f4Xr3/wo4PPLdNVf39bYXaP/1o6+/Xvy/efi4rjW02xvYBMxjx4DDdO7qPX4G5v3617Xtpnt24Dd1iscbxNO0L3aequfqK8CRFa731YaBVbax6fv+8dP4r+EVUFXV7P0vy7JpFmiaBq/XC0mSzBRAAOD3+5elGlJVFeVyGTB6dFIqHhKzHZaizhQJQUYDGQP28Y38OGeMIZ1O136oGkYKifIkpnu9XoRCIbNXv32g9EXhcBiRSMSMGKBIAnu0gNOSgoGMGlmWUa1WzQLPFFVBx5YMjdnZWUxPT2NqagozMzPm58nJSUxNTWF2dhbz8/NYWloyIzISiQSSySRSqdQyk4PWk8/nTVODDA2K8Kga4oe1MDVFGpBI7TDqb9D/JPYRZObQOXIZabXIwLCbEoFAAG6321wHnQ+7WWIdyFxZyZDYaARBQGdHJ/r6diAQDDZ0vRGKqmB0dAQjDx5s2nbaKZVKuHH9Oj75+GPcvHnTjPa5f/8+7g3eRS6Xq0tcFAQB3d09eOHFF9HRsfo3hGq1WitSbZ/AeeIRjJ7YnR2d5nO3ETLpFBKJJVSqVfukR4Yxhnw+j6mpSYyPj5n1hmCYZh5P4z3wGWNQFBXV6uaYJfUiiiKikUjtHVLHvWpFV9WaSd3EMdd1HbIkNSwsM8bg9XoR8Afsk7431K69xt8RAKCoKqrG+fL7A4hGI03db7IiYXFxEdlsxj5pQygWi5iYmMDoyAgKhcKWvdNWQtd1VKsVVCq175WN4vf54HI3F2GyYRgRxeVyualC7W63B4FA0D56S9B1HZlMBrIi2ydxOI9GYJ99zDbDIkQe/nX9ImS9+PdunVjYCH5DHNqwfd4L7Pzr2n4+FoGoEb6n55wDtH9oGG3v2ac0iHG9n/iwgevnlZr4eOKvgfZHFR6bWf8TDAm3G3LsVsA0Uv93+5SN52nal2Xw5+rKvAIMbOL53gI2xHyQJAkzMzNQVdUU18k8WClnN4nFglGImH6kkritqqq5PAxh22oq0GeKfiBRm9on86NeVFVFJpOBIAjw+XzLIjKsg9PpXJbaiPaVPttTHFnTDVF6Iau4TsWkKeUQtUdGjT3qgNIYWdMiUaQAjfcbRVnpuOtGGiIyN1RVNQ2ESqWCUqlkpn+iiAsyOuLxuGl2zM7OYmZmBnNzc5idnTXTSlFqKTI6yCwhc4MiNlYa7GZHpVIx/ypGvmDrOSZDg/aJWSIg7FEcm20+AEAkGsXu3bvR3t5uXnuNwBjD3Nw8hoaGsLgYt0/eFEZGRzE2NgZVU9Hd3Y1YLIZCPo/hBw8wPzdvHuP1YIyhu6cHRw4fsU8yYYwhlUpBXqF4OOfJx+FwIBgIoKe3xz6pbhYXFzft2h9+8AD/+D/+Bz7+3YdYWPju2g4EQ4hGG4/WAABFklAoFKA2IQZuFKIooqW1tdYDvkERWgdqKf5KRhH5Bqi9QxrP4y4adZ8i0Yh90vcG2XjnNgODbvYg9/l96OnpbSr6QVEUxONxLG5SnaHJiQn84//8H/iHv/97zM/NNXydrEWj+6pqGoqlEgqGud4okWgL3A0WCN9omFFLrZjPN/W88bjdCIfDTZtej4Ku60ilklCVxrebw9lQSoP2MZsH9ex9ZCGyHraLOE9CyCaIQ0BtPw+f3zbpIh7ie3nOOabwf3iDz7v/PaNHtn2CDf9vaqbHRouPtP5NuZe3Ce0fPtHC7TKepn2xwp+rq/CKcVye7PO9IeaDoihYXFw0/yfRVxAEKIoCp9O5LJJA0zQzosHaE54xZv6l3pU0D0U40F9YUi6JRpFiMgkagTGGXC5nFsqmHvx244EGt9ttRkJYjQcyDqxGAfXsJzNgtV7+9sgIq6FgrZlAJgWlPrJHXqxkRFiXp22rpR2pRXRY/9o/0/8UoWI9X4Jh8JDwT8aRJEnLUlJRKihKEWWP6MhkMkilUkilUkgkElhaWkIikUA6nTZTAlnPKV1btG6ruUDXDRkP9ukbjc/nQ39/P/bu3QeP12ufXBeFQgEjIyO4fes2iqXmhJJ6KRQKuHnjBuLxONpa29Df3w+Xy2XWKCk1IEgKANrbOxAIrt6zkjGGeDzetOjG2f4EgkH09vXB52/um+r8/DyGR0Y2/D7N5/MYGRnGyMgoVE2D1+szp0WjUXR1dTX1rqhUysik02YanHqo7Vpj61qPQCCA1lgrPG53Qy0LRjRSvpCHqtZvCjLGUCwWa7UiGjxXTqcLsZYYYrFW+6TvBbquo1wqQdWaE2IdjlrHBxiRDzt27oS/yTor6XQKczMzyOWy9omPRLFYxNjYKCbHJ1AulxAMBJrYvtXRNb2h605VFeRzOeQyzUV5dHR0wOf77pmxETDGGipkrSgKsrkcSpaorUYIBINoa22zj/6OJk+PVkcqJcYYZmdmIUn1pXDkcOrjlcZFlvJd+5jNYVMF+LUwxPnDj6Pn5hYKIf5fA298CGynAMrv5TnnwP+r2nXf6LOobvbWjI3Vrqv2D2vX3aaxtxYB8TTS/uHGG0aPi6dpX6zw5+rK+H9VMxy3/LhsPBtiPlSrVSQSCVOoph+dDocDiqLAawizDocDbrcbzDAhyEQgQRuGoQCbgUHz0l/7QOsjg6ARdF3H0tKSmRfcKljTtlC7jLFlJog1KoEiHaxGhH2wmhF2I4IGqzFhNSDsJoTV9CAzggaaTstQWxRxYZ1vpTb9hmlBgzXSwm5y0HJkipCxsZYZxCxpksgsUC21KSRJgmRL70FtCbYICGrLeu4o0mMraG1rw6FDh9DW3m5eL41RE+hvfXsL42NjDYmajSDLMu7euYP79wchSRK6e3rQ09sLxhgWFhaQzmSgNHDMvD4fAusIzowxTIyPN51fnrP98Xq96OrqRmdXN0Txu1Ry9cCMdHfDDx4gscG9sUdHRzAyPAxN09DZ1YW2tjbz/oy1tKCvr29Z6rt6KZVKSCRr9YHqQdU06JrekOhYD263Gzt37oTP52sopZkgCJAlCblsLTKtXmFQ17Wa6WKkJmwEj8eD9vZ2tLetIYRuEUKziusjUKvflGoqdY4gCHC53HAZvfA9Hg96e3vR2dnR1PVbLBQwPT2N6amphs/jaui6jumpKYyPjUFRFXR1daElFlvx3d8stYjY9UVvolwuI5PJoFAo2Ceti8PhQHd3N/yBjVW5GGNQFKXu416tVrAYj6PaxHcCnTFEo1FEImtFG638/WwtGGNQ5PVNy2KhgHh8EQqPeuRsKM80+MN7FFi6YB+5wbwCHGZbI8CvRftfb3F0gGE8NHQ+HpUGculvKt/Xc86p9cj+6y24DlcxAAY2IdpiRd57+q6tp0msf5r2xYQ/V1fnV7XnzlPCI5sPmqaZvdndbjf8Rg976u0PQyihHzlWc8IKs0RFCEYEAkGCM40nE8P6/2pCdz3E43FT+KYfS9Z2nZai07qum8K6aNShcLvdKxoOfks6JatRYDUjaFm7IUCf7dEM1nRL1vns5gFtj/WvvV172iYyE8hIsJ5Ht5EGipa3GhP2z9bto+NgH+z7E4lEzFoZtLzbMKoI+/ldycSgccxWoHqz8Hg82Ld/Pw4eONi0WCFJVYyPj+Hq5StYmJ/fcONEVVXMzs7i66+/RDKxBJ/Xh86OTnR2dkLTNGSyGZRLxYZ6ljpdLojriF/FQgFj42OoVCqbeg4eBTKynlQe92EVRRFtbW04cGA/gqFgw9KurmmYmZrC7du3N+y6LxaLuHHtOmZmZhAMBtHe1ga/xSgLRyLo6+tHcI2onZVgjKFULiO+EEc+l7NPXhHNeK9s9PUvCAIOHjpkpFWpH2bkkU+nUkgl6y88LMsKFpcWUZUk6A3uS0ssis6uzjWjpLYKs2xvY7vwSCzG41iKLzZlPjhEET5fAB6PxxwXjbbg4KHD8DbRM19RFMxOz+DB0ANks9lHvi4ZY8hms7h39y6mpqbg8XjQ398Pt2dji4tTysh6YIwhsbSEpcXFprbB7/ejq6sTviaO71owxlCtVus65rquI5fLYXJioikBv6Ulio6OjmXXjRUBAkTRCaHRIui0D/bxFmRZxuTkJHL5XNPRFRzOigz8b/Yx6zAC1NdPoEkMAX69FClbhf/XWySaPA7jYbvwfT3nnJoAuJkRB3beW94Lu/3DrRVm/b/ePtf5I/Orp0isf5r2heDP1dV55qkyHrAR5oMsy0gmk5AkCYIRHeByuRAKheDz+SCKotnbi1nSKTEjqsHlcpkiv8fjgaZpZqFpEvjtxgL9Tz3saZzVsKgXXdcRj8fhcDigaRqq1aq5LtpG+rFI7dM6GWNmFAQZCtZoALuhYDcBrIK/dTnr8tQumQE00Lrs5gS1Q+sjw4AGMhFoW2h+asdeS8LaJm0LGSculwsej2eZoWD9TO0Fg8GH9oUMDWttENpWmp96dtoFBPpfMEwpq4BsjYCwT9sswuEwTr/6Kvp6e+B0NhP9AJRKRdy+/S0unD+HhYX5ugSKeonH4zjzxRcYHR2Dqqho72hHZ3eXeW9WjRob9uO8FtVyGZK0etFaWZYxMjKMpfhC3aLRMhiDgM01juga2Sw2c9sJpmnQGywA3ChrXReCICAUDGLfvv3oaG+Ho8HoH8YY0ukMzp8/j/Hx8WXRTs3AGMOFc+dw//4gZEVBa1sburq7H9qHzq4uHDp0+KHx66GqKhYW5jE/P2emhVsLVVGgKgp0nW2o4i0IAgZ27UJ3by/EBp851WoVS4kE4vF43de/oiiYmZ5BpVxu6LoWHA7sHNiFvv4d9kmPB0H4zoDYAjRVxfTUFObm56Cz+o61FbfbjbbW2DIR2ev14vjxE7X7rcHrFxCQyWZwb/AeHjwYeuRIu2q1iuEHD3Dn9m1kMhlEo1H09e+A06jXtVHIkgSlzvR9qqpidHQMM9Mz9knrIjpF9PT1obW1De4N3gdd1+s2H2RZRiKRxNj4WMPvT0EQ0NPdg/4da5wHQYDoFCGIYkN3AwNQKBbWrBlTLBZw5eqVmmnSSOMczpr8qnHhber/bR+zsRx+FAF+FJj6K+DqaeArwRhOA1f/HJj6qHnTZCtEk0fZ7/JHwOBp4OoK+/wk8Cj7/iSf8+89+x+PANj+v9WuN/9vHo/gPPCUXFeHmzx3ib9a4Xl1Ghj8KyAxap97a3ia9oXgz9XV2bkVkVZbS+NqvY1KpYJ0Om3+T7n+q9UqJEkyRWu/329GNni9XohGPQF7LQFYxC76kWb/S/PQcmRe1POjbiU0TTN72sMS9WCNqKD1EaIlbZR1HAnydqHeagLYp3stpkXQiBigwWpeWE0EEvGtRoJ1sBoAgUDAPAdWw8PahrUd2g6rMRKwRDTYt8naBhkLtF8+S5Fsaoc+UzvUBhkSdF1YTQbrZxjXAjPMIdhMB+v0rcDpdGLHjh14/Y030dHReC55GNufyWRw9epVnPn8C4yPjdlnaYrxsTF88fnnuH37Vi39keBAd3cPent6gUfoma2qKpaWllCprizAzs/P4eKFC8jl8g23DUPkoIiWzYIxQKpT0EKD1xNjDDoATdvcuiNKgwWAG9kUZjE31urt7nK7sWfPHhw6fASRaNQ+eV00TcXszAzOfP45Zmdn7ZPrRtM0XL12FRcvXEAymYQoimhpaUFPb+1at9La2oqXTp6Es0GzBEZP9rHRMSSTCfukh5BkuXaONG3DdTi3242jzx1Fd3dPQ88cAUAum8X09HTdvd/T6TTm5mZQra5uOK5EMBDEgQMH0dPTfFHyjcJ8R9gn1AtjDYupo6OjePBgCKlUsqF7D8a7LuD3o6+vHz5LL3yHw4GOjg6cPv0qoi2NpzdSVRVzs7O4cO4cJsbHGxa3CVVVMTExjm+++RoLC/MAgFhrKzo6OyE20RFkLSRJglxnBMD83BxGR4aRSqfquratuF0eHDp0CC2xloaN1DVhDJqmo1hcXbS3ks1mcPvbb1EoFBreBwgC+nbsQHd3z0PfUa04RScExhoKThAEAYvxxWXf+a1UKxXc+vYWHty//4imeCNbxfle0HDUwyanXBqooyjsSpD4/tU+YPIvgLJ1Gy8A5b8BJt+vCURX/7w54cT/683LW93+YXP7nfhzY5/eBxIXLPtl2eevaJ8fsxC2Gt/Xc86pFWKuWwAcrQm9phhqCLzNnFfsBY40WuPBLsY+wvqfhugH/28a34fEn9eO3eBfrPC8ugAk/gIY3Pfd8Z1q8vg2ytO0LwR/rm4QxnPHajCZ5tJHtaE0aF/osbD6L5M6kSQJqVQtfQMzctrKsmwObrcbmqbB4/EgEAjA7XbDYRR1tvdMZ0YkAWxpj0j4p7+0vHXeZpFlGYVCYZngTcYIfbaaEdaBIi9oHvpMBoTHiAqwCvErif003moc2I0C+2cS7a1tk8FAbVM7fr/frNdgHawGgnU7qE3r9lmNA3vqJ2tbVjPBus9W84PMB6vBQeug/SBTChbzYS2RhcwGZouuafiHe5O43W4cPfo8Xjp5EpFIdM1tXQ1dZ1haWsL169fx+eef4fq1aw0VgbZSKZdx69YtnDlzBtevXUU6VRNiXC4Xenp70dXdDRg9kx1CE/ePIGBsdBQXL1xYlle7Wq1iaOg+zp87hwdDzfesZboORfkuDdpaMCNCgumNnWsGBqXOHPa6kfatEXTDPKkn3z89DxtFVpS6DRpZlsEa7H2tMwZVU9cUkgRBQDQaxXPPHcXevXvhcq+cWm8tKpUy7ty5jW+++gojI8PQGizOW61U8e233+LrL89ienoKuq7D7/OjtbUVbSvUGnC73di9Zw+efe45iEZ0Xb1UKhUMDw9jcPD+utEPpVIJxXKxVmx4/cusYQ4fPox9+/bZR68JowLBoyOYmZ5e9x4rlUqYGB/HwkKDUUyCgOeeew579+4zjf3Hiaqoxnlo7kToxrGrl3g8jmtXr2JiYgKSVKfJaUEURbS2tmLnwAA8tvQ5LpcLL7z4Ig4fOdLw9QujJsLwg2F89eWXuD84CLleE9ZAlmUM3b+Pr7/6EqMjI6hUq3C5XGhta1unzkBzMOM6XA9ZknHl8mVMTk7aJ9VFV3cX9u/bD/869YwahRlFsJeWFu2THkKSqhi6fx93795pPFWXIKC/vx+7du1GLBazTzURBAEerxfOVdKgroogYHJiHMMPHjz03snn87h27RouXryIdDpd13vVDjPeOc0sy3mKaSbdSOL/bE5sqAf/bxrfHgCY+vPvxPd6KP9NTUSYakKMb//r5gSdNWkm3cdoTQwZ/Jv6zkf5b4Cr+5oXizaL7+0559TPaO18f7WvJvSaYqgh8F4VgMEmInz8dd5zq4qxlvU3dV09KeLrKnT8xD5mbaaM51XdXKgd76sk3n9UM1DLoxv/DHua9gX8ubohWO97u8FkmkvvG0Mj18Lm0YTquBxJkpBOp6HrOmRZNgV76w+aarUKXdfNFDswDAPBkjZHEASoqros+oAEaLvAT8sSzNIDvhEYYygWi0in01BV1WxXsEVV0P7QvsEWHUHTSSwnA8JtqefgNaIMSIQnYZ4+200JryVigkwMq9BPQj0J99Su3USgedYarAYAjfNYIhis+0DroeXsRsJK9ShoH6zt+C1RHlZjg9ohk0owIlro+BP02W5eWQeavlU/ZMORMF597TWcPHnSvM4bRRAEpFJJnD9/Dv/4j/8TVy5fRnxhAYVCYc1ilcwwXYrFIhYWFnDlyhV8+vHHuHjxgmkOAkBrawzdPd2mmEVGWTPFgmdnZ/HFZ5/h4oULeDA0hNGREVy5fBmfffoJzn3zNXL55qIeYPRil6rVdYVRGKaNpmpGapv6Ybpedz0KSivXCJqqQlFkoI7lNF2Hrmt1bYuVarVSE1TroFIpPyQYrYfOGBRVhbrOcoIgYPee3Xj+hRewe/ce81nYCLlcDt98/TXOfvEF7t65i0KhYBgmKx8TZtQvSCaTuHrtKj779BPcu3vXiGYREIlG0dHZYT6z7YRDIbz51tvo6upadR2rMTs7ixvXr+Pu3bsor5KKSNNULC4uIpFM1R9h0yCx1lY8d/Qo9u5r7MubpmmYmZ7GrVu3sBiPr3pd6LqO6alJ3L59C+l0piGDLBqN4tXXXkN3T83ofNyomgqtiSgvGNeaoqp1RX7IsozZmRlcvHAeN2/eWPb8bQR/IIC9+/ahq6uWIs9Oa1sbTr58CgcPHbJPqotiqYiLFy/i7NkzuPXtt8hkMmvebzDSb+VzOdy+dQtnznyBSxcuolQqQRAEtHd0oKOjE16v177YhhBfmMfMzLR9tEmlUsa9e3dx6dIlZLNZ++Q1EYzj+cyzz6Kvv98s8L2RKIqCeHwBicTqEVOaquLevUFcvnQZicSSffK6uN1uPPPMM9i9e/ea58HhcMDv98PVqPnAGObn53D9+lVcu3oV8YUFxBcWMD42hnPffIMzZ77Ag6H79qXqRtNqnQ50feXnEed7SFOFNUeByc36kf0KcKSRXsgGg6eb36bJfc2JlodXKFj7KDSc7mO01qO2XoHIColFzez3hvM9Puec+kj8lSH6r3O+E+83J4CuR71i7OQ+YPWvICsTOGwf8wTxCtDewO+jxJ8Dk+scwzW5YPS232cM79tneASepn0Bf65uBPXe99sM8Ze//OVf2kc2AgmdJMSTQE0mgcvlMntLakZRYBKkRSPCgEwJxhgCRtFea0omq/FgNSKsKZsa+gFloGkalpaWcPv2bbhcLlQqFciybLZJ2+V0Ok2DgdZJ46zbR9EStO20PAn51nHW/51OJ9xG/QPaP2rDuh57u9Q2tWf93+PxLFuetsu6fhqsy1m319oubaf1vFq3x+v1LluWjBPr+mgZl2U/rdOdTqe53eVyGZlMBpVKxZxm3R/6TNPor2gUAaf10HzNXB/NEAwG0d7eDkEQMDMz3ZBYR5Dhkk6ncffOXdy7dw/lctm8LhljUI3i6BRpVCqVMDszg2tXr+K3//hbfP3NV5idm4Wmqua+C4KAY88/jxdeeMHsnepwODA/P4fpqallEQz1wBhDLpfD7du38M03X+Orr77EjRvXMTc711RPX0KAAKdLRHtnB3bt2oVAILDm+ctkMxgbHcH09BQUpT4hXhAEuN1u7N9/AH19fRBXEPcIxUgvcuP6dfukNREcDvTv2IF9dfSkLZVKGLw3iNmZmYZ6lzPGcOzY8xjYtcs+6SFu376FsfHxhqJRXC4Xerq7sWvX7nWLG4uiiPb2NrjdbiwuLaHYRMoQRVEwPTWF4eFhJJMp87nBGKulCDNqKMiyjFwui/v3B/HZp5/gzBefY2ZmZtn9tv/Afrz44otobX048gFGMd+WWAzVahWJpYQpotYDYwzJRALz8/MIhoIIhYIQBAd0Xa8ZZ5KEpaVFXLhwAcND9yGtkp5sJQRBgN/nw+7du3Hg4EH75IdojcUgik5MTU2j2sB6NF3H3NwsPB4PIpEoAoEAHIJg9u7XNA3j42O4cL4mokvV+q+bUDiM99//CV48ftw0Oh83dI9NT081dI/BOCeBQBADAwMIh8MQRbFmbBvmtqZpUFUVxWIBww+G8fFHH+H8+XPI5XIN3wMw7qV9e/biZ3/wB4hEIqtel12d3fB43Mhk0k2ZHIzpmJubw727d7G4GIfP54Xb7VnxfquUy5icnMSHv/sdPvnkY4yPj5v3m2CYj0ePHkVvb++q26tpGu7dvYvpOiJurAiCUPsu4HJj1+5dZvAKdV7J53K4d+cO/u5v/xaJRKLhY+7zeXHkyBG8+trr6OvrW3X7Qc+oySmMjY2iVF4/GsOKpmlwuZxoa2+Hz+cDMzpKqKoKWZZx8+ZNfPS732KoCQHf7fHg8OHDePW119Dfv2PNdxrAIMsSHgwOIp1pzFRkDFhcXMTtW7dw7dpVXDIMrG+/vYmkcewFQYDP52u48weDgJ7ubuzeswctLS32yZx1GBD+o33UJvAiMPCBfeTqKJeB+Y/tY+vgFWDgDLDvpH3C+kx9ACQar/lSFwNngPbVo4pWZOo0MP+I4kD5b4HySaC9kUjHfYDwGZDdgGPh/w2w75R97NpMfQDMP+K6y38LJBaAlg+ARvt0NX3t2fi+nnPXj4HeRs75KJCYAFz9mzcoG7BfRPtfAjXJ6REYBQY/AKb+P/YJq5O9DnT8q8av5xUZBa62AokGfp+WWho7r64MMPW39rGN0+j1lPg/NqC3/XvAvgbeV1M/3YB1bhZP0758j5+r6Ad6H/X+b+K+30YIZ8+erf+XwQrcuHED//k//2e0tbVB0zSz171g9FT3ev//7P1ncBxpmu+H/rK8h/cAAXpvm2R3k+29nZ1ZMxtxtKvdK+nunNBV3N24N46OFKEPuhH6dr7sXCmuNPtBx0k6e/bs7szsTHdP90z7brahb5IgQJCEtwWgvMtKcz9UvtmJQgFEwREk8xeRRPHNrMp8Tb5V+fzf53l8qKqK0+k09zkcDoLB4AJDu9PIB+E3YhsLA7bYX27wFoZrYQxfDbIs09fXxz/8wz8QCATI5XIUCgXTmO03EmYLA7nT6TRFE1EmjNzlr4XxXRg5xX5htMAwYFmvXTyIWv9f/lc82JWXC6z7rA+U4iG9nPLzVfps62vrZyx1veUP7tb6Vvosa7kYByMjIwwMDBCPxwlYPEW8FfJLWD09xGo+q5eFGHPW+m0kiqIyOTHOl19+yZeff04sHis/pCocTidB4UkSDBIOhQgFQzjdLjRFJZfLk0gmSKdT5PN5stnsksa1P/+//Recfeop8z7TdZ1r177jnV/9iv6+vnuucF8K0aqVJhO3x4OmalWF0vF4PBw4cIA33nyTAwcPle9ewODgXX732w/46tw5ZHnlBq1AIMBLL73ED374o2VXiSYTCT768EP+4R/+fsF4vxcOh4Mnz57l7R/8gM6OzvLdC5iemuLn//iPnD//bVXigCRJ/NGPf8zbv/d7SMvEydZ1nb/53/5Xzp8/v6LV2wKP18tjjz3Ga6+9zs5dK1txkUwkuHr1Ku+99w7jY+NLrqpfDofDgdfnIxwKUVtbR219HaFQCLfLhaIopJIp5uZmSSQSpNJp5EJhQd84nU5efe113nz7LWoiy4eBmZ6a4sMPf8c3X39dCk9WfsAyOJ1Oamtr2dbdQ1dnJ3X19Wi6xvzcPMPDw4wMD1Udt12SJCI1EZ597nl+/OM/Lt9dkWg0ytdff83vPnifufl5qgktFA6H2btvH0eOHGXnzp34gwGymSxDg4NcvXKZW7f6SSSS5W9bktraWk4//gRvvvUW9fXV5yTYKMbHxvinf/onLlz4tiohBaNP/H4/Bw4eYN/+gzQ3N+F2u5GQKMoyqXSaqekpRkZGmJycJD4/X9V9XM6e3Xt44803OXHy5D1/32Qyaa5du85HH/6OW/39S87998Ln85khFesbGgkbebBUTSOVSjI/O0silSKZSFIoLE6c/OJLL/Hyy6/Q2dW1oNyKLMv8x//wH/jii8/JZjPVDFMcDidNzU0cOHiAvXv3EQlHSrmHojPcuX2Hu3duE43OVOUBJwFOt4dDhw7y3HPPc+z4cVyu5b0As9ksn3/yKe+//xtmqvROcDgc1NbVcfDQQXbv3kNDfQOqppKIJ+i/dYu7t28zMzNddR86nU56duzglVde5dixY+YinuVIJBL8m3/9v3Ptu++q+k6wIkkSEpKZTF0yFk7U1dbx9DPPcO6rUv6dajr6sZOnePPNt9izd0/5Lpt78Jz0fHnRBvAX8GwVK+CzP4Xzf1VeujxNfw09f1lFjHUL0Z9sYGiBKuvOBlzPAb3KEBDvwafrsGK12vOud705A6eqTEq6mrG3iEe4zwN/XWWugU1gPdu26nYt53ZpRfhqDLw9A6sLN2Ml+97qV6NXVfc11NNKteOpV6reS6Ocqs65TvfNRvEw1eVRnldX8122gHW6H+8ja/J8KBaLDAwMcOvWLRoaGoxVXSU3bquh12qE93q9aEYIJnGMWNUv3iuM9JIR5kgIEEKEsAoSjlV6PSDCI4yNMTAwAEYCRU3TFpzTen1ClBCChxAhrH+t1ynqIcqtIkX5iv1KW7moIT7PWmZtC/Haej3WaxLvs26iLtbPL99v/b+4pqWuw3pOa73L31/pM8RrjPjB84YBx/re8jqVX2P5PlG2lnFSLQ6Hg1AoRF1dHS6Xi1y+QC6bW5URFsNwXCwWyWazJOJxZmZmiEajTE1NMTExweTUBLH5ObLZLLIsVxSZJEkiHA7z8iuv0mbkexB4PG6mp6eYmZlek8GsEk6XixMnHsPtchGvQoQRbRWORGhubjbFkkpMjI9z/fp1xifGy3cti7jXDx06tKyxZmRkhG+/+YbJycnyXfckEAjQ1dlFQ30DziVWouqaxtTkJFevXmVmZqZi/y1FyVBdQ2trKzU1Syd7jsVifPD+b5ibnS3ftSyKqhIMBmlv76Cjc3kBReD1+aivqyMYCpJOpclksihKcRlpZDG6sfI6m80yNzfLzMwM01NTTEyMMzY6xvjYGHNzc+Rypfuq3BAaCAQ5ffo0Bw7c2104GAwSCoaQJIlUKk0mky4/ZEl0XS95TkSjzMxMMzo6yuDgXQbv3mVsbKwqTwQrmqZTW1PLsWPHlhw3VgKBAJFwGB2ddCZdCgW1wnEkyzLzsRhTU1MMDQ2V4s1fu8aN69cZHBxcUZJcyVhs0NLSwsmTp3j66Wdo76guEfZGc3tggOs3rhOdmak6PwzG7514PF5qp8FBbg8M0N/XT39/HwO3bnF7YICRkRFSqRRaFUKrFY/Hw+7du3n6mWc4/thjeFaQK8Pj8VBTU0MwEDS/J/L5wkqivS1AVVWy2SzxeJxoNMr01BSTkxOMjY0yNjZKNBolm82iqotDV4UjEY4cOcLu3XvwLTNXr9bzAeNey2TSzBrffXfu3GHgVj99fX0MDt4lWaWXia7rBMMh9u3bz5NnznDo8OFlRWjBWjwfdF0nl8sxNzfH1OQEQ4ODDNy6RX9fP7cHbhGLlUKYrhRJkvB6vWzfsYOzZ89y9Ojxe3qoCZxOJ8Mjw0xOTq5afIBS7iQr7R0dPP3005w4eZJbt/qZr8IjR5IkAsEAbW2ttHcsnzDbZjEPtOdD4Ax0/AyO/h/Q9MTqVgVm34Or/6/y0vWj52+htpqVmreh98+huqlueaKT1bX/eqzYrNrrYQPqzShM/H8gWMVq9ZWOveV4VPucVaxU3wyyv16/1b5r8nxYowFQ3rm2ts3+FM7/aXnpygn+SRXjeh4m/ue1j+lqx9N6eD5Udc7b6+PhsVE8THV5lOfVNXk+rHHe2SKsSXxIJBLcunWLsbExampqkGXZNJRIkoTb7UbTNMLhMLqu4zQ8B8Rrzcj1IAznYoW6MPALQ7LYLzbxf/He1Ro4CoUCQ0NDDA0NmZ4Buq6bBmvruawGdquh32rwLi+z/t/6vnIDfCVjuXgtDPLi86yG/PLzVfocUW419ovNKjpYP7fSZ5a/tooF5e8Xn2293krXb32f8A5xGuNnfn6e+fl502um/D1W0abStVmPd26y+IAhQNTU1NDQ1IjL5UbTVIpGCItqjAtLoailsEtKBUNQJRwOB3v27OXJJ58kFAqZ5ZIk4fcHyOdyzM7NrjpRZCV8Xh87d+3klVdfRVVURoaHUauouyzLyMUiPiP/iehLyRA3FUUhlUpx88YNbvb2kkgkqzJwY+SjaWpqJmSs8hVG1FJ/KcTjcS5evMilSxfvmVy4HEmSUFWFcChMJBwmEAiUPt8wqOhGuJZYLEZ/fx/Xrl0juYpV8rIs4/V4aW5qwmkJMaZpGoqiMDc3x3dXr/LN199UbfATbR0IBKmrr8dt6YPl8Hq9tLW143a7UDS11JdLCGMrQVNVinKRQqGALBeWFfIkoK2jg1OnTpmJ1ZdDkiRq62oJRSJIDgdyQTbv1ZX2hKZp5PN5UqkkqVTJA2m1dcWor9PhpKWlxfQSFGOzEpIkGYJnPbpWSqSez+dXvIK65E2SLAma4+NMTU2RSCRWNF4kCXw+Px2dHRw//hhPPvkkO3buKD/sviD6ZWZ6hkuXLzJw6xbp1MrFpXKKxSLpVIr5uTlmo1FmZ6PMzc0Rj8fJ5XKr7POSAbm+vp7de3bz5JmzHH/ssQXz9L3wer00NDQQCgXRNB2lKFMoLH+fLIemqhQVmUIhj7yCz2lvb+fo0aN0dnbhXibf0VrEB0GxWCQeizE7O8vc3BzpVAqlys9yuVzU1dWxd+9enjxzlsOHjxAOh8sPq8haxAeBIhdJJpNmHZLJBIpSZR2cTmpqati5axenTz/OyZOnqgpV5HA4yGazjI2OVp0joxIej4fOzi5OnTrN0888Q11dnRHOa3rF32mSJKGpKm6Pl0gkYv4mXG7us/meLSs+xJMLQ6fUvg7BP4We/yf0/I+w+/9behivrSYMQjnvwbn1WJW4FGdg97+ozmCwIeGfLoJUjeEQqG1fmyGq43+u7nzR/x4m1slAXE41BuM1iw+PcJ9TrbFzk9gS4sM6GACL26qbR62sh0eP+/Uqws7UQ2KzhQBbfFjEQ1OXR3xeXYv40NsAifLCB481iQ+zs7MMDAwwOztLMFhadSceElwuFz6fD8kS+9VpxONXFAWXJZSSMDh7jCTDVuO1MBxb/wpjs2RJ8rwa8vk8AwMDzMzMmIYxce3iPNbziesUBnBRh/JjnYYB3GHxmLCWlR8n6mE9l/WzHYaHh/W6yttPvEccI/aJ/5e/1/oed5mQIK7L+pnW94v3inM7LXkWKn2eeG291vLzi/97PB40TWNmZoZYLGa2jzhHpc8V1yDO67a0vfjstYyTtRAKhmhra6O2tha3y0VRUcjl8+hGmILNwul08vwLz7Nr9x68FWKwh4IhikWF2HyMdLo6A3g5kiQR8AfYvn07L730MgcPHSaTzTI2Pk46tfLwLcIwPx+LUSgUcDidZr4YWS4wNjbGzd5erl65zNjYKMoK8z1YKRQKxBMJNFXD6XDgM0J5zc/PMTIywuXLl7l44QKT4+MlK2uV5LI58oU8iqoiGYKs8OLIZrNMT03R19vLlctXGB4eqtqIBpBOpYzV+hIOI9Sd0+UimUwyMjzMtWvf8dmnnxKLrU5YkmWZbKYUykvXNPxGGLR7GYNcLhfbtnVTW1uDy+lEVRQKhcIqDbQrR5Ikjh47xpGjR83cJvdCkiRqa2ppamoiFAqh6Xop3r2ioBltdq/6rjeFQp5UMonHU7pfXS4XbkMgq4QkSUQMTyGfz4eqqeQLBYrLJKqvxEqPFN+V4XCYnbt28sQTT/LEE4/T2dW15DVuJrquk06nGR4e5uLFC1y+fLmUD2CDx9+9EN/3pe9oD3V1dXT3dHPo0GGeevqZe3piLYXb7aapuYWGxga8Xq9xv8kVPYPWm127dnPkyBFaWluX7fv1EB9Wi2T8NvX7/XR2dHDk+HGeeuppDh8+dM+cPFbWQ3xYLeK3kNvtprW1jYOHDnHm7FmOnzixYo8HK36fn6nJCWZmZlbdH5IkEQoF2bF9J0+cOcuZs2dpampCVVWGhgaZmpqq6rPz+UJJwM3lyOVzBPx+/P4ADuf9+Q33ILElxQf3E6UHbevW9HbJuyG4G9xVPPgvRXajhQcg8P+GnpUafigZfwb+2/VdqSmIF6rrA3ZDdrWGvGoNRRuwQtVKNQbjtYoPj2yfG1Rl7Nwk7rv4sA7CA1Q/jwrWQ3gA4FR1fbvpQsD9OOc63DMbycNSl0d9Xl2t+DB8du05lLYIaxIfotEog4ODJJNJHEZMfWEgFpuu6/h8PnMFpssSkshqPBevhfdEpU0YO8TxjjWuZs9kMvT19ZFOp5FlGd3IwSCuzXpuq5HbWofyayzfrNdrfa/4v3ggxvJwLOpl/X/5e8rfX369YrPWR1xLeV3Ky0VZpf9bN9HH1uOs4oDLElaqvFz0uxAKrOfJZrMMDw8zPz9PMBg0P996nNMQI0S9rJ8v9lnPJ9rvfuB2u2lsaqK9vYOGxkZC4RCSVHrILloSQm8kwWCQN958i5bW1ort4PP7iUQieLxeMpkM8/PzVXsRSMaq/qbmZg4fPsIzzz7LgUMlw46qKESjUcbGxhaM7XttmqYRi80zODhINpOlqbmZpqYmZmZmePedX/PtN+cZHh5GlguL3ruSDSARjzM6PEwqlaShvoGGxkYuX7rIhx99xIXz55menl50T650A4jHY4yNjjE3O4vH66WzqwuHw8HoyChffPkFn332KcNDQwvE22q3eDzO6OgIqVSa+vp6PF4vA7du8fFHH/HtN9+YSVjL37eSTdd1kskE4+NjjI2O0NjcRH19A+5lVjgLJEmirq6O9vZ2mpqbCYZCOB0OCrKMXCj12UbwzNPPsP/AgRVdo0CSJAKBAK2trbS0NFNf30CkpgafrxQ2UFFVNENE2oxNURRm5+YYHR0lk0kTDIWpra3FeY8wTH6/n5aWFpqbm4lEanA7nchFmVwuh7QO7S1JEug6tbU17Ni1i8dOPMaZM2c5eOgwdVsox4OqqoyNjfHF55/xxWeflRIyr/IeWK/N5XIRCkeob6hj27Zu9u3bx/Hjxzl58hTHT5ygvb0dzwpCLS2Fw+EgEonQ2tZGc3Mz4UgEl8tFwfCEkTagb9xuN4ePHGb/wYP39B5Yq/ggSctltlmMaHeH00l9XSk3y6HDh3n8iSd5/Ikn6OjorGqOYB3EB3M8lO+ogARI0vfvidTU0NHVxYH9B3j8TKkO27fvMEObVoNkzHdOl5NYbJ7ZaPXBlZ0OBx0dnRw7eoynnn6aI0ePUFtba15vIp5gdGSEdCoFFe6HShvoZLNZRkdHGBy8S2NTMy2trWu6Lx4VtqT4sNFEf7KxoZYEW2n1PxerCz8EwOTqjLbVGoqy/x6G12DwvxfVGIzXKj48qn0uqMrYuUncb/Fh3VYee1eRdPo9OLeGUEtWqu3bTRcC1umc1XqYND2+DivbN4iHpS6P+ry6GvEh+1PorSKp/RZnTQmnb9y4wWeffcbs7CyBQMA08gqjssfjQTVihgvDvs/nW2Ao9hoJnCVjxS6WZNPiGKuBW7yWjBVg1T5wWZmdneWXv/wlyWSSubk5isUiLovB3Ov1mue3XpPX68VtEVhEHcS1WVfoi2OFQdxqZL+XEWk5JMMoWA3W48vfLwyTVnRLImjrPuEhYqX8Wso/u/zc1tXP5a9HRkb46quvGB0dpbGx0VypLxkii8fIHRIIBMx+EWU+n89MMi0STlvHzP1E0zSy2SyxWIyhoUHGxsaZnppifm6WeDxOMpFEUasTI3S9FHHZ4/GUwhO53caqdAeqqpDJZJBlma6ubfzX/81/Q1PT0tl1NE1jbnaWvv4+rl65ytj4KLPRWfL3MFrquk4kEqa+voG2tnZ6tm9n166ddHZtM1fwplIpLl+6xLlzX1KoMr60pmlomk5XVydPP/Ms+w8cYHx8nH/6xc+Zm5sv5RNY5vruha6Dpql0dHRy9qmn2H/gAF988TmXL14qJQsvSwxfLZqmoWs69Q0NHD1+nLNnz+J2u7lz+zbffP21mXNmDVUwPMtctLa1cfbsWdra2+nv6+PihQtEo1HTgLVaxPzgcrl45dXXOGiISitF10sGpfn5ecbHxxgdHWVmeprZ2Vli8/MkkkmKslzVNZbmFB2324NLeNBpGk6Xm5/883/OkaNHy9+yYorFIplMhlgsRnRmhuhslGQiQTqdJp/LI8syiqIYq8q1DVtdruslr6XOrk5OnjzN3n17V2yEk2WZRDzOxMQ4w8NDjI9PMDs7RzwWI5EohQla6bjWdR2vz0ckHKG2toam5mY6Ojro2raN9vZ2amvrVhQvfzNRFIWRkRG+/uocA/230HRtxfVdK+L3idPlwulw4HK58Xi9hIJBQkZS54aGBhoaGqmprSHg9+Nd5/bL5XIkEgnGx8cZGRlmYmKC+bk55ufnS0mj5cKKDODfo6Np4HI58Xi9SJIDhyRRUxPhlVdf4/Tp04Tvsfp+tQmnAwE/bW1thMIRcrkshYJMIZ9H1VQURS39htA1HA4XbrEwwlP6LgyGQtTU1tLY0EBLaxttbW3U19dXFdbKymoTTns8Hjq7uggGg8hyobT4oFCaRxRVQdM1NFXF4XDi9rhxu9w43W78Xh/BUJBwJEJjQyMtra20t7cbYbZCax7T2WyWa999x4UL57lz9w6z0dllvYN0Xae2ro6mxkba2zvYsWMH23fsoLWtbcF3gq7rDA0O8smnn3B7YACPy11SU1aArutomo7D6eCll17i+InHVuUN9KixJRNObxi3offPIHqufMcGsIoEkeuRLHU5mt6FA6+Xly7NaldMV5sYd/gsDG1gn1STJHS1dYZHu88FVSW43STWM+lsNWOJ9R7b1Y6v9fK4MKi2b9djbN+Pc1bdzutw32wYD0NdVlGHdRkHy7DZ82rVbbDO9/4WYE3iw+XLl/nss89Ip9MEAgECgQC6xXtAIAzDTmO1vRAjhFFfiAjCiGw15AvjvzDgi/L1WMkejUb5xS9+QbFYZGpqClmWzXMJEUEIDkJksJYLQcHn85nXVr5PfJ71+h2W0FJbjXJR4l6I/q70HiFSiH3lx5a/R9NKRryrV69y4cIFZmZmqKmpKYUsMlYn6kZODtHuPiMfgBhjVtFBiBEew0NiK7V3Op0mkUgwPz/PzPQU0ZkZYvMxEqnkAuOmyOmgayXDmcPhxOF04HG7cbtL9fYH/Pj8fgJGvX0+Pw6HA1VRSKaSFAoF2ts7eO7551dkME4mk4yPjTE4NMj42Dhzc7NkMxkUVUUVnhqShMvpxOfz4fcHaGpqpLW1jbb2dsMYWYvTMgdomsbs7CxDg4Nks9XPoLqmEQwF6e7poaWllUQ8zrXvviutnjVXTK4eTVUJBIOmMfXOndtMTU6VDOLrMG50TcPt8dDS2sr27dtxOp1Eo1FGR0aIzc/jqnL1bTm6IQ74/X66e3oIh8NEZ2aYGB+nUCisTx2MJNB79u6lta0NzwqN4OVkszmSybgx9meYmZlhbn6OhBFeq1gsUlQUNFU1jJOlHEEOhxOXyzDoOp24XW58Pi8eb2lzOhzouobfH+DFl16mubm5/NSrIpfLkc1mKeTzFAp58gWZfC6HLJdC2oh5q3w+Ww8k494JBIN0dnXR0tKy4Lt1JciyTDKRYHZujmg0SnRmhvm5ORLJBLlsFrlYRFUUVE1DN/IeOV0uJCScrtL3mN/vJ1JTQ31dPU3NTbS2tFJXX08kEtlyooNA07SSR9DICLFYzLxHNgMhPrg9blxOJx6PF6/Ph9/4PvJ6ffgDflNY30jy+TyJRJxYLMbMzAzR6Rnm5udJJhNkM1mKRdm83zRNQzdWtAvhxOly4TKElNJ3aul7xuF0ICERCYc5cvQo27q77zknrFZ8aG5u4skzZ9mzZy+JRJxMJkshX0BRS3OFqqqlOdblwe3+/vdaKBQiHIkQjkQIBoOEw2Ez7N1qWY34IEkS4XCY555/gZ6ebmRZJpPJUMgXSvOIpppipsu45zweL26Pl4DfT01tDZFwqQ6hcHjdDfGZTIahwUFu3epnbGyMRDxeyhljtKtDchhzgZdITQ1NTY20t7fT0dlFc1MTkZqair+vMpkMd+/eZWZmGqejusU2uq6DrrN95w7a2zvuObZsHiHxYT0NkCui2jpvhrFgk66pWgPtRhuKqrmeNRmJNql9q2KTr6laY/FmsJ73/qaNpUpUaYBcV+FjFX27Hvf1/TgnVfazIPse3Hhj9ffORvHA12WT57AVsdnXVOW9v55z3hZhTeLDt99+y6effkoul8Pv95vu1kJM0DQNj+H9EIlEcDqd6LpeiqmtaXiNBNPCuO9wOMykrMJgb31tFSPEOdbC7Ows7733Hvl8nnHDSCceWoVA4LGID0JMEIZuISaI18IgLq7VUyZCuMrCGK31+rc6yxl7rPvEa13XkWWZjz/+mFu3bpHNZpGMsC3hcNg8xmHxfqj0t2QQLxlISg/xpX6o9HB8v9GNFeHZTIZCoUAulyOVSpFKpcnmSmWKopRyEjhL9fZ4vARDISKGIcXtLhlcXC6XuQLcYdx/siyjqAo+n5+amhqcVXjbJJOl5LmZdJpUOkU6naZYKK1OlxwSPr+fcDhMKBjCFwgQDoUI+P04ljiHrusUDUPnapAsYdp0TSNfKLBi69UKkCQJtzFWikUZVVlfg7IkSTiNuQQjBEmpb5dP5rpSJEMUEnOpqpaSnK9nGwFmGy11b68UXYd8PkcmkyGXy1HI50mn02QyaXK5HMViEUXVAB2v24PHEBeF6Oj1enE4DUHC6QQcoGu43C7q6uqrNtJXg1VwKHm2LL1SeD2QLGHz1tLuuVyOXD5PPpcrCSnZHOlMlnw+V0rkrahouo7X68HhcOL3+wmFQ/h8JUO5z+cjEAiaoai2OqqqlrZVzjmrRdyLDoejZMB3Otfm2rRO5A0hLZ/Pky/kSaczZNJpstmsaQRXVRWvp3S/+Xw+fF4/Xp8Xj9uNy+0yxAgXDqM+brebYDCIdwV5YFYrPnR2dvEHf/iHnDp9mrwxN6jGPajpGromfkeUPIWEaOJ2u/F5veva9qsVH+rr6/ln/9mfcPTYcSSJ0v2mqqiqho6OpmroOkgOcDq+F1tLvyW9ODc454GqqqSSSeLxOKl0mlQqST6XQzW8MQIBP+FwhFA4TCAYIBQMEggsL4KI73xFUVbq9LCI9fq+eRR46MWH6E9g6G/W8NC/Sqo1mq27obISVRowWI0xr9q+fg8+3eDcG9UY39bSD49sn1uotg02g/U0xG3WWKpIlX1piw+rp9rzmtyG4X9V+s7ZKjzodan2+tf9vqtElfciax2bVZ5vve/9LcCaxIdvvvmGzz77DFmWAaivL8Xwcjqd5ip0n89HJpMhFArhcrlQjTBMqqriMVakC6MxRmx63ZI7QogAwmBv3db6MDI7O8u7775LPp8nGo2STqdxGKGhhNFaGDuFyCCuxefzLRAlrK/dlnBMolxcszCEV2MEfhgQRtx79Vkmk+HnP/8509PT+Hw+Mw5+XV0dwWAQh8NhJiwXCRbFWHMbIYe+N5IFzL5Yj/GyUVgN3Lqumysgvw/rUgpbJS2RmHylVFt/cV26rpW8MJTSKkiBw7gvrGN5JedYrUG//LNX+zlLsdGfT4VzsM7nKf/89fxsQfk51kL52DcFGU1F00qGfYzvFIcRu10YopabQ9fzGlfCRrSzlfWqT/l1qsZqd8VIJq4bx4i5xmXJt2Nlva5nsyiv92awFduo0v0mNs3wetG0ktBdus9Kfx33yLG1VHk5qxUfurZt4w/+8A85efJUVX250uuqhrWID//Zn/wpj508idNYiLNSNqIeldCN3xq6sRBE00q/PyRKc+9qvu9Z4/230nPYPCLiw3oZHquh2rAMm3Wd1RhPWYURYysaiqqp81qu51HtcyvV9v9miE/rSTVtuZaxVJH7bICstm/XZGw1uB/nhOrbehFbxHAPD35d7Hm1+j5c07m2JmtaSqVpGpoRDkZQMhyVVqTljFVTYhW6OE4YlDCMSsKYhJEwsfxhQxhCrNt6IAy5iqJQLBbN6xKfLx7CrNdzr9fSgsR53yPOVWnfo8BK6q3rOslkkvn5ebLZLC6Xi2AwiNvtJp/Pm4JVIBDA6XSiqqr5MCyV5QAR/Xavc24FrGPGYXh1+P1+QqGQGXaqrq6O2tpaIpEIoVDI8HgoeQatdKuW76+pFG4hEAgQDIXMze/3m6JONecov66VbuWU71/rVk75/vXYKlF+zFq2csr3r8e2nlg/12EIzX6/n2AwRCgUIhKJmGM+EAwu8Cwrv66NusaVUH7+9d7Wi/LPFYK4uLdDlk3k1LF+b6339WwW5de/GdtWxHp94n7z+XylcD6hEOFwmJqaGkKhMIFAEL/fby6uEL/NKm0biWT8I85Tfu7ltq2GJJWStYvXK902C8mywOH7eTi8pu97qqxr+WZjY9L0s+oMBOtFcHd5yfJkr5eXbAzZ2+UlyxM4VF6yPME95SXLk+ktL3lweVT73MbmoeMc3PhpeWEV7ILun8GzOhz465UbjTeEB7wu9rxqs1bxQazMLhcDhChRLBbN1XWaEf9frES3Go0li7ggVt8J4/FSq1vX46HE4XDg9/uNFV7fiyhi9Z8QI8R1WB++BeWvyx+alvq/zWJ0XWdyctJciSnLMh6Px4xvLGKsC4OJaMtyAWup9n7Q2t06dsrHkY3Nw4495u8Pdns/mmzl75mtdj2rRiqF47KxsVklBwY232ASqCLh8maSGSgvWZ7ggfKS5dmqhqLN4FHtcxubh5HsX8FwlQbmSjT9JZzS4dS70HSmfO/m8CDXxZ5XbdYqPgihwCoQCPdq3YjNL0kS+Xwpga4oc1tCGImHSvFXiBTWcvE5Vtbixi1wOp2EQiFTfBCIUDfliOsqF1uweEsIrMdW2mezGFVVmZycxGnkyZCNpMvCE0DTNAqFApqRL8Ttdi8QqSoZTUSZVGUibRsbGxsbG5v7TykfwoP//a1pKvDg18PGZsVkfwqfSktvVRtRdsHBvy4v3EDOwPKpTRaT2aQQCZlb5SU264Ld5zY2Dx1Du9cpjBMQeB0OfAnPDmye4d7KA1kXe161KbHYil4FwjvAavAVXgtYjOzir6Io5PN5M5GwCPkgDMPir4gzbX1/uYG53Mi8GpxOp5lXQJxfUF4HsRpfvM96DdaHYqvoYkWyiCgPw0P0RpDP55mdncXlcpkJprPZLMVikUAgYAoQsizjMHJzuFwuc8yJcSMQ5eV9YWNjY2NjY7P10QGlqKAUNzdp+HqjaRpFWcYIJGVjYwMw9GfVJ5AO/CX0bKSR5CElUGUYpWpXqW6Wochm5VTb5zY2DzO9ZyFareC9HLs2yXBfgYepLg8a9ry6JtZNfLAa44VQYEUYgYXxXYTVsRqNrZs41lmWmG89jfci7FKxWKwoDEiShGbkr7BiDcckPBusBu7yz7C5N7Isc+fOHSYnJ02xIRQK4XA4zKTTIhG4pmnk83kAMxY1RluLJMyiL61j0sbGxsbGxubBoijLaGW/w+4nYmFDtYjfvDY2NoJVxrDu/rebH35pRdyGTHmZzcON3ec2Ng8G56B39yo87u6FYbg/9e4mfi89THWphD2vPqysWXwoX1luDV9kNQqLv6JMhDbSjNwQiqKYwoM1VFElQ/56GZKdTieBQOnO8ng8OBwO86FSXJv1IdMqRpQLEJJFgBGb9X3W1zaLSSaTfPfdd7hcLlRVpVgsLsr3IEkSfr8fr9eLqqrmmBEChOgvIUCIMcQ6hemysbGxsbGxWR1iwQpUF31ILsoUla3h+aBpGqquolX5m0JVVQqFgv1bxMamnFXFsN7s8EtbkOxDlODZZmXYfW5js3aGdsP5n1bvdXcvAq+X8ij0/EX5no3jYarL/cKeVzeVNYkPTqfTTBwtjPXCQF9OufHdaqAXxnzxOeXeBMLAL/atlwHfYXg+OBwOPB4PLper/BATqwhh/Wt9kBTCSbkIITabyhSLRSYnJxkbGzPbsFgsoqoqXq8Xn8+HrusoioLDCLfkdrtNAcvlcuF2uxeMEfE52MKDjY2NjY3NfUdVFRRVqdpwXygUKCrF8uL7gqaqqIqKpi/+nbscmqaRzebs3yM2NpVYbfilA4+AYeS+sIr43DY2NjYPCtm/gvNnYfi98j1rp/tncGoTxfGHqS42Dz1rEh/cbjeBQKDiCvOlHrCEEb5cRBBChKIo5gp2cZwIwySMy+uFw+EgGAzidrtN8cFal0qCgTi/2GfNBWEtF69FvWxD+NLMz89z584ddF1HlmXcbjculwtFUVBVFb/fj8fjQTcELiFAOAxvBwzhR4TvEu1tHWs2NjY2NjY2949iUUFRFHRdr8bxAVmWyWaqtUxuDIqilPKEVREGSjcW2STicfs3oI1NRVYZfqnpZ9BUXviIEDhQXmLzsGP3uY3NOnIOht6ATzfAcB/4y1Look3jYarLJmPPq5vKmqyyIra+JEkEg0EzdJHAYQmfVMkbQogMwkisl4U8sr5nIzwIJEkiFAoRiUTwer0Lkl8L47W4HizXKxDXJ47TjJBM1uu0ChDitW0M/x5d15mammJoaMhMIC08HLxeL4qiIMuy6QGB0e5OI1m4tW2tCaeFF856C1Y2NjY2NjY21aHrOvl8HrlYfd4DSZJIJOJkMvc/AGxBlsnn84tygd0LWZaZnJhAluXyXTY2Nqw2/BJwYCsZRXZtXY+B7K3yEpt1we5zG5sHG2G4l6B3HUMYBV6/D14DD0td7Hn1YWVNVnBh6LU+iAlvCJ/PZwoI4kGzkvFdCBSi3GrILxcjrJ+zXrjdblpaWnA4HGYdxF9xbusqeiE4WIUR6zWKfeK1eL9ViBHlNjA7O8vExAS5XI58Po/b7cbtdpv7vV6vKeq4XC5T4HI4HKbHimh/IUCIdi5vcxsbGxsbG5v7w/z8PPH5GOoq8jcMDw3T39dXXrzpJJNJ5ubnyebz5buWRdM0ZqIz9PX1Lfj9aGNjY2E14Zd4fQPDL517RJNePqr15hGvu43NI070r+C8BOd/AtlViOHl3M/wgFuqLva8alNiTZZZsVI9nU5TKBTMGPxCSBDhc0QoHGGIFwiDfiVDvBAqlnu9HjidTrq7uykWi+Tz+QVCg6gPlmsV119+7aJ+ArHy3nqtom3EXxsYHx9nYmLCFBZUVTVDKGG0txAgFEVBkiScTieaEX7JaSQpt7a/6MPy9rexsbGxsbHZPFRVJZPJcOvWLS5fvkw0Gq1afNB1nYmJcb7+6iuuXLlCdGaGXC63aUZ8XdPIZrOMjIxw/do1xsZGUVZRh1Q6zbkvvuD8+fNMTU2RzWQ2rQ42Ng8GD0H4peCZ8pKNIbinvGR5MhucVHOz6r0V2ay6b7U+t7F5WMn+DZzfXcqlEF2j4b7pX0CgvHATeVDrYs+rDyVrEh/8fj8+n498Po8kSahG4mgRq1+yhMKxJmMWVBIdKAuxVH58uZF/rTgcDrZt22Y+AHq9XhwOh1kHq7hQLihYr8MqKFivs/xaK5U9qiSTSSYmJpibm8PhcBAKhcz2EeNG0zQzqbnoDyEA6bqO00h67jDCK4n9VpHL9n6wsbGxsbHZfFLJJNeufcfvfvdbvv3ma+bn56vK9yBIJZNcuXKZX//TP/Hpp59wq6+PZDK54b+ndF0nk81yq6+P3/32A7766kumJidxrGJdg1wocPXKZd799a/57QcfcO3aNWKxWPlhNjaPNlst/NJ6rBjdCIK7y0ts1gu7z21sbACy56B3dymXwqoN97ugZ7UeA+vI/a6LPa/arJf4oKoqbre7lITPMAALT4JCoYCmafj9fvx+/yJDsG7JhbDRD5GVkCSJpqYmamtrCYVC+P1+AAqFgrmyTTeSBaqqSrFYXGD8FtdsvXbxWjNCRYm/SwkXjyqjo6PE43Ew2lvXderq6swwS0JUKBaLeDwe0wNC1/VFXhJC3NIN8aE8ebiNjY2NjY3N5qHrOhMTE3zz1Vd8fe4csfn5RYtLVrohSeRyOQZuD/D+b37DJx9/zMT4+IZ7Dmiaxvz8POfOnePrr75iemra+P22+BpXshUVhaGhu3zw/vv85r33uHv3bvkpbWxshv5VeckK2KCY1JmB8pLlCRwqL9kYArvKS5Yne728ZHmqNRRtVr03g0e1z21sbJbAMNyf/8kqQgMCTT8sL7mP3Ke62POqDSB9/PHHq7aCz83N8fnnn/PVV1/R3t5OsVjE7Xab3gOSJFFbW4ssy0QiETNev9/vX7Sq3e124/f7UVWVQCBgekt4PB5zv9XQvN58/PHH9Pb2Mj8/T96I5RsIBPB6veZ5/X4/gUDAvCafz4ff7zdzFPh8PtNILkJOeTwePB4PPp/PrIdAekRDAum6zszMDBcuXGB8fNwUebLZLLW1tXi9XlNECAaDprAQCARwu91IkoTX6zXHkUgWLvrJ5XLh8/nMMfOotrONjY2Njc39ZHx8nOvXrzE0NIzL6VyV10M5EtDZ2cnhI0dobW3d0IUGmqYRj8W4dOkSY2Njpd8ra/hNIQE6oKkqTU1NHD12jB07dpQfZmNTNc9Jz5cXbQB/Ac/+rLxwabI/hfN/VV66MprehQOvl5fem+GzMHSuvHT1BP4aTv1leekyvAefvlFeuM6cgVNfVhf+oleCaHnhMlTb/mvp65VyQF95eK21XM+j2udWtmQbrCObNZYqUmVf3u85bS3jSHA/zrlhVNl/gi1Zp02sS7VjYFPmlFXUfzV1N6nyfOt9728B1iQ+5HI5vvzySz744AO6urpIp9OmN4RYfR4Khcjn89TW1uJyudB1nWAwaAoR1gTCfr/f9JIQBmdh/LeKD0LYWE8GBgb45JNPGBoaMlfVezwe05jt9XpN4UEYukVdhdAgXns8HtxG4mQhRgghwuVymSvgHlXS6TSXLl3i5s2b5HI5fD4fXq8XWZaRJMkUGTASggsxS4g4bsMjQgg/VpFH7LMeZ2NjY2NjY7P55HI5UqkUuVwOaR2+jyVjAYPP7ycSDuP1ejf095RuePImEglyuXxJOljj+SRD1PB6vYTDYYLBYPkhNjZV89CJD1RpIDS5XYpvvZoVnRWpss7rfv4KbIYRp1rxYTXnqJZqxsOaxt4j2udWNvt8m82mjaVK3GcDZLV9uyZjq8H9OOeGUu0csQH9uG5sVl2qPc9DOK/e73t/C7CmJ0Gfz0cgEDBDCKmqCpaQQk6n0wzFhPGwJcsyiqKgKIrpLi8ZCaqthmIRpsgankg8YG7Eg2ZjYyPhcNg0cDuMcD9iVb4kSWhGPgtrokERjglLvStds7VuG3H9DwqFQoGxsTHu3LlDMplcMBZCoRButxvdyOUgjAqSJC3wGBGCEEa7Wj1hxDh6lNvYxsbGxsZmK+D3+2lubqa7u5ttXV1r3rq6uti2bRvNTU34fL4N/66XJAmPx0NTUxPbtpXOXX5N1W5dXV10d3fT2tpqCw82NsvR+5PykhWwCw6uZ/ilv6nSCLYLmjc4UWa1CTKzt8pL7k30F+Ul9+D1lRtztzyPaJ/b2NiskL+B3vfKC5dns8IIVc1m1cWeV23WKD5IkmTmcbAKDrqRC8HpdCLLMljyIwjjsEjoXCwWTeO91XAsjPVWQz7GOcvL1oNQKERzc/MCDw2RXwBDOBFihBBGxH7dyAkhchWUJ6oWnyXYiOt/EFBVlWg0Sl9fH3Nzc+i6booKQoAIh8NmmRAgxGuPxwNGXwiPGbHPGl7J9i6xsbGxsbGxsbGxeZBZhVEEIPCX0LOORotq8x80/bi8ZH1pqsYjAYj+XXnJCrhe/YrT4Dq2+SLOwGZqtY9kn9vY2KyYagXa4IHykq3DZtXFnlcfedYkPgB4vV68Xi/FYtEUHsq9A8QqdWG0xzAgCyFBCBGyLJvGemE8LveIoMyLYL1wOp20tbXR1NSEoihm2CSHw2GKClZUVUVRFIrFoiksiDKraFEuQuiGAPMoEo/HGRgYYGBgwGxj4bngNHKA5PN5s+0lScJp5NbA6HeRT0PTNFxG/g/RpkJ0EMfa4oONjY2NjY2NjY3NA0r0jSpXSxp0/9uVhza4FzPvlJcsT+DN9Tt3OYG/rtLD4DbMrCZswznIlJfdgw0zFFUZqmI9eCT73MbGZuVUu5J/K7NJdbHn1UeeNVvBfT4fdXV1OIyY/FaPACyr1IWXgxAcrOKDEBmE94DYT5mngxAkxP/XE4fDQVNTE+3t7YRCITO/g2aEWrJegyizejhYjxPXqBseEcI4vpHXv9UpFArcvXuXmzdvoqoqbiOHh3UTQoQYD24jZ4bL5TLFCCEyiPZ0GOKU9f+26GBjY2NjY2NjY2PzELDa8Eun3i0vXB3Zv6rSMLMLev6ivHB96KkmPjWQfad6DwZBtEqvk8BfVmnMWQn3QXjgEe5zGxsbm43CnlcfedYsPoh4vsVi0VyxLhL/CjHBYQmzZDW+CwO9QBjqhfggBAhB+fHrTU1NDW1tbTQ2Npr1wAgJJLwahGcDlusRoZaEd0S58CAEFevrR81APjw8zK1bt4jFYqaAg5FQWggL5SKDECOsCaUdhtdIuXiBISAJbwhxnI2NjY2NjY2NjY3Ng8oqwy/xOhxYJ8NFtYb4pn+x/gbzqldqrjFMRLWhOAB61jPfxn0SHgSPYp/b2NiskCpDwWV6y0u2EJtYF3tefaRZs4U2FArR1tZGoVAwjb4iFJNAkqQFHgBYwuJYBQdFUcz9QmSwGuw3GrfbTWNjI+3t7abR22HksygWi2bOB6snhNULQggKwstDGNi1CrkgHiWSySR9fX2MjY3hcDgoFArkcjkzGblkhFcSYZOEgCAQooLX6zX7xGF4RmCML1GOEULLxsbGxsbGxsbGxuYhYLXhl5p+Vr2RoRLR/6nKVY/rnfj6DByscqUm78HQWsJErCIUx3rl2wj8xf0VHnhU+9zGxmZlHKpufspeLy/ZQmxiXex59ZFmzeJDIBCgra3NNLin02lkWTYNxKFQyMz5IMpE+CXhKWBFGPut4ZeEOCFtQhLhSCRCR0cHDQ0NpoCgWxJKY3hCyLK8wAtCGL6FOGEVVUTbWMseFRFCVVWuX7/OxMQExWIRWZbJ5XKmAJHL5cAI36Ua4ZhEP1tzheiGcOV2u81ycYwQK4T4tdFjxMbGxsbGxsbGxsZmE1lV+CXgwHqEXzoHQ1Wu2Az85fp5XhxYhSF++H8qL6meoZ+Wl9ybtebbaHoXTv1sbZ+xLjyifW5jY3Nvev5FecnyZLaw8XpT62LPq48yaxYfnE4nkUiEuro6stkssiyjqqppXBYr3X0+H+FwGABZls2wSsLQLIzxkiQt8CywGurFezbScC+8Hzo7O4lEItTW1poJtWVZplAomEKEdROCA0YdHJZE1dZyyhJvP8wUCgXOnTtHb2+vGZYrn8+b9dc0jUKhQCaToVAoEAiUZgKroFApjJLD8K4Rr63hl8Rx1uNtbGxsbGxsbGyWZiN/W9vYrA/3OfzSarwvmn629nP3DFTvvZH96fqs1Mz+XZWrVDHybQxUb+AJ/AUcGIADr5fvuX88in1uY/Mw0DMAz+ql7dS70LQOHlmCwF9D967y0mV4r/p5xMrDVBfsefVRZl0stML7oVgsmmXWlf7ZbHaBAd7pdOL1ehd4MggPAqvYYDXQb+ZDUTAYpLu7m/r6etOo7Xa7TZFBURRTjLCGYrIKI+K1tVy3eFBsZn3uB6lUisuXL3Pz5k3m5uZMYUo3PBiEwIDhLWL1grCKDpVEBfF/kffBYUk6LTwfHvb2tXkwUIoKiXic8fFxBgZucfXKFa59d3XBXLmVUVWVyclJLl26yNdff0XfzZvk8/nyw2xsHlmiMzNcvnSJr86do/fGDWLxWPkhWxpFUUglk0xOTDBwqzRH9d64QSaTKT/U5iEhn8sxNzfHyPAwvTducPHiRe7evftILIqxeQhYjdGCdQy/tBrvi6afwanVhI04UzLGV2UYArgNN/6qvHCVnIMbq/B+YBec0ldmLBKiw6mfQVO1dd0EHrk+XyWBM/dvs7FZjsDrpRXvzw7Agb+uXhi1EvhrOFVl2J71XDn/sNTFnlcfSaSPP/54zVbaXC7HlStX+Oijj8zEwLquEwwG8Xq95PN5IpEIgUAASZLweDyEQiEURTHj+GOsePf7/ei6buaNcDgceDweXEYyYmG03uiHpGKxyKVLl7h27RqJRMIMtWRNqO31evH5fOYm/i+u3ev14vF4zL/ivaLOG12H+4Gu6ySTSW7dusX58+dJJpOmWCPCWFnbQvSnGDe1tbUEAgECgYDZTkKIcFsSmgsBS+wXmxAftgK6kSskl81SVJTy3VWh6zqykVclHIkQDFaTFchms1BVhXg8QTQ6gyzLJBNJEok4sVic2Pw8qXSSUCjEf/lf/cWW78OiXGRw8A6XL1+mr+8muXye5sZmTj/+OIcOH6G2tqb8LTarRFUVMpksxaKMpi3tGSfEW7fbTTAYxGnnt7lvKIrC1NQU33z9Nb29N0glUzQ1N3H02DFOnHiMhoaGJfvxfqIoColEgrm5OXK5HKlkkmQyQSwWY25unnQySVNzM2++9RbtHR3lb3+o0TSNXC5nemguh7gXa2tr13wfit8KyWQCTSv9dl6v7wdd15FlmenpadLpNLlslkQiQSweIxGPE4vFyKTTHD12nN/74Q/L327zAPGc9Hx50QbwF/Dsz8oLlyb7Uzi/EQ/uVV6HyW04v3sVK/nLaHp3lavzb8Pwv4KhvynfUcYZ6PkfoHs15wCGz67/Ss0D+trEm+x7pQTWM0as8OCPoenNjRMb1nvsPWp9vhqj5P2k2vpXM57XeyxVm0i92rrdi2r7tldaneBr5X6cs+dexubbEH0Hhv4Ositp39Xeo+/Bp2+UF1bHw1QXK4/avHq/7/0twLqID6qqMjY2xs9//nNzdbvb7aampoZCoYDb7aa2thbJyPMQiUTMVevBYBCXy2W+R4TTEcZoh8OBz+dbsBre7XZveFgdXdeJx+N8++23DA4OmqGBrMKIEBLEa/F/n8+H3+/H6/Waf51O5yIhYq0PrFuReDzOd999x7Vr18hkMmZuDOEBIsQnq5AgRCXRz4FAgFAoRDAYxOfzmcda+9/n86HrOn6/39wnGeGutgq6rjM9Pc3169eYjUZN75/VoChF5mbnqK2t49Tp0xw+cqT8EJstQDKZ5IsvPufXv/oViUQCq+mxZIeU2Nbdw7/87/47IpGIZe/WQtd1xkZH+dUvf8n5C9+iKCUvNoBgKMw/+2f/jGefe678bTarQNd10ukUV65cYXJ8HFmWkZaYx4R429HRybHjxwkGg1vSwP0oMDU1xW/ee5dPP/nE9GSSgIbGRp5+9jneeOMN/H5/+dvuO/F4nHPnzvHB++8xG50Fw8vUamzft28ff/pnf053d7flnQ8/hUKBG9evMzh4l3w+Z/RoZXRdJxQK8dzzL1BTU1P1fajrOoqqIhcK5HM5w8PsAiBx/MRjHD58uPwtq0LTNKYmJ/m7v/s7rly5jGLML6K/JUnC6XDw0ssv8yf/+Z+Vv93mAeLREh/WYLRYr2u6pzHoHghjfOY6ZIDgIQgeKBnkA2v43OhPoPdeBpnVUGXf32/Wq5+tPEp9Xq2x+H5TrZHOFh/KS5dmPYSA+3HOau/X7G3IDED2F6X7M7NOQqldl+Wptm7lPEjz6v2+97cA6yI+6LrO7Ows7777LhMTE0iSRCAQwO12I8syjY2NOIyHHY/h9aCqquklIISFcDhsGpDFqnir+CCO2wzxQXDr1i16e3uZnZ1F0zTi8TiKoizwcLCKDuWeD9bN5/OZIoVYqV/tA+tWRdd15ufnuXbtGv39/cTj8QWht4QoJfpStINVWBBihNj8fj+hUMhMWm4VbYQIITbnFkw2res6U5OTfPLJJ1y9cpm5ubnyQxZQKRyXVVApFArs2LmTV155hTNnn1pwnM3WQFVVbt7s5bcffMCFixeRKvTngyA+FAoFvv3mG9599x3GRkcXjEtJknjmued48823aG9vX/A+m9URj8f54IPf8O3X3xCPx5ecx3Rdp7a2jmefe5Znnn2Omhrb++R+oKoqV69c5u//039iZGTELJcAj9fL3v37+NGP/oAdO3ZsuUUGsiwzMHCL37z3HtevXVsUAk6SJPbt3cef/NmfPZLiw5XLl/noo98xOjJaEgIr3Is6EA6H2X9gP3/wB39EfX19xeOWQtd1MpkME+Pj9PX30X/zJuPjE8Ri8+w/sJ/XX3+To8eOlb9tVehG6NPPPv2Ujz76kMmJibIjJFwuJy++9BJ/aosPDzSPnPhQ7UO8lfV6oF+r0WS92RBjiYVqDYjryfBZCHx5Hw3GBo9Kn9/Pvl4N1d7TtvhQXro062Fwvh/n3Ar36nrdnw9TXSqxFepnZcPqep/v/S3AulnwfT4fTU1NpsggSZLp9SBeq6qK2+1esApeVVUUIyRNsVikUCiYnyk+R7zGeDAW+SE2g+7ubnbt2kVDQwNutxu/34/T6TSvVSTPVlXVzP8gkkyLuln/im0z67DRCPHp6tWr9Pf3E4vFFvSx6F8hGlkFBKuQIAQZISRoRo4NIVxIRr4Q63FW0aGah//Noq6ujoOHDtHe3oGmquTz+UVbLpcjm80iORyEI2FqamsJRyL4gwEkh4NcNluKs6/rpFIpYvE4udxafcZtNgKn00lnZyf79+/H5/WV715yRftWQjdy06QzafJGHhYrEpBKJMlk0uW7bFaJz+eje1sPPr9v0fxQvgWCfrq2bcPnWzy+bDYHVVXIZLNksgvnYd0Ia5TNZEmn02vydtsoPB4PbW3t7Nq1m0iktOCjEkuVP8y43W527tzJocNH8Pl8FAqFRfdf3gjJ1N3dzRNPPGkumqkGpVjk9sAAH330IR99+CE3b95kdjaKrmkoRaXqz1sOyVgMtGfvHjo7Oir4cpR+W63nOW1sNofV5iIAuv/tyh/+l2NoNwzfLi+9P2yYscRC9q9WmfB7jUR/snUMMI9an9vY2KyOh+n+3Oi62PPqI8O6WMIkI5ROS0sLoVDIFCCE2JDP51EUBafTia7rFAoF8xhhpMZYkSdWymuaZq4EFxsWQUL8f6Pxer309PSwfft2QqEQHo/HzF0hyzL5fH5B4mnrX2sy6vIya50eZFRVJRqN0t/fT39/P/Pz86bBxToOrKKDEA6EZ4vDSCJtFRTEJsaIGBeVBAjxGVsNSZLw+f3s3buXnTt3EjFWKVvHtKhTfX09J06c4JVXXuXNt97itddf58UXX+KJJ8+wZ89eQuEwmq6Ty2aZn5sjnU4/FOPnYSQYDNHU1Izf53sgDTqSJOFyuQgZYc8oG2c6EAqF8Pm2XkiZBxWPx0N9Qz3hUAi3271ojhCb0+nE7w/Q0NCIx+Mp/xibTcJphgcMl+/C4XQSCIYIBEoLFbYigUCAxsZGfH7/lvzuvF84HA4am5o4dvQYTU1Ni+4/8Z3bUF/PgQMHOHjw4KruQ1VVmZ2d5c6dO8zPziLLMhhz60YI1JIkUVdXT21t7aqu18Zmy5L9q1UaLHbBwdUkrazA0O77Y5A3uQ29ZzfPWBJ9Y3PrO7yJdVspj1qf29jYVMfDZMDerLrY8+ojwbo95Xg8Hpqbm2lqasLj8Zhig9PpJGusDnQ6naYhXrzWNM00UheLxQUr3oUAIYz1VjbTqBcKhdi9ezfd3d1mPgKx6lSWZbLGyvSlhAcRfkgY0cXfB9kDQjdEpOnpafr7++nr6yOVSpnGdIwHeUVRTHFBGDUlSTKFCBFKSQgIlQQIyfCeEG0qxozYL8bPVsVjeMy43R7DvLAQt9tNW1sbZ86c5bXX3+Cll17m9dff4I033uSll17i2Rde4MjRo9TX16MUFWJz86SSqfKPsdki6LqOput4Pe7yXQ8Mbrebjo5Ourq2ETASG7uM+62uvo7tO3bQ1LRSf2Wbe6FpGtGZGVLJFOoyyelVVSWZSJjh/2zuD06ni+bmlpKoHIks+L5qqG9ge08Pzc0tW9qwX/rudBm+TDYCXdeJRCK4XK7yXSY+v5/a2try4hWjA06nA6/HU+EXwcbhdLlwupeul43NA8nQn60ugXTgL+HAX5SXro7oG3D+JxBdjRCyBrLvlRJoRzfZKyD6Bpz/6erafcUYhqCt4vFQzqPW5zY2NivgYTJg34e62PPqQ8+6PRmXVlbV0dLSYiYDDgQCOBylkDg+nw9N08jn87hcLjRNo1gsml4MYuWXMFiLle4YBpdyb4fNNjYHg0H279/Pzp07TeN5eQgm4aIvPDhEPYSIYi2zGtI3uy7rQTabpa+vj6+++oqbN2+SSpWM4aIuLpfLrKtVVCgXGISIYC0TXg3lG0ZIC9GmVqFjM8WoapEcDhwOp5lweME+w9BbX99Ac3Pzgno4HA4i4TCHDx/mtVdf48yZs0RqapiPx0in7ZA3WxnpAQ9jIUkSbe3tPHHmSZ48c4bdu0ri66HDh3np5Vc4fOSwHfZnHSkUCoyMjBCLx9GW+T6QJIlkMsnkxMSCEIU2m09zczNnzp7lyTNn2bVnD53btnHo8GGeevopTp0+vaokxJuFw+HA4XTglEDaVPP31kcsknA6lvZacRrf6cvcqsuiKgr5XI5CobDqz6gWyeFAkhyLfoPY2Dz4rCH8UtPPVh73/V5k/wZ6d5cMJxtqlDcMJb1n4fwbG3+upcj+FZw/uzFGouhPHwxD0KPW5zY2DxJDxr25EXNUJaI/gU83aN56mOpyL+x59aFmXRJOCzRNo6+vj8uXLzM5OYnX68VtJBEOBoPohtu63+9H13XcbreZgNjhcBAMBs2V8SKRs8NIPi1WyItNvGcz0XWdWCzGjRs3GBwcNFf6CxFBJJwOBAL4/X4zybT1tcfjWfTXZYQfehBQFIXR0VGGhoYYHx9nbm6OXC63wIPDaYRLyuVy6EaoEJeRMFrUt7w/PR4PTqcTv99vChFi/IjjXUZS6vLk3c4tGtrCymeffMK7777D+Pj4ArFJkkphek6ePs2PfvT7CxJXJhJxbvb2Ut/QSFdXF1NTU3z04YdMTIzz9DPPcObMWTxlIRRUVUUpFpENcauUL0MjEAiaIdEEiqIQnYmSTMbJ50uGTL8/QGNTI/X19ZZPXRn5fJ5MJoMsyyhKEVX5XkBcCiEgBUMhmpqaljTWybLM/Nwc0dkoiXgcuVAS+CRjfojU1NDQ0Ehrawtu9/IeB7rhZSU2WZbRVA2f30cwGFzwfk3XmJ2dZX5uvmQo0jR8fj9NTU3U1dVVvG9lWea7777jb/+vf8/0dHRBGzicTrq6ti1KOJ1MJpmbnSWTzaAUFZwuFzU1tbS3t5nC20qQZZnpqSnm5+dJp9Pk83lURcHhdODz+4lEamhubqaxsXFFn1ssFpmNRpmZmSGTSSNJEuFIDe0dHdTV1i7qL03TjP4veSrJhQKqphEKhRbERlcUxWjXOQqFAgG/nz379i36PETbzM0Ri8XIpNPIhQKapiFJDjxeN4FAkJraGhobmqirryt/+7IUCgUmJyeZn58jlUyV7hfA6/Hg9Zbm6GAohMfjRVUVfL5S399rjFWDpumMj4/xD3//d3x39TuczlKIumw2V9G7wev1cuLkKf7oxz+mqbGxYptVIhaPMzM9TTwWI5PNoCoKEhJef+l7y+/zm/OvXJRpbmomEoksGQYmn88zNTXJ3Ows6XSmtJgAcHvceDw+/H4fwVAQSXKgaxqBYJC2trZ7Xm8+nyMajTI/N0cqnaEoF0pekU4HbrcHn9dHTU0NjY2N1Dc0VLwHl0PcI7Ozc+b9JjlKIrDb7cHjduNwSOTyefz+AG1tbTQ2NpZ/DBhzSXRmhqnpaZLJBA5JoqamlqbmZurr6xfcY+L3j7jeQqFAIh4nHk+QSibIGsZoTdNwu114vaU2jERqaGou9cVqkGWZVCpFUZZRVBVd18hmsvTf6uezTz9lZnp6wfe3ZCSc/tM//3O2bdu24LPK0XWdubk5ZmdnSSYS5HI5isUimqbgdnnweL2EQiHq6+tpbGrE768uyHoykWBmZpq5+XmymdIYczgceH0+fF4fAb8ffyCATskTs6e7B78RFnMt5HI5/tf/5X/h0uVL5buQJIk9e/bw5ltvc/TYsVX9/ohGo7z7zjt88fln5Cx5dSRJ4sCBA/zg937IwUOHSoW6Ti6fB2Ohwj3nbUkik06Ty2YpKkrpu1jVSCTifPnFF1y6eJG88XkCt9vNiy+9xJ/86X++oLw0z34vpOeyWWLxOMlEglQqRTabpViU0XVwu0u/03w+P7V1dbS1teH326H5NpNHL+F0GatOWPkefPpGeeHaCZyBnn8LTau5piWI/hSG/mrrGUnWq67Z9+DGMkag+5okeAWsVztYuV99Xm2C4PtNtYlZ7+tYus9JZ6vt2/VI/nw/zllO4Aw0/w/QtBsC63WP3obhfwVDm+gdwENWl3vxMM2r9/ve3wKsq/gAMDs7y5UrV7hx4wayLBMKhUxDshAUxMOaeO0w8gEEg0E0TTOPFUZrYYR2GmF6PB4PkpFn4l7GzfVG13Wmp6fp6+tjZGTEDCklVuO7XC4CgQDBYBCPx4PX68Xv95vChNhEuVVMWesD80aTSCQYHBxkeHiY8fFxMpkMihFaSrLkYlBVlUKhgKIoC4QD0X9WQUEID6IdVrJZx4fX6zWNOVu5/ZYTH0KhMI8/8SR/8Id/SDj8fQzxgYEBfvvB++zdu4+nn3kGl8vF+W+/5crlyzQ1N/PCiy9SW1tLsVhkcHCQ0ZERHA4HRaVIUS4Z1guFApIEbe0dnDx5Er/fT6FQYGJiguHhIaYmJognEhSMJJq+QMnYdvjwEXp6eu5p2Esmk0xPTxGPxYnFS8bhfL6AopTOr+ulOlbqGyE81NXWsXvPbg4cPLToOGEcHhkeZnJigpnoDPFYjFwuj6oqSJIDn89HTW3JqN7Z1cWOHTvp6OhYcO3FYpHxsTEmJifI5/JoukZRlpHlIgW5JCq0trWxb99+WlpaUFSVqclJRkdHGB8bY3Z2tpRoVNPwBwK0tLayd+8+tu/Yjr8s98FKxIf/7r//7wmHw8zNzTEyMsLY2Ciz0SjpdBqlWMTpdFFXV8euXbs4ePjwPZOa5nI5xsZGGR0dY3xsjLm5OcMYmEVVVZwuFz6vl9raOlpaW+jp3k7Pju00Nzcv6mNVVYnNz5MvFJDlAulUmkQyQTqVolgsks3lOHDgAPv27cPj8ZLNZhkZGWFuNkrBEIWEqCPLBTRNZ/uOHRw4cMCs88CtWwwPDzMbjVIsFuno6OD3//APze8GXddJJBKMjY4yMjLM9PQ083MlQaWQz6NqKg6HE4/HTSgcpra2lqamJrq6ttG1bRvNzc0L6lSOqqqMjo4yMDDA+Ogoc/NzJAzjqaqqeD0efH4/oVCIUCiMz+dDcsD27Ts4ceIxgsFg+Ueumnw+z3ffXeUXP/85I8PDdHd3U1tXy9TkFNPT0+WH43A4aGtv5yc/+ed09/Tc0/iZyWa5e+cOd+/eZWpywhCmUsjGqmufz4c/4CccDBMMBXF7PEgOB088/gQ927fjLhNaZFlmbHSU27dvMzExTnRmhmQqRSFfuq/cbjd+X4BQOGQkNC6JBtt37ODMmTNLXm8mk2F0dJTR0RFD1JgjZXyuLMs4nA68Xh8Bf4BIJEJzczPtnR1s29ZNS0vLPY2ysiwzOTnJ0NAQI8PDRGemyWSyyEUZSZJwGd9FHsPTLpfLUVtXz+knnuD4sWPm5xSLRTKZdOm9slzKwxOLkUqW5lGH00lLSwv7DxxccN/m83lGRkaIx2Louk4q9b2oFo/FyWTSyHIRSSqFx/H5vAT8AWpq6+joaGfXrl10dnWtyICfyaSJRqPMRqPE40mSqQTFQkkUVDWVQkFmfn6Ou4ODZNLpBXldViI+qKrKzMwMw0NDjBtjIB5PkM1kkOUCqqqahuhwJEx9XT2tbW10dXXRtW0boVCo/CMXkEomGR0b4+6dO0xMTDA3N2t8t5SM5l5faRyEw6Uxqxt5wt58621aW1uXHGMrJZ/L8f+7h/jw1ts/4MjRo1WfS1EULlw4zwfvv8+tvv4FjgiSJNHe3s7xE4/Rs307mqYi5wt4fT46Ojtpb2+vOM5VVSUWixGdmWF+fr40lxnCgGJ43ObzBYaHBpmcmEApS4TuXkJ8SCQSTE5Okk6lUFWVeCxmjtlEPF4SMQ3hyu1243G7CQSD1NfX0bWtm127dtPe3r5okYTNxrA54oPNqgicgeCPoWkPBHeXck4sN5VnjdWtmQGI/gIyf3MfjCSrJPAX0PzDklFs2XreLtUp8w5E/+7+rLDdSB6lPrexeRAJnIHgIQj+EAK7Icg9DPliztqC9+jDVJflsOfVB551Fx80TaO3t5cLFy4wMzNDMBgsGXOMFXBerxdJkggEAjidTjRNw2mseHcaK+ZDoRAuwxtAGJqF2GA1Xt8vg72u60xOTtLf38/4+Ljp+SDL8oL6BAIB8/r9/tKqUrEJEcJtMb6XGwG3CrIsMz8/z927d+nt7SWdTpthf5xOJ6qRWFz0pwg9JUQlUU8hTggxwlp3a7lVlKhULvYJMeNBFh8wQnodPXaMV159jZqaGpxOJ5l0mgsXL/DxRx/x5BNP8oMf/pBgMMjU1BQ3e3vJ5fI8/sTjNDQ0kM1m+fLLL/ns00/IZbIouoauqGh6KdSXQ3LQvX07f/GTn+D1eunv6+PixYvcvNlLJpVCVhQzzrzD6SQSCXPkyFF+74c/WtIDQlEUJicm6O/v49atfsZHx8nmsxSLRdSigqbpSM5SyDVVVUvGLYsIUTIW6TQ1NXHo4EEeO3mSffsPLDhHKpXi7p07XLx4kTsDA8TiMfL5HLJcLCXmlECiFI7N7XLh8/uoqa3l8OGjPPX003R1dZljI5vNcuniBb799hsmJyZRFBVNV1FVHV0vCYd79uzl+edf4PCRIwwO3uXrr7/mVn8/c7NRZFlGVTV0TcPpchIMhjh05AjPPfccu3btXjD2ViI+/Lf/8l8iyzIXzp8veYpNTSAXChTlYkmUMcTZ9vYOXn3jdY4dO47X6zU/x0oqleTmzZtcOH+eu4N3SafS5HI5lGIRAMkhldpJ03C53QQCAVpbWjl05AinTp+mrW2hd0U2m+X8t98yMjpSMjBl0mSyWfLGquZUMskPfvB7vPLqa/j8fubn5/nmm6+5euUys9FZVFVF1VQ0DXRNQZKcHD9xgmeffZb6hga++fprzn/7LTMz02TSabxeL8eOn+D//pOfmPPJ9PQU169d57urVxifGCeTzlAolIyaOiV7nSRJ6LqGy+nC7SmFwWuob+To8WOcPHmK9vZ2HBUMg7IsMzQ4yLkvv+DqtWtkU6nSZxtzt9frxely4ZAkiiJ0nCQRCAY4/fgTvP7GG9TVVudhsRzxeIxPPvqY9z94n3QqxZkzZ9m+fTt9fX1cuHC+/HCgJBj8F//lf8XxEyeWXV2cTCa52dvLJ598wsTEONlMyYCr66Xx5fP5cDhKngmlFeulMVJbX8/v/+j3OXL0KD5LeK1isUh/fx9ffXmu9F2QKYlBQnj3GHO9pOsUi6XvQ1XVqK2r5/EnnuAHP/jBouvVdZ14PM7N3hucP3+ekdFRUqmSF4oil4QBXdfRjXvMKUl4PF58Xi/1jQ3sP3CA48eO07N9+4JrtVIoFLhz+zbfnv+W/r4+w+Mmj6qoZpgrSZJKwouRs0VVFGrq6nj1tdd5++23zc9KJOLcHrjNnTt3mJubJZ1Kk0qnKeRz5HN5vF4v+w7s562336axscmcg+KxGL/77W+5dOkSqqogFwoUZBlN19EMA7FsqS+G0OT1+YiEQ+zbv5/Tp59g/4EDSxpzVVUtiXsDt7hx4zqjwyNk0hlkpYimKChqqb66cc6iMUdYuZf4UJRlBoeGuHL5Mte++86Yl/OmR5JA3Kclo7SHcDhMZ1cXj508yYEDB6hvaKj4nR2PxentvcG3337L0NBQyYMrlwX0Ur/7fEgiN1hRAXRUVSUYDPLP/+v/B3v37q1ooK+GjRIfcrkct28P8Lvf/bb0PZ4teYda8Xg8BAJBvP5S+FJVLrJ33z6efvZZDhw4sOh8uVyOifFxbty4QX9fH7PRKLl8SZzXdQ1FLYX91HWdolxE0xYKDywjPgwNDfH5Z5/Sd/MmSlEhn8+V5kSt9F1YNLwHF4xZpxO/z0soUsPRI0c5c/asGa7UZmOxxQcbGxsbGxsbG5utivPP//zP/8fywrUgHjAymQyxWIxUKoXL5TK9GnK5nGmU1jRjlaThAVAoFEyBQTdWRbvdbiTD7VsY6B1G3gDr+TYTSZIIBoPU1NTg9XrJ5/MoioLf70eSJGPFb8n47jByXlivU/xfErGFjYdJcexWolgscvfuXb755htu3rxpejSoxso5p9NpigGSJJltIeomhAUhHlg9FkR5JWFClIv3W/86Ld4y4vVWa7dyhoeGGBgYMHNjWNE0jWw2y/j4GDdv9nLp4kXOffkl169dJZfLE45EOHr0aEnI8nhoaGykrb3NTHTqMrxtikWZGzeumeEv8vk8hUKBfCFPNpPhqaee5vq1a3zwwQdcvXKZZCJh9qcm8pIoCrlsjlQqRWdnJw0NDRUNOTd6b/Cb997js08/ZWx0jPnYPJlMxhSeJMlBbV0dNTUR0ql0yUumqJQ8MgyvDEVROHrkCM+/8CLbtnXjtJwnlUxy5fJlfvOb33D9+nVisflSCCG1NGfU1tVRX19PQS6UDIiG+JdKpRgbHSGXz9Hc2kJNTQ0Y91ZNTQ2pVIrRkVGmpiaNNspRyJeM/g6nk7q6OlRV5d133+HK5cvMTE8bnhzf5xpRFJVcPk8hlycYDJorO8UYLBnPp7l+7TsymYXyumRcx759+/js44/45OOPmJiYKIUUkUuJ6TVNQ9U05GKRVCZNUZbZt28fgcDi1fZFReGTjz/i3V//qjS+ksnSinbDQ6O+vp5IJEw+l0c3xlqhUCAejzEzPYWqqDQ3NxMMBs3rz2azfPPNN1z49lsGBweJzkSJzZeSnGczWVRVY9euXezZu9e8R8PhEPPzMUZHRkqh2LJG2xq5cHy+kgg7Mz3Db37zHpMTE2SzWXQjN9Cx48fZu7cUdml0dITPP/uMjz/6iNGRETJGuBXdCOEWDkdoam4ueV2ZfaKQy+VJJBIMDQ2RiMepq6+noaGhvMnovXGD93/zHpcvXyYRj5eM7rpOOBxm3769PPX00xw+coTOzk40VSURi5vX2tLayv59+xcZ0FeLbnjSXbpwgeHhITRN48knn+TI0aOlvDo3b5a/BYz31dc30L2tlBC8EplMhiuXL/OrX/6Cu3fvmp5qkiTR2NjE8eMnePLMWfbt2099QyOFQp5oNEpRUfB5PezevYfWtjbT0K1pGjdv9vLur3/N1StXSKaSKEa/hMNhDh06zBOPP8GxY8dpa28HTWd2dpaiESqnvb2d3bt34zEWEwhSqRSffvIx7//mPe7euUsqmaQoy2hGrqdwJEJTSwsOSaJQKKAboQ7zhTzxeJyxkRFmZ2cJhyM0NjUuMs4qikJ/fz/vv/++IZCVvG00zSI6uFyEw2Hqauvw+nzk8zlUQ0hva2/j2LHj5uel0mluXL/Ot998Q//ALWamp4jNz5NMJkvG2aJCY2Mj+w/sJxgMmXVNpVJ8+/XX9PXdJJFIkM1mcblctLY0093TTWtLGw5HqY7i+1XXdZRikUwmQ3SmJOx1besiHF4cgknTtFJovo8+5LNPP+VW/y0zlFs+n6cgyyVxWFXNrRKl8dHI0WPHzPnTyrXvrvL+b97j66+/YnZulnyuFB5M13W8Ph/19fXU1taSN8IxaoaROpPNEI3OMDw8iMPhpL6+nmCZB0Q6leLixYt88snH3Lx5k4zhCSZJEs3NzRw/fpwnz55l7759NNTXk8/nS+OlWARJ4sjRI7S0tCwaA9WiKArnv/2WyanJ8l1IkkRDQwN79u6lpbXVFJfuhaqqjI2N8X/9+3/HwK0BCkaow3JUVSWfz5NJp8lmMmRzWbZt62bf/v2L5jO5WKT3+nXef+89vvrmaybGx0mmkuRyWWPuXdjnuv69OGTF6XSyY8cOjhw9uqB8emqKy5cu0dfXRyqVIpfL4fP6aO/ooLunm8bGJnQkU4DEGLPFYpFMOs3s3Cwet5vGpqZ7ervYrJ0e6d+WF9nY2NjY2NjY2NhsCdZdfADw+/0Ui0XGxsbQdR2fz1daiaso+IxY/cKIIAwbsiyXwj8Y+SCEocnlcqHrOi4jF4QkSQuM+mt9yFwtkpFEu84wgmKsQHMbYYF0XSedTqMbIor1mq2ChPW1MKRvFUZGRswQWrOzswsMsA4jUbQwPmLUX/SrEAqEmOAxvBYwVu0KgUFs4rhKwoR1E2PiQRIeuIf4gLHScm52lqnJSaLRGWKx0mpSdB2vx8PjTzxhegeJFcvWe8Lv9yMhMT0zzezsbPnHoxora7/6+ivu3rltGp6Wajtd12loaKCzq4tAYKE/2/lvv+GDDz6gt/eGYYz+/rN8Pi9Hjh7lrbff5sUXX+TJM2cYHRkhOjOz4DMA3B4Ph44c4cjhowsMqNlMlgvnv+Xjjz9icHAQWZbN+6ihoYHnnn+eH//xH3PisZM0NTaRTqWIx+Pm+xVFYWYmitfjLcWdNhLfi1Xec3NzTM/MoFUwvqVTKe4M3ObGjRsLYnEvQgJVLeUy2LlzJ6HQ90bGZcUHyYHL6WJ0bIRr168Tj8WMlddL94PkcLBr927q6+sXzA+KovCbd97ls88+ZXJyckE/dHV28eJLL/HmW29x+vHH6erqYuDWLRTDw0XXdfL5PDPRGSKRUvx8YVB3uVyEwmGmpiaZnZs1Vhd/j0OS2Lt3ryk+SIYYWywWmZmJEo1GjXXP36OqCvPzcwwPDZnfC2Ls1tXV8exzz9PS0sJsNMqHv/sdX3/9FfFY3DRoSYDH6+XM2bP8yZ/8KadPn2bPnj0U5SLxeHyBsbYoy8zNzZPNZs26CUZHR/nyyy+4euUKmUzGLPf7SwLISy+/wtGjx+js6mRbdzdHjhylpaWF+bk55uZmaWtt4+ChQ4vuidWSzxe4e/c2ly5fZn5ujqbmZk6dOs3uPXvJ53N8/dXX5W8xUYpFDhw6RF1dZS+MG9ev89GHHzI0PLRgbDQ0NHL27FneeOsttvf00NXVxc5du9i3fz919fUM3r2L5HSyY+dOOjo6ze+zubk5fv1Pv6K/v9+MQY8xn588dZpXXnuNI0eOlAyT3T3sO3CA1rZ2ZqanyKbTtLWVxIeAJSZ/OpXiq6/O8etf/Yp4PIaqGv1teDqeOPEYP/rR7/Psc89x9MhRvF4PoyMj5rjAEOBi8zFmZmboMHKRiPtEVVRGhof58Le/pe9myWtvAUZ7PPfc87z59ts88+yznDx1iv0HD5LP55mdm6O2ppZDBw+ankd+nw+X00U6nWRycgJZli0fVxLd29raOHDwwALxIZlM8NU3XzEzPYPH6+XJM2d56623eea55zhy9BiHDh/m5MlT6FrJs7LcK0FRFJwOB11dXTS3tCyYC1RVZWJ8nA/ef5+LFy8yOxs1PZ8wrsvv83P48GHOPv00x46foK6+nkQ8QaEgL7hfpWXEh76+Pt579x0zrKb1Pd3bunnxxZd46+0fcPr0abZv38HExMSCNteMBShjY2N4vB5aWtvwG94qiqJwa2CALz7/nJu9vQvEEZ/fx4svvcQPfu/32LZtG52dnezYsZN9e/fh8/mZmpmmKMscPHCA9vYO87fGatkI8UHMd6U5qYl0OrVgDhLHNDU38+SZM7z00sscPnqUg4cOsf/AQTo6OhZ59pw7d4733/8Nt/pvLRAAxJhrbGrizNmznD37FHv37UXXS6GUyoWnpcSHyclJrl+/xtzcHD6/n5deeYW3336bs089xaFDhzh46DAHDh6kWCwSj8UWjdlCPo/b7aa1tZW2trYF+2zWH1t8sLGxsbGxsbGx2apsiPggGUb1VCplxtF2GCGUHA4HiqLgMLwXdCNWr8NIHCtW0AkjvsMw2gsjs/X/GCua7xeS4Y0RDJaS+QrRRVVV00AujL66JbSDqIf4i1EPa73Ew+NmoqoqyWSSwcFBLly4wO3bt5mcnDQN4UIUsooGbsMjQZZlM/+FEB3EPutf62vrMcKoLsorCQ/inFah4n6002pYTnxwOp0Eg0EaGuoJBIM4nS5UTaNoeCR4fV5OnDhhGoKs40fgcDgoyjJjY2OmcdeKMB4WizKHDx/myTNn2batm0KhlCS6/HiA2toadu/eQ9hIdKppGmOjo/zud7+j98aNkjhiwe3xcPjwEZ559lmOn3iMxqYmwuEwV69eqRhuyufzsX/ffnbt3m2KkKqq0HvjOl9+8QV9N/vQrCs1JYlTp07zxptv0d7eQV1dHXW1tWQyGWbn5hZcj6IoZLMZwuEw3T095n2nazpj42OMjY4uMpQoimKE+MixY+cunjxzhr379pltV46qKoRCQfbv30+NJfnycuIDxnnm5+doaWnh1OnTHDl6jFAoRCqZWHRNGPfTjh07aWlpxm0Y1VRV5dLFi3z80YeMjo6ax0qSRKSmhscff4InnjxDT08PdXX1NDY1MTMzzWw0+r0AYST3zefyNLe00NTUZN5Tbreb8fFRJicmkOWya6ogPjgcDvL5PKOjo0zPTC8ybhWLMplMBlXV6OzsYvv2HdTU1lDI52lubuHll18GCc59+SVff/0Vc7NzC8eLJHH8+HFefuUVdu3eTW1tHc3NLQDEYjFi8/MLji8Wi6TTKVxuNx0dHaawcuXyZS6c/5aZ6EIxzONx09XVxf4DB2lubjbCu/gJhkI0Nzfj9XmJx2L4fD4OHDhAyJKbZS0kkwlu3LjB1cuXKRaLHDl8hGPHj9PU3EQun+dWf/9ig7lBOpXi4KFDtHd0LJoH4/E4ly5e5MqVKwvuC0mSCIWC7Ny5k8NHjuD3+/EYYQHr6uqob2jA5XYxMxOlo6ODzs4u/EaemJu9vXz15RfEYrEF53I6nezYvp2DBw9S39BgiqORSISWlhbcbhf5fB6n08WePXsW5EG4+t13vP+b95mZmbamHcDpdLK9ZzvPv/giR44epb6+nubmZgL+AOl0mvHx8QV1VjW15E2QybJ37178hjgUj8e4fPkS5859STKZ/P4ERluEw2Gef+EFzj79NDt37qSmtpa6ujpaWlpobmkmEY9RKOTp7OyksamUmVAyFgrMx+YZGhxcNA+6XO6K4kMsFuOLL75A13Wee+55nnvuOfbu20ddXb2RWyREpKYGSXIwPT3N3NxCEVkyBJmuzi46OjtxWTzFZmejfPP1N5z78ktisYX3giRJtLS28uprr/HU009z4OBB2traUFWVkaFh0unUouPLxQdd10nE4/z617/m2nfXKBa/Fx4AampqePzJJ3jizBm6u7upq6ujqbmJYlFmenp6QRvpuk4hnyeRTBKJhOnp6UHXdTKZDBe+/ZZr174zf0sIJIfEkSNHOXz4CB5PyYsqEAhQ39BAU1MTIBGNRuneto3unm7c7sphqVbKRokPbsMLwOl0MjI8vOh7RfTV6dOP88QTT9DW3k5nRydNTU34/f4F57rZe4MPP/wdN3t7FwjpEuD1+jh85AivvvoaJ0+eZOeuXdTV1RGNRpkYn1j0PbOU+DAyPERfXx+apvPKq69w9qmn2blrF5FIhFAoTDgcpqmpiWw2y/TU1IJFAAKvx8u27m56enrKd9msM7b4YGNjY2NjY2Njs1VZ2VPTKohEIuzatcsUFMQDeNEItyIeosT/MeIyW0MOqGWhATQjbq1uCBaSJc7s/cTpdNLY2MiuXbvYvn07TU1NRCIRamtrCQQCeIwwUrIsk8vlyGazZDIZ01OgaCQGtobA2Qx0I3xFJpNhcnKSvr4+Ll++zMWLFzl//jz9/f3Mz8+b1yhEFOF9IEQARVHIGSEWxL7yzel04jQ8JcQx4v9WAcJthNYSx4jX4q94XW58f5Bxu910dnXxzHPP8cqrr/LyK6/w3PPPc+ToUWpr6ygqColEwrxPlsLhKCVkXapdEokEhw4d4q23f8CPfv/3ef2NNzh48BBe7+I46bquk0qnUNTvzykXCly7do3bt28vMrgBNDe3cPzECeMzv89PsNQ96nI4S+v9jf26rpNMJvnu6hUGBm6hU7rXMQwqjY2N7N23zzA2lWhqaqJn+w4aGhrKDGgwNjrKte++Y2Jiwix3ud24XZXzq4j5pq2jnZdeeYXf++GP+P0/+ANOnDiBt0KMdV3XjaSeiwWDpSjNAwXC4TBnz57lhz/6fX7we7/HM888Q2trW8Xr0lTVOM/3Xgux+Xm+/uorJiYmzDlR0NTUzN59+2htLRnnMebjQ4cPE45EysaHxO3bA/Td7F1gCHMaglg1Rjzz/nYs9kZTVQ23x8vO3Xt49dVXee3113n11dd4/oUXOH78BKFwmNnZWS5duMD01NSiMeN2uzl8+Ah79uw1yzweD/v272fXrt0Vw9DEYjH6+/sYuHWrFP5F14hGo8TjCaQyT5NCocDIyAiXL1/i1q1+otEoOSP5dDAU4tTp0zz1zNM0NZcMh+tFPBZjcmKCTDqN0+mkZ/t201MjEg6za/euJc+nahqjRl6Ocubn55mZmSFfKInGAl3XSacz3L59m2+/+Yahu3eJxWKmx1pLSwsvvPAihw8dpiZSg0MqjUdZlhkZGSZTZhTG+A4fHh7i8qWL3LrVbyZnV4w4/Kcff5zHH3+ClpbvxyNAdGaGa999x9DQ4IJySZJKHkVGaC8hTAJ0d3dz8uSpip4niqJw8eIF7g7eRVVVdF0nOjNDf38fiUSi/HBcLhc7dmzniSefpKNMwHG73ezbu4/Tp08TDoUZGxtb8F63203AH8DlWvkKe/E9f+DAQZ57/nl27NxpiolWGhoaaG6pnDBdVVVy+dK4FP2az+cZHBzk4sXzJBILhSEMkfeJJ57gxZdeMoS7WmpqagiFgrhcThxLfF9YKRaL9Pf3c+P6dfL5xXkKOjo62LN374JE78FgiJMnT7Ft27YyP6iS8Dk+NsbVK1eIxWJIkkQ2ky0lNzY8Rq0ocpFb/X18883XDA8Pk0gkTI+41tZWnn7qaY4dPWaMi3vX537hcrkIhUIEjUUGlXA6HAQCfjweDyEjvGcwGFwgNuXzeb788gtu9fctqq0ObOvu5ulnnuHsU0/R3tFBJBIhHIng9XqRHOXvqIyqKGSzpTBLR44e5YUXXqSzs7Pi74u6ujpC4fCi7y9JklCUUn4TGxsbGxsbGxsbG5tHl8WWrnXC7XabMeNramrQjLj2xWLRFCTEanqrAVsyVijn83ny+bzpSSBECGFoEw+n5Q+p9xOfz8fu3bs5cOAAdXV1eDweIpEIDQ0NRCIRPB4PmhFzXYgQYssb8fmLRtLP9a6Xtd10IyZvKpViamqKgYEBLl++zO9+9zu+/PJLpqenCQaD6LpONluKHSyMHVYhQDwMi+u3ighivxAbvF4vHiM5tPgr+tplCBnW91mFB8kSkkocU+kB+EFEkkr3Skd7B2fPPs1LL73MW2+/zZ/8yZ/y4z/6Y44dO4bT6SQWjy8Ic1ER0b/l5YYRIBKp4elnn2fnrl0AhMNhurZtWxDv34qiqGZcdIB0JsOtW/2kylYQYwgf3du20d3dsyge/lJjuVQulRrBEBenp6a5ffsOmUwpxr6JJNHc0kJtbS0YhpF8Pk8qlUIpFnEaXlRWdGB6epr+vr4F5Uui69TX13PisZMcOnTIGLsu2ts7aLCE7hFIYCZwrQan08mRo8c4eeo0kUgEt9tNe0cHzUvEKteNnAa6IUoWCgUGBwcZGR2hUDYmSv0cIWwYglRVJZfLlcJmeH24LJ8v7j9d1xkeHmbC8E4RY8EhVSfw6eg4JKhk23I6XXR1beO5Z5/liTNn2Ld/PydPneIP/+jHvPLaqyiKwvDQEOMTExXHb3tbe8U+qK2tpb29ndq6OjGMTCRJYjYa5c7t28iyTCGfR1GVkjdNWZ+pqsrdu3d5/733+OXP/5Gvzn1Jb28vQ0ODzMzMABKnH3+CEyceq2j4Xg35fJ6pqWmmJqfAMLjX1tbgcpfmVZ/fT0/P9kUGPRNd587t20xPT5fvQZZlikrJOFtONpvh6ndX+fu//3t++8EHXLxwgf7+fkaGh4nNzxMKBnn++efZvXs3Pp8hIuq6KVCUo2kat2/f4Z13fs2vf/Urvv7qK3pv3GB4aIhoNIrb7S2gCokAAE/CSURBVOGwkdzcGvd9YGCAwbt3F/UFQDAUoqOzk2BZPguP10tTczPtnZ0Vk4mrqsrlS5eZn59HUYpMTk4yNjJacRx7PB6OHDlG/RJhqwD27N3H3n37yFYIjyMhVfUDqliU8brdPP98KcQYxhyoGomfU6kk8/PzzM3Pkc8tFncxji9aPCkxRLbbt28zNDhUqSmpr6/nhRdfWjBuS7+pVr7IIZPJcPnSJbLZhe2A0RYtra00NTYtMJBjhP1pb+8gEKicI2V8fJybRl4TkYTbuuBEoAOXLl7kb//P/5MP3v+NuThidHSUZCJBpCbCCy++yI6duyoKOlsNVdOo/E1d+mKpFBJQoKoq42Nj9F6/QT6/+J70+XwcPnKYvXu/F2ox7tNSsvEFxUtSkGUURaG1tZUzZ86YHpBizMqyTDKZNMNEyrJcsUa6rlVMcm1jY2NjY2NjY2Nj8+hQzbNz1Xi9Xg4fPozP50NVVdxGcmlhaBeGr7yRpNhtJKEuGkksMR50FCPXgHW1H8ZD2EYY6tdKQ0MDhw4dYvfu3dTV1eE2VvcHAgEikYgZe15VVdLpNPF4nFQqZbaL8H6wGgLXimKElJmdnWV8fJyhoSFu3rzJ559/zieffMKdO3dQDI+UQqFAMplElmWcxmpmr7cU6kAYR63Xn8lkTPFACA5ic7lcZg4HpxFaSQgQYr8QIrxer1kmjncY4bnEZwvhYb3aZaugadqi8d3d083Lr75Ka0sriXi8orfBApZpE4fDwZ49e2gw8pMIPB4PPp9n0Vt1XUdTv7+3isUi0ZkZEonv4+sLJEkiFAzS0tKyuqSSxjkUReHu4CCpdLpi/7ocDvK5HFNTU9y6dYvLly7xu9/+jm+/+YbJiQmz/k4jeWxLayuR2tqS0WUF3kQuj6dk2GxvX2DAcnvcBCrUSzeMSCu25hhIDgdHjx4lYhhzMOZKj68UZq4cTS/NdeIscqHA0OBgySBa6dy6TjqVZnxigv7+fi5euMAnH33EF59/zrwlZI7b7SZSW0tbWzt+nx9VXWjUlCpcy0qocEV4vW6amxppb29fUC4ZwqIsy9waGEAuFivWqa6urqLR3+VyUVdXSzAUXCCUYYzhQqHA7NyckQdFKq30dnwveFmRgHQ6zfXrN/inX/6Sf/dv/jX/8T/8Lb/94AOuX7tGKpWms2vpBM/Vks3lmJqaZHqmJB64vV7Gx8bp673J0OAQmUyGtrY2ghXqjdHOQ8PDhjiyELfbhdvlRqrYGyXj5txslHNfneNv//Y/8O//3b/hH/7xH/j0s8+4ffs2bo+HxqYmfEJINELGVBqfGG2dSCS5euUKv/j5P/Jv/vX/zt/9x7/lww9/y40b18nlCyURvqbGvLenp6eJzc9XvNe9Hq/hebPQkOyQJIKBAK2trQuENCt379whmUyiKCqJZIL5spBcArfXy86dOxd4VpTT2NjI/v376a4QMmalK8gFXq+PvXv3sXvPHlwuF6qqkkomSwb43l6+/eYbfvvB+/zutx9w+/btitesWxYQiHabnJgoiTgVLsfv87NzZylMzlpIpVJMTk9V9L5zOZ0EgwG8ZfkIxL7GpkZqa+sW97MRyunOnTsAOJxOXG636W1Tjg7Mzs3x1blz/Ke/+4/8H//u3/Lzf/h7Pv74YwZu3cLldNLa2rpozDxsFItFLl64UNELCaCjo7M0py8xb6wUXddpbGpk9949tLW343Q60TSNWCzG8PAwN65f46tzX/L+b37Dl198wfj4+JKiia4t9M6zsbGxsbGxsbGxsXm0qPyUt064XC56enrYZcSIxfLwLB4QhYBAWQgmIUIIg6wwICqKYm5b9WFGMlaxdnR0sHv3bnp6emhubjZc7UsGdavhXZZlYrEY4+PjjI6OMjExQTQaJZ1OV3zYvxfCq0EIDXfv3qW/v5/e3l4uXrzIuXPnOH/+PAMDA8zPlxKzWr0vCoXCAhFBCA/Ce8FtiETpdJp0Om16JFhFB+smxAS34QUh/goxQZRZP0ccbxUhxLbIiPGQ4nA4aG5u5uixY6jG6ti10N7R/r0x0cDhcOBwuSoamq33l1IsEovHyGZzFVds+gMBauvqFoRbqhZNVZmZniJXwaii6zA3P8elixf41S9/yT/8/X/iH/7h7/n4448YGhrEY8RC37d3HydPneLpZ57h9ddf57XXXufI0aMrGjMej4dITe2i0EROhxO301XJtreqOcjpdNLW1mbOgRihNpa6Rl3XFxjLC7JMdDZaUYzSdZ3Z2Sjffvs1v/6nX/L3f/cf+cXP/5FPP/mY4eEhIuEwXZ1dHDhwkFOnT/PsM8/y+htv8NIrr7Bj504cDseCOi11TdVREhgCwYC5erYcVVWZmphAKRYrjC4IBoMVQ18B+PwBQqFQRWO0oigkkwlisXk8Hg8N9Y2EQkvna9CNVb2FQoG5uTlu3x7gq3PneOfXv+a9d97hxvUbxOPxVfV7OYlYjKmpSdJGHpjY/DxffPEF//jzf+TnP/9HPvvkE0aHh/EHAjgr1A0gmUgwNTW5KDl6TU0pd4HX612yD8V3bD6XY2pyit4b1/n0k4/5p1/+gk8/+YS7d+6Y96LH7aa9fXHCWyui7fL5PPPz8wzcusWXn3/Br3/1K377wW+40XuDhOE1lU6lSSYT5OXFYxjjXqw4lxgidV3N9zlWypmdjZJOpSgU8mQz2ZJAWAG3y1mKv1+2Wt+Ky+WipbWVXbt3L9whLSXrLE1rSwuvvf46bo+H6akprl65wmeffso77/yaX/7yF7zzzjt88vHHpTwfmcp5PsCYDA00TSM6M8PE+Pgi1U+SJHx+P13bti0pGq2EYrFILBYjt0RuILfbjc/nqzhGHU4nkXCEYGCxYKcb3nTTU1MA+P1+Gpua8Af8S/atboSvzGQyTExMcP36dT7+6EN+9at/4uOPP2Lg1q01f09uFJXabjXIsszdO3eW9IRsaGygrq4O1xpFGK/Hy44dOzl8+Ag+n4/x8XEuX7rEJx9/xDu/+hU//8ef85v33uPLL75geHCQQtkcJBC/+der/jY2NjY2NjY2NjY2Dx6rfyJdIT6fj3379pmxYrPZLJIRakc3Vu85HA5TXBAeDmL1v/X/1tfW/29F7weM1cyNjaXVvl1dXbS1tdHY2Eg4HDaNQqINNE0jn88Tj8eZnJxkeHiY4eFhxsbGmJ+fJxaLlUIyGKt4xVb+/+npaUZHR7l79y69vb1cvXqVq1evcvPmTW7dusXdu3dLIVYmJpibm0OW5UV94TA8E/z+Utxhq/Dg85VyCsiyTD6fR9M0U0QRIkP5JvZZhQbrfvF/IT5YhYZyoUJc46OC1+vlwMFSElyXxUim6zozMzPMz82tyNgiSRI1tbULPsPYgY5krPteGlXTyOfyKMViRSOX2+slGAriNkLGrAZN10kmkksIizpzs7PcvHmTmzdvMj09TVGWqampoWf7Do4fP8HTzzzDSy+/zIsvvshTzzzD6cef4NChUtstZcwSSIYo4POVku8uMMA7HCXbf/lHSKX2qxavx7t4Vaq0ckO/qqpkMpklvTmi0Si9N3vp7+8nOjODoijU1Nayc9cuTp0+zXMvPM9LL7/M8y+8wFNPPcXJU6c4ePAgDQ2LwxqtBxI6kuTA7V7CoGzUKZlILFknl9u1ZFu7PW68Pl9FI7JmCXMnSRLd3T3s2LED/xJhYASi/2VZJpGIMzh4l4sXLvDZZ5/Q23tjUfLialEUhampKaIzUTCM7X6fn1w+x8jwMFevXObLL77g/PnzFUUmgSRJTE5OMjm5MDFuTU0t27fvoKOzq/x2rYiu6xRyBWajUXp7e/n6q3Oc++ILBgcHURQFj9dLd08PPdu34/f5Ft0KlZBlmXg8zuDdO1w4f55zX57jxvXrZDIZMpm0Ec5vcX/ruo7TubQY53a7CQYCS34PyIUC2VyWXC5v5kmphMvpWlZMEXg8nkXhnypf2fL4AwHq6uu5cf16yePw44/4/PPPuHj+PP19fcRjMYLBIO3tHdSXeahZsfanbuTJqZTTAqOtGhoayourQlEUspnMonBPGOOv9J3trHh7Sg4HPuO3Q0X0kreRoigEAgF27NhBZ1flvAILMIzZ+Xye2dlZ+vv6+Obrr/n4448ZHR1FXWIF/v1AVVTm5uYW3aOrJZvNEovNL1nHYDCIPxBYUS6P5XC5S/kpdF1nYGCALz7/nI8/+pBzX37JxYsXuHPnDol4gtraWlpaWwmFw4t/Xxjcsz9tbGxsbGxsbGxsbB5qKj+9rzPNzc3s3LmTmpoaM0mgMDBKRggdISA4HI5FHg9CbLCKEdZtKYPVVsHn81FfX09nZyednZ10dHRQU1NjGtTdbjceI3mzWGU4MTHBnTt3uHXrFn19fQwMDNDX18eNGzcWbNevX+f69etcu3aN7777jmvXrnHz5k36+vro6+ujv7+fu3fvMjExwfz8PLlczjTsC8FHXIPP5yMcDhMMBk3xQQgPPp/P9E6QjcTZmqYtCJ8kRAKxif9X8mQo3ydei31CiLAKD+K6yw0gDzNOp5OWlhZ27dq1wACWy+X47rurjIyMkDdWHN6rVQKB4AKDXTUGAXEv6nrle83pFPk51jallGJSV65JPl8K1dbR2cGp04/z6muv8+Zbb/H666/z0ksv8YyRT+DAgYN0dXYRiURwVEh+XBFJwiFJuI2xWN42JYGmDH0FjV6GJEn4lliNvrikMuK+rdROYm51Ot10dHRx6vEnePW113jzBz/g1dde5/kXXuDs009z+vHH2bdvv5mMdClD7roggUNy4HQubleBruvIFYybAk1VF6z4tuKyeE4tRkfXVFSl9D3Rta2L48dPsG/vPgLLeBRYEdeUyWa4ce07Ll++xOTk5JLXuhLy+TwjIyPMTE/jdDpob2/j+PHjnDx1ikOHDlFfV0cynWTg9gCJZUQZHZiYnGR0dHRBudvtYueuXZw48RhdXV34/f4l2ud7rAneZ2dnuXjpEtevX2d2bg6Hw0F7ezunTp9mx86dBAwvvnuhGzHmU6kUvTeuc/H8eaLRKHKxuChMlhVtmTAtDqcTjyFiVRxOuo6qlH4bOJYLjbTJ4fuSySRXLl/mww8/5NOPP+bSpUtMTExQKBSIRGo4duw4r772Gs89/xzburpWdG2qqpIv5Jc81ul0mG21WjQRCrN8h4GmaehLzEcS4DZ+21REAk0v/cbzeDzs2rWbI0eO0rN9O15LmMelEOeUJIn5+XkuXjjPlStXlhRj7geJZII7twe4c3ugfFfV6LpOLpdbEJq0HI/xO2qt6LrOzPQ0ly9d5MPf/ZZPPvmEK1euMD09jaqqNDc3cfr0aV559TVOnn6cJkuycRsbGxsbGxsbGxsbGyvLWyPWkZ6eHvbu3UsoFCKdTpNKpZBl2TSkic1hrJJ3OBwoimKKFRgr8ITRTRjZrO/d6jidTsLhMK2trXR1dbFt2zZaW1vx+XwUCgVSqRSFQgEsORXi8Tijo6OMjo4yPj7OxMQEY2NjjI6OMjQ0xODgIIODg9y9e5fbt29z9+5dRkdHmZ+fN1fMSoaHhW4ReyRjxaLXW1rpHQwGCYfDhMNhampqiEQiC8QHr7cUj16EWlIUBZeRz8Hn8+Gx5HwQQoF47TVyOTiNnA/OCt4Pos+F4FAuVEiPmMeDFY+Iv26s0lVUlcmJCa5cvEQ6lTJDJlU2P5WQJAmvZykD7b0R7b+UuKCZImBlg8iK0HW8xviohN/n4/jxE/z+H/whr7z6Ks88+ywnT51i3/79tLW3ry7fhAWH4WnjXspQtg5IkoTX8B5aLU6nE7ercl9KkkRdfT2nTp/mtTfe4LXXX+fZ557j9KnT7Nmzh5aW1oohUDYWCckp4XItvl6BmI+WorSKvbKHj8PhxO1y4XRW+vxSO4s50O12c+DgQV559VVeePFFurq7cVcRnkRRNUZHRhkbGyVTloS4GjLpNGNjYyRTSQKBIPv2HeDlV1/l9dff4Pd++CN++Pu/z9NPPU1zc5MpxFdE14nNzTMxMbFoJXRDQwOPP/EEP/jBDzjx2AkaGxtwVhgzldB1nXg8xtDQEDNGQmu3283Ro8d48623efqZZ+nq6sJTRdvl83mGR4YZGx1FVZUl+qskCsjGAoRKSJJkeLlIlWc9CRxOBz6fD6/Xu2TbaesQym6lpNNpvrt6lfffe5erly8Ri5dyr+hAQ2MTZ86eLd2rzz7Hrl27CQZXPpfpur6kyKLrJXFgLTgkqRQWzmh7K7quoxjtWElMkiQJl9uN07XEva3rOIywbAD1DfWcPPU4r732Oqcff5zm5uZl54VyisUily9dqpgH5X4xNDRIf18fuWU8mFaKpmuo6tLePIhk1kssEqiGaDTK+Qvn+fB3v+Xa1aukUyVvL13Xae/o4OxTT/PG229z5uxZenp68Pn8a/r6t7GxsbGxsbGxsbF5eFni6X/98Xq9pgDhcrnQNI1sNksmkzFj1+qGG30pHINqGqvNlXfG6utisbjg/1ZB4kHB5/PR0NBAS0sLXV1dbN++na6uLkKhEJoRgimXy5k5GOLxOIlEwtxisdiCLZFIkEwmSSaTpkAgy/KCEDYul8sMo+T3+/H7/fh8PnMT5YFAKYZ6OBwmFAoRCASQJMkUjYTwIAQFIRQI7wghJoh9khFmy2Mkm7buE8eKz6okRIjXjzJWo08ykeDGjRtk0mnCkciSoWzKcUhLhzK5Fy6nk1AwiMftWWTu03UdVRU5WlZv9HA4ndTU1phjppxcPo8/4KenZztNTU2lOP+Gl4LYrOi6ztzcHIN37y4ZH7ucSp+zrkgSjjWOZZfLRTgSwbWESKJpGuFwiLa2Vpqbm02Pl+XqNjoywvj4GJqmLXnMWpCQcEhL11uSJAJ+X0VBBaBQKKAsYYzWdQ1N1yo6RkiShMdTmtvi8Tiz0SiqorBz5y6eeeZZfvjDH/LjP/5jnn/hBfbu3UeNke9juTZIp1LE5uYr5iZZCaqqMjI6wmw0iiRJ1NXV0dW9jfb2djo6O9m5axfHTzzGiy+9zJtvvsXBQ4eWFUjy+TzRmRmmjNj5AFNTU0xPT+P3+zly9Bgvv/Iqf/hHf8wPfvgjnnzyDN3d3XgMD5ylquqQJFKpFLFYjHg8zvDwMOg6e/bu5bnnnuOHP/wRf/BHP+bZ555n9+49BA3xb6m203Xd/DyHo5RcuNKxkhAGlsl3pGmakXtmcafrOPB5fQSDQQL+wJICiaIoq87fsdL3iPrduX2bLz77jJGRERSjXpIkEQoG2bdvL2fOnqW7pweP14uqqRTk0iKEe+FwOHC6XBXHPoCqqWSXyNWwUhxOJz6/H+cSXmSq0VeVzqHruuG1VL7nezweN06ni5iRA8Xn83L02DFeevkV/uCPfswPf/gjzpw5w7Zt20peHMuMWV0vhedLbrDnQ6VxW4lMNktfXz+JZJLOjs7y3VXjdDhLYQGXOb8syyhLhRtbph+s5HM5bt3q4+rly4yMjKJYBFB/wM/Bgwd55pln6OjowOv1lhYfqErFfFD3Ip/LcffOHW729jI6OrpkIm0bGxsbGxsbGxsbmweXypaeDaK+vp4dO3bQ3d1tigXFYpFcLkc2mzVWz5WEBCEwCOO5MJ6J/RgGCMXI/fCgCRCSxfMgEonQ3NzMtm3b2L59O7t376a7u5vGxkYz9IAwygtjq6hrpXpLltwNwoBvNfILTwchQAjBQXg6iDLhDaEbcaXT6TSakePB+rkOI0eEEBi8Roxnq5eDEBHEcdbNbYRMsXo7iH2iDit92H9QWemoLRQKDNy6xY3r1wjXRMzwXRuN2+OhvqGeQDBAJcuPIsvksjnTsGZlqb4rlX9fc5fbTWdnJ94l4rBLQCwWI51KrkiMSiaT9Pf10dvbW76rIpVNmVsPj8dDW3tbRQ8KXddJp9MkEgkUZWWrumdmZrh+/Rpjo2Poa1wlvRQlI3flcQDgdrloaW5dsl+TqaTpFVaOoqjIBbniSnmHw0EwGKSmpoZEIk5v7w3GJybw+ny0d3Rw6NBhnnzyDM8//wKvvPoqb7z5Fs88+yzt7R1L3leqoiDLS4sh90LTNPr7bzE/P4fDIdHY1Ehbaxs+n88MIRUOh9nWvY0Tj53kmWefZe/evXg8nsr3nqIwOxtlbGTELBsZHqbPkkdg+/YdHDt+nKeffpoXXnyRV159jddff4OTJ09RU1tXuW8kCVVRKBaLxONxLl28xNzcHB6Ph86uLg4eFm33fCm015tv8dTTT9PR0VHx8ySgKMsUi0WCoRDhUGhJL6NiUSabyVScT0rXJCNRWtlfTl19HYFg0Ax32LxEOBhZLjIyPLwi74dcLsfo6AjxeAxd101vs3shSRLxeIzbtwcYHBpcIKjouk44EmHHjh10dXWZInIqmSK1TE4Ra9tKkkQ4FF5SnCoaeTfK+0P8XqjUfuV4PR7qamuXDN+kKAq5bBa5wv2pGwmi5SXa2Ofz0djUiMMhMTMzw43rN5ifnyMYDNLT08PRo8d4yhizJU+uNzjx2GPU1S2dx0IsuthIvhe/lmegv5+7t2/jcDhoa28zyxffHRaW+FjhWSJ+my0l1GazWXL53KLfwrqugwQrSZU+Pz9Pf18/IyMjaJbvBEmSaGxsYteuXTS3tJjztVhItJxXRvkY1HSNwcFBfv3rX/HbDz7gtx98wHvv/JpPPvqQgYGBZcVHGxsbGxsbGxsbG5sHi8pPLxuE0+mkubmZffv2EQ6HcRjx+4vFIvl8nnw+j2pJLi0ShQpRQoSf0I3wQUKYEPuWDU+xhXE4HHi9XsLhMB0dHezdu5f9+/eza9cutm/fTltbG01NTdTX11NbW2uGRaqpqSEUChE0DC1WEaH8rwh95Ha78VryOIj3+Q0viEAgQCAQMPepqmp6W6iqagoMQjQQq9StYZes57CKC2K/VZCwig3l3g9iX/lD68OGrpfMGNaH/Epomsbdu3e5cOECo6OjdG7bRigc3pT2cTqdNDQ20dzSUtHTIpvNMj8/v6QBqpKhRtO1Uqlx/S6nk23d3TQ1NVW+jyWJkZFhrl69Ur6nIkODg/T29pJIJJY0zlmRljUKVbgeg81ofys+n4/t27dTV1dX0Ysin88zNDjI+NgY6j0MOKqi0N/fx/DwMNns6sMIWVmqNZZuwVJIn+07duBdIh/G3NzckgbZfD5PJp0pJUMvw+PxUFdfR319PcVikdsDt7lz+zapVAqMtqytq2PHzp2cOnWKF195hTffepvnnnue9vZ2XBXCxZTmL8+KQxhZ0XWdTCbN3Tt3yGSyBEMhWlpaaGpuXjTmJclBXX09R48d57GTJ2lra6toLZYkSMRijIwMmwJMPB5noL+fO3fumF6EgUCA5pYW9u3fz5mnnuL1N97gjTff5PjxE0smOHY6HXg9HorFIgMDtxgYGCCdToNhBK1vqGfnrl2cPHWKV197jbff/gFnn3qKtra2RcZR3Wg7p6vkRdXU1ERNTU3F/s7n88zPz5HNZhe1SymRdayi2ASwY8d2Isa82NTczLbunoqiliwXuHmz957JwxUjOfj58+eJx+OleXpxNyzJ9PQMo6Oj5HJlBmFdx+/3U1NT8vYSRKNRZmaiS94xuiW8kcPhoNHwoCxvR13XyRcKTBgeTeWoqrqkx9ACJImaujoaGhqWFORi8TjJZHJRX+m6RiabJpdbvJpdkiQikQg9PTvQDdG07+ZNBu8OoqgKTqcTv99HU3Mze/ft5+zZp3jjzTd58823OP7YY9TXNyyqM4anRqXk8+uJpusoxcreHhhtH41GuXjxInPzc+ZvNpMK1y3QdH1RCKtcLsfk5ARTU1M4JCfbtnWXxMgKxGLzJJPJiqKapqpoS1yzQNd1YrEY42PjFUPL1dfVU1f3/XyhKArz83PGsUvXq7ytpiYm+fzzT3n3nXf46qsvuXTxAl9+8Tm/ff99zn35JdNTUxXHrY2NjY2NjY2NjY3Ng0f11pM14vP56OrqYvfu3ehG3gZhZC4WiySTSTPPg24RJoQIIQSGoiXhnlWwsHpGPIgII31NTQ07d+7k+PHjPPbYY2zfvp3W1lIYlba2Njo7O2lpaaG1tZXGxkYaGhqora0lHA4TiUTM/A3W0ElCpLAa+YWng1V4EOKDpmmMj48zMzODqqqmR4PLCLEkxAXhnSEECPHZHo+HYDBoihPCwGIVKkR9hUBhFSMchrfLw8BSY1LXSysa5UKBfD5f8ThxnwwO3uXcl59z+dJFVE2jq6trQRLqe2FNKGtluRa2Hh8MBtm3bz+NjY0LDIu6rpPOZhkfH2duft4sFyxlrFMUFdWSr0WSJJqamtmzdy+NjY2LrkvXdcZGx/j666+JRqNLrm7VdZ14PM7FS5cYHxujc4mV2JUoySTlBjR92Vaq1KYA6BXeo+toWiWjaYVjLYj5EGGo376Dnp7t+AOB8kNB17lz5w7Xr11nYmKifK+JahhVL128hKZp1NXVr9hopy2TZ6dSa1RqVysut5vde/ZQU1NTsT0z6TTTU1MVQx0ljLBAlYxqtbW1dHZ2UlNbi8/nIx6Pc/f2bUaGhxd5eTicTnxeL+3t7bz6+mvs2bMXn8+/aOz4/AFC4XBFEe5eqKrK4N27RGemcTggEo7Q0tJGXd0S3gdQCs2z/wDbt2/H7/eX7wYgk8kyOTlF3Mgl4PP5mJ6Z5vqN64tCC0lGYvVQKMTuPXt44YUX2L59R0UDvc/nJ1JTQzgcRtMUvv32GyYnJhZ9nvge6Ojs5MzZs5w8daqiV4PP5yMcCuNyuejq2kbXtm3lh6DrOtlMhomxCWKxkqeBQFFUEsmEkTdi8X3kdDo5ePAwNbW1ADQ1N7Nj5w5CodCi9pVlmevXrzM4OLikVw3GKvCbvb3cuX0bn89XaidJ3LGL+0xC3Oel606lUqRSqcX3iyShG96bpbfoFAoFhoaGmJyarCgK6LoOxlygG4swOjo72bVrV/mhIMLnDAwsElh0XTPDWy53XwqCgQD79u4lFAqX7wIgOjvL9Mz0IgFTlotMT00Tj81XnBhKYtg+MEJzzs3OMnCrn/GxsQXHSYanaCgYZOfOnTz77LPs3LkTr3exl1wkHCZYaV6sgkpzkBWlqJDP50shpcrQDU/Rr746x9WrV/C4PbS1tSNZwlY5HFKFkVNCluVFYbfGx8e4cvkSN3tvoKNz9NixJfOCjE9MMj4+sUg40DSVYlG+pyCNIXb8/9s7s+82zvTMP18VdhAgCHATScmSqIWUtcu2bMvddidnstxO/oE+k6vczJlJZu7zr+RycjFz0t3JnCTT7bbddnvRwn3fCRIg9r32qrmo7ysVQFJWuzttSn5/54AEClUFVNVXBeB93vd9Op32sXMGAEzL9CpZLNNE7vAQ2f0sWq3WifMzcf3v2adzs7P4/NPPeKWKBdOyYNkOypUK5mZnsLK84vmWEQRBEARBEATxavNHFx8AIBaLYXp6Gjdv3kQkEvHMp0VgW1VVz7NA5pnvpun+2FO5J4Roy6RpmvejXvwg9wfqXnVkblJ95coV3Lx5E9evX8f58+cxPDzs3YQokclkuqoj/AJEIpHwyvVFpYMQE0K8VZIQIMLhMDRNw8rKCu/P7Zp3inlFZYN4HI1GEeQtk8QxFMKBbduIxWJdokXAV9kgpvsFCiGOvC7ig+M43ATy5DFpmgbqtSoqlUpXQN3hokOr7ZqV/uxnP8eXv/0Kuq67xzud6cqYdV7wGg7PgvUHwBzHgWWasE0T6AmMOVzg80fAgsEg7j94gGvXrx8XPRwHOzvbWFyYRy6Xc9dtWVBVFfVT+qrrugZVUbqCiLFYDPfv3cfU9DSkE4KXtm1jc2MD//iP/8vLJrZ41ZPJDeprtRr+6X//H8w8eYJkog8X3ugOcJ70XgAHjgMYugnT7A4oObYNyzSPBQMZY3BsV/DsDSw6vCKrF8dxoJ0gMpmmCfMFfhkWr/4SRCIRfPSTn+CN8+dPNO5VFQXffPM1Pv7VL7G3u+d6JpgmbF4lpioK9vf38W//9q+Yn5tDX6IPo+dGAd/+sa3Tx5NhmjD045m1J49zB5Zpn96HXFTFjYzg3v0HSKUGep8GACwszGNhYaFrWqFwhJ2dHZRKxa7XZYwhEoni8uQV3L5z172+hCOIRiJYW1/Dr371SxzmDk8VsMDYc+3It16HMQykBzB67hwS/kzml0TTNHz55Vdot9tc8HEzyr+N/v5+jJ4bQ3/y5EoBwzRQKhWxtb0N8PPIMAysLC3hk48/RrvV6tqOXk56JhQKYnjE/VwJh8MIyEGsra7iN5//Bnv7z1s8HefkwGowGMToyCiGhoYAB7g8OYmbt24hlUodm19RVezsbmN3Z6crAKlpKg4PDrC9vX3s/JJlGW+8cRFv3rzpXZ/64nG8eeNN3Lp9C+Fwd6a44ziolCv4t3/9V8w8e+YdE3HuWpaFarWKr7/6Cp998okrYiX73WXFfCftU+bAtE0vyOs4rmBwEuVyGSvLK9jc2ETu8BD//ItfYH5+DtIJxxji+qFpXesbHhnBtetTGBlxz99eqpUKfvnLX6LiE4Y1TUetWkX7hMoS8PPHTzgSwTsPH+Lc6CgCJ4hUhwcHWF9fR6FY9KY5joPCUQGbm5sol8tdIgdjDP2pFG7cuIELF94AuPigaCoWFxfx+PETFIvd57RAklzza5wo/QDXrl/DwCmVPC+LqLY9jU67jWq5DE17fi13HAeGruPw8BAff/wrfPLxx6iUyxgaGsLo6GjXMQ0GgwiGQse3z3HQbDRQPHINs92qggrmZmdRLpWRGnC/3929exeTly8jHAodO1ZqR8HiwhxWVpahac8TedqtNur1+qn+R956uE/HsffGt3FvdxdLS4vIHeawv7+PTz/5NZaWFtFqnewtYtkODN39vi7QdN1XLXGcdruN/f29UxMyCIIgCIIgCIJ4tZB/+tOf/n3vxP9o3MCQG+g2TROapsFxHC/zUgSjxY8mxvuFi2xr8WNECBNinRL3ORC31wXGs/5CoRAiEddIU1QziAoEIR4IUUFMFwKBEBj8NyEYiIoDEciu1WpYX19Hs9mEdIJPg8j+FCIE87VdCgaDXfMLMUEIDeJ9iOfFMv71v07CA3gAYX1tDRsbG2i33ZYlfmye/erYrreJYehoNBs4OipgdWUFX3/5Jb787W+xsb4OTVMRjkQwfWMad+7c7crobTabWFpaQHZ//9gPdsYYLl2+jIuXLiLE2zVYluW1Jmq3jgcBYrE4bt254wYL+TrC4TBi8RhazSZKpVJX8FbTNLSaLbSaTdcEt1jEk2++wcLiwokZjI7jIB6Lu23FeF92xhjifX0IBIOu0XqlCsMwusaCYRioViooFguoVato1BsoVyo4yGaxvLyMz3/zKZ49e4aO0sGNN9/Ew4fvIsDHdqvVwtraGnZ2drqCIQyAHAhgZHQUk5OXuzJ8s/v7ePr0qdeqx1uGMcRiMVyfmsKYr82MZVnIHR7i2bOnJ2ZUS4zhxx9+2CXg1Ot1zM/N4fDgoEuMYdygemJ8ApcuX/aWYYwhmexHJBJBvVZHuVz2lhGoqopKpYKjfA61eh3NZgPlchl7u7uYX5jHV19+iYWFBRimibfeegvXrrm+AowxGLrutkA5ISucMYbR0VFcnryCROL5fqpUKlhbXcVBzzaAB7LHJ8YxPT0N6QTjWsaz56OxGJrNBiqVMswecUMI0rFoFIFAANVKGU+ePMGzZ09RKBS8Mc8YQ0CWcePGDbz/wSNcvXoVjDFoqoqNzU3s7OygWCiiVqt51xzbdoU+TdNQq1UxPzeHp0+folwqwfIFIftTKTx48AA3b93q2vaXwbZtbG1t4l/+77+g3WpBlgOYOH8e0zduYHBwsHf2LhwAB9kD7OxsHxuH4K1aHMdBqj+Jy5cnUatVsbW5iWw2i3K5ArXTQYBXl9m2aw6vKgoKxSK++eZrrKwsH8uOv3DhDbz9zjuYnp6GwasEsgcHKBeL6LTcrOhAIADHtmGYBnRdR7VSwdLiIr755htUKpWu4PxAOo179x7gzr27iMVi7rkej8O2LOzs7R7LyDYMA61Wk3+OhdFROlhaXMRnn32Gg4ODrnkZY5gYn8Cf/+Vf4uq1a953CUmSEI5EEAgE3dZAtVpXtrrj2Gg2GihXyqjXauh0Omg2mygUClhfX8cXv/kNHn/zNRzHxo9+/CEmzp+HJEnQNA27OztYXV2Foii+d+K+Zio1gKvXriOTyaDZbGJndwdHPkNwgWVZqNVq2NnewsL8PBbm51GtVLqud924QfupqSnP4Ft8xlqWhaNCHoqidnX1sW2bC9sGDNNAs9HAxuYGZmaeIZ/PHztXGWNIZzK4ffsOUryChDHmJRkUS0VUq9Wu9+g4jtsiy3YQ4V40+Xwen37yCZYWF6CqvmuI4yAWi+Hhu+/h/UeP0N/vCjr1Ws29Bh4eotlsoN1uISC73wcsPmYVRcFRPo+ZmRksLC54rZ7EW8lkMviLv/hLXL58ciXPy1KtVvHk6RMUC64I0IthGDAtE8FQELbjmtDncjksLi7it198jiePH6PAl7156xbu3LmHeN/z672qqtjZ2UU2e/yz2jAMOHAgSzKKxSKePnmCtZUVDKTTePPmTSSTSfdaGYmgUqmg6BN8BOJz2DBd37R8Po/ZmWdYWV722qb5kSSGS5cu4w4XaqvVKtbX1roEK4FhGKhWq9jcWMfc3ByWl5bQajX5Vap73DIAgUAQwyOjeOPiG4jxihTTMDA3N4ftra2u+eH7LDg3eg5T09PetYL4di6yf+idRBAEQRAEQRBngu9FfIAvcCeC151OB51OB4wHsgO+rGfGhQXxA0TcF//FdHG/9/HrhMSNmSPck0GIDEJ48IsRflFCCAVCkOgVBSRJgmmaqFaryGazKBQKkLkhtphP/BfigXgshBGxTv9NrFvcF8sJwUPcgr5qB7+o9KojfvgvzM9je3sL+gnZ4owxKIqCWq2GarmM/WwW21tbWFlextLiIubmZnnrKzc4l0wkcP/BfVy7dh1h3vpF0zTs7e7i2bOnKBaLXfuP8QqUaDSKifEJ9Pf3w7JtFItFzM/PY211FYZpHMsmlSUZY2NjyGQyXlAavOdzKByGrmtoNpqweLsz8CB6sVjEUeEIu7s7mJ+bQ5W3gumFMQZN0xGNRDA+MYEIN5qWZRnJZBLRSBS6rkJVFZjm89cAD4DkDg/c1zo6wt7uLtY31rG8vITFhQVomoZksh93793D1PQ0wFtE7O3uYXFx8ZhAwxiDZdmIxaIYGhryelpruobZmVnMPHt2YpCOMYZMZhCDg4OIRt0WPbVaDWurK5iZmYFt213hGMbHxOSVq26v90AA7U4Hm5sbmJudQalU8s3tYlsW4n19GDs3hnQ67b2uJEkYGhqCJElQVQ2K5nrmiHZCDAyqquDg4AClUglHR3ns7exibW0VS4tLWF9fg6aqGD13Dvfv38f4xARkWYZpmigWCnj65DGy2eyJ2x0MBjA0OIhz58YAvk1bW5tYWlzEUT5/bPw5joNkMoGh4WH09SVODAxKkoREIgE5IEPXdLRaLRiGCcdxt8e2bTRqNVSqFRSKbnB4dnYW2f2s18pKkiREo1Fcu3YN7z96hFu3bntim2EYWFtbRTa771V+tFstlEol5I/yODg4wPb2FpaXlvD0yRPs7e56WcIioHzz1pt4+M67GB8fP3EbTsKyLCiKgu3tbfz2t19gaXEREj8n+1MpjI2NYXjY7dnfe91zeBbyUf4IS4sL2NraPC4G8b+u5wXD0PAQWs0W9rP7OMrn0Ol0kMvlUK/XUSoVkTvMYW9/H5sbG5ifn3evGb4gaygUwvDICB689Rbu3ruHVCoFVVOxvLyMw8NDaKqKo6M8KuUKypUycrk8stksdra2sLS4hNmZGWxtbXnjRpZd74rp6Rt49713MT4x4WWBx+NxJBIJNJtNdDodL+OcMQbbslCpVNBstVAqlrC9tY2ZmRmsrq645y7fX5FIBOcvXMBbb7+ND370gRf8FgQCAfQlEpCYBEXpoNVudwmPtm1750exWEQ26+6bpcUlzM/PoV6v4fLkJD78yZ+gr89tI5jL5bC87LZi6hIx+XENBIMYGh5CJjOIYDCIWrWKg8ODY544tm1DVVWUyyUUi0V0FAXDw8MYGh6GaRgwfFnqjDGYpgEHwOjIMPoSfQiF3O9P0WgUsb44NNGi0uzO3G+32ygWCygcFbC7u+sKizvbMDSt5/rE4MBBLBrD+QvnMTAwgCD3dWKMYXBwEKZpot1uQ1UUz3SdiWqAWg3VahW53CGWlpbw9OkT1Gs1b5QGAgGkBgbw5q1bePToA0xOXvGOVaPRwNLCAsqlEprNBoqFAmq1GorFEvL5PPaz+9hY38DiwgJmZ2fd9l/8fQcCAWQyg3jnnYd4+N67p7Yk+jYcx4GqKFhdXcHs7CwajcaxOh4GwLLd9l/VahX5/BF2trewvLyM+fk5rCwvocXFuWAoiAcPHuD61JR3HQIAy7JRLpVQLBSPtapyHMdtM1coYH9vFwvzc2ASw5tv3sT161MIhlwhfSCdhuM4UBQFSkeBbT+vVhBjulQqukLa6hqWlxdRKh0XKsSYTafTuDF9A4x/FywcFVApl0+slFA6HRSLRZRKJSiKgvPnzyOR6IOmG96YgG/MhsMh9Pf3I5VKed8Zd7a2sb6xfkx8YXBFyenpaVy9ds37jUB8OyQ+EARBEARBEGeV7018AP9hkkwmEYlEvOCrabpGg7LPeBj8B5nDqyNEgFr8aPELE/4fKdJrVgHRiwj6C9FBBPiFYOAXKIInmED7H7sBkDKy2SyKxaInJoj/AV/lgsQNsoWIINYhxAWZVzMIQSHU4wUhnhfvwz/tdTpmDjfRXFxYwNLSIs8EtiFL7hjuvamaglwuh93dXc8wuFp1l3HHuGvQPjIygrfffhvnz1/w9tVR4Qizs7NYWV6BySsF/OuWZRmapiHVn0Qy2Q9V07C6soyFuVm3rzocSD3vi8kSgoEgYrEYksmkJ3QwxjA0MoJkIgnLssAYg+M8b7ej67prmnp0BFVVXxg40DQViqpgcHAQ4z5vhlAohMxgBgMDA4Bjw7K4qbxtQ2JifDAeVCsin8+hWCig2Wi4+8RxcOnSZdy9dw/nzp2D4zioVCqu2LK25mZ/+q4n7o0BjCEYCiGdzsA0TWxvbWHm2TMcHGSPHS8mMciSDNtxEOWihWla2NrawsLCPA6y2Z71u9cpORCALEuIx/sQCofd7NbHj7G7s+P10u5aTpYAB+jr60Oyvx/RaBSyr0psdHQU/al+VwSyrOfGywxegLbVaqJQKCKXz6FULKLddoNjkiThxvQN3Lx1C0NDQ2CModFoYGF+HosL82g2G3Cc7vcDxmBZJgKBINIDacTicZRKJSwuzGNrcxOdTuf4NovrdiCATCaDWCzmrqsHWZaRTqfRF4/DsR0YpukZuzLGoGkajgoFbKyvY3trC7VaDeDX+kgkgszgICavXMWPfvwh7ty521VdYlkWtjY3kM/loWkaJElCPp/H+toatjY3sbm5ieXFRSwvLaFUKsG2be/6NTw8jDdv3sK7773nVYi8LIqiYHd3B0+ePMaTx4+9DP9AwL0mhsJh9CeTiMZiCPCqPz+NRgNzc7NYWlpEuVw+8Roi9rEbCHegazoajTqaLddrQNd17O/vY2NjHRsbG1hbXcPS0iLW19a8sSDLMuLxOM5PnMf9B/fx3vvv49y5c+5+VzVsb22hcHQE0zJhmiaOjo6wxo/D+vo6FhcXsLKy4gloYttGR0Zw+9ZtPHzvPVyfmjpm1N2X6MPIyCgsn3eTZdtgzK3SKBaL2NraxMbGOopFVyQRx2VgIIXLk5fx9sOHeP99N4u+d/+Bt/QZHBpCMBiCbuhQVA2WZXaNQUVRUCwWcJjN4vDwEJVKBZZlYSCVxvT0NN597z0wxtBsNLCyuoLFhQWv4sh/LCTJbQsUCMgYGBjA8PAwArKMarWKWrXKOyY9r+hkjEFiMiRZQiadwcP33sXVq1fRaXdQqVS6zz0Alun6XcWiMQyk097nZn+yHwPpjHsdg9saSgg5kiRBUVXk83kcZLOoVCpupV3P9UninxUSP3Z9XBwSlWPBYBBDQyOIRCLQdN09VpbpigCMod1q4SC7j/W1Nezt7kJVVcjcZDwWi2NsbAw3bt7CRx99hMnJSe/7HQB0Oh2sr6+jWq26Pki6jmw2i3U+xtZWV7G4uOBVZcqyDFmSXGF2bAx379zFf/qzPzvViPplsG0b2WwW33z9Nfb396HrOiS5e/+Im8Pbdu3t7WJnZweHBwe8euh5YszExATu3LmD8+cveNdscI8bk1ehlEolr0JIjAe3uqCCYqEATdNwfWoKd+/dxbmxMW/bZFnG4PAwkokEvz66x1ysx3Ec1Ot1ZLNZ5HI5dBTFO89P2pZQKIS+vgRisRhSqRRsx0Gj2UC9Xodo8+Ufs0xyzehHx8bw6IMPMDQ4CEXpoNFsQfatG1xAhwMk+pNIJpIIhUJotVrI5XKo1WrefIwxSAEZ58+7YuLE+fNdY4R4MSQ+EARBEARBEGcV9vHHH3enHX0POI6DarWKxcVFrK6uwrbtrox+EbwGDyKI7H25p82PCKiLx2FuhPy64zhuux6bBxssy/IySG3e0kfcFzexnKZpyOfdzNVisQjDMCDz7GfXZNQNXgghQexnxkvjxf1IJALJV80gjo+YR9wP8DZPJ4kO4rnXBcdxcHh4iG+++gp7+3tQtRcH4l8EA4Nlut4G4+Pj+PGHH+LipUve+ubn5/H555+d2JLFz9DgIO7de4BINIrZmWfIHhzPbPcTjUQwOXkVd+7exdiYm+UO3prL4hUPW1ub2NvdRaVcRrvdgW7oMAwDhqHDMC1YpolWs4lWq+WNPT+hUAg3b9/G3/zN3yAa7TYKtSwLpVIJmxsb2NreQj6XR71WRavVdPtIm27gS5YDCIdCCIdCkAIByBLD/fsP8P6jRxg9dw6WZWFzYx2PHz9BLp+DZZknHgvGGPqTKdy7fx/RaBQb62vY29uF8gIRRZZljAyP4M/+/M8BAM+ePcPy0hJ043jGqCAcjuDa1Wu4eOkSGo06vvn6a6iaeuL+AX9fIyOjuPnmLUxNTx0zHhaCz9rqKnZ2tlEqlVCr1dFpt6HrKizLhgOGQDCAoBD9gkEEZRmPHn2AB2+/jcHBQdi2jaN8Hv/+//4dpZJr6n3idjtAIpHA9etTeOutt7C5tYW5uRkUi0VPkOqa3XHFrXQ6g3feeRtTU9MvDCqJ7dnc2MDW5iaOCkeo1+tedrxlWpAld3tiPEA6kM7g4sWLmJ6+gXPnznlimX+dX37xBVZXV6GqKnRDR7PVQrvVgqYqMAwTAENAZggEgohyY+nh4WFcunwJU9M3MDIy8sL3fRLFYhGzs27GfqfHMJuBIZVK4frUFG7dun0seG5ZFg4PDvDpZ58in8+dOj4EjDHEolH096dgWTbanTZMw81Ub7Wa6HQUaJrmtR4KBNzzJhqLIdnfj7GxMVy9ehXXr19HX+J5hUq73caXX3yBrc1NGKYJRemg2Wqg0+5AVXXopgHmuMHsYDCEWCyCvkQ/RkdGcOXKJK5cvYqRkdFTP49N00S9XsPqyiq2tjaRy+XRaNTRbrdh6Dp0w/A+NyKRCJKJBNKZNCYmLuDqtWu4cOHCS7VnURQFOzs7WFxcwP7uLqrVmnv8NdX1KwEQ8NoQutVe4xPjePTBB3jr7XcAAPu8DdvW1iZM83glG/hxiITDuHX7Lm7fvo1wOIyN9XV89dWX2N/dQ71Rh667VQyRcBjJZAKZgTSuXL+O+w8eIBQK4elTt6WYWJ8fWZYxefkKPvjRj7o8QyzLQr1ex/7eHvb39lAql9Bqt6GrGizn9Ot8LxJzg/quN9etY74kitJBNpvF8tIysvv7KFfKaLVabtWFocNxGAIB97M9Hosj1d+P4ZERXJ6cxNVr15DJZLrOI8dxUCqV8Pnnv8HhwQFMw4TS6aDdbqHdbkPTNFg8AB4IBBAKh90geX+/2wLuyhVcv3YdqVTq9/oOoaoqnj5+jPmFeTRbTU9Q/11xbPe71eXLl/Dw4Xu4NDl5THRrNptYWVnBk8ffYGd3F/VaDbqqAZKESDiMSDiERH8KA6kU7t27h5u3byGdPu4Po2maJ9C5n481KIoC0zRg2sevxSfhOI7bHml4GPfu3cfU1JSbOLG4iNnZGezv76PVbELTNMj8u3WiL4Gx0VFcnbqOO3fuotloYHZuFpubGydepxLxBK5PT+Hu3XsYGBhAvVbD48eP8cUXn3teFMFgEKPnzuH2rdt4++FDDKRSL/X+CZeP2E96JxEEQRAEQRDEmeBMiA/wCRALCwvY3NyEYRief4HIrJd4ln2ox/TYH8QWYoTIzBfP/dBwuGlmr+AgxARN01Aul92MvcND1Go1r31EIBBAlPdVF/td5q2Q/AJD736XeUadOCbieXHfLzKIxzKviBBZcq/TD03HcdBut1E4OkJHcY09f5/tE+JDLBbD+Pi4Z3grAjf5fA44IVAlcAMMAQxmBiEHAiiXSy+sTBDvt68vgcHBQfTxHuOaquLzzz9HIpHA2++847VMa7fb6HQ60FQVuq574oNpGqiWK1hfX8PG+rqX3S9gjGFwaAh/+3d/h/HxiWPBI5u3JqnXXW+DSrmMZqPBRQ4TDhz3ehByz3khfI2Nj2NiYgLhcJhfXyoolcrQNK2rJ7ofx3F7bWcGByFJDM1m08sMPw3HcRAMBPHGG2/AdtxM7WazdeprAG4iqTCCNww30I5vOXZuprdrOBo6IfPesix0Oh00Gg1UK25LnGazCV3T3OoBxhAKueequD7KsoyLb1zEyOgoQtwAtdVqYX9//1SBBvz9S5JbuTY8PMJ9N8owDP0Fy/AA19AgUgPpb70ui+2p12qoVCqoVCpot9vQdR2mZUJm7rUmFo+hP5VCOp1BKpVCIplAQD4uEFiWhWKh4AkAmq6hVquj1Wyi3eYtngAEeVZ9PB5HfyqFwaEhDAwMIBKNnmi2+210Oh2Uy2VepdF9DRDjLdnfj6GhIYR6DGTF8Tg8POTVGifvW4HDg6XBYAiBgOz5azQbDTRaTbQaTTcwaZlgTEKQ946P98WRzmQwmBlEIpk8Jm65bViOvJZPiqqgXquh2Wiioyie0BaQA4iEw4j3xZHoT2FkeBj9/f2IRiOQTzgmfhzHQafdRr3RQLVaRbVSQZMHPIX4EA6FEI1G0N/f7x7vgQEkEokTz4fT0HUdDZ5xXioW0Ww2oKqqazTPgKAcQCAYQCgYgiRLSA0M4OLFS54vR7PRQKFY5G0ie9f+HMdxkE5nkE6nEY1GXb+Cozyy+25Fm1986OfHf2hoCKkB13C9Uqkgn88dO58cXgUai8UxPj5+7Fg5PKlAVRSomtuGSVVU2L7qtG/DvfZLSCaTGBoaOvYa4G3MGo0G6rUaSuUyGvU6FKUD3TBgWTaCIkidTCCVGkAmnXbHwilVT4qqolQoeIkTnY6CRqOGJvcQMgwTYMwVmSNh9PUlkE4PIJ1OI5FIvpT49G1YljvOq9UarJcM3J+E47ifk/39SQyPjCKZTB5blzi3c7kcDg6yqFaqUBTF+54bi0aRTKWQTqcxMjyMZDIJ+RTh0+Kt3VTedktVFBjcO+J3OebBYAiZTOb5WG82kc/neYVCFZqmu98PIxEk+5MYHRlFZnAQyWQShmGgXC6hVnMrV3rXLUsyEskEBgfd8eTw7/w7O9soHBWg6RoikQhGRkYwPj6BTCZz4jghTofEB4IgCIIgCOKscmbEB0GxWMTS0hIODg6gKAoCvnY+QnQI8fY//pZCQmgQ98V8/gD3Dw3mM+0WyLKMSqWCbDaLvb09bu7o9u0X+wpwA6OO43jCD+Ol9iKbWIgKQnzw/+8VJ/yPe6f5xYfXEdt2Az69x+G74PD+74xXoki+MS2qWyTeQuFFSJJ7LC3reHbiSTBfCyfHcTA3O4t//sUvMDU9jf/8V3/VNa9puZUONm+dYlkWHNtBs9nA7OwMPvn1r5HLuSKJgDGGRCKB//rf/juuXr36wnPVMN2MWF3XvW0G36aAHIDExxPj1ThBXpkDHlgSQRFxbpyGOx4dOM7zgO6LcAM3QfcY2ZboUvFC/MdKiIIvQjwvtu9F6LoOVVXdjGHLFa0Yb7nh3iSvzVYkEvHOcfgM0MU5/6LtlyQGSZK7BM4XwZjbQV16iW3wo+s6VEWBruuwbBu2bYExCQF+LQlzz5sXIc4fSZLAJAmWZUJVNVco4+sFz/qWAzJCwSDCvALv98EdEy/eP+LYnLRPHMdxz6MXHIdeHF9LMcYYdF2HpmkwdB0GP28YP69lLrbEYrFTzz3HcWDZNmS+PpObc2tc2LIdd8xLkntMQqEQgvwz+rtgmiYUcbxNk7dhYpAlCYFgEJFIGJGI67HyXfG/hmka3jnLwMBkhmAgCAYgGAoiHHbPEQCwHRu29XKBfHHd9L/PZrMJVVG88RYMBBDk+1+8hsDvJ3EMbqz+MvtAjJ+Xec8Ch1dUittpOI4DRVWh8/Fl8c887zzirSGDvHXTaXjnJx+DhmG4whM/PuLaHZDdFlXhsHvOnzZmvwv+6/fvsq9OwjJN7/PoRe/Rsiy0Wi2ovPqK8arSQCDgVgBHIr+z6OnuS/t3Eh8EvWPWNE10Oh2oquspxPj3j3A4hHgsDuYbG+61yjz1848xCbL8vMUSeLVJu92GbVuQZbc913e9bvzQIfGBIAiCIAiCOKucOfEBXIDY2NjA3t6el3Uc6BEfREVEhAedhOAQ5q2WZG6WHOJZ0L9LZuTrisN7AG9vb2NtbQ25XA4WD8YFfJUI4sel2I9iH8qyjCg31RXBMhG0FAKRmE88J9bbKzYEeRWEeD1/IJY4mziOg1KxiJ///J/w6Sef4scffoT/8td/3TvbqczOPMPPfvYzrK6sdE1njCGdTuNv/8f/xAQ3PSYIgiAIgiBeDhIfCIIgCIIgiLPK6els3yODg4OYnp7G9PQ0MhnXPNC2bd5H3uAtXdz7vY81TYNhGJ5xpd/vwPk92968yti2jaOjI/z617/G119/7QkPQrAR2c/BoGsw7DiOlwnrFxcc3rrHL/r0CgxCZBCC0UmChLgvMuxIeDj7qKqKJ0+eYGlxEZZloVwuYXd3p3e2E9F1HW2lg1a73fsUHMfBQDqNoaEhEh4IgiAIgiAIgiAIgiAI4jVB/ulPf/r3vRO/b0SwO5FIYGBgAIFAAK1Wyy3lf0ELALdk3m1lILLzheDQW0r+Q6LVamFmZgZffvklqtWqty9FFYMQD/wVEEI4EBUlfmEBQNf8ovWBX1TwL9Nb+eAXHX6Ix+NVRFNVLC0t4Ve/+hVyh4ewbRutVgu1Wg3RaAyDg4MvPC/n5+fw+WefYXOj24ySMYZ0JoOPPvoJpqamaDwQBEEQBEH8jlxk/9A7iSAIgiAIgiDOBGey7ZIfy7JQr9eRz+ext7eHWq0Gy7IQ4oag/uB4iHtBiPt+c2rRd1gEvU8LlL5OqKqKg4MDbG9v4/DwEAcHB4jH4543gOiRLoSEIO+PzxhDLBaDZVme54N4XmSm+ysaIpEImPAh8PWIFvP7xQfW09ucgs2vBrquY3V1FT//2c+wurLsCQixWAwXLryBCxcuYHBoEH19CUSiEciyDNMw0e50cHh4gJ3tbWT399BstgCf58LAwADef/QIf/Inf4qR0dGeVyUIgiAIgiC+DWq7RBAEQRAEQZxVzrz4ILAsC3t7ezg4OECpVIKqqgiHw56w4BcZRMA7xA0vhSAhMvTFPK8bovKj3W6jWq3i6OgIOzs7yOfzkGUZluUa+okKBFG5IO6HQiEvKJxIJKDrepdpr796wb+sWKfYrxL3cugVHn5Iws/rhm3bqNVqmH32DLOzs9jb20G9Voem63AcgDGgr68PyWQSsXgcwUAAum6g0WygWCh4IpPjOGCShGgkgkwmg3v37+Pd997HhQsXel+SIAiCIAiCeAlIfCAIgiAIgiDOKq+M+CBQFAXb29vY2NhAp9OBJEmIRCKIRCJeln7A1+pH+Bn4RQohWrwObX+EV4JpmlAUBfV6HQcHB1hcXESpVAJjDPF4HOFwGPF4nLfJiSIcDkPXdYTDYQDw9psQCYRwIESGXqHBPx0AwuFw13JifnEsAHjiA/Fqc3hwgKdPHmNhYR5HRwUoqgZN02CaBhxfSyWBqHYJcn+RWDyOsXNjeO/993HjzRtIJJK9ixAEQRAEQRAvCYkPBEEQBEEQxFnllRMfwAPt1WoVy8vLKJVKME0TMq9o6BUihODQKzyIagiRqf+qGh7ruo5Op4NyuYzt7W1sbW15ooxt217w37ZtJBIJWJaFWCzmTZN5BYjMWyEJwcYwDPT19cGyLG+aeN4vQvjFCP800XYp6GvVRLweCAP3cqmEra0tr7qmWi1D1XTYlgXYtlsRITMEJBnRaAwD6QGMTUxgcnIS589fQDKZ9ERAgiAIgiAI4rtB4gNBEARBEARxVnklxQf42sAUCgUUi0W0Wi0YhgHHcRAMBhGNRrvaLgnhoVeEeBWD447jQFEUNBoNlMtl7O7uolQqQVEU6LoORVGQTLrZ5KI6Qdd19Pf3e34ZolJBtEES+0CIB4ybfgshwS80MJ+/gxA3hNgg1uW/iQqTV1XgIU6n0+mg3WqhoyjodDpQVXcMGroBcFErEokgHo8hGoshGo2hL9GHSDjSuyqCIAiCIAjiO0DiA0EQBEEQBHFWeWXFB4GqqqjX696t1WrBsixYluUF0GOxGMLhsHc7TYA4yxnYjuPAMAxomoZWq4VCoYDDw0M0Gg0Ui0W0222EQiH09fVBURT09fV1VSqYpulVMkiS5FWG9AoL4G1ywuGwJ+SIfRPk7ZTEMv7WS0Jo8Fc+CGGD+GFhmiZM0wS4+BDkbbcIgiAIgiCIPzwkPhAEQRAEQRBnlVdefBBYloVms+kJEI1GA51OB7ZtIxgMer4P4XAY0WjUu++viJAkyQuan4UsfcuyYNs2DMPwRJZqtYpKpYJisYhcLucJBbZtQ5IkxONxaJqGWCwGxnvty9xsOhaLeWKACAo7joNIJAKpx3A6Ho97BtVCTBD3xXy9woR4XkwjCIIgCIIgCOI/FhIfCIIgCIIgiLPKayM++NE0DY1GA81m0/tvGAYkSfLMlv1VEMInIuTzgfi+xQchNpTLZa+lUrvdRr1eh6IonhgAAKFQCLquAwASiQQMw/AEAiEGgJtCh0IhT1QQ96PRKBzH6apgiEajXuWC+O+vdBCvL15H8rVdIgiCIAiCIAjijwOJDwRBEARBEMRZ5bUUH8CrBizLQqfTQbPZ9P4rigLDMBAIBBCPx5FMJhGLxb73NkyWZaFaraJcLnsCg6IoaDabqFarkLgptmVZABcSwD0aQqGQt55QKATDMLr8F4RwIMQCYTQtKiaEgHBSCyWxnGjJ5H9OrDvITYNJeCAIgiAIgiCIPy4kPhAEQRAEQRBnlddWfBA4jgNd16HrOtrtNtrtthfYNwwDtm2DMYZYLIZkMolUKoVYLOb5G4iqARH0/0NgmiY0TYOmaZ7A0Gw20W63US6X0Ww24TgObNuGrutwHAehUAiO43gtjoLBICzLQjgc9oQSmbdSsm0bAW4M7a9+sG0bsVjMW48QMERPfn9Vg8TbMInpQmjwCw4Sr4oQ++iPKdYQBEEQBEEQBEHiA0EQBEEQBHF2ee3FBz+iGsIwDDSbTS/QL1oWhcNhxGIxrzVTNBo9FngH4AXd/TdRmSA8GmzbhmmasG2762aaJjqdDlqtFhRFQaPRQLVahaIoYIxBURRYluWJAI7jeB4VhmF4AgPj3gxCIBCihBAphPgAn7+DYRiIx+Nd4oMQD5jPnNovPohtE8/5xQn/9hMEQRAEQRAE8ceHxAeCIAiCIAjirPKDEh/82LbtiRGWZaFQKODo6Ai1Wg2maSLEvSBE1UCQG1TLvHWRqBIQLZpEWyLR3qler3ttnnRdh2EY3msJkUIICEIMABdI/MKDxH0qRMsl8Xo2N9IOBAKe2bQQC+CrVhA3xhgMw/CMqIVY4a9m8IsM/uclqnQgCIIgCIIgiDMJiQ8EQRAEQRDEWeUHKz4IHG4sLSoixH9h9lyv19HpdGAYhicAiOC7EAfAA/HiefFfVFSI1xCI4L9YVgT7xXOiDZJ4LEmSJzz4KxoCgYD3HoQY4hcWxH0hnjBe3QBeveEXHvxChViPWK+YV4gPfrGEIAiCIAiCIIjvDxIfCIIgCIIgiLPKD158OAnGGFRV9aoWRDVDo9HoqmSwbdurYgCvpgAP7PsrGsR08ZwI3PsD+v7HvZUF/uoGMb8QCcR0IRKI5/zrEAKDECD8goN4DVFRIdYlnut9jwRBEARBEARBnB1IfCAIgiAIgiDOKiQ+vASMMXQ6Hc+sWtM0dDod6LoO0zQ9bwd/WyU/Qojw3/xCgZgmAv4i6C/ui2oF8V7AqyXEskJ48E8XywvxAFxg8IsT/ioI/zL+agfGKx0IgiAIgiAIgjh7kPhAEARBEARBnFVIfPgOWJbVVRkhKiE0TesSI/xBe8fXkkmID70IsaFXNPBPEwKFqKqQeKWCwF+14BcUmK8VE7jg0Duv//XF6xIEQRAEQRAEcXYh8YEgCIIgCII4q5D48B0RwoIQFfzig99g2jRNAPAECQHj7Zj808R09LRkEmJDb0WD+C+WE8uIaWL+XjHCv2zvegiCIAiCIAiCeHUg8YEgCIIgCII4q5D48AfC7/tg2zZM0/TEB/9/fwUEfC2ZhBgh7vtFCCE++IUE8bzMvR38QoVfWPDP3ys6nFaBQRAEQRAEQRDEqwGJDwRBEARBEMRZhcSH/wCEMCBEBiFICE8Iy7KAU7wghCghBAexrl5hQSCEBDGPX4QQ08U0/zJi/QRBEARBEARBvLqQ+EAQBEEQBEGcVUh8+CMhSVKX54OolOgVHSzL8sQD8EoKcV9UKvifR48wIab7HwsRgwQHgiAIgiAIgni9IPGBIAiCIAiCOKuQ+PA94xcDbNv22iEJocBf/eDHLyqIx+Dr632OIAiCIAiCIIjXExIfCIIgCIIgiLMKNfz/nvFXKAh/Br9fg98k2l/14J/PLzKQ8EAQBEEQBEEQBEEQBEEQBEF835D4cEbxt2LyI4QHwWnzEARBEARBEARBEARBEARBEMT3BYkPBEEQBEEQBEEQBEEQBEEQBEH8Qfn/tBIDvA+HPcMAAAAASUVORK5CYII=
+
+               """
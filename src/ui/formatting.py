@@ -0,0 +1,19 @@
+# src/ui/formatting.py
+
+import pandas as pd
+
+from core.column_types import DATE_FORMAT
+
+
+def format_column(column: pd.Series) -> list[str]:
+    # Datas no padrão dd/mm/aaaa e valores ausentes como texto vazio
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column.dt.strftime(DATE_FORMAT).fillna("").tolist()
+    values = column.astype(object)
+    return ["" if pd.isna(value) else str(value) for value in values]
+
+
+def format_dataframe(df: pd.DataFrame) -> list[list[str]]:
+    # Converte as linhas para texto apenas na hora de exibir
+    columns = [format_column(df.iloc[:, i]) for i in range(df.shape[1])]
+    return [list(row) for row in zip(*columns)]
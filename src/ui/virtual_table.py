@@ -0,0 +1,104 @@
+# src/ui/virtual_table.py
+
+from core.profiling import profiler
+
+
+class Virtual_Table:
+    # Mantém no Treeview apenas a janela de linhas visíveis (mais uma pequena
+    # folga abaixo) e reaproveita os mesmos itens ao rolar, trocando só os
+    # valores. Custo de memória e de desenho constante, qualquer que seja o
+    # tamanho do DataFrame.
+    def __init__(self, tree, scrollbar_y, row_height: int = 28, overscan: int = 5):
+        self.tree = tree
+        self.scrollbar_y = scrollbar_y
+        self.row_height = row_height
+        self.overscan = overscan
+        self.df = None
+        self.offset = 0
+        self.item_ids = []
+
+        self.scrollbar_y.configure(command=self.yview)
+        self.tree.configure(yscrollcommand="")
+        self.tree.bind("<Configure>", lambda event: self._render())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_units(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_units(3))
+
+    def set_data(self, df):
+        self.df = df
+        self.offset = 0
+        self._render()
+
+    def clear(self):
+        self.tree.delete(*self.tree.get_children())
+        self.item_ids = []
+        self.df = None
+        self.offset = 0
+        self.scrollbar_y.set(0, 1)
+
+    def _total_rows(self) -> int:
+        return 0 if self.df is None else len(self.df)
+
+    def visible_rows(self) -> int:
+        # Descontando a linha do cabeçalho das colunas
+        height = self.tree.winfo_height()
+        return max(1, height // self.row_height - 1)
+
+    def _max_offset(self) -> int:
+        return max(0, self._total_rows() - self.visible_rows())
+
+    def _render(self):
+        total_rows = self._total_rows()
+        self.offset = min(max(0, self.offset), self._max_offset())
+        rows = []
+        with profiler.stage("desenho da tabela") as stage:
+            if total_rows:
+                # Importado aqui: o pandas só é carregado quando há dados a exibir
+                from ui.formatting import format_dataframe
+
+                end = self.offset + self.visible_rows() + self.overscan
+                rows = format_dataframe(self.df.iloc[self.offset : end])
+
+            # Ajusta o conjunto de itens ao tamanho da janela, sem recriar os demais
+            while len(self.item_ids) < len(rows):
+                self.item_ids.append(self.tree.insert("", "end", iid=str(len(self.item_ids))))
+            while len(self.item_ids) > len(rows):
+                self.tree.delete(self.item_ids.pop())
+
+            for i, (item_id, row) in enumerate(zip(self.item_ids, rows)):
+                tags = ("evenrow",) if (self.offset + i) % 2 == 0 else ()
+                self.tree.item(item_id, values=row, tags=tags)
+            self.tree.yview_moveto(0)
+            stage.rows = len(rows)
+
+        if total_rows:
+            first = self.offset / total_rows
+            last = min(1.0, (self.offset + self.visible_rows()) / total_rows)
+            self.scrollbar_y.set(first, last)
+        else:
+            self.scrollbar_y.set(0, 1)
+
+    def _scroll_units(self, units: int):
+        new_offset = min(max(0, self.offset + units), self._max_offset())
+        if new_offset != self.offset:
+            self.offset = new_offset
+            self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        # No Windows o delta vem em múltiplos de 120; no macOS, em unidades
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_units(-3 * step)
+
+    def yview(self, *args):
+        # Mesmo protocolo do 'command' das barras de rolagem do Tk
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self._total_rows())
+            self._render()
+        elif args[0] == "scroll":
+            units = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                units *= self.visible_rows()
+            self._scroll_units(units)